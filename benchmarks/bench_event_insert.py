@@ -0,0 +1,88 @@
+"""
+Benchmark: event insertion throughput.
+
+Compares the old one-statement-per-event loop (insert_event) against
+the batched executemany path (insert_events) on a synthetic load
+spread across repos, the shape of a first full refresh.
+
+Usage:
+    python benchmarks/bench_event_insert.py [--events 500000] [--repos 1500]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from repoindex.database import Database
+from repoindex.database.events import insert_event, insert_events
+from repoindex.domain.event import Event
+
+
+def _synthetic_events(n_events: int, n_repos: int):
+    """Yield (repo_index, events) with commits spread evenly over repos."""
+    per_repo = max(1, n_events // n_repos)
+    base = datetime(2024, 1, 1)
+    for r in range(n_repos):
+        name = f'repo{r}'
+        yield r, [
+            Event(
+                type='commit',
+                timestamp=base + timedelta(minutes=i),
+                repo_name=name,
+                repo_path=f'/bench/{name}',
+                data={
+                    'hash': f'{i:08x}{r:032x}',
+                    'author': 'Bench Author',
+                    'email': 'bench@example.com',
+                    'message': f'commit {i} in {name}',
+                },
+            )
+            for i in range(per_repo)
+        ]
+
+
+def _run(db_path: Path, n_events: int, n_repos: int, bulk: bool) -> tuple:
+    with Database(db_path=db_path) as db:
+        repo_ids = []
+        for r in range(n_repos):
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)",
+                       (f'repo{r}', f'/bench/repo{r}'))
+            repo_ids.append(db.lastrowid)
+        db.commit()
+
+        batches = list(_synthetic_events(n_events, n_repos))
+        inserted = 0
+        start = time.perf_counter()
+        for r, events in batches:
+            if bulk:
+                inserted += insert_events(db, events, repo_ids[r])
+            else:
+                for event in events:
+                    if insert_event(db, event, repo_ids[r]):
+                        inserted += 1
+        db.commit()
+        elapsed = time.perf_counter() - start
+    return inserted, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--events', type=int, default=500_000)
+    parser.add_argument('--repos', type=int, default=1500)
+    args = parser.parse_args()
+
+    results = {}
+    for label, bulk in (('per-row insert_event', False), ('batched insert_events', True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            inserted, elapsed = _run(Path(tmp) / 'bench.db', args.events, args.repos, bulk)
+        results[label] = elapsed
+        print(f"{label:24s} {inserted:>8d} rows  {elapsed:7.2f}s  {inserted / elapsed:>10,.0f} rows/s")
+
+    base, new = results.values()
+    print(f"speedup: {base / new:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
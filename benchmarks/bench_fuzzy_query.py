@@ -0,0 +1,92 @@
+"""
+Benchmark: fuzzy queries in SQLite vs over Python dicts.
+
+Compares query.Query.evaluate() over every repo record (the rows and
+their tags loaded into dicts first, as views and the shell used to)
+against the same query compiled by compile_query() and run inside
+SQLite, where ~= and contains try a LIKE before calling the registered
+fuzzy_ratio / fuzzy_partial_ratio functions.
+
+Usage:
+    python benchmarks/bench_fuzzy_query.py [--repos 10000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from repoindex.database import Database, compile_query
+from repoindex.query import Query
+
+QUERIES = (
+    "name ~= 'projcet-04217'",
+    "language ~= 'pyton'",
+    "tags contains 'topic:t7/*'",
+    "description contains 'bayesian' and 'work' in tags",
+)
+
+LANGUAGES = ('Python', 'Rust', 'Go', 'JavaScript', 'Haskell')
+
+
+def _populate(db, n_repos: int) -> None:
+    for r in range(n_repos):
+        db.execute(
+            "INSERT INTO repos (name, path, language, description) VALUES (?, ?, ?, ?)",
+            (
+                f'project-{r:05d}', f'/bench/project-{r:05d}', LANGUAGES[r % len(LANGUAGES)],
+                f'tools for {"bayesian" if r % 50 == 0 else "general"} analysis, item {r}',
+            ),
+        )
+        repo_id = db.lastrowid
+        tags = [f'topic:t{r % 13}/sub{r % 3}', f'lang:{LANGUAGES[r % len(LANGUAGES)].lower()}']
+        if r % 7 == 0:
+            tags.append('work')
+        db.executemany(
+            "INSERT INTO tags (repo_id, tag, source) VALUES (?, ?, 'user')",
+            [(repo_id, tag) for tag in tags],
+        )
+    db.commit()
+
+
+def _python(db, dsl: str) -> set:
+    compiled = compile_query('', with_tags=True)
+    db.execute(compiled.sql)
+    query = Query(dsl)
+    return {
+        record['name'] for record in map(compiled.to_record, db.fetchall())
+        if query.evaluate(record)
+    }
+
+
+def _sqlite(db, dsl: str) -> set:
+    compiled = compile_query(dsl, columns=['name'])
+    return {row['name'] for row in db.execute(compiled.sql, tuple(compiled.params))}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repos', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=3, help='Runs per mode; best time wins')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, Database(db_path=Path(tmp) / 'bench.db') as db:
+        _populate(db, args.repos)
+        print(f"{args.repos} repos")
+
+        for dsl in QUERIES:
+            print(dsl)
+            results = {}
+            for label, fn in (('Query.evaluate (Python)', _python), ('compiled (SQLite)', _sqlite)):
+                best = float('inf')
+                for _ in range(args.rounds):
+                    start = time.perf_counter()
+                    results[label] = fn(db, dsl)
+                    best = min(best, time.perf_counter() - start)
+                print(f"  {label:24s} {best:8.3f}s  ({len(results[label])} repos)")
+            python, sqlite = results.values()
+            assert sqlite >= python, f"{dsl}: SQLite missed {sorted(python - sqlite)[:5]}"
+
+
+if __name__ == '__main__':
+    main()
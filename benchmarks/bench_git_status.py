@@ -0,0 +1,92 @@
+"""
+Benchmark: per-repo git status cost.
+
+Compares the previous four shell invocations (rev-parse HEAD, status
+--porcelain, rev-parse @{upstream}, rev-list --left-right) against
+GitClient.status, which runs one `git status --porcelain=v2 --branch`
+without a shell. Repos are small clones with an upstream configured so
+both paths do the ahead/behind work.
+
+Usage:
+    python benchmarks/bench_git_status.py [--repos 200]
+"""
+
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from repoindex.infra.git_client import GitClient
+
+
+def _git(cwd, *args):
+    subprocess.run(['git', *args], cwd=str(cwd), capture_output=True, check=True)
+
+
+def _make_repos(root: Path, n: int) -> list:
+    origin = root / 'origin'
+    origin.mkdir()
+    _git(origin, 'init')
+    _git(origin, 'config', 'user.email', 'bench@example.com')
+    _git(origin, 'config', 'user.name', 'Bench')
+    for i in range(20):
+        (origin / f'file{i}.txt').write_text(str(i))
+    _git(origin, 'add', '.')
+    _git(origin, 'commit', '-m', 'init')
+
+    repos = []
+    for i in range(n):
+        clone = root / f'repo{i}'
+        subprocess.run(['git', 'clone', '-q', str(origin), str(clone)],
+                       capture_output=True, check=True)
+        if i % 3 == 0:
+            (clone / 'file0.txt').write_text('dirty')
+        repos.append(str(clone))
+    return repos
+
+
+def _legacy_status(path: str) -> tuple:
+    def run(cmd):
+        r = subprocess.run(cmd, shell=True, cwd=path, capture_output=True, text=True)
+        return r.stdout.strip(), r.returncode
+
+    branch, _ = run("git rev-parse --abbrev-ref HEAD")
+    porcelain, _ = run("git status --porcelain")
+    _, code = run("git rev-parse --abbrev-ref @{upstream}")
+    ahead = behind = 0
+    if code == 0:
+        out, _ = run("git rev-list --left-right --count HEAD...@{upstream}")
+        ahead, behind = (int(x) for x in out.split())
+    return branch, not porcelain, ahead, behind
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repos', type=int, default=200)
+    args = parser.parse_args()
+
+    client = GitClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        repos = _make_repos(Path(tmp), args.repos)
+
+        start = time.perf_counter()
+        legacy = [_legacy_status(p) for p in repos]
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        current = [client.status(p) for p in repos]
+        current_s = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for old, new in zip(legacy, current)
+        if old != (new.branch, new.clean, new.ahead, new.behind)
+    )
+    n = len(repos)
+    print(f"legacy 4-process status  {legacy_s:7.2f}s  {legacy_s / n * 1000:6.2f} ms/repo")
+    print(f"porcelain v2 status      {current_s:7.2f}s  {current_s / n * 1000:6.2f} ms/repo")
+    print(f"speedup: {legacy_s / current_s:.2f}x  (mismatches: {mismatches})")
+
+
+if __name__ == '__main__':
+    main()
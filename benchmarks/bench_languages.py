@@ -0,0 +1,77 @@
+"""
+Benchmark: language detection.
+
+Builds a git repository with committed sources and a large untracked
+node_modules tree, then times three ways of getting its language stats:
+a pruned working-tree walk (what refresh did before), counting the
+tracked files listed in the git index (cold), and a LanguageCache hit
+for the same tree (what every later refresh of an unchanged tree costs).
+
+Usage:
+    python benchmarks/bench_languages.py [--source-files 5000] [--vendored-files 20000]
+"""
+
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from repoindex.languages import (
+    LanguageCache,
+    LanguageSettings,
+    _tally,
+    _walked_files,
+    language_stats,
+)
+
+
+def _make_repo(root: Path, source_files: int, vendored_files: int) -> None:
+    exts = ['.py', '.js', '.ts', '.go', '.sh', '.txt']
+    for i in range(source_files):
+        d = root / 'src' / f'pkg{i % 50}'
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f'm{i}{exts[i % len(exts)]}').write_text('x = 1\n')
+    for i in range(vendored_files):
+        d = root / 'vendored_deps' / f'dep{i % 500}' / 'lib'
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f'x{i}.js').write_text('')
+    (root / '.gitignore').write_text('vendored_deps/\n')
+    subprocess.run(['git', 'init', '-q'], cwd=root, check=True)
+    subprocess.run(['git', 'add', '-A'], cwd=root, check=True)
+    subprocess.run(
+        ['git', '-c', 'user.email=b@b', '-c', 'user.name=B', 'commit', '-q', '-m', 'init'],
+        cwd=root, check=True,
+    )
+
+
+def _time(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--source-files', type=int, default=5000)
+    parser.add_argument('--vendored-files', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_repo(root, args.source_files, args.vendored_files)
+        settings = LanguageSettings.from_config({})
+        cache = LanguageCache()
+
+        walk_s, walked = _time(lambda: _tally(_walked_files(tmp, settings, budget=10**9), settings))
+        cold_s, cold = _time(lambda: language_stats(tmp, cache=cache))
+        warm_s, _ = _time(lambda: language_stats(tmp, cache=cache))
+
+    print(f"files:        {args.source_files} tracked + {args.vendored_files} untracked (ignored)")
+    print(f"tree walk:    {walk_s:.3f}s, JavaScript files = {walked['JavaScript']['files']}")
+    print(f"index, cold:  {cold_s:.3f}s, JavaScript files = {cold['JavaScript']['files']}")
+    print(f"index, warm:  {warm_s:.4f}s (cache hit)")
+
+
+if __name__ == '__main__':
+    main()
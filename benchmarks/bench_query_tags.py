@@ -0,0 +1,103 @@
+"""
+Benchmark: query results with their tags.
+
+Compares reading a broad query's tags with one SELECT per result row
+(what `query`, `link` and friends used to do) against
+compile_query(..., with_tags=True), which selects each repo's tags with
+a correlated GROUP_CONCAT in the same statement, and against a
+LEFT JOIN ... GROUP BY over the whole result for reference.
+
+Usage:
+    python benchmarks/bench_query_tags.py [--repos 10000] [--tags 12]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from repoindex.database import Database, compile_query
+
+QUERY = "language == 'Python' order by name"
+
+
+def _populate(db, n_repos: int, n_tags: int) -> None:
+    for r in range(n_repos):
+        db.execute(
+            "INSERT INTO repos (name, path, language, readme_content) VALUES (?, ?, ?, ?)",
+            (f'repo{r:05d}', f'/bench/repo{r}', 'Python' if r % 5 else 'Rust', 'readme ' * 200),
+        )
+        repo_id = db.lastrowid
+        db.executemany(
+            "INSERT INTO tags (repo_id, tag, source) VALUES (?, ?, ?)",
+            [(repo_id, f'topic:t{(r + i) % 97}', 'github') for i in range(n_tags)],
+        )
+    db.commit()
+
+
+def _per_row(db) -> int:
+    compiled = compile_query(QUERY)
+    db.execute(compiled.sql, tuple(compiled.params))
+    rows = db.fetchall()
+    n = 0
+    for row in rows:
+        record = dict(row)
+        db.execute("SELECT tag FROM tags WHERE repo_id = ?", (record['id'],))
+        record['tags'] = [r['tag'] for r in db.fetchall()]
+        n += len(record['tags'])
+    return n
+
+
+def _with_tags(db) -> int:
+    compiled = compile_query(QUERY, with_tags=True)
+    db.execute(compiled.sql, tuple(compiled.params))
+    return sum(len(compiled.to_record(row)['tags']) for row in db.fetchall())
+
+
+def _group_by(db) -> int:
+    compiled = compile_query(QUERY)
+    sql = compiled.sql.replace(
+        "SELECT * FROM repos",
+        "SELECT repos.*, GROUP_CONCAT(tg.tag, char(31)) AS tags_joined "
+        "FROM repos LEFT JOIN tags tg ON tg.repo_id = repos.id",
+    ).replace(" ORDER BY", " GROUP BY repos.id ORDER BY")
+    db.execute(sql, tuple(compiled.params))
+    n = 0
+    for row in db.fetchall():
+        record = dict(row)
+        joined = record.pop('tags_joined')
+        record['tags'] = joined.split('\x1f') if joined else []
+        n += len(record['tags'])
+    return n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repos', type=int, default=10000)
+    parser.add_argument('--tags', type=int, default=12)
+    parser.add_argument('--rounds', type=int, default=5, help='Runs per mode; best time wins')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, Database(db_path=Path(tmp) / 'bench.db') as db:
+        _populate(db, args.repos, args.tags)
+        print(f"{args.repos} repos x {args.tags} tags, query: {QUERY}")
+
+        expected = None
+        for label, fn, statements in (
+            ('per-row tag SELECT', _per_row, '1 + rows'),
+            ('with_tags (correlated)', _with_tags, '1'),
+            ('LEFT JOIN GROUP BY', _group_by, '1'),
+        ):
+            best = float('inf')
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                n = fn(db)
+                best = min(best, time.perf_counter() - start)
+            if expected is None:
+                expected = n
+            assert n == expected, f"{label}: {n} tags, expected {expected}"
+            print(f"{label:24s} {best:8.3f}s  ({statements} statements)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: no-op smart refresh staleness pass.
+
+Indexes N minimal repositories, then times how long it takes to decide
+that none of them changed: refresh_reasons() per repo (one query plus
+one fingerprint each, as refresh used to do) against find_stale_repos()
+(one query, fingerprints in a thread pool).
+
+Repos are synthetic .git directories (HEAD, config, a loose branch ref,
+an index and a pyproject.toml) so setup stays fast at 2,000 repos.
+
+Usage:
+    python benchmarks/bench_stale_check.py [--repos 2000] [--workers 16]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from repoindex.database import Database, find_stale_repos, refresh_reasons, upsert_repo
+from repoindex.domain import Repository
+
+
+def _make_repos(root: Path, n: int) -> list:
+    paths = []
+    for i in range(n):
+        repo = root / f'repo{i}'
+        git = repo / '.git'
+        (git / 'refs' / 'heads').mkdir(parents=True)
+        (git / 'refs' / 'tags').mkdir()
+        (git / 'HEAD').write_text('ref: refs/heads/main\n')
+        (git / 'config').write_text(
+            f'[remote "origin"]\n\turl = https://github.com/bench/repo{i}.git\n'
+        )
+        (git / 'refs' / 'heads' / 'main').write_text(f'{i:040x}\n')
+        (git / 'index').write_bytes(b'DIRC')
+        (repo / 'pyproject.toml').write_text('[project]\nname = "x"\n')
+        paths.append(str(repo))
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repos', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = _make_repos(root, args.repos)
+        with Database(db_path=root / 'index.db') as db:
+            for path in paths:
+                upsert_repo(db, Repository(path=path, name=Path(path).name))
+            db.commit()
+
+            start = time.perf_counter()
+            per_repo = [p for p in paths if refresh_reasons(db, p)]
+            per_repo_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            bulk = find_stale_repos(db, paths, workers=args.workers)
+            bulk_s = time.perf_counter() - start
+
+    print(f"repos:            {args.repos}")
+    print(f"per-repo lookups: {per_repo_s:.3f}s ({len(per_repo)} stale)")
+    print(f"bulk pass:        {bulk_s:.3f}s ({len(bulk)} stale, {args.workers} workers)")
+    if bulk_s:
+        print(f"speedup:          {per_repo_s / bulk_s:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark: derived-tag sync and publication upserts.
+
+Compares the old per-row loops (a SELECT, then one DELETE / INSERT /
+UPDATE per changed tag, and a SELECT plus INSERT or UPDATE per
+publication) against the set-based path: sync_derived_tags() reading
+the current tags once and applying the difference as one executemany
+DELETE and one executemany INSERT ... ON CONFLICT, and
+upsert_publications() doing one prepared upsert. Each is timed on the first write of every repo (all tags new),
+a repeat with nothing changed, and a repeat where a third of each
+repo's tags changed, both per repo (what refresh's single writer does)
+and as one batch for all repos.
+
+Usage:
+    python benchmarks/bench_tag_sync.py [--repos 3000] [--tags 25]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from repoindex.database import Database, sync_derived_tags, upsert_publications
+from repoindex.domain.repository import PackageMetadata
+
+REGISTRIES = ('pypi', 'npm', 'cargo')
+
+
+def _legacy_sync_derived_tags(db, repo_id, derived_tags):
+    """The per-row loop sync_derived_tags replaced."""
+    desired = {}
+    for tag, source in derived_tags:
+        if tag not in desired:
+            desired[tag] = source
+    db.execute("SELECT tag, source FROM tags WHERE repo_id = ? AND source != 'user'", (repo_id,))
+    current = {row['tag']: row['source'] for row in db.fetchall()}
+    for tag in current:
+        if tag not in desired:
+            db.execute("DELETE FROM tags WHERE repo_id = ? AND tag = ?", (repo_id, tag))
+    for tag, source in desired.items():
+        if tag not in current:
+            db.execute("INSERT OR IGNORE INTO tags (repo_id, tag, source) VALUES (?, ?, ?)",
+                       (repo_id, tag, source))
+    for tag, source in desired.items():
+        if tag in current and current[tag] != source:
+            db.execute("UPDATE tags SET source = ? WHERE repo_id = ? AND tag = ?",
+                       (source, repo_id, tag))
+
+
+def _legacy_upsert_publication(db, repo_id, package):
+    """The SELECT-then-write loop upsert_publications replaced."""
+    db.execute("SELECT id FROM publications WHERE repo_id = ? AND registry = ?",
+               (repo_id, package.registry))
+    existing = db.fetchone()
+    if existing:
+        db.execute("""UPDATE publications SET package_name = ?, current_version = ?, published = ?,
+                          url = ?, doi = ?, downloads_total = ?, downloads_30d = ?,
+                          last_published = ?, scanned_at = CURRENT_TIMESTAMP
+                      WHERE id = ?""",
+                   (package.name, package.version, package.published, package.url, package.doi,
+                    package.downloads, package.downloads_30d, package.last_updated, existing['id']))
+    else:
+        db.execute("""INSERT INTO publications (repo_id, registry, package_name, current_version,
+                          published, url, doi, downloads_total, downloads_30d, last_published)
+                      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                   (repo_id, package.registry, package.name, package.version, package.published,
+                    package.url, package.doi, package.downloads, package.downloads_30d,
+                    package.last_updated))
+
+
+def _desired(repo_ids, n_tags, generation):
+    """Tags per repo; each generation renames a third of them."""
+    changed = n_tags // 3
+    return {
+        repo_id: [
+            (f'topic:t{i}' + (f'-g{generation}' if i < changed else ''), 'github' if i % 2 else 'implicit')
+            for i in range(n_tags)
+        ]
+        for repo_id in repo_ids
+    }
+
+
+def _packages(repo_id, generation):
+    return [
+        PackageMetadata(registry=r, name=f'pkg{repo_id}', version=f'1.{generation}', published=True,
+                        downloads=repo_id * generation)
+        for r in REGISTRIES
+    ]
+
+
+def _run(db_path: Path, n_repos: int, n_tags: int, mode: str) -> list:
+    with Database(db_path=db_path) as db:
+        repo_ids = []
+        for r in range(n_repos):
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)", (f'repo{r}', f'/bench/repo{r}'))
+            repo_ids.append(db.lastrowid)
+            db.execute("INSERT INTO tags (repo_id, tag, source) VALUES (?, 'mine', 'user')", (db.lastrowid,))
+        db.commit()
+
+        timings = []
+        for label, generation in (('first write', 0), ('unchanged', 0), ('1/3 changed', 1)):
+            desired = _desired(repo_ids, n_tags, generation)
+            start = time.perf_counter()
+            if mode == 'batch':
+                sync_derived_tags(db, desired)
+            for repo_id in repo_ids:
+                if mode == 'per-row':
+                    _legacy_sync_derived_tags(db, repo_id, desired[repo_id])
+                    for package in _packages(repo_id, generation):
+                        _legacy_upsert_publication(db, repo_id, package)
+                else:
+                    if mode == 'set-based':
+                        sync_derived_tags(db, {repo_id: desired[repo_id]})
+                    upsert_publications(db, repo_id, _packages(repo_id, generation))
+            db.commit()
+            timings.append((label, time.perf_counter() - start))
+
+        db.execute("SELECT COUNT(*) AS n FROM tags")
+        assert db.fetchone()['n'] == n_repos * (n_tags + 1)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repos', type=int, default=3000)
+    parser.add_argument('--tags', type=int, default=25)
+    parser.add_argument('--rounds', type=int, default=3, help='Fresh databases per mode; best time wins')
+    args = parser.parse_args()
+
+    print(f"{args.repos} repos x {args.tags} derived tags + 1 user tag, {len(REGISTRIES)} publications each")
+    results = {}
+    for mode in ('per-row', 'set-based', 'batch'):
+        rounds = []
+        for _ in range(args.rounds):
+            with tempfile.TemporaryDirectory() as tmp:
+                rounds.append(_run(Path(tmp) / 'bench.db', args.repos, args.tags, mode))
+        results[mode] = [(label, min(r[i][1] for r in rounds)) for i, (label, _) in enumerate(rounds[0])]
+
+    print(f"{'':14s}" + ''.join(f"{mode:>12s}" for mode in results))
+    for i, (label, _) in enumerate(results['per-row']):
+        print(f"{label:14s}" + ''.join(f"{timings[i][1]:11.3f}s" for timings in results.values()))
+
+
+if __name__ == '__main__':
+    main()
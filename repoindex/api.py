@@ -28,6 +28,12 @@ Example:
     for repo in ri.repos(tags=["lang:python", "topic:ml"]):
         print(repo.name)
 
+    # Once `repoindex refresh` has built the index, repos(), get_repo(),
+    # count() and stats() read it instead of walking the filesystem;
+    # walk it anyway with discover=True (or RepoIndex(use_index=False))
+    for repo in ri.repos(discover=True):
+        print(repo.path)
+
     # Scan events (local by default)
     for event in ri.events(since="7d"):
         print(event.type, event.repo_name)
@@ -50,6 +56,7 @@ Example:
     ri.tag_service
 """
 
+import json
 from typing import Generator, List, Optional, Dict, Any, Union, Iterable
 from datetime import datetime
 from pathlib import Path
@@ -93,7 +100,8 @@ class RepoIndex:
         paths: Optional[List[str]] = None,
         config_path: Optional[str] = None,
         github_token: Optional[str] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        use_index: Optional[bool] = None,
     ):
         """
         Initialize RepoIndex.
@@ -103,7 +111,11 @@ class RepoIndex:
             config_path: Path to config file (default: ~/.repoindex/config.json)
             github_token: GitHub API token (overrides config/env)
             config: Full config dict (overrides file if provided)
+            use_index: Read repositories from the index database (True),
+                discover them on the filesystem (False), or use the
+                index when it exists (None)
         """
+        self._use_index = use_index
         # Load configuration
         if config:
             self._config = config
@@ -173,36 +185,39 @@ class RepoIndex:
         recursive: bool = True,
         with_status: bool = False,
         with_github: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        discover: bool = False,
     ) -> Generator[Repository, None, None]:
         """
         Discover and filter repositories.
 
+        Reads the index database when there is one (see `use_index`):
+        the query is compiled to SQL, tags and limit are applied there,
+        and rows become Repository objects as they are iterated. Passing
+        `paths` or `discover=True` walks the filesystem instead.
+
         Args:
             paths: Paths to search (uses config if None)
-            query: Query expression (e.g., "language == 'Python'")
+            query: Query expression (e.g., "language == 'Python'"); the
+                query DSL when reading the index
             tags: Tag patterns to filter by (e.g., ["lang:python"])
             recursive: Search subdirectories
-            with_status: Enrich repos with git status
+            with_status: Enrich repos with live git status
             with_github: Fetch GitHub metadata (slow, rate-limited)
             limit: Maximum repos to return
+            discover: Walk the filesystem even if there is an index
 
         Yields:
             Repository objects
         """
-        # Discover repos
-        repos = self._repository_service.discover(
-            paths=paths,
-            recursive=recursive
-        )
+        compiled = None
+        if not paths and not discover:
+            compiled = self._index_query(query, tags, limit)
 
-        # Filter by query
-        if query:
-            repos = self._repository_service.filter_by_query(repos, query)
-
-        # Filter by tags
-        if tags:
-            repos = self._repository_service.filter_by_tags(repos, tags)
+        if compiled is not None:
+            repos = self._indexed_repos(compiled)
+        else:
+            repos = self._discovered_repos(paths, query, tags, recursive)
 
         # Enrich and yield
         count = 0
@@ -218,25 +233,118 @@ class RepoIndex:
             if limit and count >= limit:
                 break
 
+    def _discovered_repos(
+        self,
+        paths: Optional[List[str]],
+        query: Optional[str],
+        tags: Optional[List[str]],
+        recursive: bool,
+    ) -> Iterable[Repository]:
+        """Repositories found on the filesystem, filtered in Python."""
+        repos = self._repository_service.discover(
+            paths=paths,
+            recursive=recursive
+        )
+        if query:
+            repos = self._repository_service.filter_by_query(repos, query)
+        if tags:
+            repos = self._repository_service.filter_by_tags(repos, tags)
+        return repos
+
+    def _index_available(self) -> bool:
+        """Whether repos should be read from the index database."""
+        from .database import get_db_path
+
+        if self._use_index is False:
+            return False
+        return self._use_index is True or get_db_path(self._config).exists()
+
+    def _index_query(
+        self,
+        query: Optional[str],
+        tags: Optional[List[str]],
+        limit: Optional[int] = None,
+        count: bool = False,
+    ):
+        """
+        A query and tag patterns compiled for the index (a repo matches
+        if it has any of the tags). Text compares case-insensitively,
+        as the filesystem filter does.
+
+        Returns:
+            CompiledQuery, or None if there is no index or the query
+            doesn't compile (the filesystem filter accepts shorthands
+            the DSL does not)
+        """
+        from .database import QueryCompileError, compile_query
+
+        if not self._index_available():
+            return None
+        dsl = (query or '').strip()
+        if tags:
+            any_tag = " or ".join(f"tagged({json.dumps(t)})" for t in tags)
+            dsl = f"({dsl}) and ({any_tag})" if dsl else any_tag
+        try:
+            compiled = compile_query(dsl, with_tags=not count, count=count, nocase=True)
+            if limit and not compiled.limit:
+                compiled = compile_query(
+                    f"{dsl or '1 == 1'} limit {int(limit)}",
+                    with_tags=not count, count=count, nocase=True,
+                )
+        except QueryCompileError:
+            return None
+        return compiled
+
+    def _indexed_repos(self, compiled) -> Generator[Repository, None, None]:
+        """Rows of a compiled query as Repository objects, built as iterated."""
+        from .database import Database, record_to_domain
+
+        with Database(config=self._config, read_only=True) as db:
+            for row in db.execute(compiled.sql, tuple(compiled.params)):
+                yield record_to_domain(compiled.to_record(row))
+
+    def _indexed_repo(self, column: str, value: str) -> Optional[Repository]:
+        """One repo looked up by an indexed column (name or path)."""
+        from .database import CompiledQuery
+
+        compiled = CompiledQuery(
+            sql='', params=[value], limit=1,
+            clauses=f" WHERE {column} = ? LIMIT 1", filters=f" WHERE {column} = ?",
+        ).project(None, with_tags=True)
+        return next(self._indexed_repos(compiled), None)
+
     def get_repo(self, name_or_path: str) -> Optional[Repository]:
         """
         Get a single repository by name or path.
 
+        With an index this is one indexed lookup; otherwise a path is
+        read from disk and a name is searched for among discovered repos.
+
         Args:
             name_or_path: Repository name or absolute path
 
         Returns:
             Repository if found, None otherwise
         """
+        is_path = '/' in name_or_path and Path(name_or_path).exists()
+
+        if self._index_available():
+            if is_path:
+                repo = self._indexed_repo('path', str(Path(name_or_path).resolve()))
+            else:
+                repo = self._indexed_repo('name', name_or_path)
+            if repo is not None or not is_path:
+                return repo
+
         # Check if it's a path
-        if '/' in name_or_path and Path(name_or_path).exists():
+        if is_path:
             path = Path(name_or_path).resolve()
             if (path / '.git').exists():
                 return Repository.from_path(str(path))
             return None
 
         # Search by name
-        for repo in self.repos():
+        for repo in self.repos(discover=True):
             if repo.name == name_or_path:
                 return repo
 
@@ -416,15 +524,30 @@ class RepoIndex:
         """
         Get repository statistics.
 
+        With an index, language/owner/license are counted with one
+        GROUP BY query.
+
         Args:
             group_by: Field to group by ("language", "owner", "license")
 
         Returns:
             Dict mapping group values to counts
         """
+        if group_by in _STATS_COLUMNS and self._index_available():
+            from .database import Database
+
+            column, default = _STATS_COLUMNS[group_by]
+            with Database(config=self._config, read_only=True) as db:
+                db.execute(
+                    f"SELECT COALESCE(NULLIF({column}, ''), ?) AS key, COUNT(*) AS count "
+                    f"FROM repos GROUP BY key ORDER BY count DESC",
+                    (default,)
+                )
+                return {row['key']: row['count'] for row in db.fetchall()}
+
         counts: Dict[str, int] = {}
 
-        for repo in self.repos(with_status=True):
+        for repo in self.repos(with_status=True, discover=True):
             if group_by == "language":
                 key = repo.language or "Unknown"
             elif group_by == "owner":
@@ -442,6 +565,12 @@ class RepoIndex:
         """
         Count repositories matching criteria.
 
+        With an index, the count is one SELECT COUNT(*) compiled the
+        same way as repos() (query in the query DSL, text compared
+        case-insensitively; a repo counts if it has any of the tags).
+        Without one, or for a query the DSL can't compile, repositories
+        are discovered and counted.
+
         Args:
             query: Query expression
             tags: Tag patterns
@@ -449,7 +578,24 @@ class RepoIndex:
         Returns:
             Number of matching repositories
         """
-        return sum(1 for _ in self.repos(query=query, tags=tags))
+        compiled = self._index_query(query, tags, count=True)
+        if compiled is None:
+            return sum(1 for _ in self.repos(query=query, tags=tags, discover=True))
+
+        from .database import Database
+
+        with Database(config=self._config, read_only=True) as db:
+            db.execute(compiled.sql, tuple(compiled.params))
+            row = db.fetchone()
+            return row['count'] if row else 0
+
+
+# stats() group_by -> (repos column, label for repos without a value)
+_STATS_COLUMNS = {
+    'language': ('language', 'Unknown'),
+    'owner': ('owner', 'Local'),
+    'license': ('license_key', 'None'),
+}
 
 
 # Convenience function for quick access
@@ -118,7 +118,7 @@ def tree_handler(
     # Query repos from database
     try:
         views = config.get('views', {})
-        compiled = compile_query(query_string, views=views)
+        compiled = compile_query(query_string, views=views, with_tags=True)
 
         repos = []
         with Database(config=config, read_only=True) as db:
@@ -128,10 +128,9 @@ def tree_handler(
 
             db.execute(compiled.sql, tuple(compiled.params))
             for row in db.fetchall():
-                record = dict(row)
-                # Get explicit tags from database
-                db.execute("SELECT tag FROM tags WHERE repo_id = ?", (record['id'],))
-                explicit_tags = [r['tag'] for r in db.fetchall()]
+                record = compiled.to_record(row)
+                # Explicit tags from database (selected with the repo)
+                explicit_tags = record['tags']
 
                 # Get implicit tags (including topic:{github_topic})
                 implicit_tags = get_implicit_tags_from_row(record)
@@ -88,8 +88,13 @@ def query_options(f):
     return f
 
 
-def _get_repos_from_query(config, query_string: str, debug: bool = False, **query_flags):
-    """Get repos matching query and flags."""
+def _get_repos_from_query(config, query_string: str, debug: bool = False,
+                          with_tags: bool = False, **query_flags):
+    """Get repos matching query and flags.
+
+    With `with_tags`, each repo dict also has a 'tags' list, read in the
+    same statement as the repos.
+    """
     language = query_flags.get('language', None)
     dirty = query_flags.get('dirty', False)
     tag = query_flags.get('tag', ())
@@ -109,7 +114,7 @@ def _get_repos_from_query(config, query_string: str, debug: bool = False, **quer
 
     # Query repos from database
     views = config.get('views', {})
-    compiled = compile_query(query_string, views=views)
+    compiled = compile_query(query_string, views=views, with_tags=with_tags)
 
     repos = []
     with Database(config=config, read_only=True) as db:
@@ -122,7 +127,7 @@ def _get_repos_from_query(config, query_string: str, debug: bool = False, **quer
 
         db.execute(compiled.sql, tuple(compiled.params))
         for row in db.fetchall():
-            repos.append(dict(row))
+            repos.append(compiled.to_record(row))
 
     # Post-filter excluded directories from config
     exclude_dirs = config.get('exclude_directories', [])
@@ -731,7 +736,7 @@ def github_cmd():
     """GitHub write operations across multiple repositories.
 
     Set topics, descriptions, and other GitHub settings.
-    Requires the gh CLI to be installed and authenticated.
+    Requires a GitHub token (github.token, GITHUB_TOKEN, or a `gh auth login`).
 
     \b
     Examples:
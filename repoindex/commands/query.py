@@ -13,6 +13,7 @@ from typing import Optional, List
 
 from ..config import load_config
 from ..database import (
+    CompiledQuery,
     Database,
     compile_query,
     QueryCompileError,
@@ -280,10 +281,13 @@ def query_handler(
     # Compile to SQL
     try:
         views = _load_query_views(config)
-        compiled = compile_query(query_string, views=views)
+        # Listing output includes each repo's tags; --count runs as COUNT(*)
+        compiled = compile_query(query_string, views=views, with_tags=not count, count=count)
 
         if limit and not compiled.limit:
-            compiled = compile_query(f"{query_string} limit {limit}", views=views)
+            compiled = compile_query(
+                f"{query_string} limit {limit}", views=views, with_tags=not count, count=count,
+            )
 
         if show_explain:
             # Pretty formatted explain output
@@ -309,103 +313,121 @@ def query_handler(
         sys.exit(1)
 
 
+# repos columns each output mode reads, besides --fields. Selecting only
+# these keeps wide columns (readme_content) off the read path.
+_BASE_COLUMNS = ('path', 'name')
+_JSONL_COLUMNS = _BASE_COLUMNS + ('language', 'github_stars', 'branch')
+_TABLE_COLUMNS = _BASE_COLUMNS + ('language', 'is_clean', 'github_stars', 'description')
+
+
+def _output_columns(db, fields: Optional[str], brief: bool, pretty: bool):
+    """
+    The repos columns an output mode needs, and whether it shows tags.
+
+    --fields names that are not repos columns are left out of the SELECT;
+    they were never in the output either.
+    """
+    if brief:
+        return list(_BASE_COLUMNS), False
+    if fields:
+        requested = [f.strip() for f in fields.split(',') if f.strip()]
+        db.execute("PRAGMA table_info(repos)")
+        existing = {row['name'] for row in db.fetchall()}
+        columns = list(_BASE_COLUMNS)
+        columns += [f for f in dict.fromkeys(requested) if f in existing and f not in columns]
+        return columns, 'tags' in requested
+    if pretty:
+        return list(_TABLE_COLUMNS), False
+    return list(_JSONL_COLUMNS), True
+
+
+def _emit_results(db, compiled, pretty, brief, fields, debug):
+    """
+    Run a compiled query and print its results.
+
+    Only the columns the output shows are selected, and JSONL lines are
+    written as rows come off the cursor, so memory stays flat however
+    many repos match. The table view needs every row before it can
+    render, but holds only its own columns.
+    """
+    columns, with_tags = _output_columns(db, fields, brief, pretty)
+    compiled = compiled.project(columns, with_tags=with_tags)
+    if debug:
+        print(f"DEBUG: SQL: {compiled.sql}", file=sys.stderr)
+        print(f"DEBUG: Params: {compiled.params}", file=sys.stderr)
+
+    results = []
+    for row in db.execute(compiled.sql, tuple(compiled.params)):
+        record = compiled.to_record(row)
+        if pretty:
+            results.append(record)
+        else:
+            _output_result(record, fields, brief)
+    return results
+
+
 def _execute_sql_query(config, compiled, pretty, brief, fields, debug):
     """Execute a compiled SQL query."""
     from . import warn_if_stale
-    results = []
 
     with Database(config=config, read_only=True) as db:
         warn_if_stale(db)
-        if debug:
-            print(f"DEBUG: SQL: {compiled.sql}", file=sys.stderr)
-            print(f"DEBUG: Params: {compiled.params}", file=sys.stderr)
-
-        db.execute(compiled.sql, compiled.params)
-        rows = db.fetchall()
-
-        for row in rows:
-            record = dict(row)
-            db.execute("SELECT tag FROM tags WHERE repo_id = ?", (record['id'],))
-            record['tags'] = [r['tag'] for r in db.fetchall()]
-
-            if pretty:
-                results.append(record)
-            else:
-                _output_result(record, fields, brief)
+        results = _emit_results(db, compiled, pretty, brief, fields, debug)
 
     if pretty:
         _display_pretty_results(results, fields)
 
 
+def _fts_query(query_string: str, limit: Optional[int]) -> CompiledQuery:
+    """A full-text search as a CompiledQuery (ranked best match first)."""
+    filters = " JOIN repos_fts fts ON fts.rowid = repos.id WHERE repos_fts MATCH ?"
+    clauses = filters + " ORDER BY rank"
+    if limit:
+        clauses += f" LIMIT {int(limit)}"
+    return CompiledQuery(
+        sql='', params=[query_string], limit=limit, clauses=clauses, filters=filters,
+    )
+
+
 def _execute_fts_query(config, query_string, pretty, brief, fields, limit, debug):
     """Execute a full-text search query."""
     from . import warn_if_stale
-    results = []
+
+    compiled = _fts_query(query_string, limit)
 
     with Database(config=config, read_only=True) as db:
         warn_if_stale(db)
-        sql = """
-            SELECT r.*, GROUP_CONCAT(t.tag) as tags_csv
-            FROM repos r
-            JOIN repos_fts fts ON fts.rowid = r.id
-            LEFT JOIN tags t ON t.repo_id = r.id
-            WHERE repos_fts MATCH ?
-            GROUP BY r.id
-            ORDER BY rank
-        """
-        if limit:
-            sql += f" LIMIT {limit}"
-
         if debug:
             print(f"DEBUG: FTS: {query_string}", file=sys.stderr)
-
-        db.execute(sql, (query_string,))
-
-        for row in db.fetchall():
-            record = dict(row)
-            tags_csv = record.pop('tags_csv', None)
-            record['tags'] = tags_csv.split(',') if tags_csv else []
-
-            if pretty:
-                results.append(record)
-            else:
-                _output_result(record, fields, brief)
+        results = _emit_results(db, compiled, pretty, brief, fields, debug)
 
     if pretty:
         _display_pretty_results(results, fields)
 
 
 def _execute_sql_count(config, compiled, debug):
-    """Execute a compiled SQL query and output just the count."""
+    """Execute a query compiled with count=True and output the count."""
     from . import warn_if_stale
 
     with Database(config=config, read_only=True) as db:
         warn_if_stale(db)
         if debug:
             print(f"DEBUG: SQL: {compiled.sql}", file=sys.stderr)
-        db.execute(compiled.sql, compiled.params)
-        rows = db.fetchall()
-        print(len(rows))
+        db.execute(compiled.sql, tuple(compiled.params))
+        print(db.fetchone()['count'])
 
 
 def _execute_fts_count(config, query_string, limit, debug):
     """Execute a full-text search query and output just the count."""
     from . import warn_if_stale
 
+    compiled = _fts_query(query_string, limit).count_query()
     with Database(config=config, read_only=True) as db:
         warn_if_stale(db)
-        sql = """
-            SELECT COUNT(*) as cnt
-            FROM repos r
-            JOIN repos_fts fts ON fts.rowid = r.id
-            WHERE repos_fts MATCH ?
-        """
         if debug:
             print(f"DEBUG: FTS count: {query_string}", file=sys.stderr)
-        db.execute(sql, (query_string,))
-        row = db.fetchone()
-        count = min(row['cnt'], limit) if limit else row['cnt']
-        print(count)
+        db.execute(compiled.sql, tuple(compiled.params))
+        print(db.fetchone()['count'])
 
 
 def _output_result(result: dict, fields: Optional[str], brief: bool = False):
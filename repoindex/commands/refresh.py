@@ -11,15 +11,21 @@ import os
 import re
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import click
+from rich.progress import ProgressColumn
+from rich.text import Text
 
 logger = logging.getLogger(__name__)
 
 _PROVIDER_WORKERS = 8
 
+# Repos written per transaction by the --jobs writer
+_WRITE_BATCH_SIZE = 50
+
 # SQL identifier validation (letters, digits, underscores; must start with letter/underscore)
 _IDENT_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 
@@ -36,18 +42,66 @@ from ..database import (
     reset_database,
     upsert_repo,
     cleanup_missing_repos,
-    needs_refresh,
+    refresh_reasons,
+    find_stale_repos,
     get_repo_count,
     record_scan_error,
     clear_scan_error_for_path,
     get_scan_error_count,
     record_refresh,
+    sync_derived_tags,
+    upsert_publications,
+)
+from ..database.events import (
+    ensure_event_cursor_table,
+    get_event_cursors,
+    insert_events,
+    prune_unreachable_events,
+    save_event_cursor,
+)
+from ..database.detections import (
+    ensure_source_detections_table,
+    get_source_detections,
+    save_source_detections,
+)
+from ..database.languages import ensure_language_stats_table, get_language_stats, save_language_stats
+from ..infra.fingerprint import repo_fingerprint
+from ..infra.rate_limit import all_budgets, quota_wait
+from ..infra import registry_cache
+from ..infra.response_cache import get_response_cache
+from ..services.enrichment_service import (
+    DEFAULT_CONCURRENCY,
+    LATENCY_BUCKETS,
+    EnrichmentService,
+    run_source,
 )
-from ..database.events import insert_events
 from ..services.repository_service import RepositoryService
-from ..services.tag_derivation import derive_persistable_tags
-from ..events import scan_events
+from ..services.tag_derivation import PERSISTABLE_TAG_COLUMNS, derive_persistable_tags
+from ..domain.event import EventCursor
+from ..domain.repository import PackageMetadata
+from ..events import scan_events_incremental
+from ..languages import LanguageCache
 from ..sources import discover_sources
+from ..sources.detection import DetectionCache
+
+
+class _ProjectedFinishColumn(ProgressColumn):
+    """Projected wall-clock finish time for the refresh.
+
+    Uses the progress ETA, pushed back to the reset time while an API
+    quota is exhausted (every request to that host is waiting for it).
+    """
+
+    def render(self, task) -> Text:
+        remaining = task.time_remaining
+        wait, budget = quota_wait()
+        if remaining is None and not wait:
+            return Text("")
+        finish = datetime.now() + timedelta(seconds=max(remaining or 0, wait))
+        label = f"done ~{finish:%H:%M}"
+        if wait and wait >= (remaining or 0):
+            label += f" ({budget} quota reset)"
+        return Text(label, style="progress.remaining")
 
 
 def _resolve_active_sources(
@@ -97,8 +151,11 @@ def _resolve_active_sources(
         # Config default enables github
         all_names.add('github')
 
-    # Config defaults for providers (e.g., pypi: true)
+    # Config defaults for providers (e.g., pypi: true, or
+    # cran: {enabled: true, ttl: 7d} to also set cache TTLs)
     for name, enabled in provider_config.items():
+        if isinstance(enabled, dict):
+            enabled = enabled.get('enabled', False)
         if enabled and name not in excluded:
             all_names.add(name)
 
@@ -117,6 +174,15 @@ def _resolve_active_sources(
     return active_sources
 
 
+def _validate_max_age(ctx, param, value) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return registry_cache.parse_duration(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
 @click.command('refresh')
 @click.option('--full', is_flag=True, help='Force full refresh of all repos')
 @click.option('--since', default='90d', help='How far back to scan for events (e.g., 7d, 30d, 90d)')
@@ -129,7 +195,14 @@ def _resolve_active_sources(
 @click.option('-d', '--dir', 'directory', type=click.Path(exists=True),
               help='Refresh specific directory instead of configured paths')
 @click.option('--dry-run', is_flag=True, help='Show what would be refreshed')
+@click.option('--check', is_flag=True,
+              help='Only list stale repos and why (exit 1 if any); no sources, no writes')
 @click.option('--quiet', '-q', is_flag=True, help='Minimal output')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Process repos with N parallel workers (default: 1, or refresh.jobs)')
+@click.option('--max-age', default=None, callback=_validate_max_age,
+              help='Re-query registry lookups older than this (e.g. 12h, 7d; 0 = all), '
+                   'overriding the per-registry TTLs')
 def refresh_handler(
     full: bool,
     since: str,
@@ -140,6 +213,9 @@ def refresh_handler(
     directory: Optional[str],
     dry_run: bool,
     quiet: bool,
+    jobs: Optional[int] = None,
+    check: bool = False,
+    max_age: Optional[float] = None,
 ):
     """
     Refresh the repository index database.
@@ -175,6 +251,12 @@ def refresh_handler(
         repoindex refresh -d ~/projects
         # Scan events from last 30 days only
         repoindex refresh --since 30d
+        # Process 8 repos at a time (one DB writer)
+        repoindex refresh --full --jobs 8
+        # Re-query every registry instead of using cached lookups
+        repoindex refresh --external --max-age 0
+        # List stale repos and why, without refreshing (exit 1 if any)
+        repoindex refresh --check
         # Reset and rebuild: use sql --reset first
         repoindex sql --reset && repoindex refresh --full
 
@@ -187,8 +269,19 @@ def refresh_handler(
             pypi: false     # Registry providers disabled by default
             cran: false
             zenodo: false
+            npm:            # Per-registry lookup cache TTLs (default 1d,
+              enabled: true #   6h for packages that were not found)
+              ttl: 7d
+              negative_ttl: 1d
+          jobs: 1           # Parallel workers (--jobs overrides)
+          enrich_concurrency: 32  # Source fetches in flight at once
     """
     config = load_config()
+    if max_age is not None:
+        config.setdefault('refresh', {})['max_age'] = max_age
+
+    if jobs is None:
+        jobs = max(1, int(config.get('refresh', {}).get('jobs', 1) or 1))
 
     # Resolve active sources from all flags + config
     active_sources = _resolve_active_sources(
@@ -201,7 +294,7 @@ def refresh_handler(
 
     # Prefetch batch sources (e.g., Zenodo ORCID lookup)
     for s in active_sources:
-        if s.batch:
+        if s.batch and not check:
             try:
                 s.prefetch(config)
                 if not quiet:
@@ -241,6 +334,9 @@ def refresh_handler(
     # Initialize service
     service = RepositoryService(config=config)
 
+    if check:
+        sys.exit(_check_stale(service, paths, config, quiet))
+
     # Stats tracking
     stats = {
         'scanned': 0,
@@ -268,26 +364,89 @@ def refresh_handler(
             click.echo("Use 'repoindex config repos add <path>' to configure paths.", err=True)
             click.echo("", err=True)
 
+        # Per-repo state the writer saves; created here once, not per repo
+        ensure_event_cursor_table(db)
+        ensure_language_stats_table(db)
+        ensure_source_detections_table(db)
+
+        # One bulk staleness pass instead of a DB lookup + stat per repo
+        stale = None if full else find_stale_repos(db, [repo.path for repo in repos])
+        # Event high-water marks; --full rescans events from scratch
+        cursors = {} if full else get_event_cursors(db)
+        # Language stats by tracked tree; --full recounts every repo
+        service.language_cache = LanguageCache({} if full else get_language_stats(db))
+
+        # Batch hook for remote sources (e.g. GitHub GraphQL), given only
+        # the repos this refresh will actually run sources on; then fetch
+        # every source for all of them as one concurrent stage, on a
+        # worker pool that lasts for the whole refresh
+        enrichment = None
+        if active_sources and not dry_run:
+            todo = [
+                (repo.path, _source_record(repo)) for repo in repos
+                if stale is None or stale.get(repo.path)
+            ]
+            for s in active_sources:
+                try:
+                    s.prefetch_repos([record for _, record in todo], config)
+                except Exception as e:
+                    if not quiet:
+                        click.echo(f"Warning: {s.name} prefetch failed: {e}", err=True)
+            enrichment = EnrichmentService(
+                active_sources, config,
+                concurrency=int(config.get('refresh', {}).get('enrich_concurrency')
+                                or DEFAULT_CONCURRENCY),
+                on_error=None if quiet else _echo_source_error,
+                # detect() answers by declared input files; --full re-detects
+                detections=DetectionCache({} if full else get_source_detections(db)),
+            )
+            if todo:
+                enrichment.start(todo)
+
         from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        ) as progress:
-            task = progress.add_task("Refreshing repos...", total=len(repos))
-
-            for repo in repos:
-                _process_repo(
-                    db, service, repo, stats,
-                    full=full,
-                    since=since_datetime,
-                    sources=active_sources,
-                    config=config,
-                    dry_run=dry_run,
-                    quiet=quiet
-                )
-                progress.update(task, advance=1)
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                _ProjectedFinishColumn(),
+            ) as progress:
+                task = progress.add_task("Refreshing repos...", total=len(repos))
+
+                if jobs > 1:
+                    _process_repos_parallel(
+                        db, service, repos, stats,
+                        full=full,
+                        since=since_datetime,
+                        sources=active_sources,
+                        config=config,
+                        dry_run=dry_run,
+                        quiet=quiet,
+                        jobs=jobs,
+                        on_done=lambda: progress.update(task, advance=1),
+                        stale=stale,
+                        cursors=cursors,
+                        enrichment=enrichment,
+                    )
+                else:
+                    for repo in repos:
+                        _process_repo(
+                            db, service, repo, stats,
+                            full=full,
+                            since=since_datetime,
+                            sources=active_sources,
+                            config=config,
+                            dry_run=dry_run,
+                            quiet=quiet,
+                            stale=stale,
+                            cursors=cursors,
+                            enrichment=enrichment,
+                        )
+                        progress.update(task, advance=1)
+        finally:
+            if enrichment is not None:
+                enrichment.close()
 
         # Cleanup repos that no longer exist
         if not dry_run:
@@ -295,6 +454,19 @@ def refresh_handler(
             stats['removed'] = removed
 
         stats['end_time'] = datetime.now().isoformat()
+        github_cache = get_response_cache(config).stats()
+        if github_cache['hits'] or github_cache['misses']:
+            stats['github_cache'] = github_cache
+        lookups = registry_cache.get_registry_cache(config).stats()
+        if lookups['hits'] or lookups['misses']:
+            stats['registry_cache'] = lookups
+        if enrichment is not None:
+            latency = enrichment.timings.summary()
+            if latency:
+                stats['source_latency'] = latency
+        waits = {b.name: b.waited for b in all_budgets() if b.waited}
+        if waits:
+            stats['rate_limit_waits'] = waits
         stats['total_repos'] = get_repo_count(db)
         stats['total_scan_errors'] = get_scan_error_count(db)
 
@@ -393,16 +565,9 @@ def _run_sources_parallel(sources, repo_path, repo_dict, config, quiet=False):
     if not sources:
         return []
 
-    def _check(src):
-        if src.detect(repo_path, repo_dict):
-            data = src.fetch(repo_path, repo_dict, config)
-            if data:
-                return src, data
-        return None
-
     results = []
     with ThreadPoolExecutor(max_workers=min(len(sources), _PROVIDER_WORKERS)) as pool:
-        futures = {pool.submit(_check, s): s for s in sources}
+        futures = {pool.submit(run_source, s, repo_path, repo_dict, config): s for s in sources}
         for future in as_completed(futures):
             src = futures[future]
             try:
@@ -412,15 +577,21 @@ def _run_sources_parallel(sources, repo_path, repo_dict, config, quiet=False):
             except Exception as e:
                 logger.warning(f"Source {src.source_id} failed: {e}")
                 if not quiet:
-                    click.echo(f"  Warning: source {src.source_id} failed: {e}", err=True)
+                    _echo_source_error(src, e)
     return results
 
 
-def _derive_tags(db, repo_id, repo_record):
+def _echo_source_error(source, error: Exception) -> None:
+    click.echo(f"  Warning: source {source.source_id} failed: {error}", err=True)
+
+
+def _derive_tags(db, repo_id, repo_record=None):
     """Derive tags from metadata fields and sync to tags table.
 
     Runs after all MetadataSources have enriched a repo. Reads metadata
     columns and populates the tags table with source-attributed entries.
+    Without a `repo_record`, only the PERSISTABLE_TAG_COLUMNS are read
+    back from the repos table (not the whole row).
 
     User-assigned tags (source='user') are never touched.
     Derived tags (all other sources) are synced: stale ones removed, new ones added.
@@ -430,6 +601,16 @@ def _derive_tags(db, repo_id, repo_record):
     function is the thin DB-aware wrapper that supplies the published
     registries from the publications table.
     """
+    if repo_record is None:
+        db.execute(
+            f"SELECT {', '.join(PERSISTABLE_TAG_COLUMNS)} FROM repos WHERE id = ?",
+            (repo_id,)
+        )
+        row = db.fetchone()
+        if row is None:
+            return
+        repo_record = dict(row)
+
     # Look up which registries have a published row for this repo.
     # Kept at the call site (rather than pushed into tag_derivation) so
     # the shared helper stays pure / DB-free and can be used by read-view
@@ -451,78 +632,70 @@ def _sync_derived_tags(db, repo_id, derived_tags):
 
     Uses the tag string as the identity key (matches PRIMARY KEY (repo_id, tag)).
     Tags with source='user' are never modified. For derived tags, stale ones
-    are removed and new ones are added.
+    are removed, new ones are added and changed sources are updated, with
+    set-based statements (see `sync_derived_tags`) rather than one per tag.
 
     Args:
         db: Database connection
         repo_id: Repository ID
         derived_tags: list of (tag_string, source_name) tuples
     """
-    # Build desired map: tag_string -> source_name
-    # If the same tag appears from multiple sources, first one wins
-    desired = {}
-    for tag, source in derived_tags:
-        if tag not in desired:
-            desired[tag] = source
-
-    # Get current non-user tags
-    db.execute(
-        "SELECT tag, source FROM tags WHERE repo_id = ? AND source != 'user'",
-        (repo_id,)
-    )
-    current = {row['tag']: row['source'] for row in db.fetchall()}
-
-    # Remove stale tags (in current but not desired)
-    for tag in current:
-        if tag not in desired:
-            db.execute(
-                "DELETE FROM tags WHERE repo_id = ? AND tag = ?",
-                (repo_id, tag)
-            )
+    sync_derived_tags(db, {repo_id: derived_tags})
 
-    # Add new tags (in desired but not current)
-    for tag, source in desired.items():
-        if tag not in current:
-            db.execute(
-                "INSERT OR IGNORE INTO tags (repo_id, tag, source) VALUES (?, ?, ?)",
-                (repo_id, tag, source)
-            )
 
-    # Update source if it changed for an existing derived tag
-    for tag, source in desired.items():
-        if tag in current and current[tag] != source:
-            db.execute(
-                "UPDATE tags SET source = ? WHERE repo_id = ? AND tag = ?",
-                (source, repo_id, tag)
-            )
+@dataclass
+class _RepoWork:
+    """Everything gathered for one repo before it is written to the DB.
 
+    Produced by `_collect_repo` (filesystem, git and network only) and
+    consumed by `_write_repo` (database only), so the two halves can run
+    on different threads.
+    """
+    repo: Any
+    enriched: Any = None
+    source_results: list = field(default_factory=list)
+    source_error: Optional[Exception] = None
+    events: list = field(default_factory=list)
+    events_error: Optional[Exception] = None
+    error: Optional[Exception] = None
+    fingerprint: Optional[dict] = None
+    reasons: List[str] = field(default_factory=list)
+    event_cursor: Optional[EventCursor] = None
+    events_rewritten: bool = False
+    events_reachable: Optional[FrozenSet[str]] = None
+    languages: Optional[tuple] = None
+    detections: list = field(default_factory=list)
+
+
+def _source_record(repo) -> dict:
+    """The repo_record MetadataSource.detect()/fetch() receive."""
+    return {
+        'remote_url': repo.remote_url,
+        'name': repo.name,
+        'owner': getattr(repo, 'owner', None),
+    }
 
-def _process_repo(
-    db: Database,
+
+def _collect_repo(
     service: RepositoryService,
     repo,
-    stats: dict,
-    full: bool,
     since: datetime,
     sources: list,
     config: dict,
-    dry_run: bool,
     quiet: bool,
-):
-    """Process a single repository."""
-    stats['scanned'] += 1
-
+    cursor: Optional[EventCursor] = None,
+    enrichment: Optional[EnrichmentService] = None,
+) -> _RepoWork:
+    """Gather status, source results and events for a repo without touching the DB.
+
+    Safe to call from worker threads. Failures are captured on the
+    returned `_RepoWork` rather than raised, so the writer can record
+    them exactly as the sequential path does.
+    """
+    # Fingerprint before reading anything, so edits made mid-scan are
+    # still seen as changes on the next refresh
+    work = _RepoWork(repo=repo, fingerprint=repo_fingerprint(repo.path))
     try:
-        # Check if needs refresh
-        if not full and not needs_refresh(db, repo.path):
-            stats['skipped'] += 1
-            return
-
-        if dry_run:
-            if not quiet:
-                click.echo(f"  Would refresh: {repo.name} ({repo.path})", err=True)
-            return
-
         # Enrich with status
         enriched = service.get_status(repo)
 
@@ -530,29 +703,79 @@ def _process_repo(
         tags_from_config = service.config.get('repository_tags', {}).get(repo.path, [])
         if tags_from_config:
             enriched = enriched.with_tags(frozenset(tags_from_config))
+        work.enriched = enriched
+    except Exception as e:
+        work.error = e
+        return work
+
+    # The (tree key, stats) language detection resolved to, for the writer
+    cache = getattr(service, 'language_cache', None)
+    if isinstance(cache, LanguageCache):
+        work.languages = cache.resolved(repo.path)
+
+    # Run all active sources (parallel) — isolated so source failures
+    # don't poison the rest of repo processing (event scanning, etc.).
+    # With an enrichment stage they are already running; wait for them.
+    if sources:
+        try:
+            if enrichment is None:
+                results = _run_sources_parallel(
+                    sources, repo.path, _source_record(enriched), config, quiet=quiet
+                )
+            else:
+                results = enrichment.results(repo.path)
+                if results is None:
+                    results = enrichment.run(repo.path, _source_record(enriched))
+                if enrichment.detections is not None:
+                    work.detections = enrichment.detections.resolved(repo.path)
+            work.source_results = results
+        except Exception as e:
+            work.source_error = e
+
+    # Always scan events, from the repo's high-water mark when there is one
+    try:
+        scan = scan_events_incremental(repo.path, since=since, cursor=cursor)
+        work.events = scan.events
+        work.event_cursor = scan.cursor
+        work.events_rewritten = scan.rewritten
+        work.events_reachable = scan.reachable
+    except Exception as e:
+        work.events_error = e
+
+    return work
+
+
+def _write_repo(db: Database, work: _RepoWork, stats: dict, quiet: bool) -> None:
+    """Persist a collected repo: upsert, source fields, tags and events.
+
+    Must run on the thread that owns `db`. Updates `stats` and records
+    scan errors the same way for both the sequential and --jobs paths.
+    """
+    repo = work.repo
+    try:
+        if work.error is not None:
+            raise work.error
+
+        enriched = work.enriched
 
         # Upsert to database
-        repo_id = upsert_repo(db, enriched)
+        repo_id = upsert_repo(db, enriched, fingerprint=work.fingerprint)
+        if repo_id and work.languages:
+            save_language_stats(db, repo_id, *work.languages)
+        if repo_id and work.detections:
+            save_source_detections(db, repo_id, work.detections)
 
-        # Run all active sources (parallel) — isolated so source failures
-        # don't poison the rest of repo processing (event scanning, etc.).
-        if sources and repo_id:
+        if work.source_error is not None:
+            if not quiet:
+                click.echo(f"  Warning: source enrichment failed for {repo.name}: {work.source_error}", err=True)
+        elif work.source_results and repo_id:
             try:
-                repo_dict = {
-                    'remote_url': enriched.remote_url,
-                    'name': enriched.name,
-                    'owner': getattr(enriched, 'owner', None),
-                }
-                results = _run_sources_parallel(
-                    sources, repo.path, repo_dict, config, quiet=quiet
-                )
-                for source, data in results:
+                packages = []
+                for source, data in work.source_results:
                     if source.target == 'repos':
                         _update_repo_platform_fields(db, repo_id, data)
                     elif source.target == 'publications':
-                        from ..database.repository import _upsert_publication
-                        from ..domain.repository import PackageMetadata
-                        pkg = PackageMetadata(
+                        packages.append(PackageMetadata(
                             registry=data.get('registry', ''),
                             name=data.get('name', ''),
                             version=data.get('version'),
@@ -562,8 +785,7 @@ def _process_repo(
                             downloads=data.get('downloads'),
                             downloads_30d=data.get('downloads_30d'),
                             last_updated=data.get('last_updated'),
-                        )
-                        _upsert_publication(db, repo_id, pkg)
+                        ))
                     else:
                         # Belt-and-suspenders: discover_sources() already
                         # filters unknown targets, but if something slips
@@ -574,6 +796,9 @@ def _process_repo(
                             "Source %s has unknown target %r; skipping",
                             source.source_id, source.target,
                         )
+                # All of the repo's registries in one upsert
+                if packages:
+                    upsert_publications(db, repo_id, packages)
             except Exception as e:
                 if not quiet:
                     click.echo(f"  Warning: source enrichment failed for {repo.name}: {e}", err=True)
@@ -582,10 +807,7 @@ def _process_repo(
         # Derive tags from all metadata (runs after sources have enriched the repo)
         if repo_id:
             try:
-                db.execute("SELECT * FROM repos WHERE id = ?", (repo_id,))
-                updated_record = db.fetchone()
-                if updated_record:
-                    _derive_tags(db, repo_id, dict(updated_record))
+                _derive_tags(db, repo_id)
             except Exception as e:
                 if not quiet:
                     click.echo(f"  Warning: tag derivation failed for {repo.name}: {e}", err=True)
@@ -593,23 +815,29 @@ def _process_repo(
         # Clear any previous scan errors for this path
         clear_scan_error_for_path(db, repo.path)
 
-        # Always scan events
         if repo_id:
-            try:
-                repo_events = list(scan_events(
-                    repos=[repo.path],
-                    since=since,
-                    types=['commit', 'git_tag', 'branch', 'merge']
-                ))
-                if repo_events:
-                    inserted = insert_events(db, repo_events, repo_id)
-                    stats['events_added'] += inserted
-            except Exception as e:
+            if work.events_error is not None:
                 if not quiet:
-                    click.echo(f"Warning: Failed to scan events for {repo.name}: {e}", err=True)
+                    click.echo(f"Warning: Failed to scan events for {repo.name}: {work.events_error}", err=True)
+            else:
+                try:
+                    if work.events_rewritten:
+                        # History rewritten: drop the stored commits/merges no
+                        # ref reaches any more; the rest are still valid
+                        if work.events_reachable is not None:
+                            prune_unreachable_events(db, repo_id, work.events_reachable)
+                        stats['history_rewrites'] = stats.get('history_rewrites', 0) + 1
+                    if work.events:
+                        inserted = insert_events(db, work.events, repo_id)
+                        stats['events_added'] += inserted
+                    save_event_cursor(db, repo_id, work.event_cursor)
+                except Exception as e:
+                    if not quiet:
+                        click.echo(f"Warning: Failed to scan events for {repo.name}: {e}", err=True)
 
         if not quiet:
-            click.echo(f"  Refreshed: {repo.name}", err=True)
+            why = f" ({', '.join(work.reasons)})" if work.reasons else ""
+            click.echo(f"  Refreshed: {repo.name}{why}", err=True)
 
     except PermissionError as e:
         stats['errors'] += 1
@@ -631,6 +859,164 @@ def _process_repo(
             click.echo(f"  Error: {repo.name}: {e}", err=True)
 
 
+def _needs_processing(
+    db: Database,
+    repo,
+    stats: dict,
+    full: bool,
+    dry_run: bool,
+    quiet: bool,
+    stale: Optional[Dict[str, List[str]]] = None,
+) -> Optional[List[str]]:
+    """Count the repo as scanned and decide whether it must be refreshed.
+
+    Handles the smart-refresh skip and the dry-run report. A failing
+    staleness check is recorded as a scan error, like any other failure.
+    When `stale` (from find_stale_repos) is given it is used instead of
+    a per-repo lookup.
+
+    Returns:
+        Why the repo is dirty (``['full']`` under --full), or None if it
+        should not be collected. Reason counts go to ``stats['reasons']``.
+    """
+    stats['scanned'] += 1
+    try:
+        # Check if needs refresh
+        if full:
+            reasons = ['full']
+        elif stale is not None:
+            reasons = stale.get(repo.path, [])
+        else:
+            reasons = refresh_reasons(db, repo.path)
+        if not reasons:
+            stats['skipped'] += 1
+            return None
+    except Exception as e:
+        _write_repo(db, _RepoWork(repo=repo, error=e), stats, quiet)
+        return None
+
+    counts = stats.setdefault('reasons', {})
+    for reason in reasons:
+        counts[reason] = counts.get(reason, 0) + 1
+
+    if dry_run:
+        if not quiet:
+            click.echo(
+                f"  Would refresh: {repo.name} ({repo.path}) [{', '.join(reasons)}]",
+                err=True,
+            )
+        return None
+    return reasons
+
+
+def _process_repo(
+    db: Database,
+    service: RepositoryService,
+    repo,
+    stats: dict,
+    full: bool,
+    since: datetime,
+    sources: list,
+    config: dict,
+    dry_run: bool,
+    quiet: bool,
+    stale: Optional[Dict[str, List[str]]] = None,
+    cursors: Optional[Dict[str, EventCursor]] = None,
+    enrichment: Optional[EnrichmentService] = None,
+):
+    """Process a single repository."""
+    reasons = _needs_processing(db, repo, stats, full, dry_run, quiet, stale)
+    if reasons is None:
+        return
+    cursor = (cursors or {}).get(repo.path)
+    work = _collect_repo(service, repo, since, sources, config, quiet, cursor, enrichment)
+    work.reasons = reasons
+    _write_repo(db, work, stats, quiet)
+
+
+def _process_repos_parallel(
+    db: Database,
+    service: RepositoryService,
+    repos: list,
+    stats: dict,
+    full: bool,
+    since: datetime,
+    sources: list,
+    config: dict,
+    dry_run: bool,
+    quiet: bool,
+    jobs: int,
+    on_done: Optional[Callable[[], None]] = None,
+    stale: Optional[Dict[str, List[str]]] = None,
+    cursors: Optional[Dict[str, EventCursor]] = None,
+    enrichment: Optional[EnrichmentService] = None,
+):
+    """Process repos with a worker pool and a single DB writer.
+
+    Staleness checks run up front on the calling thread. Workers then
+    run `_collect_repo` (git status, license/language detection, source
+    fetches, event scanning) concurrently, while the calling thread is
+    the only one that writes: it drains finished work through
+    `_write_repo` and commits every `_WRITE_BATCH_SIZE` repos.
+
+    Stats, scan errors and the refresh log end up identical to the
+    sequential path; only the order in which repos are written differs.
+    """
+    pending = {}
+    for repo in repos:
+        reasons = _needs_processing(db, repo, stats, full, dry_run, quiet, stale)
+        if reasons is not None:
+            pending[repo.path] = (repo, reasons)
+        elif on_done:
+            on_done()
+
+    if not pending:
+        return
+
+    written = 0
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(
+                _collect_repo, service, repo, since, sources, config, quiet,
+                (cursors or {}).get(repo.path), enrichment,
+            )
+            for repo, _ in pending.values()
+        ]
+        for future in as_completed(futures):
+            work = future.result()
+            work.reasons = pending[work.repo.path][1]
+            _write_repo(db, work, stats, quiet)
+            written += 1
+            if written % _WRITE_BATCH_SIZE == 0:
+                db.commit()
+            if on_done:
+                on_done()
+    db.commit()
+
+
+def _check_stale(service: RepositoryService, paths: list, config: dict, quiet: bool) -> int:
+    """Report stale repos for `refresh --check` using one bulk staleness pass.
+
+    Prints ``name (path) [reasons]`` per stale repo on stdout and a count on
+    stderr. Nothing is written to the database.
+
+    Returns:
+        Exit code: 1 if any repo needs refresh, else 0
+    """
+    with Database(config=config) as db:
+        repos = list(service.discover(paths=paths, recursive=True))
+        stale = find_stale_repos(db, [repo.path for repo in repos])
+
+    for repo in repos:
+        reasons = stale.get(repo.path)
+        if reasons:
+            click.echo(f"{repo.name} ({repo.path}) [{', '.join(reasons)}]")
+
+    if not quiet:
+        click.echo(f"{len(stale)} of {len(repos)} repos need refresh", err=True)
+    return 1 if stale else 0
+
+
 def _parse_since(since_str: str) -> datetime:
     """Parse a since string like '7d', '30d', '90d' into a datetime."""
     from datetime import timedelta
@@ -683,14 +1069,84 @@ def _print_summary_pretty(stats: dict):
     table.add_row("Repos scanned", str(stats.get('scanned', 0)))
     table.add_row("Repos updated", str(stats.get('updated', 0)))
     table.add_row("Repos skipped", str(stats.get('skipped', 0)))
+    reasons = stats.get('reasons')
+    if reasons:
+        ranked = sorted(reasons.items(), key=lambda kv: (-kv[1], kv[0]))
+        table.add_row("Dirty because", ", ".join(f"{k} ({v})" for k, v in ranked))
     table.add_row("Repos removed", str(stats.get('removed', 0)))
     table.add_row("Events added", str(stats.get('events_added', 0)))
+    github_cache = stats.get('github_cache')
+    if github_cache:
+        table.add_row(
+            "GitHub cache",
+            f"{github_cache['not_modified']} not modified (304), "
+            f"{github_cache['hits'] - github_cache['not_modified']} changed, "
+            f"{github_cache['misses']} new",
+        )
+    lookups = stats.get('registry_cache')
+    if lookups:
+        table.add_row(
+            "Registry cache",
+            f"{lookups['hits'] - lookups['negative_hits']} fresh, "
+            f"{lookups['negative_hits']} known missing, "
+            f"{lookups['misses']} queried",
+        )
+    waits = stats.get('rate_limit_waits')
+    if waits:
+        table.add_row(
+            "Rate-limit waits",
+            ", ".join(f"{name} {seconds:.1f}s" for name, seconds in sorted(waits.items())),
+        )
     table.add_row("Errors (this run)", str(stats.get('errors', 0)))
     table.add_row("Total scan errors", str(stats.get('total_scan_errors', 0)))
     table.add_row("Total in DB", str(stats.get('total_repos', 0)))
 
     console.print(table)
 
+    latency = stats.get('source_latency')
+    if latency:
+        console.print(_source_latency_table(latency))
+
+
+# One bar per LATENCY_BUCKETS bucket, scaled to the source's busiest bucket
+_BARS = ' ▁▂▃▄▅▆▇█'
+
+
+def _source_latency_table(latency: Dict[str, dict]):
+    """Per-source fetch latency, slowest total first: the long pole on top."""
+    from rich.table import Table
+
+    table = Table(title="Source Latency")
+    table.add_column("Source", style="cyan")
+    table.add_column("Fetches", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column(
+        f"Histogram ({_format_seconds(LATENCY_BUCKETS[0])}…{_format_seconds(LATENCY_BUCKETS[-1])}+)"
+    )
+    for source_id, row in latency.items():
+        peak = max(row['histogram']) or 1
+        # Round up, so a bucket with any fetches never renders blank
+        bars = ''.join(_BARS[-(-n * (len(_BARS) - 1) // peak)] for n in row['histogram'])
+        table.add_row(
+            source_id,
+            str(row['count']),
+            _format_seconds(row['total']),
+            _format_seconds(row['p50']),
+            _format_seconds(row['p95']),
+            _format_seconds(row['max']),
+            bars,
+        )
+    return table
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.1f}s"
+
 
 @click.command('db')
 @click.option('--info', 'show_info', is_flag=True, help='Show database info')
@@ -106,7 +106,7 @@ def export_handler(
     exporter = exporters[format_id]
     config = load_config()
     repos = _get_repos_from_query(
-        config, query_string, debug=debug,
+        config, query_string, debug=debug, with_tags=True,
         language=language, dirty=dirty, tag=tag, recent=recent,
     )
 
@@ -129,7 +129,7 @@ def _export_archive(output_file, query_string, debug, language, dirty, tag, rece
 
     config = load_config()
     repos = _get_repos_from_query(
-        config, query_string, debug=debug,
+        config, query_string, debug=debug, with_tags=True,
         language=language, dirty=dirty, tag=tag, recent=recent,
     )
 
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Tuple
 import click
 
 from ..config import load_config
-from ..database import Database, get_database_info, get_scan_error_count
+from ..database import Database, get_database_info, get_repo_count, get_scan_error_count
 from ..database.refresh_log import ensure_refresh_log_table, get_latest_refresh, get_refresh_log
 
 
@@ -195,13 +195,8 @@ def _gather_dashboard_data(config: dict, db_info: dict) -> Dict[str, Any]:
                     data['database']['last_refresh'] = row['scanned_at']
 
             # Get health stats
-            db.execute("SELECT COUNT(*) as count FROM repos WHERE is_clean = 1")
-            row = db.fetchone()
-            data['health']['clean'] = row['count'] if row else 0
-
-            db.execute("SELECT COUNT(*) as count FROM repos WHERE is_clean = 0")
-            row = db.fetchone()
-            data['health']['dirty'] = row['count'] if row else 0
+            data['health']['clean'] = get_repo_count(db, 'is_clean')
+            data['health']['dirty'] = get_repo_count(db, 'not is_clean')
 
             # Get language breakdown
             db.execute("""
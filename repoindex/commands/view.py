@@ -26,7 +26,7 @@ console_err = Console(stderr=True)
 def get_view_service() -> ViewService:
     """Get a ViewService instance, loading views."""
     config = load_config()
-    service = ViewService(config=config)
+    service = ViewService(config=config, use_index=True)
     service.load()
     return service
 
@@ -369,11 +369,15 @@ def get_default_config():
                 # "zenodo": False,
                 # "npm": False,
                 # "cargo": False,
+                # Lookup cache TTLs per registry (default 1d / 6h):
+                # "cran": {"enabled": True, "ttl": "7d", "negative_ttl": "1d"},
             },
             # Refresh log settings
             "log": {
                 "max_rows": 100,
             },
+            # Parallel repo workers (--jobs overrides); 1 = sequential
+            "jobs": 1,
         },
 
         # NOTE: Legacy keys (registries, cache) are ignored if present in old configs
@@ -439,6 +443,12 @@ refresh:
     # pypi: false
     # cran: false
     # npm: false
+    # Registry lookups are cached; TTLs per registry (default 1d, and 6h
+    # for packages that were not found). refresh --max-age overrides them.
+    # cran:
+    #   enabled: true
+    #   ttl: 7d
+    #   negative_ttl: 1d
 """
     config_path.write_text(example_content)
     logger.info(f"Example configuration saved to {config_path}")
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Optional, List
 
 from .config import logger, load_config
+from .infra.http import http_get
 
 
 def find_r_package_files(repo_path: str) -> List[str]:
@@ -134,7 +135,7 @@ def check_cran_package(package_name: str) -> Optional[Dict]:
         config = load_config()
         timeout = config.get('cran', {}).get('timeout_seconds', 10)
 
-        response = requests.get(
+        response = http_get(
             f'https://crandb.r-pkg.org/{package_name}', timeout=timeout,
         )
 
@@ -169,7 +170,7 @@ def check_bioconductor_package(package_name: str) -> Optional[Dict]:
         config = load_config()
         timeout = config.get('cran', {}).get('timeout_seconds', 10)
 
-        response = requests.get(
+        response = http_get(
             f'https://bioconductor.org/packages/json/3.20/bioc/{package_name}',
             timeout=timeout,
         )
@@ -31,6 +31,8 @@ from .repository import (
     get_repos_with_tags,
     delete_repo,
     needs_refresh,
+    refresh_reasons,
+    find_stale_repos,
     get_stale_repos,
     cleanup_missing_repos,
     get_repo_count,
@@ -38,6 +40,8 @@ from .repository import (
     get_repos_by_language,
     get_repos_by_tag,
     record_to_domain,
+    upsert_publications,
+    sync_derived_tags,
 )
 from .events import (
     insert_event,
@@ -50,12 +54,25 @@ from .events import (
     has_event,
     event_count,
     last_event_timestamp,
+    delete_events_for_repo,
+    prune_unreachable_events,
+    get_event_cursors,
+    save_event_cursor,
+)
+from .languages import (
+    get_language_stats,
+    save_language_stats,
+)
+from .detections import (
+    get_source_detections,
+    save_source_detections,
 )
 from .query_compiler import (
     compile_query,
     CompiledQuery,
     QueryCompiler,
     QueryCompileError,
+    register_functions,
 )
 from .errors import (
     ensure_scan_errors_table,
@@ -94,6 +111,8 @@ __all__ = [
     'get_repos_with_tags',
     'delete_repo',
     'needs_refresh',
+    'refresh_reasons',
+    'find_stale_repos',
     'get_stale_repos',
     'cleanup_missing_repos',
     'get_repo_count',
@@ -101,6 +120,8 @@ __all__ = [
     'get_repos_by_language',
     'get_repos_by_tag',
     'record_to_domain',
+    'upsert_publications',
+    'sync_derived_tags',
     # Events
     'insert_event',
     'insert_events',
@@ -112,11 +133,22 @@ __all__ = [
     'has_event',
     'event_count',
     'last_event_timestamp',
+    'delete_events_for_repo',
+    'prune_unreachable_events',
+    'get_event_cursors',
+    'save_event_cursor',
+    # Language stats
+    'get_language_stats',
+    'save_language_stats',
+    # Source detections
+    'get_source_detections',
+    'save_source_detections',
     # Query compiler
     'compile_query',
     'CompiledQuery',
     'QueryCompiler',
     'QueryCompileError',
+    'register_functions',
     # Scan errors
     'ensure_scan_errors_table',
     'record_scan_error',
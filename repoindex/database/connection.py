@@ -11,6 +11,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Generator
 
+from .query_compiler import register_functions
 from .schema import ensure_schema
 
 
@@ -76,6 +77,7 @@ def get_connection(
     # Configure connection
     conn.row_factory = sqlite3.Row  # Enable dict-like access
     conn.execute("PRAGMA foreign_keys = ON")  # Enforce foreign keys
+    register_functions(conn)  # fuzzy_ratio() etc. for compiled queries
 
     # Use WAL mode for better concurrent access (unless read-only)
     if not read_only:
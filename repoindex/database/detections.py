@@ -0,0 +1,72 @@
+"""
+Source detection persistence for repoindex.
+
+Stores each repo's cached detect() answers (see repoindex.sources.detection)
+so refresh only re-runs a source's detection when one of the files it
+declares has changed, and so a registry source's package name comes
+back without re-parsing its manifest.
+"""
+
+from typing import Iterable, Tuple
+
+from ..sources.detection import Detection, DetectionEntries
+from .connection import Database
+
+
+def ensure_source_detections_table(db: Database) -> None:
+    """
+    Ensure the source_detections table exists.
+
+    Uses CREATE TABLE IF NOT EXISTS so it's safe to call on every refresh,
+    including against databases created before the table was added.
+    """
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS source_detections (
+            repo_id INTEGER NOT NULL,
+            source_id TEXT NOT NULL,
+            input_key TEXT NOT NULL,
+            detected INTEGER NOT NULL,
+            detail TEXT,
+            PRIMARY KEY (repo_id, source_id),
+            FOREIGN KEY (repo_id) REFERENCES repos(id) ON DELETE CASCADE
+        )
+    """)
+
+
+def get_source_detections(db: Database) -> DetectionEntries:
+    """
+    Load every stored detection in one query.
+
+    Returns:
+        Dict of (repo path, source id) -> (input key, detection), ready
+        to seed a DetectionCache
+    """
+    ensure_source_detections_table(db)
+    db.execute("""
+        SELECT r.path, d.source_id, d.input_key, d.detected, d.detail
+        FROM source_detections d JOIN repos r ON r.id = d.repo_id
+    """)
+    return {
+        (row['path'], row['source_id']): (
+            row['input_key'], row['detail'] or bool(row['detected']),
+        )
+        for row in db.fetchall()
+    }
+
+
+def save_source_detections(db: Database, repo_id: int,
+                           entries: Iterable[Tuple[str, str, Detection]]) -> None:
+    """
+    Store (source_id, input key, detection) entries for a repo.
+
+    Runs once per repo in refresh's writer, so it is a single executemany()
+    and relies on the table existing (schema, or get_source_detections()).
+    """
+    db.executemany(
+        """INSERT OR REPLACE INTO source_detections
+           (repo_id, source_id, input_key, detected, detail)
+           VALUES (?, ?, ?, ?, ?)""",
+        [(repo_id, source_id, input_key, 1 if detected else 0,
+          detected if isinstance(detected, str) else None)
+         for source_id, input_key, detected in entries]
+    )
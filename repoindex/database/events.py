@@ -6,12 +6,37 @@ Provides CRUD operations for events (commits, tags, releases, etc.)
 
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Generator
+from typing import AbstractSet, Dict, Any, Optional, List, Generator, Iterable
 
-from ..domain.event import Event
+from ..domain.event import Event, EventCursor
 from .connection import Database
 
 
+# Rows per executemany() call in insert_events()
+EVENT_BATCH_SIZE = 1000
+
+_INSERT_EVENT_SQL = """
+    INSERT OR IGNORE INTO events
+    (repo_id, event_id, type, timestamp, ref, message, author, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _event_row(event: Event, repo_id: int) -> tuple:
+    """Build the INSERT parameter tuple for an event."""
+    data = event.data
+    return (
+        repo_id,
+        event.id,  # Stable event ID for deduplication
+        event.type,
+        event.timestamp.isoformat(),
+        data.get('ref') or data.get('tag') or data.get('branch'),
+        data.get('message'),
+        data.get('author'),
+        json.dumps(data),
+    )
+
+
 def insert_event(db: Database, event: Event, repo_id: int) -> int:
     """
     Insert an event.
@@ -24,40 +49,61 @@ def insert_event(db: Database, event: Event, repo_id: int) -> int:
     Returns:
         Row ID of the inserted event
     """
-    db.execute("""
-        INSERT OR IGNORE INTO events
-        (repo_id, event_id, type, timestamp, ref, message, author, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        repo_id,
-        event.id,  # Stable event ID for deduplication
-        event.type,
-        event.timestamp.isoformat(),
-        event.data.get('ref') or event.data.get('tag') or event.data.get('branch'),
-        event.data.get('message'),
-        event.data.get('author'),
-        json.dumps(event.data),
-    ))
+    db.execute(_INSERT_EVENT_SQL, _event_row(event, repo_id))
     return db.lastrowid or 0
 
 
-def insert_events(db: Database, events: List[Event], repo_id: int) -> int:
+def insert_events(
+    db: Database,
+    events: Iterable[Event],
+    repo_id: int,
+    batch_size: int = EVENT_BATCH_SIZE,
+    commit_every: Optional[int] = None,
+) -> int:
     """
     Insert multiple events efficiently.
 
+    Rows are written with one prepared executemany() per batch, and the
+    number actually inserted (duplicates are ignored by event_id) is taken
+    from the connection's change counter. All batches share the caller's
+    transaction unless commit_every is set, in which case the transaction
+    is committed after roughly every commit_every rows.
+
     Args:
         db: Database connection
-        events: List of Event domain objects
+        events: Event domain objects (any iterable; consumed lazily)
         repo_id: ID of the associated repository
+        batch_size: Rows per executemany() call
+        commit_every: Commit after this many rows (None = leave to caller)
 
     Returns:
         Number of events inserted
     """
+    conn = db.conn
     inserted = 0
+    since_commit = 0
+    batch: List[tuple] = []
+
+    def flush() -> int:
+        before = conn.total_changes
+        db.executemany(_INSERT_EVENT_SQL, batch)
+        return conn.total_changes - before
+
     for event in events:
-        result = insert_event(db, event, repo_id)
-        if result:
-            inserted += 1
+        batch.append(_event_row(event, repo_id))
+        if len(batch) >= batch_size:
+            inserted += flush()
+            since_commit += len(batch)
+            batch = []
+            if commit_every and since_commit >= commit_every:
+                db.commit()
+                since_commit = 0
+
+    if batch:
+        inserted += flush()
+        if commit_every:
+            db.commit()
+
     return inserted
 
 
@@ -194,12 +240,49 @@ def count_events(
     return row[0] if row else 0
 
 
-def delete_events_for_repo(db: Database, repo_id: int) -> int:
-    """Delete all events for a repository."""
-    db.execute("DELETE FROM events WHERE repo_id = ?", (repo_id,))
+def delete_events_for_repo(
+    db: Database,
+    repo_id: int,
+    types: Optional[List[str]] = None
+) -> int:
+    """Delete all events (or only those of the given types) for a repository."""
+    if types:
+        placeholders = ', '.join('?' for _ in types)
+        db.execute(
+            f"DELETE FROM events WHERE repo_id = ? AND type IN ({placeholders})",
+            (repo_id, *types)
+        )
+    else:
+        db.execute("DELETE FROM events WHERE repo_id = ?", (repo_id,))
     return db.rowcount
 
 
+def prune_unreachable_events(
+    db: Database,
+    repo_id: int,
+    reachable: AbstractSet[str],
+    types: Iterable[str] = ('commit', 'merge'),
+) -> int:
+    """
+    Delete a repository's commit/merge events whose hash is not in
+    `reachable` (e.g. commits dropped by a rebase or reset).
+
+    Returns:
+        Number of events deleted
+    """
+    types = list(types)
+    placeholders = ', '.join('?' for _ in types)
+    db.execute(
+        f"SELECT id, json_extract(metadata, '$.hash') AS hash FROM events "
+        f"WHERE repo_id = ? AND type IN ({placeholders})",
+        (repo_id, *types)
+    )
+    stale = [(row['id'],) for row in db.fetchall() if row['hash'] not in reachable]
+    if stale:
+        db.executemany("DELETE FROM events WHERE id = ?", stale)
+    return len(stale)
+
+
 def get_event_types(db: Database) -> List[str]:
     """Get list of distinct event types in database."""
     db.execute("SELECT DISTINCT type FROM events ORDER BY type")
@@ -370,3 +453,59 @@ def last_event_timestamp(
     if row and row['ts']:
         return datetime.fromisoformat(row['ts'])
     return None
+
+
+def ensure_event_cursor_table(db: Database) -> None:
+    """
+    Ensure the event_cursors table exists.
+
+    Uses CREATE TABLE IF NOT EXISTS so it's safe to call on every refresh,
+    including against databases created before incremental scanning.
+    """
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS event_cursors (
+            repo_id INTEGER PRIMARY KEY,
+            head TEXT,
+            tags TEXT,
+            reflog TEXT,
+            since TEXT,
+            scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (repo_id) REFERENCES repos(id) ON DELETE CASCADE
+        )
+    """)
+
+
+def get_event_cursors(db: Database) -> Dict[str, EventCursor]:
+    """
+    Load every repo's event scan cursor in one query.
+
+    Returns:
+        Dict of repo path -> EventCursor
+    """
+    ensure_event_cursor_table(db)
+    db.execute("""
+        SELECT r.path, c.head, c.tags, c.reflog, c.since
+        FROM event_cursors c JOIN repos r ON r.id = c.repo_id
+    """)
+    return {
+        row['path']: EventCursor(
+            head=row['head'], tags=row['tags'], reflog=row['reflog'], since=row['since'],
+        )
+        for row in db.fetchall()
+    }
+
+
+def save_event_cursor(db: Database, repo_id: int, cursor: Optional[EventCursor]) -> None:
+    """
+    Store (or clear, if cursor is None) a repo's event scan cursor.
+
+    Relies on the table existing (schema, or get_event_cursors()).
+    """
+    if cursor is None:
+        db.execute("DELETE FROM event_cursors WHERE repo_id = ?", (repo_id,))
+        return
+    db.execute(
+        """INSERT OR REPLACE INTO event_cursors (repo_id, head, tags, reflog, since)
+           VALUES (?, ?, ?, ?, ?)""",
+        (repo_id, cursor.head, cursor.tags, cursor.reflog, cursor.since)
+    )
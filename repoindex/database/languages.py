@@ -0,0 +1,61 @@
+"""
+Language stats persistence for repoindex.
+
+Stores each repo's tree-keyed language stats (see repoindex.languages) so
+refresh only recounts languages when a repo's tracked tree changes.
+"""
+
+import json
+from typing import Dict
+
+from ..languages import LanguageStats
+from .connection import Database
+
+
+def ensure_language_stats_table(db: Database) -> None:
+    """
+    Ensure the language_stats table exists.
+
+    Uses CREATE TABLE IF NOT EXISTS so it's safe to call on every refresh,
+    including against databases created before the table was added.
+    """
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS language_stats (
+            repo_id INTEGER PRIMARY KEY,
+            tree_key TEXT NOT NULL,
+            stats TEXT NOT NULL,
+            computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (repo_id) REFERENCES repos(id) ON DELETE CASCADE
+        )
+    """)
+
+
+def get_language_stats(db: Database) -> Dict[str, LanguageStats]:
+    """
+    Load every stored result in one query.
+
+    Returns:
+        Dict of tree key -> language stats, ready to seed a LanguageCache
+    """
+    ensure_language_stats_table(db)
+    db.execute("SELECT tree_key, stats FROM language_stats")
+    result = {}
+    for row in db.fetchall():
+        try:
+            result[row['tree_key']] = json.loads(row['stats'])
+        except (TypeError, ValueError):
+            continue
+    return result
+
+
+def save_language_stats(db: Database, repo_id: int, tree_key: str, stats: LanguageStats) -> None:
+    """
+    Store the language stats a repo's tracked tree resolved to.
+
+    Relies on the table existing (schema, or get_language_stats()).
+    """
+    db.execute(
+        """INSERT OR REPLACE INTO language_stats (repo_id, tree_key, stats)
+           VALUES (?, ?, ?)""",
+        (repo_id, tree_key, json.dumps(stats))
+    )
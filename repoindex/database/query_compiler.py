@@ -16,6 +16,12 @@ DSL Grammar:
     operator   := '==' | '!=' | '>' | '<' | '>=' | '<=' | '~=' | 'contains' | 'in'
     value      := string | number | boolean
 
+Fuzzy operators match like query.Query, but inside SQLite: `~=` and
+`contains` try a plain LIKE first and only then call the fuzzy_ratio /
+fuzzy_partial_ratio functions (see register_functions). `tags` compares
+against the repo's rows in the tags table; `'x' in field` is
+`field contains 'x'`.
+
 Examples:
     language == 'Python'
     language == 'Python' and stars > 10
@@ -24,13 +30,117 @@ Examples:
     has_event('commit', since='30d')
     @python-active and is_clean
     language == 'Python' order by stars desc limit 10
+    name ~= 'repoindx'
+    tags contains 'topic:ml/*'
 """
 
+import math
 import re
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+import sqlite3
+from dataclasses import dataclass, replace
+from typing import List, Tuple, Optional, Dict, Any, Sequence
 from datetime import datetime, timedelta
 
+from rapidfuzz import fuzz
+
+
+# Separator for the aggregated tag column (ASCII unit separator, which
+# cannot appear in a tag, unlike ',')
+TAG_SEPARATOR = '\x1f'
+
+# Aggregated tags of the current repos row: one correlated subquery per
+# result row (an index lookup on the tags primary key) instead of a
+# query per repo
+_TAGS_SUBQUERY = (
+    "(SELECT GROUP_CONCAT(tg.tag, char(31)) FROM tags tg "
+    "WHERE tg.repo_id = repos.id) AS tags_joined"
+)
+
+_COLUMN_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Default similarity (0-100) for ~= and contains, as in query.Query
+FUZZY_THRESHOLD = 80
+
+
+def _fuzzy_ratio(a, b) -> float:
+    if a is None or b is None:
+        return 0.0
+    return fuzz.ratio(str(a).lower(), str(b).lower())
+
+
+def _fuzzy_partial_ratio(a, b) -> float:
+    if a is None or b is None:
+        return 0.0
+    return fuzz.partial_ratio(str(a).lower(), str(b).lower())
+
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    """
+    Register the SQL functions compiled queries call.
+
+    fuzzy_ratio(a, b) and fuzzy_partial_ratio(a, b) are rapidfuzz's
+    ratio / partial_ratio of the lowercased values (0 for NULL).
+    """
+    conn.create_function('fuzzy_ratio', 2, _fuzzy_ratio, deterministic=True)
+    conn.create_function('fuzzy_partial_ratio', 2, _fuzzy_partial_ratio, deterministic=True)
+
+
+def _ratio_length_window(length: int, threshold: float) -> Tuple[int, int]:
+    """
+    Lengths a string can have and still reach fuzz.ratio >= threshold
+    against one of `length` characters (ratio is at most
+    200 * min(a, b) / (a + b)).
+    """
+    threshold = min(max(threshold, 1), 100)
+    return (
+        math.ceil(length * threshold / (200 - threshold)),
+        math.floor(length * (200 - threshold) / threshold),
+    )
+
+
+def _glob_escape(text: str) -> str:
+    return re.sub(r'([*?\[])', r'[\1]', text)
+
+
+def _is_hierarchical_pattern(value: Any) -> bool:
+    """Whether a tag value is matched hierarchically (as query.Query does)."""
+    return isinstance(value, str) and ':' in value and ('*' in value or '/' in value)
+
+
+def _hierarchical_tag_match(pattern: str) -> Tuple[str, List[Any]]:
+    """
+    Condition on t.tag equivalent to tags.match_hierarchical_tag: the
+    levels before the first '*' select a tag and everything below it
+    ('topic:ml/*' and 'topic:ml' both match 'topic:ml' and 'topic:ml/nlp').
+    """
+    key, _, value = pattern.partition(':')
+    levels = value.split('/') if value else []
+    if '*' in levels:
+        levels = levels[:levels.index('*')]
+    if levels:
+        prefix = f"{key}:{'/'.join(levels)}"
+        below = f"{_glob_escape(prefix)}/*"
+    else:
+        prefix = key
+        below = f"{_glob_escape(key)}:*"
+    return "(t.tag = ? OR t.tag GLOB ?)", [prefix, below]
+
+
+def _select_list(with_tags: bool, columns: Optional[Sequence[str]]) -> str:
+    """SELECT list for repos rows: all or some columns, plus tags."""
+    if columns is None:
+        if not with_tags:
+            return "*"
+        select = "repos.*"
+    else:
+        bad = [c for c in columns if not _COLUMN_RE.match(c)]
+        if bad:
+            raise QueryCompileError(f"Invalid column name(s): {', '.join(bad)}")
+        select = ", ".join(f"repos.{c}" for c in columns)
+    if with_tags:
+        select = f"{select}, {_TAGS_SUBQUERY}" if select else _TAGS_SUBQUERY
+    return select or "repos.id"
+
 
 @dataclass
 class CompiledQuery:
@@ -39,6 +149,59 @@ class CompiledQuery:
     params: List[Any]
     order_by: Optional[List[Tuple[str, str]]] = None
     limit: Optional[int] = None
+    with_tags: bool = False
+    # Selected repos columns (None = all)
+    columns: Optional[List[str]] = None
+    # Everything after "FROM repos" (WHERE / ORDER BY / LIMIT)
+    clauses: str = ''
+    # The part of `clauses` that decides which rows match (joins, WHERE)
+    filters: str = ''
+
+    def to_record(self, row) -> Dict[str, Any]:
+        """
+        A result row as a dict, with 'tags' as a list when compiled
+        with_tags.
+        """
+        record = dict(row)
+        if self.with_tags:
+            joined = record.pop('tags_joined', None)
+            record['tags'] = joined.split(TAG_SEPARATOR) if joined else []
+        return record
+
+    def project(self, columns: Optional[Sequence[str]],
+                with_tags: Optional[bool] = None) -> 'CompiledQuery':
+        """
+        The same query selecting only `columns` (None = all).
+
+        Args:
+            columns: repos columns to select; the caller checks they exist
+            with_tags: Select tags too (default: as compiled)
+
+        Raises:
+            QueryCompileError: If a column name is not an identifier
+        """
+        if with_tags is None:
+            with_tags = self.with_tags
+        columns = list(columns) if columns is not None else None
+        return replace(
+            self,
+            sql=f"SELECT {_select_list(with_tags, columns)} FROM repos{self.clauses}",
+            with_tags=with_tags,
+            columns=columns,
+        )
+
+    def count_query(self) -> 'CompiledQuery':
+        """
+        The same query as a single ``SELECT COUNT(*) AS count``.
+
+        Rows are counted inside SQLite instead of being fetched; ORDER BY
+        is dropped, and a LIMIT is kept by counting a limited subquery.
+        """
+        if self.limit:
+            sql = f"SELECT COUNT(*) AS count FROM (SELECT 1 FROM repos{self.filters} LIMIT {int(self.limit)})"
+        else:
+            sql = f"SELECT COUNT(*) AS count FROM repos{self.filters}"
+        return replace(self, sql=sql, with_tags=False, columns=None)
 
 
 class QueryCompileError(Exception):
@@ -147,28 +310,49 @@ class QueryCompiler:
         # query.params = ['Python', 10]
     """
 
-    def __init__(self, views: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        views: Optional[Dict[str, str]] = None,
+        fuzzy_threshold: float = FUZZY_THRESHOLD,
+        nocase: bool = False,
+    ):
         """
         Initialize compiler.
 
         Args:
             views: Dictionary of view name -> query string for @view expansion
+            fuzzy_threshold: Similarity (0-100) ~= and contains require
+            nocase: Compare text with ==, != and in case-insensitively
         """
         self.views = views or {}
+        self.fuzzy_threshold = fuzzy_threshold
+        self.nocase = nocase
 
-    def compile(self, query_str: str) -> CompiledQuery:
+    def compile(
+        self,
+        query_str: str,
+        with_tags: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        count: bool = False,
+    ) -> CompiledQuery:
         """
         Compile a query string to SQL.
 
         Args:
             query_str: Query in DSL format
+            with_tags: Also select each repo's tags in the same statement
+                (read them with CompiledQuery.to_record)
+            columns: Select only these repos columns (default: all)
+            count: Compile to ``SELECT COUNT(*) AS count`` instead (see
+                CompiledQuery.count_query)
 
         Returns:
             CompiledQuery with SQL, params, order_by, and limit
         """
         query_str = query_str.strip()
         if not query_str:
-            return CompiledQuery(sql="SELECT * FROM repos", params=[])
+            compiled = CompiledQuery(sql="", params=[])
+            return compiled.count_query() if count else compiled.project(columns, with_tags)
 
         # Extract limit first (must be at the end), then order by
         query_str, limit = self._extract_limit(query_str)
@@ -177,10 +361,8 @@ class QueryCompiler:
         # Compile predicate
         where_clause, params = self._compile_predicate(query_str.strip())
 
-        if where_clause:
-            sql = f"SELECT * FROM repos WHERE {where_clause}"
-        else:
-            sql = "SELECT * FROM repos"
+        filters = f" WHERE {where_clause}" if where_clause else ""
+        clauses = filters
 
         # Add order by
         if order_by:
@@ -188,18 +370,21 @@ class QueryCompiler:
             for field, direction in order_by:
                 col = FIELD_MAPPINGS.get(field, field)
                 order_parts.append(f"{col} {direction.upper()}")
-            sql += " ORDER BY " + ", ".join(order_parts)
+            clauses += " ORDER BY " + ", ".join(order_parts)
 
         # Add limit
         if limit:
-            sql += f" LIMIT {limit}"
+            clauses += f" LIMIT {limit}"
 
-        return CompiledQuery(
-            sql=sql,
+        compiled = CompiledQuery(
+            sql="",
             params=params,
             order_by=order_by,
-            limit=limit
+            limit=limit,
+            clauses=clauses,
+            filters=filters,
         )
+        return compiled.count_query() if count else compiled.project(columns, with_tags)
 
     def _extract_order_by(self, query: str) -> Tuple[str, Optional[List[Tuple[str, str]]]]:
         """Extract ORDER BY clause from query."""
@@ -322,7 +507,7 @@ class QueryCompiler:
                 view_name = token[1:]
                 if view_name in self.views:
                     view_query = self.views[view_name]
-                    sub_compiler = QueryCompiler(self.views)
+                    sub_compiler = QueryCompiler(self.views, self.fuzzy_threshold, self.nocase)
                     # Only compile the predicate part (strip order by / limit)
                     view_query, _ = self._extract_order_by(view_query)
                     view_query, _ = self._extract_limit(view_query)
@@ -521,21 +706,30 @@ class QueryCompiler:
         value: str
     ) -> Tuple[str, List[Any]]:
         """Compile a comparison expression."""
-        # Map field name
-        col = FIELD_MAPPINGS.get(field, field)
+        # 'value' in field -> field contains 'value'
+        if op.lower() == 'in' and field[:1] in ("'", '"'):
+            field, op, value = value, 'contains', field
 
         # Parse value
         parsed_value = self._parse_value(value)
 
+        if field == 'tags':
+            return self._compile_tag_comparison(op, parsed_value)
+
+        # Map field name
+        col = FIELD_MAPPINGS.get(field, field)
+        threshold = self.fuzzy_threshold
+        collate = " COLLATE NOCASE" if self.nocase and isinstance(parsed_value, str) else ""
+
         # Map operator
         if op in ('==', '='):
             if parsed_value is None:
                 return f"{col} IS NULL", []
-            return f"{col} = ?", [parsed_value]
+            return f"{col} = ?{collate}", [parsed_value]
         elif op == '!=':
             if parsed_value is None:
                 return f"{col} IS NOT NULL", []
-            return f"{col} != ?", [parsed_value]
+            return f"{col} != ?{collate}", [parsed_value]
         elif op == '>':
             return f"{col} > ?", [parsed_value]
         elif op == '<':
@@ -544,11 +738,24 @@ class QueryCompiler:
             return f"{col} >= ?", [parsed_value]
         elif op == '<=':
             return f"{col} <= ?", [parsed_value]
-        elif op == '~=' or op.lower() == 'like':
-            # Fuzzy match - use LIKE with wildcards
+        elif op == '~=':
+            # Fuzzy match: a substring hit needs no function call; otherwise
+            # only values of a length that can reach the threshold are scored
+            text = str(parsed_value)
+            shortest, longest = _ratio_length_window(len(text), threshold)
+            return (
+                f"({col} LIKE ? OR (length({col}) BETWEEN ? AND ? "
+                f"AND fuzzy_ratio({col}, ?) >= ?))",
+                [f"%{text}%", shortest, longest, text, threshold],
+            )
+        elif op.lower() == 'like':
             return f"{col} LIKE ?", [f"%{parsed_value}%"]
         elif op.lower() == 'contains':
-            return f"{col} LIKE ?", [f"%{parsed_value}%"]
+            text = str(parsed_value)
+            return (
+                f"({col} LIKE ? OR fuzzy_partial_ratio({col}, ?) >= ?)",
+                [f"%{text}%", text, threshold],
+            )
         elif op.lower() == 'in':
             # value should be a comma-separated list or JSON array
             if isinstance(parsed_value, str):
@@ -556,10 +763,38 @@ class QueryCompiler:
             else:
                 values = [parsed_value]
             placeholders = ','.join(['?' for _ in values])
-            return f"{col} IN ({placeholders})", values
+            return f"{col}{collate} IN ({placeholders})", values
         else:
             raise QueryCompileError(f"Unknown operator: {op}")
 
+    def _compile_tag_comparison(self, op: str, value: Any) -> Tuple[str, List[Any]]:
+        """
+        Compile ``tags <op> value`` to EXISTS over the repo's tags.
+
+        Hierarchical patterns match the tag and its children; otherwise
+        == is an exact tag, and contains / ~= accept an exact tag or one
+        similar enough to the value.
+        """
+        lowered = op.lower()
+        tag = str(value)
+        if lowered in ('==', '=', '~=', 'contains') and _is_hierarchical_pattern(value):
+            match, params = _hierarchical_tag_match(tag)
+        elif lowered in ('==', '=', '!='):
+            match, params = "t.tag = ?", [tag]
+        elif lowered == 'contains':
+            match = "(t.tag = ? OR fuzzy_partial_ratio(t.tag, ?) >= ?)"
+            params = [tag, tag, self.fuzzy_threshold]
+        elif lowered == '~=':
+            match = "(t.tag = ? OR fuzzy_ratio(t.tag, ?) >= ?)"
+            params = [tag, tag, self.fuzzy_threshold]
+        else:
+            raise QueryCompileError(f"Unsupported operator for tags: {op}")
+
+        sql = f"EXISTS (SELECT 1 FROM tags t WHERE t.repo_id = repos.id AND {match})"
+        if lowered == '!=':
+            sql = f"NOT {sql}"
+        return sql, params
+
     def _parse_value(self, value: str) -> Any:
         """Parse a value token into Python type."""
         # Remove quotes from strings
@@ -660,7 +895,11 @@ class QueryCompiler:
 
 def compile_query(
     query_str: str,
-    views: Optional[Dict[str, str]] = None
+    views: Optional[Dict[str, str]] = None,
+    with_tags: bool = False,
+    columns: Optional[Sequence[str]] = None,
+    count: bool = False,
+    nocase: bool = False,
 ) -> CompiledQuery:
     """
     Convenience function to compile a query.
@@ -668,9 +907,13 @@ def compile_query(
     Args:
         query_str: Query in DSL format
         views: Optional view definitions for @view expansion
+        with_tags: Also select each repo's tags (see QueryCompiler.compile)
+        columns: Select only these repos columns (default: all)
+        count: Compile to a COUNT(*) query
+        nocase: Compare text with ==, != and in case-insensitively
 
     Returns:
         CompiledQuery object
     """
-    compiler = QueryCompiler(views=views)
-    return compiler.compile(query_str)
+    compiler = QueryCompiler(views=views, nocase=nocase)
+    return compiler.compile(query_str, with_tags=with_tags, columns=columns, count=count)
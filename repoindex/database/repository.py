@@ -6,28 +6,38 @@ domain objects and database records.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Generator
+from typing import Dict, Any, Iterable, List, Optional, Generator
 
 from ..domain.repository import Repository, GitStatus, GitHubMetadata, LicenseInfo
 from ..citation import parse_citation_file
+from ..infra.fingerprint import fingerprint_changes, repo_fingerprint
 from .connection import Database
+from .query_compiler import compile_query
 
 
-def upsert_repo(db: Database, repo: Repository) -> int:
+def upsert_repo(
+    db: Database,
+    repo: Repository,
+    fingerprint: Optional[Dict[str, str]] = None,
+) -> int:
     """
     Insert or update a repository.
 
     Args:
         db: Database connection
         repo: Repository domain object
+        fingerprint: Stat fingerprint taken before the repo was read
+            (computed now if None). Capturing it first means a change made
+            while the repo is being scanned still marks it dirty next time.
 
     Returns:
         Row ID of the inserted/updated repository
     """
     # Convert domain object to database record
-    record = _repo_to_record(repo)
+    record = _repo_to_record(repo, fingerprint)
 
     # Check if exists
     db.execute("SELECT id FROM repos WHERE path = ?", (repo.path,))
@@ -53,7 +63,10 @@ def upsert_repo(db: Database, repo: Repository) -> int:
     return repo_id
 
 
-def _repo_to_record(repo: Repository) -> Dict[str, Any]:
+def _repo_to_record(
+    repo: Repository,
+    fingerprint: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
     """Convert Repository domain object to database record."""
     record: Dict[str, Any] = {
         'name': repo.name,
@@ -110,10 +123,13 @@ def _repo_to_record(repo: Repository) -> Dict[str, Any]:
             'github_pushed_at': repo.github.pushed_at,
         })
 
-    # Git index mtime for smart refresh
+    # Git index mtime and stat fingerprint for smart refresh
     git_index = Path(repo.path) / '.git' / 'index'
     if git_index.exists():
         record['git_index_mtime'] = git_index.stat().st_mtime
+    if fingerprint is None:
+        fingerprint = repo_fingerprint(repo.path)
+    record['fingerprint'] = json.dumps(fingerprint, sort_keys=True) if fingerprint else None
 
     # Check for common files
     repo_path = Path(repo.path)
@@ -189,49 +205,42 @@ def _upsert_publication(db: Database, repo_id: int, package) -> None:
         repo_id: Repository ID
         package: PackageMetadata object
     """
-    if not package:
-        return
+    if package:
+        upsert_publications(db, repo_id, [package])
+
+
+_UPSERT_PUBLICATION_SQL = """
+    INSERT INTO publications (
+        repo_id, registry, package_name, current_version,
+        published, url, doi, downloads_total, downloads_30d, last_published
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (repo_id, registry) DO UPDATE SET
+        package_name = excluded.package_name,
+        current_version = excluded.current_version,
+        published = excluded.published,
+        url = excluded.url,
+        doi = excluded.doi,
+        downloads_total = excluded.downloads_total,
+        downloads_30d = excluded.downloads_30d,
+        last_published = excluded.last_published,
+        scanned_at = CURRENT_TIMESTAMP
+"""
 
-    # Check if publication exists for this repo and registry
-    db.execute(
-        "SELECT id FROM publications WHERE repo_id = ? AND registry = ?",
-        (repo_id, package.registry)
-    )
-    existing = db.fetchone()
 
-    if existing:
-        # Update existing
-        db.execute("""
-            UPDATE publications SET
-                package_name = ?,
-                current_version = ?,
-                published = ?,
-                url = ?,
-                doi = ?,
-                downloads_total = ?,
-                downloads_30d = ?,
-                last_published = ?,
-                scanned_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (
-            package.name,
-            package.version,
-            package.published,
-            package.url,
-            getattr(package, 'doi', None),
-            package.downloads,
-            getattr(package, 'downloads_30d', None),
-            package.last_updated,
-            existing['id']
-        ))
-    else:
-        # Insert new
-        db.execute("""
-            INSERT INTO publications (
-                repo_id, registry, package_name, current_version,
-                published, url, doi, downloads_total, downloads_30d, last_published
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+def upsert_publications(db: Database, repo_id: int, packages: Iterable) -> None:
+    """
+    Insert or update a repository's publications in one statement.
+
+    One prepared INSERT ... ON CONFLICT (repo_id, registry) runs over all
+    packages, instead of a SELECT plus an INSERT or UPDATE per package.
+
+    Args:
+        db: Database connection
+        repo_id: Repository ID
+        packages: PackageMetadata objects (one per registry)
+    """
+    rows = [
+        (
             repo_id,
             package.registry,
             package.name,
@@ -241,8 +250,77 @@ def _upsert_publication(db: Database, repo_id: int, package) -> None:
             getattr(package, 'doi', None),
             package.downloads,
             getattr(package, 'downloads_30d', None),
-            package.last_updated
-        ))
+            package.last_updated,
+        )
+        for package in packages if package
+    ]
+    if rows:
+        db.executemany(_UPSERT_PUBLICATION_SQL, rows)
+
+
+# Repos per SELECT when reading current tags (SQLite's default host
+# parameter limit was 999 before 3.32)
+_TAG_SYNC_CHUNK = 500
+
+_UPSERT_DERIVED_TAG_SQL = """
+    INSERT INTO tags (repo_id, tag, source) VALUES (?, ?, ?)
+    ON CONFLICT (repo_id, tag) DO UPDATE SET source = excluded.source
+    WHERE tags.source != 'user'
+"""
+
+
+def sync_derived_tags(db: Database, desired: Dict[int, Iterable]) -> None:
+    """
+    Reconcile derived tags for a batch of repos.
+
+    Reads the batch's current derived tags with one SELECT per
+    _TAG_SYNC_CHUNK repos, then applies the difference as two prepared
+    statement sets: one DELETE over every stale tag and one
+    INSERT ... ON CONFLICT over every new or re-sourced tag. An unchanged
+    repo costs only its share of the read. Tags with source='user' are
+    never modified; a derived tag that matches a user tag leaves the
+    user tag as it is.
+
+    Args:
+        db: Database connection
+        desired: repo_id -> (tag, source) pairs; if a tag appears more
+            than once, the first source wins. A repo mapped to no pairs
+            loses all its derived tags.
+    """
+    wanted: Dict[int, Dict[str, str]] = {}
+    for repo_id, pairs in desired.items():
+        tags = wanted.setdefault(repo_id, {})
+        for tag, source in pairs:
+            tags.setdefault(tag, source)
+    if not wanted:
+        return
+
+    current: Dict[int, Dict[str, str]] = {}
+    repo_ids = list(wanted)
+    for i in range(0, len(repo_ids), _TAG_SYNC_CHUNK):
+        chunk = repo_ids[i:i + _TAG_SYNC_CHUNK]
+        db.execute(
+            f"SELECT repo_id, tag, source FROM tags "
+            f"WHERE source != 'user' AND repo_id IN ({','.join('?' * len(chunk))})",
+            tuple(chunk)
+        )
+        for row in db.fetchall():
+            current.setdefault(row['repo_id'], {})[row['tag']] = row['source']
+
+    stale = [
+        (repo_id, tag)
+        for repo_id, tags in current.items()
+        for tag in tags if tag not in wanted[repo_id]
+    ]
+    changed = [
+        (repo_id, tag, source)
+        for repo_id, tags in wanted.items()
+        for tag, source in tags.items() if current.get(repo_id, {}).get(tag) != source
+    ]
+    if stale:
+        db.executemany("DELETE FROM tags WHERE repo_id = ? AND tag = ?", stale)
+    if changed:
+        db.executemany(_UPSERT_DERIVED_TAG_SQL, changed)
 
 
 def _sync_tags(db: Database, repo_id: int, tags: frozenset, source: str = 'user') -> None:
@@ -328,12 +406,41 @@ def delete_repo_by_path(db: Database, path: str) -> bool:
     return db.rowcount > 0
 
 
+def refresh_reasons(db: Database, path: str) -> List[str]:
+    """
+    Explain why a repository needs to be refreshed.
+
+    Compares the stored stat fingerprint (HEAD, refs, FETCH_HEAD, index
+    and metadata files) with the current one.
+
+    Args:
+        db: Database connection
+        path: Repository path
+
+    Returns:
+        Names of the changed components (e.g. ``['HEAD', 'refs']``), or
+        ``['new']`` if the repo is not in the database. Empty if up-to-date.
+    """
+    db.execute("SELECT fingerprint FROM repos WHERE path = ?", (path,))
+    row = db.fetchone()
+    if not row:
+        return ['new']  # Not in database, needs initial scan
+    return _fingerprint_reasons(row['fingerprint'], path)
+
+
+def _fingerprint_reasons(stored_json: Optional[str], path: str) -> List[str]:
+    """Diff a stored fingerprint column value against the repo on disk."""
+    try:
+        stored = json.loads(stored_json) if stored_json else None
+    except (TypeError, ValueError):
+        stored = None
+    return fingerprint_changes(stored, repo_fingerprint(path))
+
+
 def needs_refresh(db: Database, path: str) -> bool:
     """
     Check if a repository needs to be refreshed.
 
-    Compares stored git_index_mtime with current mtime.
-
     Args:
         db: Database connection
         path: Repository path
@@ -341,25 +448,51 @@ def needs_refresh(db: Database, path: str) -> bool:
     Returns:
         True if repo needs refresh, False if up-to-date
     """
-    db.execute(
-        "SELECT git_index_mtime FROM repos WHERE path = ?",
-        (path,)
-    )
-    row = db.fetchone()
+    return bool(refresh_reasons(db, path))
+
+
+# Fingerprinting is stat()-bound, so threads overlap filesystem latency
+STALE_CHECK_WORKERS = 16
 
-    if not row:
-        return True  # Not in database, needs initial scan
 
-    stored_mtime = row['git_index_mtime']
-    if stored_mtime is None:
-        return True
+def find_stale_repos(
+    db: Database,
+    paths: Optional[Iterable[str]] = None,
+    workers: int = STALE_CHECK_WORKERS,
+) -> Dict[str, List[str]]:
+    """
+    Find every repository that needs refresh in one pass.
 
-    git_index = Path(path) / '.git' / 'index'
-    if not git_index.exists():
-        return True
+    Loads all stored fingerprints with a single query, then fingerprints
+    the repos on disk in a thread pool. Use this instead of calling
+    refresh_reasons() per repo.
 
-    current_mtime = git_index.stat().st_mtime
-    return current_mtime > stored_mtime
+    Args:
+        db: Database connection
+        paths: Repo paths to check (e.g. freshly discovered ones); paths
+            not in the database are reported as ``['new']``. Defaults to
+            every repo in the database.
+        workers: Thread pool size for the filesystem pass
+
+    Returns:
+        Dict of path -> reasons, containing only the dirty repos
+    """
+    db.execute("SELECT path, fingerprint FROM repos")
+    stored = {row['path']: row['fingerprint'] for row in db.fetchall()}
+    check = list(stored) if paths is None else list(dict.fromkeys(paths))
+
+    def reasons_for(path: str) -> List[str]:
+        if path not in stored:
+            return ['new']
+        return _fingerprint_reasons(stored[path], path)
+
+    if workers > 1 and len(check) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(reasons_for, check))
+    else:
+        results = [reasons_for(path) for path in check]
+
+    return {path: reasons for path, reasons in zip(check, results) if reasons}
 
 
 def get_stale_repos(db: Database) -> Generator[str, None, None]:
@@ -369,10 +502,7 @@ def get_stale_repos(db: Database) -> Generator[str, None, None]:
     Yields:
         Paths to repositories needing refresh
     """
-    db.execute("SELECT path, git_index_mtime FROM repos")
-    for row in db.fetchall():
-        if needs_refresh(db, row['path']):
-            yield row['path']
+    yield from find_stale_repos(db)
 
 
 def cleanup_missing_repos(db: Database) -> int:
@@ -393,11 +523,28 @@ def cleanup_missing_repos(db: Database) -> int:
     return removed
 
 
-def get_repo_count(db: Database) -> int:
-    """Get total number of repositories."""
-    db.execute("SELECT COUNT(*) FROM repos")
+def get_repo_count(
+    db: Database,
+    query: Optional[str] = None,
+    views: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Number of repositories, or of those matching a query.
+
+    Counted with a single SELECT COUNT(*); no rows are fetched.
+
+    Args:
+        db: Database connection
+        query: Query DSL predicate (None or empty counts all repos)
+        views: View definitions for @view expansion
+
+    Raises:
+        QueryCompileError: If the query is invalid
+    """
+    compiled = compile_query(query or '', views=views, count=True)
+    db.execute(compiled.sql, tuple(compiled.params))
     row = db.fetchone()
-    return row[0] if row else 0
+    return row['count'] if row else 0
 
 
 def search_repos(db: Database, query: str) -> Generator[Dict[str, Any], None, None]:
@@ -22,7 +22,11 @@ from typing import List, Tuple
 # v6: Added keywords column (JSON array extracted from project manifests)
 # v7: Added local asset detection columns (has_codemeta, has_funding, has_contributors, has_changelog)
 # v8: Added Gitea/Codeberg/Forgejo metadata columns (gitea_*)
-CURRENT_VERSION = 8
+# v9: Added fingerprint column (stat fingerprint for smart refresh)
+# v9+: Added event_cursors table (non-breaking, uses CREATE IF NOT EXISTS)
+# v9+: Added language_stats table (non-breaking, uses CREATE IF NOT EXISTS)
+# v9+: Added source_detections table (non-breaking, uses CREATE IF NOT EXISTS)
+CURRENT_VERSION = 9
 
 # Schema definition as SQL statements
 SCHEMA_V1 = """
@@ -135,7 +139,9 @@ CREATE TABLE IF NOT EXISTS repos (
     scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
     -- For smart refresh (mtime of .git/index)
-    git_index_mtime REAL
+    git_index_mtime REAL,
+    -- Stat fingerprint JSON: HEAD, refs, FETCH_HEAD, index, metadata files
+    fingerprint TEXT
 );
 
 -- Tags table (user-assigned and implicit)
@@ -202,7 +208,10 @@ CREATE INDEX IF NOT EXISTS idx_repos_citation_doi ON repos(citation_doi);
 CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
 CREATE INDEX IF NOT EXISTS idx_tags_source ON tags(source);
 
-CREATE INDEX IF NOT EXISTS idx_events_repo ON events(repo_id);
+-- No standalone events(repo_id) index: idx_events_repo_type_ts leads with
+-- repo_id and serves those lookups (and ON DELETE CASCADE) on its own, so a
+-- second index would only slow down bulk event inserts. Older databases
+-- lose it when the schema-version rebuild drops and recreates events.
 CREATE INDEX IF NOT EXISTS idx_events_type ON events(type);
 CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);
 CREATE INDEX IF NOT EXISTS idx_events_repo_type_ts ON events(repo_id, type, timestamp);
@@ -233,6 +242,38 @@ CREATE TABLE IF NOT EXISTS refresh_log (
 
 CREATE INDEX IF NOT EXISTS idx_refresh_log_started ON refresh_log(started_at);
 
+-- Event scan high-water marks (incremental event scanning in refresh)
+CREATE TABLE IF NOT EXISTS event_cursors (
+    repo_id INTEGER PRIMARY KEY,
+    head TEXT,                         -- commit HEAD pointed at when last scanned
+    tags TEXT,                         -- signature of refs/tags + packed-refs
+    reflog TEXT,                       -- stat signature of logs/HEAD
+    since TEXT,                        -- time bound of the last full scan
+    scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (repo_id) REFERENCES repos(id) ON DELETE CASCADE
+);
+
+-- Language stats keyed by tracked tree (recounted only when the tree changes)
+CREATE TABLE IF NOT EXISTS language_stats (
+    repo_id INTEGER PRIMARY KEY,
+    tree_key TEXT NOT NULL,            -- root tree OID (or index checksum) + settings digest
+    stats TEXT NOT NULL,               -- JSON: {language: {files, bytes}}
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (repo_id) REFERENCES repos(id) ON DELETE CASCADE
+);
+
+-- Cached MetadataSource.detect() answers, keyed by the stat signatures of
+-- the files each source declares it reads
+CREATE TABLE IF NOT EXISTS source_detections (
+    repo_id INTEGER NOT NULL,
+    source_id TEXT NOT NULL,
+    input_key TEXT NOT NULL,           -- digest of the declared files' stat signatures
+    detected INTEGER NOT NULL,
+    detail TEXT,                       -- what detect() named, e.g. the package name
+    PRIMARY KEY (repo_id, source_id),
+    FOREIGN KEY (repo_id) REFERENCES repos(id) ON DELETE CASCADE
+);
+
 -- Full-text search on repos (name, description, readme)
 CREATE VIRTUAL TABLE IF NOT EXISTS repos_fts USING fts5(
     name,
@@ -364,6 +405,9 @@ def apply_schema(conn: sqlite3.Connection, version: int = CURRENT_VERSION) -> No
             DROP TABLE IF EXISTS publications;
             DROP TABLE IF EXISTS scan_errors;
             DROP TABLE IF EXISTS refresh_log;
+            DROP TABLE IF EXISTS event_cursors;
+            DROP TABLE IF EXISTS language_stats;
+            DROP TABLE IF EXISTS source_detections;
             DROP TABLE IF EXISTS repos;
             DROP TABLE IF EXISTS _schema_info;
         """)
@@ -372,7 +416,7 @@ def apply_schema(conn: sqlite3.Connection, version: int = CURRENT_VERSION) -> No
     conn.executescript(SCHEMA_V1)
     conn.execute(
         "INSERT OR REPLACE INTO _schema_info (version, description) VALUES (?, ?)",
-        (CURRENT_VERSION, "v0.13.0: Added Gitea/Codeberg/Forgejo metadata columns")
+        (CURRENT_VERSION, "v0.15.3: Added stat fingerprint column for smart refresh")
     )
 
     conn.commit()
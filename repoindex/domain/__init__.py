@@ -14,7 +14,7 @@ serialization methods for JSONL output.
 
 from .repository import Repository, GitStatus, GitHubMetadata, PackageMetadata
 from .tag import Tag, TagSource
-from .event import Event
+from .event import Event, EventCursor
 from .view import (
     View, ViewSpec, ViewEntry, ViewTemplate,
     Overlay, Annotation, ViewMetadata,
@@ -46,6 +46,7 @@ __all__ = [
     'Tag',
     'TagSource',
     'Event',
+    'EventCursor',
     # View system
     'View',
     'ViewSpec',
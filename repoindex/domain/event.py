@@ -10,7 +10,7 @@ Events are timestamped, have stable IDs, and are serializable for JSONL output.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 import json
 
@@ -113,3 +113,23 @@ class Event:
         if not isinstance(other, Event):
             return False
         return self.id == other.id
+
+
+@dataclass(frozen=True)
+class EventCursor:
+    """
+    High-water mark of a repository's last local event scan.
+
+    Lets refresh ask git only for what changed since the previous scan.
+
+    Attributes:
+        head: Commit HEAD pointed at (commits/merges up to here are stored)
+        tags: Signature of refs/tags and packed-refs (tag events)
+        reflog: Stat signature of logs/HEAD (branch events)
+        since: ISO lower time bound of the last full scan
+    """
+
+    head: Optional[str] = None
+    tags: Optional[str] = None
+    reflog: Optional[str] = None
+    since: Optional[str] = None
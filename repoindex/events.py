@@ -42,7 +42,8 @@ Total: 30 event types across multiple categories.
 repoindex is read-only: it observes and reports, external tools consume the stream.
 """
 
-from typing import Dict, Any, List, Optional, Generator
+from typing import Dict, Any, FrozenSet, List, Optional, Generator
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -50,11 +51,14 @@ import re
 import json
 import logging
 import hashlib
+import threading
 import time
 
 from .utils import run_command, get_remote_url, parse_repo_url
 # Import Event from domain layer for backward compatibility
-from .domain.event import Event
+from .domain.event import Event, EventCursor
+from .infra.fingerprint import refs_signature, stat_signature
+from .infra.git_dir import GitDir, UnsupportedGitLayout
 
 logger = logging.getLogger(__name__)
 
@@ -339,7 +343,8 @@ def scan_commits(
     repo_path: str,
     since: Optional[datetime] = None,
     until: Optional[datetime] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    rev_range: Optional[str] = None
 ) -> Generator[Event, None, None]:
     """
     Scan a repository for recent commits.
@@ -349,6 +354,7 @@ def scan_commits(
         since: Only commits after this time
         until: Only commits before this time
         limit: Maximum commits to return
+        rev_range: Revision range to walk (e.g. ``<old>..HEAD``; default HEAD)
 
     Yields:
         Event objects for each commit found
@@ -365,6 +371,8 @@ def scan_commits(
         cmd += f' --until="{until.isoformat()}"'
     if limit:
         cmd += f' -n {limit}'
+    if rev_range:
+        cmd += f' {rev_range}'
 
     output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
 
@@ -513,7 +521,8 @@ def scan_merges(
     repo_path: str,
     since: Optional[datetime] = None,
     until: Optional[datetime] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    rev_range: Optional[str] = None
 ) -> Generator[Event, None, None]:
     """
     Scan a repository for merge commits.
@@ -523,6 +532,7 @@ def scan_merges(
         since: Only merges after this time
         until: Only merges before this time
         limit: Maximum merges to return
+        rev_range: Revision range to walk (e.g. ``<old>..HEAD``; default HEAD)
 
     Yields:
         Event objects for merge commits
@@ -539,6 +549,8 @@ def scan_merges(
         cmd += f' --until="{until.isoformat()}"'
     if limit:
         cmd += f' -n {limit}'
+    if rev_range:
+        cmd += f' {rev_range}'
 
     output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
 
@@ -588,7 +600,156 @@ def scan_merges(
 
 
 # =============================================================================
-# GITHUB EVENT SCANNING (opt-in, uses gh CLI)
+# INCREMENTAL LOCAL SCANNING (refresh)
+# =============================================================================
+
+# Local event types persisted by refresh
+REFRESH_EVENT_TYPES = ['commit', 'git_tag', 'branch', 'merge']
+
+# Per-repo caps, matching scan_events()
+_COMMIT_LIMIT = 50
+_BRANCH_LIMIT = 20
+
+_OID_RE = re.compile(r'^[0-9a-f]{40}([0-9a-f]{24})?$')
+
+
+@dataclass
+class IncrementalScan:
+    """
+    Result of scan_events_incremental().
+
+    Attributes:
+        events: New local events (may overlap stored ones; inserts dedupe)
+        cursor: High-water mark to store for the next scan, or None if the
+            repo layout could not be read (next scan is full again)
+        rewritten: History was rewritten since the last scan (the old
+            HEAD is no longer on any branch or tag); stored commit/merge
+            events whose hash is not in `reachable` are stale
+        reachable: With `rewritten`, every commit hash reachable from a
+            ref, or None if it could not be listed (keep stored events)
+    """
+    events: List[Event] = field(default_factory=list)
+    cursor: Optional[EventCursor] = None
+    rewritten: bool = False
+    reachable: Optional[FrozenSet[str]] = None
+
+
+def _is_ancestor(repo_path: str, old: str, new: str) -> bool:
+    """True if commit `old` is reachable from `new` (exists and not rewritten)."""
+    if not (_OID_RE.match(old) and _OID_RE.match(new)):
+        return False
+    _, returncode = run_command(
+        f'git merge-base --is-ancestor {old} {new}',
+        cwd=repo_path, capture_output=True, check=False, log_stderr=False
+    )
+    return returncode == 0
+
+
+def _on_any_ref(repo_path: str, commit: str) -> bool:
+    """True if `commit` is reachable from some branch or tag."""
+    if not _OID_RE.match(commit):
+        return False
+    output, returncode = run_command(
+        ['git', 'for-each-ref', '--contains', commit, '--count=1', '--format=%(refname)'],
+        cwd=repo_path, capture_output=True, check=False, log_stderr=False
+    )
+    return returncode == 0 and bool(output and output.strip())
+
+
+def _reachable_commits(repo_path: str) -> Optional[FrozenSet[str]]:
+    """Hashes of all commits reachable from any ref, or None on failure."""
+    output, returncode = run_command(
+        ['git', 'rev-list', '--all'],
+        cwd=repo_path, capture_output=True, check=False, log_stderr=False
+    )
+    if returncode != 0 or output is None:
+        return None
+    return frozenset(output.split())
+
+
+def scan_events_incremental(
+    repo_path: str,
+    since: Optional[datetime] = None,
+    cursor: Optional[EventCursor] = None,
+) -> IncrementalScan:
+    """
+    Scan local events (commits, tags, branches, merges) from a high-water mark.
+
+    With no cursor this is the same full scan refresh always did. With one:
+
+    - commits/merges: nothing if HEAD has not moved, ``<last>..HEAD`` if
+      the old HEAD is still an ancestor or still on some branch or tag
+      (e.g. after a checkout), otherwise a full rescan flagged as a
+      history rewrite, with the commits that are still reachable
+    - tags: rescanned only when refs/tags or packed-refs changed
+    - branches: rescanned only when the HEAD reflog changed
+
+    A scan with a wider time window than the cursor's is always full.
+
+    Args:
+        repo_path: Path to git repository
+        since: Only events after this time
+        cursor: Cursor stored by the previous scan of this repo
+
+    Returns:
+        IncrementalScan with the events and the cursor to store
+    """
+    since_iso = since.isoformat() if since else None
+    try:
+        git_dir = GitDir.open(repo_path)
+        _, head = git_dir.head()
+        tags_sig: Optional[str] = refs_signature(str(git_dir.common_dir), 'refs/tags')
+        reflog_sig = stat_signature(str(git_dir.git_dir / 'logs' / 'HEAD'))
+    except UnsupportedGitLayout:
+        git_dir = None
+        head = tags_sig = reflog_sig = None
+
+    # A wider window than the stored events cover needs a full scan
+    wider = cursor is not None and cursor.since is not None and (
+        since_iso is None or since_iso < cursor.since
+    )
+    full = cursor is None or git_dir is None or wider
+
+    result = IncrementalScan()
+    events = result.events
+
+    # Commits and merges
+    rev_range = None
+    scan_history = True
+    if not full:
+        if head == cursor.head:
+            scan_history = False
+        elif cursor.head and head and (
+            _is_ancestor(repo_path, cursor.head, head) or _on_any_ref(repo_path, cursor.head)
+        ):
+            rev_range = f'{cursor.head}..{head}'
+        else:
+            # Old HEAD is gone (rebase, reset, force-pull): rescan this repo
+            # and let the writer drop only the commits no ref reaches now
+            result.rewritten = True
+            result.reachable = _reachable_commits(repo_path)
+    if scan_history:
+        events.extend(scan_commits(repo_path, since, limit=_COMMIT_LIMIT, rev_range=rev_range))
+        events.extend(scan_merges(repo_path, since, limit=_COMMIT_LIMIT, rev_range=rev_range))
+
+    if full or tags_sig != cursor.tags:
+        events.extend(scan_git_tags(repo_path, since))
+
+    if full or reflog_sig is None or reflog_sig != cursor.reflog:
+        events.extend(scan_branches(repo_path, since, limit=_BRANCH_LIMIT))
+
+    if git_dir is not None:
+        result.cursor = EventCursor(
+            head=head,
+            tags=tags_sig,
+            reflog=reflog_sig,
+            since=since_iso if full or result.rewritten else cursor.since,
+        )
+    return result
+
+
+# =============================================================================
+# GITHUB EVENT SCANNING (opt-in, GitHub API)
 # =============================================================================
 
 def _get_github_repo_info(repo_path: str) -> Optional[tuple]:
@@ -604,6 +765,32 @@ def _get_github_repo_info(repo_path: str) -> Optional[tuple]:
     return (owner, name)
 
 
+_github_client = None
+_github_client_lock = threading.Lock()
+
+
+def _github_api(endpoint: str, paginate: bool = False, accept: Optional[str] = None) -> Optional[Any]:
+    """
+    GET a GitHub REST endpoint for the scanners.
+
+    Shares one in-process GitHubClient (and its conditional-request cache) across all
+    scanners, so unchanged resources come back as 304s served from disk.
+    """
+    global _github_client
+    from .infra.github_client import DEFAULT_ACCEPT, GitHubClient, resolve_token
+    from .infra.response_cache import get_response_cache
+
+    with _github_client_lock:
+        if _github_client is None:
+            from .config import load_config
+            config = load_config()
+            _github_client = GitHubClient(
+                token=resolve_token(config), response_cache=get_response_cache(config),
+            )
+        client = _github_client
+    return client.api(endpoint, accept=accept or DEFAULT_ACCEPT, paginate=paginate)
+
+
 def scan_github_releases(
     repo_path: str,
     since: Optional[datetime] = None,
@@ -613,7 +800,7 @@ def scan_github_releases(
     """
     Scan GitHub releases for a repository.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -633,17 +820,8 @@ def scan_github_releases(
 
     owner, name = info
 
-    # Use gh CLI to get releases
-    cmd = f'gh api repos/{owner}/{name}/releases --paginate'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        releases = json.loads(output)
-    except json.JSONDecodeError:
+    releases = _github_api(f'repos/{owner}/{name}/releases?per_page=100', paginate=True)
+    if not isinstance(releases, list):
         return
 
     count = 0
@@ -699,7 +877,7 @@ def scan_github_prs(
     """
     Scan GitHub pull requests for a repository.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -720,18 +898,9 @@ def scan_github_prs(
 
     owner, name = info
 
-    # Use gh CLI to get PRs
     # Note: state_filter is computed but we use state=all in the hardcoded URL
-    cmd = f'gh api "repos/{owner}/{name}/pulls?state=all&sort=updated&direction=desc&per_page=100"'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        prs = json.loads(output)
-    except json.JSONDecodeError:
+    prs = _github_api(f'repos/{owner}/{name}/pulls?state=all&sort=updated&direction=desc&per_page=100')
+    if not isinstance(prs, list):
         return
 
     count = 0
@@ -788,7 +957,7 @@ def scan_github_issues(
     """
     Scan GitHub issues for a repository.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -809,17 +978,9 @@ def scan_github_issues(
 
     owner, name = info
 
-    # Use gh CLI to get issues (excluding PRs)
-    cmd = f'gh api "repos/{owner}/{name}/issues?state=all&sort=updated&direction=desc&per_page=100"'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        issues = json.loads(output)
-    except json.JSONDecodeError:
+    # Issues (PRs are filtered out below)
+    issues = _github_api(f'repos/{owner}/{name}/issues?state=all&sort=updated&direction=desc&per_page=100')
+    if not isinstance(issues, list):
         return
 
     count = 0
@@ -879,7 +1040,7 @@ def scan_github_workflows(
     """
     Scan GitHub Actions workflow runs for a repository.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -899,19 +1060,10 @@ def scan_github_workflows(
 
     owner, name = info
 
-    # Use gh CLI to get workflow runs
-    cmd = f'gh api "repos/{owner}/{name}/actions/runs?per_page=100"'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        data = json.loads(output)
-        runs = data.get('workflow_runs', [])
-    except json.JSONDecodeError:
+    data = _github_api(f'repos/{owner}/{name}/actions/runs?per_page=100')
+    if not isinstance(data, dict):
         return
+    runs = data.get('workflow_runs', [])
 
     count = 0
     for run in runs:
@@ -981,7 +1133,7 @@ def scan_pypi_publishes(
     Yields:
         Event objects for PyPI releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -1016,7 +1168,7 @@ def scan_pypi_publishes(
 
     # Query PyPI API
     try:
-        response = requests.get(f'https://pypi.org/pypi/{package_name}/json', timeout=10)
+        response = http_get(f'https://pypi.org/pypi/{package_name}/json', timeout=10)
         if response.status_code != 200:
             return
 
@@ -1095,7 +1247,7 @@ def scan_cran_publishes(
     Yields:
         Event objects for CRAN releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -1120,7 +1272,7 @@ def scan_cran_publishes(
 
     # Query CRAN API
     try:
-        response = requests.get(
+        response = http_get(
             f'https://crandb.r-pkg.org/{package_name}/all',
             timeout=10
         )
@@ -1210,7 +1362,7 @@ def scan_npm_publishes(
     Yields:
         Event objects for npm releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -1238,7 +1390,7 @@ def scan_npm_publishes(
 
     # Query npm registry
     try:
-        response = requests.get(f'https://registry.npmjs.org/{package_name}', timeout=10)
+        response = http_get(f'https://registry.npmjs.org/{package_name}', timeout=10)
         if response.status_code != 200:
             return
 
@@ -1312,7 +1464,7 @@ def scan_cargo_publishes(
     Yields:
         Event objects for crates.io releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -1345,7 +1497,7 @@ def scan_cargo_publishes(
     # Query crates.io API
     try:
         headers = {'User-Agent': 'repoindex (https://github.com/queelius/repoindex)'}
-        response = requests.get(
+        response = http_get(
             f'https://crates.io/api/v1/crates/{package_name}/versions',
             headers=headers,
             timeout=10
@@ -1425,7 +1577,7 @@ def scan_docker_publishes(
     Yields:
         Event objects for Docker Hub tags
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -1451,7 +1603,7 @@ def scan_docker_publishes(
 
     # Query Docker Hub API
     try:
-        response = requests.get(
+        response = http_get(
             f'https://hub.docker.com/v2/repositories/{docker_image}/tags?page_size=100',
             timeout=10
         )
@@ -1711,7 +1863,7 @@ def scan_deps_updates(
 
 
 # =============================================================================
-# GITHUB SECURITY ALERTS (opt-in, uses gh CLI)
+# GITHUB SECURITY ALERTS (opt-in, GitHub API)
 # =============================================================================
 
 def scan_github_security_alerts(
@@ -1723,7 +1875,7 @@ def scan_github_security_alerts(
     """
     Scan GitHub Dependabot security alerts for a repository.
 
-    Requires: gh CLI installed and authenticated with appropriate permissions.
+    Requires: an authenticated gh CLI or a GitHub token with appropriate permissions.
 
     Args:
         repo_path: Path to git repository
@@ -1743,17 +1895,8 @@ def scan_github_security_alerts(
 
     owner, name = info
 
-    # Use gh CLI to get Dependabot alerts
-    cmd = f'gh api repos/{owner}/{name}/dependabot/alerts --paginate'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        alerts = json.loads(output)
-    except json.JSONDecodeError:
+    alerts = _github_api(f'repos/{owner}/{name}/dependabot/alerts?per_page=100', paginate=True)
+    if not isinstance(alerts, list):
         return
 
     count = 0
@@ -1807,7 +1950,7 @@ def scan_github_security_alerts(
 
 
 # =============================================================================
-# GITHUB REPOSITORY EVENTS (opt-in, uses gh CLI)
+# GITHUB REPOSITORY EVENTS (opt-in, GitHub API)
 # =============================================================================
 
 def scan_github_repo_events(
@@ -1821,7 +1964,7 @@ def scan_github_repo_events(
 
     Uses the GitHub Events API to detect repository-level administrative changes.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -1842,18 +1985,9 @@ def scan_github_repo_events(
 
     owner, name = info
 
-    # Use gh CLI to get repository events
     # The events API returns various event types including repo-level changes
-    cmd = f'gh api "repos/{owner}/{name}/events?per_page=100"'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        events = json.loads(output)
-    except json.JSONDecodeError:
+    events = _github_api(f'repos/{owner}/{name}/events?per_page=100')
+    if not isinstance(events, list):
         return
 
     # Event type mapping from GitHub API to our event types
@@ -1915,11 +2049,9 @@ def scan_github_repo_events(
     # Additionally, check if current repo name differs from local directory name
     # This can detect a recent rename
     try:
-        repo_info_cmd = f'gh api "repos/{owner}/{name}"'
-        repo_output, repo_rc = run_command(repo_info_cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
+        repo_data = _github_api(f'repos/{owner}/{name}')
 
-        if repo_rc == 0 and repo_output:
-            repo_data = json.loads(repo_output)
+        if isinstance(repo_data, dict):
             github_name = repo_data.get('name', '')
             local_name = Path(repo_path).name
 
@@ -1977,7 +2109,7 @@ def scan_github_repo_events(
 
 
 # =============================================================================
-# GITHUB DEPLOYMENTS (opt-in, uses gh CLI)
+# GITHUB DEPLOYMENTS (opt-in, GitHub API)
 # =============================================================================
 
 def scan_github_deployments(
@@ -1991,7 +2123,7 @@ def scan_github_deployments(
 
     Detects gh-pages deployments and other deployment environments.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -2011,17 +2143,8 @@ def scan_github_deployments(
 
     owner, name = info
 
-    # Use gh CLI to get deployments
-    cmd = f'gh api "repos/{owner}/{name}/deployments?per_page=100"'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        deployments = json.loads(output)
-    except json.JSONDecodeError:
+    deployments = _github_api(f'repos/{owner}/{name}/deployments?per_page=100')
+    if not isinstance(deployments, list):
         return
 
     count = 0
@@ -2070,7 +2193,7 @@ def scan_github_deployments(
 
 
 # =============================================================================
-# GITHUB FORKS (opt-in, uses gh CLI)
+# GITHUB FORKS (opt-in, GitHub API)
 # =============================================================================
 
 def scan_github_forks(
@@ -2084,7 +2207,7 @@ def scan_github_forks(
 
     Detects when someone forks your repository.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -2104,17 +2227,9 @@ def scan_github_forks(
 
     owner, name = info
 
-    # Use gh CLI to get forks (sorted by newest)
-    cmd = f'gh api "repos/{owner}/{name}/forks?sort=newest&per_page=100"'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        forks = json.loads(output)
-    except json.JSONDecodeError:
+    # Forks, newest first
+    forks = _github_api(f'repos/{owner}/{name}/forks?sort=newest&per_page=100')
+    if not isinstance(forks, list):
         return
 
     count = 0
@@ -2161,7 +2276,7 @@ def scan_github_forks(
 
 
 # =============================================================================
-# GITHUB STARS (opt-in, uses gh CLI)
+# GITHUB STARS (opt-in, GitHub API)
 # =============================================================================
 
 def scan_github_stars(
@@ -2177,7 +2292,7 @@ def scan_github_stars(
     starring API with Accept header to get timestamps, but this may not work
     for all repos.
 
-    Requires: gh CLI installed and authenticated.
+    Requires: an authenticated gh CLI or a GitHub token.
 
     Args:
         repo_path: Path to git repository
@@ -2197,17 +2312,13 @@ def scan_github_stars(
 
     owner, name = info
 
-    # Use gh CLI with star timestamps (requires special Accept header)
-    cmd = f'gh api "repos/{owner}/{name}/stargazers" -H "Accept: application/vnd.github.star+json" --paginate'
-
-    output, returncode = run_command(cmd, cwd=repo_path, capture_output=True, check=False, log_stderr=False)
-
-    if returncode != 0 or not output:
-        return
-
-    try:
-        stargazers = json.loads(output)
-    except json.JSONDecodeError:
+    # Star timestamps require a special Accept header
+    stargazers = _github_api(
+        f'repos/{owner}/{name}/stargazers?per_page=100',
+        accept='application/vnd.github.star+json',
+        paginate=True,
+    )
+    if not isinstance(stargazers, list):
         return
 
     # Sort by starred_at (newest first)
@@ -2277,7 +2388,7 @@ def scan_gem_publishes(
     Yields:
         Event objects for RubyGems releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -2304,7 +2415,7 @@ def scan_gem_publishes(
 
     # Query RubyGems API
     try:
-        response = requests.get(
+        response = http_get(
             f'https://rubygems.org/api/v1/versions/{gem_name}.json',
             timeout=10
         )
@@ -2381,7 +2492,7 @@ def scan_nuget_publishes(
     Yields:
         Event objects for NuGet releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -2419,7 +2530,7 @@ def scan_nuget_publishes(
 
     # Query NuGet API
     try:
-        response = requests.get(
+        response = http_get(
             f'https://api.nuget.org/v3/registration5-semver1/{package_name.lower()}/index.json',
             timeout=10
         )
@@ -2498,7 +2609,7 @@ def scan_maven_publishes(
     Yields:
         Event objects for Maven Central releases
     """
-    import requests
+    from .infra.http import http_get
 
     repo_path = str(Path(repo_path).resolve())
     repo_name = Path(repo_path).name
@@ -2527,7 +2638,7 @@ def scan_maven_publishes(
 
     # Query Maven Central Search API
     try:
-        response = requests.get(
+        response = http_get(
             f'https://search.maven.org/solrsearch/select?q=g:{group_id}+AND+a:{artifact_id}&core=gav&rows=20&wt=json',
             timeout=10
         )
@@ -3006,7 +3117,7 @@ def scan_events(
             for event in scan_merges(repo_path, since, until, limit=50):
                 all_events.append(event)
 
-        # GitHub events (opt-in, uses gh CLI)
+        # GitHub events (opt-in, GitHub API)
         if 'github_release' in types:
             for event in scan_github_releases(repo_path, since, until):
                 all_events.append(event)
@@ -3,14 +3,18 @@ Infrastructure layer for repoindex.
 
 Contains abstractions for external systems:
 - GitClient: Git command execution
+- GitDir: Fork-free reader for HEAD, refs and config
 - GitHubClient: GitHub API access
 - ZenodoClient: Zenodo API access (DOI enrichment)
 - FileStore: JSON/YAML file persistence
+- http: Shared keep-alive HTTP pools with retry/backoff (http_get)
+- rate_limit: Process-wide per-host request budgets used by http
 
 These provide clean interfaces that can be mocked for testing.
 """
 
 from .git_client import GitClient, GitStatus as GitStatusResult
+from .git_dir import GitDir, UnsupportedGitLayout
 from .github_client import GitHubClient, RateLimitStatus
 from .zenodo_client import ZenodoClient, ZenodoRecord
 from .file_store import FileStore
@@ -18,6 +22,8 @@ from .file_store import FileStore
 __all__ = [
     'GitClient',
     'GitStatusResult',
+    'GitDir',
+    'UnsupportedGitLayout',
     'GitHubClient',
     'RateLimitStatus',
     'ZenodoClient',
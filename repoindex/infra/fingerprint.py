@@ -0,0 +1,147 @@
+"""
+Stat fingerprints for smart refresh.
+
+A fingerprint is a small dict of ``component -> signature`` built only
+from ``stat()`` calls plus one read of HEAD, so checking thousands of repos
+costs no subprocesses. It covers everything a refresh reads:
+
+- ``HEAD``: contents of HEAD (branch switches, detached checkouts)
+- ``refs``: packed-refs plus every directory under refs/. Git updates a
+  loose ref by renaming a lock file over it, which bumps the mtime of its
+  directory, so new commits, fetched remote refs and tags all show here.
+- ``FETCH_HEAD``: fetches, even ones that move no ref
+- ``index``: staging and checkouts
+- ``config``: the repository's git config (remotes, hence owner and the
+  platform a repo is enriched from)
+- one entry per metadata file that sources and record building read
+  (CITATION.cff, pyproject.toml, LICENSE, ...), and one per ``*.gemspec``
+  in the working tree root
+
+Comparing a stored fingerprint with a fresh one yields the names of
+the components that changed, so refresh can report why a repo is dirty.
+"""
+
+import hashlib
+import os
+from typing import Dict, List, Optional
+
+from .git_dir import GitDir, UnsupportedGitLayout
+
+# Root-level files matched by suffix rather than name (rubygems globs these)
+FINGERPRINT_SUFFIXES = ('.gemspec',)
+
+# Files (relative to the working tree) whose contents feed the repos row
+# or a metadata source. Missing files are simply absent from the
+# fingerprint, so creating or deleting one also marks the repo dirty.
+FINGERPRINT_FILES = (
+    # Package manifests (providers, keywords)
+    'pyproject.toml', 'setup.py', 'setup.cfg', 'package.json', 'Cargo.toml',
+    'go.mod', 'DESCRIPTION', 'Dockerfile',
+    'meta.yaml', 'recipe/meta.yaml', 'conda.recipe/meta.yaml',
+    # Citation metadata
+    'CITATION.cff', 'CITATION.bib', 'CITATION', '.zenodo.json', 'codemeta.json',
+    # README / license detection
+    'README.md', 'README.rst', 'README.txt', 'README',
+    'LICENSE', 'LICENSE.txt', 'LICENSE.md', 'LICENCE', 'COPYING',
+    # Local assets
+    '.github/FUNDING.yml', 'CONTRIBUTORS', 'CONTRIBUTORS.md', 'AUTHORS', 'AUTHORS.md',
+    'CHANGELOG.md', 'CHANGES.md', 'NEWS.md', 'HISTORY.md', 'CHANGELOG', 'CHANGES',
+    # CI detection
+    '.github/workflows', '.gitlab-ci.yml', '.travis.yml', 'Jenkinsfile',
+)
+
+
+def stat_signature(path: str) -> Optional[str]:
+    """``mtime_ns:size`` for a path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def refs_signature(common_dir: str, namespace: str = 'refs') -> str:
+    """
+    Digest of packed-refs and the mtimes of all directories under a ref
+    namespace (``refs`` for everything, ``refs/tags`` for tags only).
+    """
+    digest = hashlib.sha1()
+    digest.update(f"packed-refs={stat_signature(os.path.join(common_dir, 'packed-refs'))}\n".encode())
+    stack = [os.path.join(common_dir, namespace)]
+    while stack:
+        directory = stack.pop()
+        try:
+            st = os.stat(directory)
+            with os.scandir(directory) as it:
+                stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+        digest.update(f"{directory}={st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def repo_fingerprint(path: str) -> Optional[Dict[str, str]]:
+    """
+    Build the stat fingerprint of a repository.
+
+    Args:
+        path: Working tree root
+
+    Returns:
+        Dict of component -> signature, or None if the git directory
+        cannot be read (callers should then treat the repo as dirty)
+    """
+    try:
+        git_dir = GitDir.open(path)
+    except UnsupportedGitLayout:
+        return None
+    own_dir = str(git_dir.git_dir)
+
+    fingerprint = {'refs': refs_signature(str(git_dir.common_dir))}
+    try:
+        with open(os.path.join(own_dir, 'HEAD'), encoding='utf-8') as f:
+            fingerprint['HEAD'] = f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        pass
+    for name in ('FETCH_HEAD', 'index'):
+        signature = stat_signature(os.path.join(own_dir, name))
+        if signature:
+            fingerprint[name] = signature
+    signature = stat_signature(os.path.join(str(git_dir.common_dir), 'config'))
+    if signature:
+        fingerprint['config'] = signature
+
+    # One directory listing tells which metadata files can exist, so only
+    # those present are stat'ed
+    try:
+        with os.scandir(path) as it:
+            present = {entry.name for entry in it}
+    except OSError:
+        present = set()
+    names = [name for name in FINGERPRINT_FILES if name.split('/', 1)[0] in present]
+    names += sorted(name for name in present if name.endswith(FINGERPRINT_SUFFIXES))
+    for name in names:
+        signature = stat_signature(os.path.join(path, name))
+        if signature:
+            fingerprint[name] = signature
+    return fingerprint
+
+
+def fingerprint_changes(
+    stored: Optional[Dict[str, str]],
+    current: Optional[Dict[str, str]],
+) -> List[str]:
+    """
+    Name the components that differ between two fingerprints.
+
+    Returns:
+        Sorted component names; empty when the fingerprints match.
+        ``['unreadable']`` if the current fingerprint could not be built,
+        ``['unfingerprinted']`` if nothing was stored.
+    """
+    if current is None:
+        return ['unreadable']
+    if not stored:
+        return ['unfingerprinted']
+    keys = set(stored) | set(current)
+    return sorted(k for k in keys if stored.get(k) != current.get(k))
@@ -10,11 +10,13 @@ All git operations go through this client, making them:
 
 import subprocess
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 import logging
 
+from .git_dir import UnsupportedGitLayout, read_current_branch, read_remote_url
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +32,88 @@ class GitStatus:
     untracked_files: int = 0
     staged_files: int = 0
     modified_files: int = 0
+    upstream: Optional[str] = None
+    changes: Tuple[str, ...] = ()  # Two-letter XY codes, one per changed path
+
+
+# One invocation yields branch, upstream, ahead/behind and per-file states.
+# --no-optional-locks keeps status read-only: it never rewrites .git/index,
+# so concurrent status calls don't contend for index.lock or bump its mtime.
+STATUS_COMMAND = ['git', '--no-optional-locks', 'status', '--porcelain=v2', '--branch']
+
+
+def parse_porcelain_v2(output: str) -> GitStatus:
+    """
+    Parse `git status --porcelain=v2 --branch` output.
+
+    Header lines carry the branch (``# branch.head``), upstream
+    (``# branch.upstream``) and ahead/behind (``# branch.ab``; only present
+    when the upstream ref exists). Entry lines are ``1``/``2``/``u`` for
+    tracked changes (XY state in the second field, ``.`` = unchanged) and
+    ``?`` for untracked paths.
+
+    XY codes are normalised to porcelain v1 spelling (space for unchanged)
+    so callers can keep v1-style counting.
+
+    Args:
+        output: Raw stdout from STATUS_COMMAND
+
+    Returns:
+        GitStatus populated from the output
+    """
+    branch = "main"
+    upstream = None
+    has_upstream = False
+    ahead = behind = 0
+    changes: List[str] = []
+    untracked = 0
+
+    for line in output.splitlines():
+        if not line:
+            continue
+        kind = line[0]
+        if kind == '#':
+            parts = line.split(' ', 2)
+            if len(parts) < 3:
+                continue
+            key, value = parts[1], parts[2]
+            if key == 'branch.head':
+                # Detached HEAD: match `git rev-parse --abbrev-ref HEAD`
+                branch = 'HEAD' if value == '(detached)' else value
+            elif key == 'branch.upstream':
+                upstream = value
+            elif key == 'branch.ab':
+                counts = value.split()
+                if len(counts) == 2:
+                    try:
+                        ahead = int(counts[0].lstrip('+'))
+                        behind = int(counts[1].lstrip('-'))
+                        has_upstream = True
+                    except ValueError:
+                        pass
+        elif kind in '12u':
+            xy = line[2:4]
+            if len(xy) == 2:
+                changes.append(xy.replace('.', ' '))
+        elif kind == '?':
+            untracked += 1
+            changes.append('??')
+
+    tracked = [xy for xy in changes if xy != '??']
+    clean = not changes
+    return GitStatus(
+        branch=branch,
+        clean=clean,
+        ahead=ahead,
+        behind=behind,
+        has_upstream=has_upstream,
+        uncommitted_changes=not clean,
+        untracked_files=untracked,
+        staged_files=sum(1 for xy in tracked if xy[0] != ' '),
+        modified_files=sum(1 for xy in tracked if xy[1] != ' '),
+        upstream=upstream if has_upstream else None,
+        changes=tuple(changes),
+    )
 
 
 @dataclass
@@ -77,7 +161,7 @@ class GitClient:
 
     def _run(
         self,
-        cmd: str,
+        cmd: Union[str, List[str]],
         cwd: str,
         check: bool = False,
         capture_stderr: bool = False
@@ -86,7 +170,7 @@ class GitClient:
         Run a git command.
 
         Args:
-            cmd: Command to run
+            cmd: Command to run (a string runs through the shell, a list does not)
             cwd: Working directory
             check: Raise on non-zero exit
             capture_stderr: Include stderr in output
@@ -97,7 +181,7 @@ class GitClient:
         try:
             result = subprocess.run(
                 cmd,
-                shell=True,
+                shell=isinstance(cmd, str),
                 cwd=cwd,
                 capture_output=True,
                 text=True,
@@ -134,68 +218,27 @@ class GitClient:
         """
         Get repository status.
 
+        Uses a single `git status --porcelain=v2 --branch` process (no
+        shell) for branch, upstream, ahead/behind and file counts.
+
         Args:
             path: Path to git repository
 
         Returns:
             GitStatus with branch, clean status, etc.
         """
-        result = GitStatus()
-
-        # Get branch name
-        output, code = self._run("git rev-parse --abbrev-ref HEAD", cwd=path)
-        if code == 0 and output:
-            result = GitStatus(branch=output.strip())
-
-        # Check for uncommitted changes
-        output, code = self._run("git status --porcelain", cwd=path)
-        if code == 0:
-            if output:
-                lines = output.strip().split('\n') if output.strip() else []
-                result = GitStatus(
-                    branch=result.branch,
-                    clean=False,
-                    uncommitted_changes=True,
-                    untracked_files=sum(1 for line in lines if line.startswith('??')),
-                    staged_files=sum(1 for line in lines if line[0] in 'MADRC'),
-                    modified_files=sum(1 for line in lines if line[1] in 'MADRC')
-                )
-            else:
-                result = GitStatus(branch=result.branch, clean=True)
-
-        # Check upstream status
-        output, code = self._run("git rev-parse --abbrev-ref @{upstream}", cwd=path)
-        has_upstream = code == 0 and output
-
-        if has_upstream:
-            # Get ahead/behind counts
-            output, code = self._run("git rev-list --left-right --count HEAD...@{upstream}", cwd=path)
-            if code == 0 and output:
-                parts = output.strip().split()
-                if len(parts) == 2:
-                    try:
-                        ahead = int(parts[0])
-                        behind = int(parts[1])
-                        result = GitStatus(
-                            branch=result.branch,
-                            clean=result.clean,
-                            ahead=ahead,
-                            behind=behind,
-                            has_upstream=True,
-                            uncommitted_changes=result.uncommitted_changes,
-                            untracked_files=result.untracked_files,
-                            staged_files=result.staged_files,
-                            modified_files=result.modified_files
-                        )
-                    except ValueError:
-                        pass
-
-        return result
+        output, code = self._run(STATUS_COMMAND, cwd=path)
+        if code != 0 or output is None:
+            return GitStatus()
+        return parse_porcelain_v2(output)
 
     def remote_url(self, path: str, remote: str = "origin") -> Optional[str]:
         """
         Get remote URL.
 
+        Reads .git/config directly; falls back to `git config` only for
+        layouts the reader does not handle (includes, reftable, ...).
+
         Args:
             path: Path to git repository
             remote: Remote name (default: "origin")
@@ -203,6 +246,11 @@ class GitClient:
         Returns:
             Remote URL or None if not found
         """
+        try:
+            return read_remote_url(path, remote)
+        except UnsupportedGitLayout as e:
+            logger.debug(f"Falling back to git config for {path}: {e}")
+
         output, code = self._run(f"git config --get remote.{remote}.url", cwd=path)
         if code == 0 and output:
             return output.strip()
@@ -341,7 +389,12 @@ class GitClient:
         return commits
 
     def current_branch(self, path: str) -> Optional[str]:
-        """Get current branch name."""
+        """Get current branch name ('HEAD' when detached)."""
+        try:
+            return read_current_branch(path)
+        except UnsupportedGitLayout as e:
+            logger.debug(f"Falling back to git rev-parse for {path}: {e}")
+
         output, code = self._run("git rev-parse --abbrev-ref HEAD", cwd=path)
         if code == 0 and output:
             return output.strip()
@@ -0,0 +1,317 @@
+"""
+Pure-Python reader for git metadata files.
+
+Reads HEAD, config, loose refs and packed-refs straight from the git
+directory so that discovery and branch lookup do not fork a git process
+per repository. Handles ``.git`` files (``gitdir: ...``) used by linked
+worktrees and submodules, and the ``commondir`` indirection that shares
+config and refs between worktrees.
+
+Anything the reader does not fully understand (reftable ref storage,
+config ``include``/``includeIf`` directives, unreadable files) raises
+UnsupportedGitLayout so callers can fall back to the git CLI.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Symbolic refs deeper than this are treated as a loop, as git does
+MAX_SYMREF_DEPTH = 5
+
+_ESCAPES = {'n': '\n', 't': '\t', 'b': '\b', '\\': '\\', '"': '"'}
+
+
+class UnsupportedGitLayout(Exception):
+    """The repository layout cannot be read without the git CLI."""
+
+
+def find_git_dir(path: str) -> Path:
+    """
+    Locate the git directory for a working tree.
+
+    Args:
+        path: Working tree root
+
+    Returns:
+        Path to the git directory (``.git`` itself, or the target of a
+        ``gitdir:`` file)
+
+    Raises:
+        UnsupportedGitLayout: If no readable git directory is found
+    """
+    dot_git = Path(path) / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        try:
+            content = dot_git.read_text(encoding='utf-8').strip()
+        except (OSError, UnicodeDecodeError) as e:
+            raise UnsupportedGitLayout(f"Cannot read {dot_git}: {e}")
+        if content.startswith('gitdir:'):
+            target = Path(content[len('gitdir:'):].strip())
+            if not target.is_absolute():
+                target = dot_git.parent / target
+            if target.is_dir():
+                return target
+    raise UnsupportedGitLayout(f"No git directory at {path}")
+
+
+def parse_git_config(text: str) -> Dict[str, List[str]]:
+    """
+    Parse git config file syntax.
+
+    Keys are returned as ``section.key`` or ``section.subsection.key``.
+    Section and key names are lowercased (git treats them
+    case-insensitively); subsection names keep their case. Each key maps
+    to all of its values in file order, so the last one is what
+    ``git config --get`` reports.
+
+    Args:
+        text: Contents of a config file
+
+    Returns:
+        Dict of key -> list of values
+
+    Raises:
+        UnsupportedGitLayout: On include directives or malformed syntax
+    """
+    values: Dict[str, List[str]] = {}
+    section: Optional[str] = None
+    lines = text.splitlines()
+    i = 0
+
+    while i < len(lines):
+        line = lines[i].strip()
+        i += 1
+        if not line or line[0] in '#;':
+            continue
+
+        if line[0] == '[':
+            end = line.find(']')
+            if end < 0:
+                raise UnsupportedGitLayout(f"Malformed config section: {line}")
+            header = line[1:end].strip()
+            if '"' in header:
+                name, _, sub = header.partition(' ')
+                sub = sub.strip()
+                if len(sub) < 2 or sub[0] != '"' or sub[-1] != '"':
+                    raise UnsupportedGitLayout(f"Malformed config section: {line}")
+                sub = sub[1:-1].replace('\\\\', '\\').replace('\\"', '"')
+                section = f"{name.lower()}.{sub}"
+            else:
+                # Also covers the deprecated [section.subsection] form,
+                # whose subsection git lowercases too
+                section = header.lower()
+            if section.split('.', 1)[0] in ('include', 'includeif'):
+                raise UnsupportedGitLayout("Config uses include directives")
+            line = line[end + 1:].strip()
+            if not line or line[0] in '#;':
+                continue
+
+        if section is None:
+            raise UnsupportedGitLayout(f"Config entry outside a section: {line}")
+
+        name, sep, raw = line.partition('=')
+        key = f"{section}.{name.strip().lower()}"
+        if not sep:
+            values.setdefault(key, []).append('true')
+            continue
+
+        # Values may continue onto the next line with a trailing backslash
+        while _continues(raw) and i < len(lines):
+            raw = raw[:-1] + lines[i]
+            i += 1
+        values.setdefault(key, []).append(_parse_config_value(raw))
+
+    return values
+
+
+def _continues(raw: str) -> bool:
+    """True if a value line ends in an unescaped backslash."""
+    return (len(raw) - len(raw.rstrip('\\'))) % 2 == 1
+
+
+def _parse_config_value(raw: str) -> str:
+    """Unquote a config value, drop inline comments and trim whitespace."""
+    out: List[str] = []
+    pending_space = ''
+    in_quotes = False
+    i = 0
+    while i < len(raw):
+        c = raw[i]
+        i += 1
+        if c == '\\' and i < len(raw):
+            out.append(pending_space + _ESCAPES.get(raw[i], raw[i]))
+            pending_space = ''
+            i += 1
+        elif c == '"':
+            in_quotes = not in_quotes
+        elif not in_quotes and c in '#;':
+            break
+        elif not in_quotes and c in ' \t':
+            # Internal whitespace is kept, leading/trailing is not
+            if out:
+                pending_space += c
+        else:
+            out.append(pending_space + c)
+            pending_space = ''
+    return ''.join(out)
+
+
+class GitDir:
+    """
+    Read-only view of a repository's git directory.
+
+    Example:
+        git_dir = GitDir.open("/path/to/repo")
+        git_dir.current_branch()   # 'main', or 'HEAD' when detached
+        git_dir.remote_url()       # value of remote.origin.url
+    """
+
+    def __init__(self, git_dir: Path):
+        """
+        Initialize GitDir.
+
+        Args:
+            git_dir: The git directory (per-worktree one for linked worktrees)
+        """
+        self.git_dir = git_dir
+        self.common_dir = self._read_common_dir(git_dir)
+        self._config: Optional[Dict[str, List[str]]] = None
+        self._packed: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def open(cls, path: str) -> 'GitDir':
+        """Open the git directory of the working tree at path."""
+        return cls(find_git_dir(path))
+
+    @staticmethod
+    def _read_common_dir(git_dir: Path) -> Path:
+        commondir = git_dir / 'commondir'
+        if not commondir.is_file():
+            return git_dir
+        try:
+            target = Path(commondir.read_text(encoding='utf-8').strip())
+        except (OSError, UnicodeDecodeError) as e:
+            raise UnsupportedGitLayout(f"Cannot read {commondir}: {e}")
+        if not target.is_absolute():
+            target = git_dir / target
+        return target
+
+    def _read(self, path: Path) -> str:
+        try:
+            return path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            raise UnsupportedGitLayout(f"Cannot read {path}: {e}")
+
+    @property
+    def config(self) -> Dict[str, List[str]]:
+        """Parsed repository config (common dir), loaded once."""
+        if self._config is None:
+            config = parse_git_config(self._read(self.common_dir / 'config'))
+            if config.get('extensions.refstorage', ['files'])[-1].lower() != 'files':
+                raise UnsupportedGitLayout("Non-file ref storage (reftable)")
+            if config.get('extensions.worktreeconfig', ['false'])[-1].lower() == 'true':
+                raise UnsupportedGitLayout("Per-worktree config is enabled")
+            self._config = config
+        return self._config
+
+    def get_config(self, key: str) -> Optional[str]:
+        """
+        Get a config value like ``git config --get`` (last value wins).
+
+        Args:
+            key: ``section.key`` or ``section.subsection.key``
+
+        Returns:
+            The value, or None if unset
+        """
+        section, _, name = key.rpartition('.')
+        head, dot, sub = section.partition('.')
+        normalized = f"{head.lower()}{dot}{sub}.{name.lower()}"
+        found = self.config.get(normalized)
+        return found[-1] if found else None
+
+    def remote_url(self, remote: str = 'origin') -> Optional[str]:
+        """Get the configured URL of a remote, or None."""
+        return self.get_config(f"remote.{remote}.url")
+
+    def head(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read HEAD.
+
+        Returns:
+            Tuple of (symbolic ref, commit id). The ref is None for a
+            detached HEAD; the commit id is None for an unborn branch.
+        """
+        content = self._read(self.git_dir / 'HEAD').strip()
+        if content.startswith('ref:'):
+            ref = content[len('ref:'):].strip()
+            if ref == 'refs/heads/.invalid':
+                # Placeholder HEAD written by reftable repositories
+                raise UnsupportedGitLayout("Non-file ref storage (reftable)")
+            return ref, self.resolve_ref(ref)
+        return None, content or None
+
+    def current_branch(self) -> Optional[str]:
+        """
+        Current branch name, matching ``git rev-parse --abbrev-ref HEAD``.
+
+        Returns:
+            Branch name, 'HEAD' when detached, or None on an unborn branch
+        """
+        ref, oid = self.head()
+        if oid is None:
+            return None
+        if ref is None:
+            return 'HEAD'
+        if ref.startswith('refs/heads/'):
+            return ref[len('refs/heads/'):]
+        return ref
+
+    def _packed_refs(self) -> Dict[str, str]:
+        if self._packed is None:
+            packed: Dict[str, str] = {}
+            path = self.common_dir / 'packed-refs'
+            if path.is_file():
+                for line in self._read(path).splitlines():
+                    if not line or line[0] in '#^':
+                        continue
+                    oid, _, name = line.partition(' ')
+                    packed[name.strip()] = oid
+            self._packed = packed
+        return self._packed
+
+    def resolve_ref(self, ref: str) -> Optional[str]:
+        """
+        Resolve a full ref name (e.g. ``refs/heads/main``) to a commit id.
+
+        Loose refs win over packed-refs, as in git. Per-worktree refs live
+        in the worktree's git dir, shared ones in the common dir.
+
+        Returns:
+            Commit id, or None if the ref does not exist
+        """
+        for _ in range(MAX_SYMREF_DEPTH):
+            content = None
+            for base in (self.git_dir, self.common_dir):
+                loose = base / ref
+                if loose.is_file():
+                    content = self._read(loose).strip()
+                    break
+            if content is None:
+                return self._packed_refs().get(ref)
+            if not content.startswith('ref:'):
+                return content or None
+            ref = content[len('ref:'):].strip()
+        raise UnsupportedGitLayout(f"Symbolic ref loop at {ref}")
+
+
+def read_remote_url(path: str, remote: str = 'origin') -> Optional[str]:
+    """Read a remote URL from disk (raises UnsupportedGitLayout to fall back)."""
+    return GitDir.open(path).remote_url(remote)
+
+
+def read_current_branch(path: str) -> Optional[str]:
+    """Read the current branch from disk (raises UnsupportedGitLayout to fall back)."""
+    return GitDir.open(path).current_branch()
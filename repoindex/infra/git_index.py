@@ -0,0 +1,156 @@
+"""
+Reader for the git index (``.git/index``).
+
+Lists tracked files with their sizes and modes straight from the index,
+plus the root tree OID from the cache-tree (``TREE``) extension, so
+per-file statistics need neither a git process nor a working-tree walk.
+
+Index versions 2, 3 and 4 (path-prefix compression) are supported, with
+SHA-1 or SHA-256 object names. Split indexes (``link`` extension) and
+anything malformed raise UnsupportedGitLayout.
+"""
+
+import os
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+from .git_dir import GitDir, UnsupportedGitLayout
+
+# Entry modes that are not regular files
+MODE_SYMLINK = 0o120000
+MODE_GITLINK = 0o160000
+MODE_DIRECTORY = 0o040000  # sparse-index directory entries
+
+_HEADER = struct.Struct('>4sII')
+# ctime, mtime (s, ns each), dev, ino, mode, uid, gid, size
+_STAT = struct.Struct('>10I')
+_EXTENDED_FLAG = 0x4000
+
+
+class IndexEntry(NamedTuple):
+    """One tracked path as recorded in the index."""
+    path: str
+    mode: int
+    size: int
+
+
+class GitIndex(NamedTuple):
+    """Parsed index: tracked entries, root tree OID and file checksum."""
+    entries: List[IndexEntry]
+    tree: Optional[str]
+    checksum: str
+
+    @property
+    def key(self) -> str:
+        """
+        Content key for the tracked tree.
+
+        The root tree OID while the cache-tree is valid (i.e. the index
+        matches a tree object, as after a commit or checkout); otherwise
+        the index checksum, which still changes whenever the index does.
+        """
+        return self.tree or f"index:{self.checksum}"
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decode git's offset varint (used by index v4 path compression)."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7f
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7f)
+    return value, pos
+
+
+def _root_tree(data: bytes, pos: int, end: int, hash_len: int) -> Optional[str]:
+    """Root tree OID from the extensions area, if its cache-tree is valid."""
+    while pos + 8 <= end:
+        signature, size = struct.unpack_from('>4sI', data, pos)
+        pos += 8
+        if signature == b'link':
+            raise UnsupportedGitLayout('split index')
+        if signature == b'TREE':
+            # Root entry: "" NUL "<entry_count> <subtrees>\n" [oid]
+            nul = data.index(b'\0', pos)
+            newline = data.index(b'\n', nul)
+            entry_count = int(data[nul + 1:newline].split(b' ', 1)[0])
+            if entry_count < 0:
+                return None
+            return data[newline + 1:newline + 1 + hash_len].hex()
+        pos += size
+    return None
+
+
+def parse_git_index(data: bytes, hash_len: int = 20) -> GitIndex:
+    """
+    Parse the contents of an index file.
+
+    Args:
+        data: Raw index file bytes
+        hash_len: Object name length (20 for SHA-1, 32 for SHA-256)
+
+    Raises:
+        UnsupportedGitLayout: Unknown version, split index or malformed data
+    """
+    try:
+        signature, version, count = _HEADER.unpack_from(data, 0)
+        if signature != b'DIRC' or version not in (2, 3, 4):
+            raise UnsupportedGitLayout(f'unsupported index version {version}')
+
+        entries: List[IndexEntry] = []
+        pos = _HEADER.size
+        previous = b''
+        for _ in range(count):
+            start = pos
+            fields = _STAT.unpack_from(data, pos)
+            mode, size = fields[6], fields[9]
+            pos += _STAT.size + hash_len
+            (flags,) = struct.unpack_from('>H', data, pos)
+            pos += 2
+            if version >= 3 and flags & _EXTENDED_FLAG:
+                pos += 2
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                nul = data.index(b'\0', pos)
+                path = previous[:len(previous) - strip] + data[pos:nul]
+                pos = nul + 1
+            else:
+                nul = data.index(b'\0', pos)
+                path = data[pos:nul]
+                # Entries are NUL-padded to a multiple of 8 bytes
+                pos = start + ((nul - start + 8) & ~7)
+            previous = path
+            entries.append(IndexEntry(path.decode('utf-8', 'surrogateescape'), mode, size))
+
+        end = len(data) - hash_len
+        tree = _root_tree(data, pos, end, hash_len)
+        return GitIndex(entries, tree, data[end:].hex())
+    except (struct.error, ValueError, IndexError) as e:
+        raise UnsupportedGitLayout(f'malformed index: {e}') from e
+
+
+def read_git_index(path: str) -> GitIndex:
+    """
+    Read the index of the repository whose working tree is at ``path``.
+
+    A repository without an index (nothing staged yet) has no entries.
+
+    Raises:
+        UnsupportedGitLayout: No git directory, or an index this reader
+            cannot parse
+    """
+    git_dir = GitDir.open(path)
+    if not (git_dir.git_dir / 'HEAD').is_file():
+        raise UnsupportedGitLayout(f"No HEAD in {git_dir.git_dir}")
+    object_format = (git_dir.get_config('extensions.objectformat') or 'sha1').lower()
+    hash_len = 32 if object_format == 'sha256' else 20
+    try:
+        with open(os.path.join(str(git_dir.git_dir), 'index'), 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return GitIndex([], None, 'empty')
+    except OSError as e:
+        raise UnsupportedGitLayout(f'cannot read index: {e}') from e
+    return parse_git_index(data, hash_len)
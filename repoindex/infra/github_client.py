@@ -2,22 +2,149 @@
 GitHub API client infrastructure for repoindex.
 
 Provides a clean abstraction over GitHub API access:
-- Uses `gh` CLI when available for authentication
-- Falls back to requests with token
-- Handles rate limiting with exponential backoff
+- Resolves a token once (config, environment, then ``gh auth token``)
+  and makes every call in-process over the shared HTTP pools; the `gh`
+  binary is only consulted for that token, never forked per request
+- Shares the process-wide api.github.com budget (rate_limit), so
+  threads wait together for a quota reset; secondary rate limits get
+  exponential backoff
+- Sends conditional requests (ETag / If-Modified-Since) when given a
+  ResponseCache, serving 304s from disk
+- Fetches repo metadata in bulk through GraphQL aliases (get_repos)
 """
 
+import hashlib
 import subprocess
 import json
 import os
+import re
+import threading
 import time
 import logging
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, replace
+from typing import Optional, List, Dict, Any, Mapping, NamedTuple, Tuple
 from datetime import datetime
 
+from .rate_limit import RateLimitExhausted
+from .response_cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
+API_ROOT = 'https://api.github.com/'
+DEFAULT_ACCEPT = 'application/vnd.github.v3+json'
+
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+# Repos per GraphQL query; each is one aliased repository() lookup
+GRAPHQL_BATCH_SIZE = 100
+
+# Everything GitHubRepo needs, in one round trip per repo. GitHub allows
+# at most 20 topics per repo. There is no GraphQL field for "Pages
+# enabled"; Pages builds deploy to the github-pages environment, so a
+# deployment there stands in for REST's has_pages. Branch-served sites
+# without a recorded (or with a pruned) deployment have none, so a
+# gh-pages branch or docs/ directory is fetched too, and get_repos()
+# asks REST for those repos.
+_REPO_GRAPHQL_FIELDS = """
+fragment RepoFields on Repository {
+  name
+  nameWithOwner
+  owner { login }
+  description
+  homepageUrl
+  primaryLanguage { name }
+  stargazerCount
+  forkCount
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  isFork
+  isPrivate
+  isArchived
+  defaultBranchRef { name }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  licenseInfo { key }
+  hasIssuesEnabled
+  hasWikiEnabled
+  deployments(environments: ["github-pages"], first: 1) { totalCount }
+  pagesBranch: ref(qualifiedName: "refs/heads/gh-pages") { name }
+  docsTree: object(expression: "HEAD:docs") { __typename }
+  createdAt
+  updatedAt
+  pushedAt
+}
+"""
+
+
+def _pages_unconfirmed(node: Dict[str, Any]) -> bool:
+    """A GraphQL node without a Pages deployment that may still serve Pages."""
+    deployments = (node.get('deployments') or {}).get('totalCount', 0)
+    return not deployments and bool(node.get('pagesBranch') or node.get('docsTree'))
+
+
+class ApiResponse(NamedTuple):
+    """Status, headers (case-insensitive) and body text of one API call."""
+    status: int
+    headers: Mapping[str, str]
+    body: str
+
+
+def _next_page(link_header: Optional[str]) -> Optional[str]:
+    """Endpoint of the ``rel="next"`` page from a Link header, if any."""
+    if not link_header:
+        return None
+    match = _LINK_NEXT_RE.search(link_header)
+    if not match:
+        return None
+    url = match.group(1)
+    return url[len(API_ROOT):] if url.startswith(API_ROOT) else None
+
+
+_gh_token: Optional[str] = None
+_gh_token_checked = False
+_gh_token_lock = threading.Lock()
+
+
+def gh_auth_token() -> Optional[str]:
+    """
+    The token the `gh` CLI is logged in with, if any.
+
+    Runs ``gh auth token`` at most once per process; the answer (including
+    "no token") is remembered.
+    """
+    global _gh_token, _gh_token_checked
+    with _gh_token_lock:
+        if not _gh_token_checked:
+            _gh_token_checked = True
+            try:
+                result = subprocess.run(
+                    ['gh', 'auth', 'token'],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                if result.returncode == 0:
+                    _gh_token = result.stdout.strip() or None
+            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+                pass
+        return _gh_token
+
+
+def resolve_token(config: Optional[dict] = None) -> Optional[str]:
+    """
+    GitHub token for API calls.
+
+    Checks config['github']['token'], then REPOINDEX_GITHUB_TOKEN (the
+    repoindex-specific override) and GITHUB_TOKEN, then the `gh` CLI login.
+    """
+    token = ((config or {}).get('github') or {}).get('token')
+    return (
+        token
+        or os.environ.get('REPOINDEX_GITHUB_TOKEN')
+        or os.environ.get('GITHUB_TOKEN')
+        or gh_auth_token()
+    )
+
 
 @dataclass
 class RateLimitStatus:
@@ -101,6 +228,45 @@ class GitHubRepo:
             pushed_at=data.get('pushed_at'),
         )
 
+    @classmethod
+    def from_graphql(cls, node: Dict[str, Any]) -> 'GitHubRepo':
+        """Create from a GraphQL ``RepoFields`` node.
+
+        Counts follow the REST semantics: open_issues includes open pull
+        requests and watchers mirrors the star count.
+        """
+        def total(field: str) -> int:
+            return (node.get(field) or {}).get('totalCount', 0)
+
+        def name_of(field: str) -> Optional[str]:
+            return (node.get(field) or {}).get('name')
+
+        topics = (node.get('repositoryTopics') or {}).get('nodes') or []
+        return cls(
+            owner=(node.get('owner') or {}).get('login', ''),
+            name=node.get('name', ''),
+            full_name=node.get('nameWithOwner', ''),
+            description=node.get('description'),
+            homepage=node.get('homepageUrl'),
+            language=name_of('primaryLanguage'),
+            stars=node.get('stargazerCount', 0),
+            forks=node.get('forkCount', 0),
+            watchers=node.get('stargazerCount', 0),
+            open_issues=total('issues') + total('pullRequests'),
+            is_fork=node.get('isFork', False),
+            is_private=node.get('isPrivate', False),
+            is_archived=node.get('isArchived', False),
+            default_branch=name_of('defaultBranchRef') or 'main',
+            topics=[t['topic']['name'] for t in topics if t and t.get('topic')],
+            license_key=(node.get('licenseInfo') or {}).get('key'),
+            has_issues=node.get('hasIssuesEnabled', True),
+            has_wiki=node.get('hasWikiEnabled', True),
+            has_pages=total('deployments') > 0,
+            created_at=node.get('createdAt'),
+            updated_at=node.get('updatedAt'),
+            pushed_at=node.get('pushedAt'),
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -133,8 +299,10 @@ class GitHubClient:
     """
     GitHub API client with rate limiting.
 
-    Uses `gh` CLI for authentication when available,
-    with fallback to direct API calls with token.
+    All requests are made in-process through the shared connection pools.
+    Without an explicit token the client uses resolve_token(), so a `gh`
+    login works without any configuration; with no token at all, REST
+    calls are made anonymously (60 requests/hour).
 
     Example:
         client = GitHubClient()
@@ -148,22 +316,26 @@ class GitHubClient:
         token: Optional[str] = None,
         max_retries: int = 3,
         base_delay: float = 1.0,
-        max_delay: float = 60.0
+        max_delay: float = 60.0,
+        response_cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize GitHubClient.
 
         Args:
-            token: GitHub token (defaults to REPOINDEX_GITHUB_TOKEN or GITHUB_TOKEN env var)
+            token: GitHub token (defaults to resolve_token(): environment,
+                then the `gh` CLI login)
             max_retries: Maximum retry attempts for rate-limited requests
             base_delay: Base delay for exponential backoff
             max_delay: Maximum delay between retries
+            response_cache: ETag/Last-Modified cache for conditional requests
+                (None disables caching)
         """
-        self.token = token or os.environ.get('REPOINDEX_GITHUB_TOKEN') or os.environ.get('GITHUB_TOKEN')
+        self.token = token or resolve_token()
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
-        self._use_gh_cli = self._check_gh_cli()
+        self.response_cache = response_cache
         self._rate_limit_status: Optional[RateLimitStatus] = None
 
     def _update_rate_limit_from_headers(self, headers: Dict[str, str]) -> None:
@@ -207,36 +379,14 @@ class GitHubClient:
 
     def _fetch_rate_limit(self) -> None:
         """Fetch rate limit status from GitHub API."""
-        if self._use_gh_cli:
-            try:
-                result = subprocess.run(
-                    ['gh', 'api', 'rate_limit'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if result.returncode == 0 and result.stdout:
-                    data = json.loads(result.stdout)
-                    core = data.get('rate', {})
-                    self._rate_limit_status = RateLimitStatus(
-                        remaining=core.get('remaining', 0),
-                        limit=core.get('limit', 0),
-                        reset_time=core.get('reset', 0),
-                        used=core.get('used', 0)
-                    )
-                    return
-            except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
-                pass
-
-        # Fall back to requests
         try:
-            import requests
+            from .http import http_get
             url = "https://api.github.com/rate_limit"
             headers = {'Accept': 'application/vnd.github.v3+json', 'User-Agent': 'repoindex'}
             if self.token:
                 headers['Authorization'] = f'token {self.token}'
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_get(url, headers=headers, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 core = data.get('rate', {})
@@ -249,39 +399,19 @@ class GitHubClient:
         except Exception:
             pass
 
-    def _check_gh_cli(self) -> bool:
-        """Check if gh CLI is available and authenticated."""
-        try:
-            result = subprocess.run(
-                ['gh', 'auth', 'status'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
-
-    def _gh_api(self, endpoint: str) -> Optional[Dict[str, Any]]:
-        """Call GitHub API using gh CLI."""
-        try:
-            result = subprocess.run(
-                ['gh', 'api', endpoint],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0 and result.stdout:
-                return json.loads(result.stdout)
-            return None
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
-            logger.debug(f"gh api call failed for {endpoint}: {e}")
-            return None
+    def _cache_key(self, endpoint: str, accept: str) -> str:
+        """Response cache key; responses differ by credentials and media type."""
+        if self.token:
+            identity = hashlib.sha256(self.token.encode()).hexdigest()[:16]
+        else:
+            identity = 'anonymous'
+        return f"{identity}|{accept}|{endpoint}"
 
-    def _requests_api(self, endpoint: str) -> Optional[Dict[str, Any]]:
+    def _requests_api(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> Optional[ApiResponse]:
         """Call GitHub API using requests library."""
         try:
             import requests
+            from .http import http_get
         except ImportError:
             logger.warning("requests library not available for GitHub API")
             return None
@@ -289,7 +419,8 @@ class GitHubClient:
         url = f"https://api.github.com/{endpoint}"
         headers = {
             'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'repoindex'
+            'User-Agent': 'repoindex',
+            **(headers or {}),
         }
 
         if self.token:
@@ -297,36 +428,32 @@ class GitHubClient:
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = http_get(url, headers=headers, timeout=30)
 
                 # Track rate limit from headers
                 self._update_rate_limit_from_headers(response.headers)
 
-                if response.status_code == 200:
-                    return response.json()
+                if response.status_code in (200, 304, 404):
+                    return ApiResponse(response.status_code, response.headers, response.text)
 
                 if response.status_code == 403:
-                    # Rate limited
-                    reset_time = response.headers.get('X-RateLimit-Reset')
-                    if reset_time:
-                        wait_time = int(reset_time) - int(time.time())
-                        if wait_time > 0 and wait_time < self.max_delay:
-                            logger.info(f"Rate limited, waiting {wait_time}s")
-                            time.sleep(wait_time)
-                            continue
-
-                    # Exponential backoff
+                    # Quota used up: the shared api.github.com budget now
+                    # holds every thread until the reset, so just retry
+                    if response.headers.get('X-RateLimit-Remaining') == '0':
+                        continue
+
+                    # Secondary rate limit: exponential backoff
                     delay = min(self.base_delay * (2 ** attempt), self.max_delay)
                     logger.info(f"Rate limited, waiting {delay}s (attempt {attempt + 1})")
                     time.sleep(delay)
                     continue
 
-                if response.status_code == 404:
-                    return None
-
                 logger.warning(f"GitHub API error {response.status_code} for {endpoint}")
                 return None
 
+            except RateLimitExhausted as e:
+                logger.warning(f"GitHub API: {e}")
+                return None
             except requests.RequestException as e:
                 logger.warning(f"GitHub API request failed: {e}")
                 if attempt < self.max_retries - 1:
@@ -336,14 +463,101 @@ class GitHubClient:
 
         return None
 
+    def _get_page(self, endpoint: str, accept: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        GET one page, conditionally when the response cache has it.
+
+        Returns:
+            (decoded JSON or None, endpoint of the next page or None)
+        """
+        headers = {'Accept': accept}
+        cache = self.response_cache
+        key = self._cache_key(endpoint, accept)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+
+        response = self._requests_api(endpoint, headers)
+        if response is None:
+            return None, None
+        link = response.headers.get('Link')
+
+        if response.status == 304 and cached is not None:
+            cache.record_not_modified()
+            body = cached.body
+            # A 304 need not repeat Link; the stored page's still applies
+            link = link or cached.link
+        elif response.status == 200:
+            body = response.body
+            if cache is not None:
+                cache.put(key, response.headers.get('ETag'), response.headers.get('Last-Modified'), body, link)
+        else:
+            return None, None
+        next_endpoint = _next_page(link)
+
+        try:
+            return json.loads(body), next_endpoint
+        except json.JSONDecodeError as e:
+            logger.debug(f"Invalid JSON from {endpoint}: {e}")
+            return None, None
+
+    def api(
+        self,
+        endpoint: str,
+        accept: str = DEFAULT_ACCEPT,
+        paginate: bool = False,
+    ) -> Optional[Any]:
+        """
+        GET a REST endpoint and decode its JSON.
+
+        Requests are conditional when a response cache is configured, so
+        unchanged resources come back as 304s served from disk.
+
+        Args:
+            endpoint: Path below https://api.github.com/ (query string allowed)
+            accept: Media type to request
+            paginate: Follow ``Link: rel="next"`` and concatenate list pages
+
+        Returns:
+            Decoded JSON, or None on error or 404
+        """
+        data, next_endpoint = self._get_page(endpoint, accept)
+        if not paginate or not isinstance(data, list):
+            return data
+        while next_endpoint:
+            page, next_endpoint = self._get_page(next_endpoint, accept)
+            if not isinstance(page, list):
+                break
+            data.extend(page)
+        return data
+
+    def write(self, method: str, endpoint: str, payload: Dict[str, Any]) -> ApiResponse:
+        """
+        Send a write request (PATCH, PUT, POST, DELETE) with a JSON body.
+
+        Writes are sent once, never retried. Needs a token; without one
+        GitHub answers 401.
+
+        Returns:
+            ApiResponse; callers check the status
+
+        Raises:
+            requests.RequestException: On network errors and timeouts
+        """
+        from .http import http_request
+
+        headers = {'Accept': DEFAULT_ACCEPT, 'User-Agent': 'repoindex'}
+        if self.token:
+            headers['Authorization'] = f'token {self.token}'
+        response = http_request(
+            method, f"{API_ROOT}{endpoint}", json=payload, headers=headers, timeout=30,
+        )
+        self._update_rate_limit_from_headers(response.headers)
+        return ApiResponse(response.status_code, response.headers, response.text)
+
     def _api(self, endpoint: str) -> Optional[Dict[str, Any]]:
         """Call GitHub API using best available method."""
-        if self._use_gh_cli:
-            result = self._gh_api(endpoint)
-            if result is not None:
-                return result
-
-        return self._requests_api(endpoint)
+        return self.api(endpoint)
 
     def get_repo(self, owner: str, name: str) -> Optional[GitHubRepo]:
         """
@@ -361,6 +575,99 @@ class GitHubClient:
             return GitHubRepo.from_api_response(data)
         return None
 
+    def graphql(self, query: str, variables: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run a GraphQL query (requires a token).
+
+        Returns:
+            The decoded response, ``{'data': ..., 'errors': [...]}``; data
+            may be partial when some fields failed. None if the request
+            itself failed.
+        """
+        variables = variables or {}
+        if not self.token:
+            return None
+        try:
+            import requests
+            from .http import http_post
+        except ImportError:
+            logger.warning("requests library not available for GitHub API")
+            return None
+        try:
+            response = http_post(
+                GRAPHQL_URL,
+                json={'query': query, 'variables': variables},
+                headers={'Authorization': f'bearer {self.token}'},
+                timeout=60,
+            )
+        except requests.RequestException as e:
+            logger.warning(f"GitHub GraphQL request failed: {e}")
+            return None
+        self._update_rate_limit_from_headers(response.headers)
+        if response.status_code != 200:
+            logger.warning(f"GitHub GraphQL error {response.status_code}")
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def get_repos(
+        self,
+        repos: List[Tuple[str, str]],
+        batch_size: int = GRAPHQL_BATCH_SIZE,
+    ) -> Dict[Tuple[str, str], Optional[GitHubRepo]]:
+        """
+        Get metadata for many repositories, batch_size per GraphQL query.
+
+        Args:
+            repos: (owner, name) pairs
+            batch_size: Aliased repository lookups per query
+
+        Returns:
+            Dict keyed by the (owner, name) pairs as given. A GitHubRepo
+            for each repo found, None for each GitHub reported as not
+            found; pairs in a batch that failed for any other reason are
+            left out, so callers can fall back to get_repo().
+        """
+        results: Dict[Tuple[str, str], Optional[GitHubRepo]] = {}
+        pairs = list(dict.fromkeys(repos))
+        for start in range(0, len(pairs), batch_size):
+            chunk = pairs[start:start + batch_size]
+            params = ', '.join(f'$o{i}: String!, $n{i}: String!' for i in range(len(chunk)))
+            lookups = '\n'.join(
+                f'  r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}'
+                for i in range(len(chunk))
+            )
+            variables = {}
+            for i, (owner, name) in enumerate(chunk):
+                variables[f'o{i}'] = owner
+                variables[f'n{i}'] = name
+            response = self.graphql(
+                f'query({params}) {{\n{lookups}\n}}\n{_REPO_GRAPHQL_FIELDS}', variables
+            )
+            data = (response or {}).get('data') or {}
+
+            # Only NOT_FOUND is a definitive answer for a missing alias
+            not_found = {
+                error['path'][0]
+                for error in (response or {}).get('errors') or []
+                if error.get('type') == 'NOT_FOUND' and error.get('path')
+            }
+            for i, pair in enumerate(chunk):
+                node = data.get(f'r{i}')
+                if node:
+                    repo = GitHubRepo.from_graphql(node)
+                    if _pages_unconfirmed(node):
+                        # REST's has_pages is authoritative
+                        rest = self.get_repo(*pair)
+                        if rest is not None:
+                            repo = replace(repo, has_pages=rest.has_pages)
+                    results[pair] = repo
+                elif f'r{i}' in not_found:
+                    results[pair] = None
+        return results
+
     def get_topics(self, owner: str, name: str) -> List[str]:
         """
         Get repository topics.
@@ -377,6 +684,31 @@ class GitHubClient:
             return data.get('names', [])
         return []
 
+    def add_topics(self, owner: str, name: str, topics: List[str]) -> ApiResponse:
+        """
+        Add topics to a repository, keeping the ones it already has.
+
+        Raises:
+            LookupError: If the current topics cannot be read (writing
+                then would drop them)
+            requests.RequestException: On network errors and timeouts
+        """
+        data = self.api(f"repos/{owner}/{name}/topics")
+        if not isinstance(data, dict):
+            raise LookupError(f"could not read current topics of {owner}/{name}")
+        current = data.get('names', [])
+        names = current + [t for t in topics if t not in current]
+        return self.write('PUT', f"repos/{owner}/{name}/topics", {'names': names})
+
+    def update_repo(self, owner: str, name: str, **fields: Any) -> ApiResponse:
+        """
+        Update repository settings (description, homepage, ...).
+
+        Raises:
+            requests.RequestException: On network errors and timeouts
+        """
+        return self.write('PATCH', f"repos/{owner}/{name}", fields)
+
     def repo_exists(self, owner: str, name: str) -> bool:
         """Check if repository exists and is accessible."""
         return self.get_repo(owner, name) is not None
@@ -0,0 +1,131 @@
+"""
+Shared HTTP layer for repoindex.
+
+Every outbound request (registry providers, event scanners, the GitHub
+REST fallback and GraphQL batches) goes through one process-wide
+connection pool instead of a bare ``requests.get``, which opened a new
+TCP/TLS connection per call:
+
+- keep-alive pools per host, so a refresh with ``--external`` pays one
+  handshake per registry rather than one per package
+- at most MAX_CONNECTIONS_PER_HOST concurrent connections per host;
+  further requests wait for a free connection instead of opening more
+- GET/HEAD retried on connection errors, 429 and 5xx with exponential
+  backoff, honoring ``Retry-After`` (capped at MAX_RETRY_AFTER seconds).
+  When retries run out the last response is returned, so callers keep
+  handling status codes as before. POSTs are not retried.
+- each request first acquires from its host's process-wide budget
+  (``rate_limit``), which paces requests and honors quota headers
+
+Sessions are per thread (cookies and other session state are not shared
+between workers) but all mount the same adapter, so connection pools are.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rate_limit import get_budget
+
+USER_AGENT = 'repoindex (+https://github.com/queelius/repoindex)'
+
+# Hosts with a live pool (LRU); refresh talks to a dozen at most
+POOLED_HOSTS = 32
+MAX_CONNECTIONS_PER_HOST = 8
+
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5  # seconds; doubles per attempt
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Never sleep longer than this for a Retry-After header
+MAX_RETRY_AFTER = 60
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry whose Retry-After sleeps are capped."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def build_adapter(
+    per_host: int = MAX_CONNECTIONS_PER_HOST,
+    retries: int = RETRY_TOTAL,
+) -> HTTPAdapter:
+    """HTTPAdapter with pooled keep-alive connections and retry/backoff."""
+    retry = _CappedRetry(
+        total=retries,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=POOLED_HOSTS,
+        pool_maxsize=per_host,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+
+_adapter: Optional[HTTPAdapter] = None
+_adapter_lock = threading.Lock()
+_local = threading.local()
+
+
+def _shared_adapter() -> HTTPAdapter:
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = build_adapter()
+        return _adapter
+
+
+def get_session() -> requests.Session:
+    """This thread's session on the shared connection pools."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        adapter = _shared_adapter()
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['User-Agent'] = USER_AGENT
+        _local.session = session
+    return session
+
+
+def http_request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Any method through the shared pools and the host's rate-limit budget.
+
+    Takes the same arguments as requests.request.
+
+    Raises:
+        RateLimitExhausted: If the host's quota will not reset soon
+            (a requests.RequestException, like other transport errors)
+    """
+    budget = get_budget(url)
+    budget.acquire()
+    response = None
+    try:
+        response = get_session().request(method, url, **kwargs)
+        return response
+    finally:
+        budget.release(response.headers if response is not None else None)
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared pools; takes the same arguments as requests.get."""
+    kwargs.setdefault('allow_redirects', True)
+    return http_request('GET', url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """POST through the shared pools (not retried); same arguments as requests.post."""
+    return http_request('POST', url, **kwargs)
@@ -0,0 +1,241 @@
+"""
+Process-wide request budgets, one per API host.
+
+Every request made through ``repoindex.infra.http`` first acquires from
+the budget for its host, so the source workers, the --jobs repo workers
+and the event scanners share one pace per API instead of each thread
+discovering the limit on its own:
+
+- a token bucket (requests per second plus a burst) per host, from
+  DEFAULT_LIMITS; hosts not listed are only paced by their headers
+- quota headers (``X-RateLimit-*`` as sent by GitHub, or the IETF
+  ``RateLimit-*`` fields) update the budget as each response is
+  released; requests still in flight count against it. Once
+  less than PACE_BELOW of the quota is left, the remaining requests are
+  spread evenly until the reset; at zero, every thread waits for the
+  reset (up to MAX_QUOTA_WAIT seconds, after which acquire() raises
+  RateLimitExhausted instead of stalling the refresh).
+
+GitHub's search and GraphQL quotas are separate from its core quota, so
+they get budgets of their own.
+"""
+
+import threading
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+# (requests per second, burst) by budget key
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    'api.github.com': (10.0, 20),
+    'api.github.com/search': (0.5, 5),  # 30 requests/minute
+    'pypi.org': (20.0, 20),
+    'pypistats.org': (1.0, 3),
+    'crates.io': (1.0, 1),  # crawler policy: one request per second
+}
+
+# Start pacing once less than this fraction of a quota is left
+PACE_BELOW = 0.2
+# Longest a request waits for an exhausted quota to reset
+MAX_QUOTA_WAIT = 60.0
+
+
+class RateLimitExhausted(requests.RequestException):
+    """A host's quota is used up and does not reset within MAX_QUOTA_WAIT."""
+
+
+def budget_key(url: str) -> str:
+    """The budget a URL draws from: its host, or a GitHub quota resource."""
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if host == 'api.github.com':
+        if parts.path.startswith('/search/'):
+            return f'{host}/search'
+        if parts.path == '/graphql':
+            return f'{host}/graphql'
+    return host
+
+
+def _header_int(headers: Mapping[str, str], *names: str) -> Optional[int]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return int(float(value))
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class HostBudget:
+    """
+    Token bucket plus header-reported quota for one host.
+
+    Every acquire() must be paired with a release(), passing the
+    response headers when there is a response. Thread-safe; acquire()
+    sleeps outside the lock, so one waiting thread does not hold up
+    release() calls from the others.
+    """
+
+    def __init__(self, name: str, rate: Optional[float] = None, burst: int = 1):
+        """
+        Args:
+            name: Budget key (see budget_key)
+            rate: Requests per second; None paces by headers only
+            burst: Requests allowed back to back before pacing applies
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.requests = 0
+        self.waited = 0.0  # seconds spent waiting, summed over threads
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._reported: Optional[int] = None  # lowest remaining seen this window
+        self._in_flight = 0
+        self._limit: Optional[int] = None
+        self._reset_at: Optional[float] = None  # Unix time
+        self._pace: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _remaining(self) -> Optional[int]:
+        if self._reported is None:
+            return None
+        return self._reported - self._in_flight
+
+    def _current_rate(self) -> Optional[float]:
+        rates = [r for r in (self.rate, self._pace) if r]
+        return min(rates) if rates else None
+
+    def _wait_needed(self, now: float) -> float:
+        """Seconds until a request may go (callers hold the lock); 0 takes it."""
+        remaining = self._remaining()
+        if remaining is not None and remaining <= 0 and self._reset_at:
+            until_reset = self._reset_at - time.time()
+            if until_reset > MAX_QUOTA_WAIT:
+                raise RateLimitExhausted(
+                    f"{self.name} quota exhausted; resets in {int(until_reset)}s"
+                )
+            if until_reset > 0:
+                return until_reset
+            # The window has rolled over; the next response reports the new quota
+            self._reported = None
+            self._pace = None
+
+        rate = self._current_rate()
+        if rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * rate)
+            self._refilled = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / rate
+            self._tokens -= 1
+
+        self.requests += 1
+        self._in_flight += 1
+        return 0.0
+
+    def acquire(self) -> None:
+        """
+        Block until a request to this host may be sent.
+
+        Raises:
+            RateLimitExhausted: If the quota is used up for longer than
+                MAX_QUOTA_WAIT
+        """
+        while True:
+            with self._lock:
+                wait = self._wait_needed(time.monotonic())
+                if wait <= 0:
+                    return
+                self.waited += wait
+            time.sleep(wait)
+
+    def release(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Finish a request, updating the quota from its rate-limit headers."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            remaining = _header_int(headers or {}, 'X-RateLimit-Remaining', 'RateLimit-Remaining')
+            if remaining is None:
+                return
+            limit = _header_int(headers, 'X-RateLimit-Limit', 'RateLimit-Limit')
+            reset = _header_int(headers, 'X-RateLimit-Reset')
+            if reset is None:
+                delta = _header_int(headers, 'RateLimit-Reset')  # seconds from now
+                reset = int(time.time()) + delta if delta is not None else None
+
+            if reset is not None and reset != self._reset_at:
+                # New window: the header is authoritative
+                self._reported = remaining
+            elif self._reported is None or remaining < self._reported:
+                # Responses arrive out of order; keep the lower count
+                self._reported = remaining
+            if reset is not None:
+                self._reset_at = reset
+            if limit is not None:
+                self._limit = limit
+
+            self._pace = None
+            if self._limit and self._reset_at and self._reported < self._limit * PACE_BELOW:
+                seconds_left = max(1.0, self._reset_at - time.time())
+                self._pace = max(self._reported - self._in_flight, 1) / seconds_left
+
+    def status(self) -> dict:
+        """Snapshot for progress reporting and stats."""
+        with self._lock:
+            return {
+                'name': self.name,
+                'requests': self.requests,
+                'waited': round(self.waited, 1),
+                'remaining': self._remaining(),
+                'limit': self._limit,
+                'reset_at': self._reset_at,
+                'rate': self._current_rate(),
+                'paced': self._pace is not None,
+            }
+
+
+_budgets: Dict[str, HostBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_budget(url: str) -> HostBudget:
+    """The process-wide budget for a URL's host."""
+    key = budget_key(url)
+    with _budgets_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            host = key.split('/', 1)[0]
+            rate, burst = DEFAULT_LIMITS.get(key) or DEFAULT_LIMITS.get(host) or (None, 1)
+            budget = _budgets[key] = HostBudget(key, rate, burst)
+        return budget
+
+
+def all_budgets() -> List[HostBudget]:
+    with _budgets_lock:
+        return list(_budgets.values())
+
+
+def reset_budgets() -> None:
+    """Forget all budgets (tests, long-lived processes between runs)."""
+    with _budgets_lock:
+        _budgets.clear()
+
+
+def quota_wait() -> Tuple[float, Optional[str]]:
+    """
+    Longest wait for an exhausted quota to reset, and which budget.
+
+    Returns:
+        (seconds, budget name), or (0.0, None) when no quota is exhausted
+    """
+    longest, name = 0.0, None
+    now = time.time()
+    for budget in all_budgets():
+        state = budget.status()
+        if state['remaining'] is not None and state['remaining'] <= 0 and state['reset_at']:
+            wait = state['reset_at'] - now
+            if wait > longest:
+                longest, name = wait, budget.name
+    return longest, name
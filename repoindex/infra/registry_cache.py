@@ -0,0 +1,205 @@
+"""
+TTL cache for package registry lookups.
+
+Registry metadata (versions, download counts) changes rarely, so each
+provider's check() result is stored keyed by ``(registry, package)`` and
+reused until it is older than the registry's TTL. Lookups that found no
+package (the providers' ``published: False`` answer to a 404) are cached
+too, with a shorter TTL, so unpublished packages don't cost a request on
+every refresh. Failed lookups (check() returned None) are never cached.
+
+TTLs come from ``refresh.providers`` in the config:
+
+    refresh:
+      providers:
+        pypi: true                  # default TTLs
+        cran:
+          enabled: true
+          ttl: 7d                   # seconds, or 30m / 12h / 7d / 1w
+          negative_ttl: 1d
+
+``refresh --max-age`` overrides every TTL for one run (``--max-age 0``
+re-queries everything). Like the HTTP response cache, the store is its
+own SQLite file next to the index database, since it is written from
+source worker threads.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+# Default file name, created next to the index database
+REGISTRY_CACHE_FILENAME = 'registry_cache.db'
+
+# Seconds a found package / a not-found answer stays fresh
+DEFAULT_TTL = 24 * 3600
+DEFAULT_NEGATIVE_TTL = 6 * 3600
+
+_DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+
+
+def parse_duration(value: Union[str, int, float]) -> float:
+    """
+    Parse a duration: seconds, or a number with an s/m/h/d/w suffix.
+
+    Raises:
+        ValueError: If the value is not a non-negative duration
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = float(value)
+    else:
+        match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*', str(value))
+        if not match:
+            raise ValueError(f"Invalid duration: {value!r} (use e.g. 3600, 30m, 12h, 7d)")
+        seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2) or 's']
+    if seconds < 0:
+        raise ValueError(f"Invalid duration: {value!r} (must not be negative)")
+    return seconds
+
+
+def registry_ttls(registry: str, config: Optional[dict] = None) -> Tuple[float, float]:
+    """
+    (ttl, negative_ttl) in seconds for a registry.
+
+    ``refresh.max_age`` (set by ``refresh --max-age``) overrides both.
+    """
+    refresh_config = (config or {}).get('refresh', {}) or {}
+    max_age = refresh_config.get('max_age')
+    if max_age is not None:
+        seconds = parse_duration(max_age)
+        return seconds, seconds
+    entry = (refresh_config.get('providers') or {}).get(registry)
+    if not isinstance(entry, dict):
+        return DEFAULT_TTL, DEFAULT_NEGATIVE_TTL
+    ttl = parse_duration(entry.get('ttl', DEFAULT_TTL))
+    return ttl, parse_duration(entry.get('negative_ttl', min(ttl, DEFAULT_NEGATIVE_TTL)))
+
+
+class RegistryCache:
+    """
+    Persistent registry lookup results keyed by (registry, package).
+
+    Counters (this process only):
+        hits: a fresh stored result was returned
+        negative_hits: of those, how many were cached not-found answers
+        misses: nothing fresh was stored, so the registry was queried
+
+    Example:
+        cache = RegistryCache(Path("~/.repoindex/registry_cache.db"))
+        data = cache.get('pypi', 'requests', max_age=86400)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            path: SQLite file to use (opened on first use); None keeps
+                the cache in memory
+        """
+        self.path = Path(path).expanduser() if path else None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the store on first use (callers hold the lock)."""
+        if self._conn is None:
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path) if self.path else ':memory:',
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS registry_results (
+                    registry TEXT NOT NULL,
+                    package TEXT NOT NULL,
+                    found INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (registry, package)
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, registry: str, package: str, max_age: float,
+            negative_max_age: Optional[float] = None) -> Optional[dict]:
+        """
+        A stored result no older than its max age, counting a hit or a miss.
+
+        Args:
+            registry: Registry id (e.g. "pypi")
+            package: Package name as detected
+            max_age: Seconds a found package stays fresh
+            negative_max_age: Seconds a not-found answer stays fresh
+                (defaults to max_age)
+
+        Returns:
+            The stored result dict, or None if missing or expired
+        """
+        if negative_max_age is None:
+            negative_max_age = max_age
+        with self._lock:
+            row = self._db().execute(
+                "SELECT found, data, fetched_at FROM registry_results WHERE registry = ? AND package = ?",
+                (registry, package)
+            ).fetchone()
+            if row is not None:
+                found, data, fetched_at = row
+                if time.time() - fetched_at < (max_age if found else negative_max_age):
+                    self.hits += 1
+                    if not found:
+                        self.negative_hits += 1
+                    return json.loads(data)
+            self.misses += 1
+            return None
+
+    def put(self, registry: str, package: str, data: dict) -> None:
+        """Store a lookup result; ``data['published']`` false marks a not-found answer."""
+        with self._lock:
+            db = self._db()
+            db.execute(
+                """INSERT OR REPLACE INTO registry_results (registry, package, found, data, fetched_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (registry, package, 1 if data.get('published') else 0, json.dumps(data), time.time())
+            )
+            db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for this process: hits, negative_hits and misses."""
+        with self._lock:
+            return {'hits': self.hits, 'negative_hits': self.negative_hits, 'misses': self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM registry_results")
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_shared: Dict[str, RegistryCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_registry_cache(config: Optional[dict] = None) -> RegistryCache:
+    """The process-wide registry cache stored next to the index database."""
+    from ..database.connection import get_db_path
+    path = get_db_path(config).with_name(REGISTRY_CACHE_FILENAME)
+    key = str(path)
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = RegistryCache(path)
+        return _shared[key]
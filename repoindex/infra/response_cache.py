@@ -0,0 +1,157 @@
+"""
+Conditional-request cache for API responses.
+
+Stores the body of each GET response together with its validators
+(``ETag`` / ``Last-Modified``) and its ``Link`` header so the next request for the same endpoint
+can be sent conditionally. A ``304 Not Modified`` answer is then served
+from disk, pagination included (a 304 need not repeat ``Link``); GitHub does not count authorized 304s against the rate limit,
+so an unchanged repo costs nothing on a repeat ``refresh --github``.
+
+The cache lives in its own SQLite file next to the index database (it is
+filled from worker threads, while the index has a single writer) and
+keeps hit/miss/304 counters for the current process.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+# Default file name, created next to the index database
+RESPONSE_CACHE_FILENAME = 'http_cache.db'
+
+
+class CachedResponse(NamedTuple):
+    """A stored response body, the validators it was served with and its Link header."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: str
+    link: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that make a request conditional on this response."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Persistent ETag/Last-Modified cache keyed by request.
+
+    Counters (this process only):
+        hits: a stored response existed, so the request was conditional
+        misses: nothing stored, so the request was unconditional
+        not_modified: the server answered 304 and the body came from disk
+
+    Example:
+        cache = ResponseCache(Path("~/.repoindex/http_cache.db"))
+        client = GitHubClient(response_cache=cache)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            path: SQLite file to use (opened on first use); None keeps
+                the cache in memory
+        """
+        self.path = Path(path).expanduser() if path else None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the store on first use (callers hold the lock)."""
+        if self._conn is None:
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path) if self.path else ':memory:',
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body TEXT NOT NULL,
+                    link TEXT,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a stored response, counting a hit or a miss."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT etag, last_modified, body, link FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return CachedResponse(*row)
+
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: str,
+            link: Optional[str] = None) -> None:
+        """Store a response; ignored unless it carries a validator."""
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            db = self._db()
+            db.execute(
+                """INSERT OR REPLACE INTO responses (key, etag, last_modified, body, link, fetched_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, etag, last_modified, body, link, time.time())
+            )
+            db.commit()
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for this process: hits, misses and not_modified (304s)."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'not_modified': self.not_modified}
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM responses")
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_shared: Dict[str, ResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_response_cache(config: Optional[dict] = None) -> ResponseCache:
+    """
+    The process-wide cache stored next to the index database.
+
+    One instance per file, so every client and scanner in a refresh
+    shares connections and counters.
+    """
+    from ..database.connection import get_db_path
+    path = get_db_path(config).with_name(RESPONSE_CACHE_FILENAME)
+    key = str(path)
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = ResponseCache(path)
+        return _shared[key]
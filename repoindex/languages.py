@@ -0,0 +1,373 @@
+"""
+Language statistics for repositories.
+
+One engine behind every language detector in repoindex (the refresh
+path's RepositoryService and MetadataStore.refresh): per-language file
+and byte counts over the files git tracks, read straight from the index
+rather than by walking the working tree. Untracked build output, vendored
+checkouts and virtualenvs therefore never count, whatever they are named.
+
+Results are keyed by the tracked tree (see GitIndex.key) plus the
+detection settings, so a LanguageCache only recomputes them when HEAD's
+tree (or the staged tree) changes. Directories that are not git
+repositories fall back to a pruned, budgeted walk of the working tree,
+which is not cached.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+from .infra.git_dir import UnsupportedGitLayout
+from .infra.git_index import MODE_DIRECTORY, MODE_GITLINK, MODE_SYMLINK, read_git_index
+
+# Extension (lowercase) -> language
+LANGUAGE_EXTENSIONS = {
+    # Python
+    '.py': 'Python', '.pyw': 'Python', '.pyx': 'Python', '.pxd': 'Python',
+    '.pyi': 'Python', '.py3': 'Python',
+    # JavaScript/TypeScript
+    '.js': 'JavaScript', '.mjs': 'JavaScript', '.jsx': 'JavaScript',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript',
+    # Web
+    '.html': 'HTML', '.htm': 'HTML', '.xhtml': 'HTML',
+    '.css': 'CSS', '.scss': 'CSS', '.sass': 'CSS', '.less': 'CSS',
+    '.vue': 'Vue', '.svelte': 'Svelte',
+    # Systems
+    '.c': 'C', '.h': 'C',
+    '.cpp': 'C++', '.cc': 'C++', '.cxx': 'C++', '.hpp': 'C++', '.hh': 'C++', '.hxx': 'C++',
+    '.rs': 'Rust', '.go': 'Go', '.zig': 'Zig',
+    # JVM
+    '.java': 'Java', '.kt': 'Kotlin', '.kts': 'Kotlin',
+    '.scala': 'Scala', '.sc': 'Scala', '.clj': 'Clojure', '.cljs': 'Clojure',
+    # .NET
+    '.cs': 'C#', '.fs': 'F#', '.vb': 'Visual Basic',
+    # Mobile
+    '.swift': 'Swift', '.m': 'Objective-C', '.mm': 'Objective-C',
+    '.dart': 'Dart',
+    # Scripting
+    '.rb': 'Ruby', '.php': 'PHP', '.pl': 'Perl', '.pm': 'Perl',
+    '.lua': 'Lua', '.tcl': 'Tcl',
+    # Shell
+    '.sh': 'Shell', '.bash': 'Shell', '.zsh': 'Shell', '.fish': 'Shell',
+    '.ps1': 'PowerShell', '.psm1': 'PowerShell', '.psd1': 'PowerShell',
+    '.bat': 'Batch', '.cmd': 'Batch',
+    # Data/Config
+    '.json': 'JSON', '.xml': 'XML', '.yaml': 'YAML', '.yml': 'YAML',
+    '.toml': 'TOML', '.ini': 'INI', '.cfg': 'INI',
+    '.sql': 'SQL',
+    # Documentation
+    '.md': 'Markdown', '.rst': 'reStructuredText', '.adoc': 'AsciiDoc',
+    '.tex': 'TeX', '.latex': 'LaTeX',
+    # Other
+    '.r': 'R', '.rmd': 'R',
+    '.jl': 'Julia', '.nim': 'Nim', '.nims': 'Nim',
+    '.ex': 'Elixir', '.exs': 'Elixir', '.erl': 'Erlang', '.hrl': 'Erlang',
+    '.ml': 'OCaml', '.mli': 'OCaml', '.hs': 'Haskell', '.lhs': 'Haskell',
+    '.lisp': 'Lisp', '.cl': 'Common Lisp', '.el': 'Emacs Lisp',
+    '.vim': 'Vim script', '.vimrc': 'Vim script',
+}
+
+# `.h` is both C's and C++'s header; tallied as C unless the repository
+# has C++ sources, so headers don't outvote a C++ project's own files
+C_HEADER_EXTENSION = '.h'
+
+# Bumped when the same files would tally differently, so stored stats recompute
+STATS_VERSION = 2
+
+# Filename-based detection for extensionless files
+FILENAME_LANGUAGES = {
+    'Makefile': 'Makefile', 'makefile': 'Makefile', 'GNUmakefile': 'Makefile',
+    'Dockerfile': 'Dockerfile', 'dockerfile': 'Dockerfile',
+    'Jenkinsfile': 'Groovy', 'Vagrantfile': 'Ruby',
+    'Gemfile': 'Ruby', 'Rakefile': 'Ruby', 'Guardfile': 'Ruby',
+    'Pipfile': 'Python', 'requirements.txt': 'Python', 'setup.py': 'Python',
+    'package.json': 'JSON', 'composer.json': 'JSON', 'tsconfig.json': 'JSON',
+    'CMakeLists.txt': 'CMake', '.gitignore': 'Git', '.dockerignore': 'Docker',
+}
+
+# Data, config and prose formats: counted, but never a repo's "language"
+NON_CODE_LANGUAGES = frozenset({
+    'JSON', 'XML', 'YAML', 'TOML', 'INI', 'Markdown', 'reStructuredText',
+    'AsciiDoc', 'Git', 'Docker',
+})
+
+# Languages the repos table's primary `language` is chosen from (the set
+# the repository scanner always detected), so markup, styles, TeX and
+# build files never become a repo's language
+PRIMARY_LANGUAGES = frozenset({
+    'Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C', 'C++',
+    'Ruby', 'PHP', 'Swift', 'Kotlin', 'Scala', 'R', 'Julia', 'Shell', 'Lua',
+    'Perl',
+})
+
+# Common binary/vendor directories to skip (combined with config)
+DEFAULT_SKIP_DIRS = frozenset({
+    '.git', 'node_modules', 'vendor', 'venv', '.venv', 'env', '_deps',
+    '__pycache__', '.mypy_cache', '.pytest_cache', 'dist', 'build',
+    'target', 'bin', 'obj', '.idea', '.vscode', 'coverage',
+    '.tox', 'htmlcov', '.coverage', 'site-packages', '.env',
+    'virtualenv', '.virtualenv', 'site', '_site', 'public',
+    'docs/_build', 'docs/site',
+})
+
+BINARY_EXTENSIONS = frozenset({
+    '.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe', '.o',
+    '.a', '.lib', '.jar', '.war', '.ear', '.class',
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.svg',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx',
+    '.zip', '.tar', '.gz', '.bz2', '.7z', '.rar',
+    '.db', '.sqlite', '.sqlite3',
+})
+
+# The working-tree fallback stops after this many files; proportions are
+# settled long before a large tree's tail
+WALK_FILE_BUDGET = 20000
+
+_SHEBANGS = (
+    ('python', 'Python'), ('node', 'JavaScript'), ('js', 'JavaScript'),
+    ('ruby', 'Ruby'), ('perl', 'Perl'), ('bash', 'Shell'), ('sh', 'Shell'),
+)
+
+LanguageStats = Dict[str, Dict[str, int]]
+
+
+class LanguageSettings(NamedTuple):
+    """The ``language_detection`` config section, normalized."""
+    skip_dirs: FrozenSet[str]
+    skip_hidden: bool
+    skip_extensions: Tuple[str, ...]
+    max_file_size: int
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'LanguageSettings':
+        lang_config = (config or {}).get('language_detection', {})
+        return cls(
+            skip_dirs=DEFAULT_SKIP_DIRS | frozenset(lang_config.get('skip_directories', [])),
+            skip_hidden=bool(lang_config.get('skip_hidden_directories', True)),
+            skip_extensions=tuple(sorted(e.lower() for e in lang_config.get('skip_file_extensions', []))),
+            max_file_size=lang_config.get('max_file_size_kb', 1024) * 1024,
+        )
+
+    @property
+    def digest(self) -> str:
+        """Short digest, part of the cache key so config changes recompute."""
+        text = repr((
+            STATS_VERSION, sorted(self.skip_dirs), self.skip_hidden,
+            self.skip_extensions, self.max_file_size,
+        ))
+        return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+    def skips_dir(self, name: str, rel: str) -> bool:
+        """Whether a directory (by name or path relative to the root) is skipped."""
+        return (
+            name in self.skip_dirs
+            or rel in self.skip_dirs
+            or (self.skip_hidden and name.startswith('.'))
+        )
+
+
+class LanguageCache:
+    """
+    Tree-keyed language stats, safe to share between worker threads.
+
+    Also remembers which key each repository resolved to, so a caller
+    that persists the cache (refresh stores it in the database) can write
+    one row per repository.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, LanguageStats]] = None):
+        self._entries: Dict[str, LanguageStats] = dict(entries or {})
+        self._resolved: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, repo_path: str, key: str) -> Optional[LanguageStats]:
+        with self._lock:
+            self._resolved[repo_path] = key
+            stats = self._entries.get(key)
+            if stats is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return stats
+
+    def store(self, repo_path: str, key: str, stats: LanguageStats) -> None:
+        with self._lock:
+            self._resolved[repo_path] = key
+            self._entries[key] = stats
+
+    def resolved(self, repo_path: str) -> Optional[Tuple[str, LanguageStats]]:
+        """The (key, stats) a repository last resolved to, if cached."""
+        with self._lock:
+            key = self._resolved.get(repo_path)
+            if key is None or key not in self._entries:
+                return None
+            return key, self._entries[key]
+
+
+def _shebang_language(filepath: str) -> Optional[str]:
+    try:
+        with open(filepath, 'rb') as f:
+            first_line = f.readline()
+    except OSError:
+        return None
+    if not first_line.startswith(b'#!'):
+        return None
+    shebang = first_line.decode('utf-8', errors='ignore').strip()
+    for needle, language in _SHEBANGS:
+        if needle in shebang:
+            return language
+    return None
+
+
+def _classify(filename: str, filepath: str, size: int, settings: LanguageSettings) -> Optional[str]:
+    """Language of one file, or None if it is skipped or unrecognized."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in BINARY_EXTENSIONS or size > settings.max_file_size:
+        return None
+    if settings.skip_extensions and filename.lower().endswith(settings.skip_extensions):
+        return None
+    if filename in FILENAME_LANGUAGES:
+        return FILENAME_LANGUAGES[filename]
+    if ext in LANGUAGE_EXTENSIONS:
+        return LANGUAGE_EXTENSIONS[ext]
+    if not ext:
+        return _shebang_language(filepath)
+    return None
+
+
+def _tally(files: Iterable[Tuple[str, str, int]], settings: LanguageSettings) -> LanguageStats:
+    """Accumulate (filename, filepath, size) triples into language stats."""
+    languages: LanguageStats = {}
+    headers = {'files': 0, 'bytes': 0}
+    for filename, filepath, size in files:
+        language = _classify(filename, filepath, size, settings)
+        if language == 'C' and filename.lower().endswith(C_HEADER_EXTENSION):
+            headers['files'] += 1
+            headers['bytes'] += size
+        elif language:
+            entry = languages.setdefault(language, {'files': 0, 'bytes': 0})
+            entry['files'] += 1
+            entry['bytes'] += size
+    if headers['files']:
+        entry = languages.setdefault('C++' if 'C++' in languages else 'C', {'files': 0, 'bytes': 0})
+        entry['files'] += headers['files']
+        entry['bytes'] += headers['bytes']
+    return languages
+
+
+def _tracked_files(repo_path: str, entries, settings: LanguageSettings):
+    """Index entries that are regular files outside skipped directories."""
+    dir_ok: Dict[str, bool] = {'': True}
+
+    def allowed(directory: str) -> bool:
+        ok = dir_ok.get(directory)
+        if ok is None:
+            parent, _, name = directory.rpartition('/')
+            ok = allowed(parent) and not settings.skips_dir(name, directory)
+            dir_ok[directory] = ok
+        return ok
+
+    for entry in entries:
+        if entry.mode in (MODE_SYMLINK, MODE_GITLINK, MODE_DIRECTORY):
+            continue
+        directory, _, filename = entry.path.rpartition('/')
+        if allowed(directory):
+            yield filename, os.path.join(repo_path, entry.path), entry.size
+
+
+def _walked_files(root: str, settings: LanguageSettings, budget: int):
+    """Files of a working tree, pruning skipped directories, up to a budget."""
+    seen = 0
+    stack = [(root, '')]
+    while stack:
+        directory, rel = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            sub = f"{rel}/{entry.name}" if rel else entry.name
+                            if not settings.skips_dir(entry.name, sub):
+                                stack.append((entry.path, sub))
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        size = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    yield entry.name, entry.path, size
+                    seen += 1
+                    if seen >= budget:
+                        return
+        except OSError:
+            continue
+
+
+def language_stats(
+    repo_path: str,
+    config: Optional[Dict[str, Any]] = None,
+    cache: Optional[LanguageCache] = None,
+    budget: int = WALK_FILE_BUDGET,
+) -> LanguageStats:
+    """
+    Per-language file and byte counts for a repository.
+
+    Args:
+        repo_path: Working tree root
+        config: Configuration (reads the ``language_detection`` section)
+        cache: Optional tree-keyed cache to consult and fill
+        budget: File limit for the working-tree fallback
+
+    Returns:
+        Dict mapping language -> {'files': n, 'bytes': n}, in first-seen
+        order. Callers get their own copy and may modify it.
+    """
+    settings = LanguageSettings.from_config(config)
+    try:
+        index = read_git_index(repo_path)
+    except UnsupportedGitLayout:
+        return _tally(_walked_files(repo_path, settings, budget), settings)
+
+    key = f"{index.key}:{settings.digest}"
+    stats = cache.lookup(repo_path, key) if cache is not None else None
+    if stats is None:
+        stats = _tally(_tracked_files(repo_path, index.entries, settings), settings)
+        if cache is not None:
+            cache.store(repo_path, key, stats)
+    return {language: dict(counts) for language, counts in stats.items()}
+
+
+def rank_languages(
+    stats: LanguageStats,
+    by: str = 'files',
+    code_only: bool = True,
+    primary_from: Optional[FrozenSet[str]] = None,
+) -> Tuple[Optional[str], list]:
+    """
+    Order languages for display.
+
+    Args:
+        stats: Output of language_stats()
+        by: 'files' or 'bytes'; the other count breaks ties
+        code_only: Leave out data, config and prose formats
+        primary_from: Only these languages can be the primary one
+            (default: any that is ranked)
+
+    Returns:
+        (primary language or None, all languages in descending order)
+    """
+    other = 'bytes' if by == 'files' else 'files'
+    ranked = sorted(
+        (lang for lang in stats if not (code_only and lang in NON_CODE_LANGUAGES)),
+        key=lambda lang: (stats[lang][by], stats[lang][other]),
+        reverse=True,
+    )
+    primary = next((lang for lang in ranked if primary_from is None or lang in primary_from), None)
+    return primary, ranked
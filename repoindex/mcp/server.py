@@ -25,6 +25,7 @@ from typing import Optional
 
 from ..config import load_config
 from ..database.connection import Database, get_db_path
+from ..database.repository import get_repo_count
 
 _TABLE_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 
@@ -55,10 +56,14 @@ def _get_manifest_impl() -> dict:
             ('tags', 'Repository tags'),
             ('publications', 'Package registry publications'),
         ]:
-            db.execute(f"SELECT COUNT(*) as count FROM {table_name}")
-            row = db.fetchone()
+            if table_name == 'repos':
+                row_count = get_repo_count(db)
+            else:
+                db.execute(f"SELECT COUNT(*) as count FROM {table_name}")
+                row = db.fetchone()
+                row_count = row['count'] if row else 0
             tables[table_name] = {
-                'row_count': row['count'] if row else 0,
+                'row_count': row_count,
                 'description': desc,
             }
 
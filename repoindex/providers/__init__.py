@@ -16,7 +16,7 @@ import logging
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..domain.repository import PackageMetadata
 
@@ -40,10 +40,14 @@ class RegistryProvider(ABC):
         registry: Short identifier (e.g., "pypi", "npm", "cargo")
         name: Human-readable name (e.g., "Python Package Index")
         batch: True if this provider uses batch pre-fetch instead of per-repo API calls
+        detect_files: Paths (relative to the repo root) that detect() reads
+            to decide, if nothing else; lets refresh cache detection
+            (see MetadataSource.detect_files)
     """
     registry: str = ""
     name: str = ""
     batch: bool = False
+    detect_files: Optional[Tuple[str, ...]] = None
 
     @abstractmethod
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
@@ -149,6 +153,15 @@ class PlatformProvider(ABC):
             Dict of {prefix}_* fields to merge into repos table, or None
         """
 
+    def prefetch_repos(self, repo_records: List[dict], config: dict) -> None:
+        """
+        Optional batch hook, called once per refresh after discovery.
+
+        Receives the records (remote_url, name, owner) of every repo the
+        refresh will enrich, so a platform can fetch them in bulk and
+        answer enrich() from memory.
+        """
+
 
 # Built-in provider module names (relative to repoindex.providers)
 BUILTIN_PROVIDERS = [
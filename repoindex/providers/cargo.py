@@ -10,8 +10,7 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -22,6 +21,7 @@ class CargoProvider(RegistryProvider):
     registry = "cargo"
     name = "crates.io"
     batch = False
+    detect_files = ('Cargo.toml',)
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect Rust crate name from Cargo.toml."""
@@ -53,7 +53,7 @@ class CargoProvider(RegistryProvider):
         try:
             url = f"https://crates.io/api/v1/crates/{package_name}"
             headers = {'User-Agent': 'repoindex (https://github.com/queelius/repoindex)'}
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = http_get(url, headers=headers, timeout=10)
 
             if resp.status_code == 200:
                 data = resp.json()
@@ -9,8 +9,7 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,7 @@ class CondaProvider(RegistryProvider):
     registry = "conda"
     name = "conda-forge"
     batch = False
+    detect_files = ('recipe/meta.yaml', 'meta.yaml', 'conda.recipe/meta.yaml')
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect conda package from recipe/meta.yaml or meta.yaml."""
@@ -53,7 +53,7 @@ class CondaProvider(RegistryProvider):
         """Check Anaconda (conda-forge channel) for package."""
         try:
             url = f"https://api.anaconda.org/package/conda-forge/{package_name}"
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
 
             if resp.status_code == 200:
                 data = resp.json()
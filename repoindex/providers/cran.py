@@ -9,8 +9,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -39,6 +38,7 @@ class CRANProvider(RegistryProvider):
     registry = "cran"
     name = "CRAN / Bioconductor"
     batch = False
+    detect_files = ('DESCRIPTION',)
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect R package name from DESCRIPTION file."""
@@ -58,7 +58,7 @@ class CRANProvider(RegistryProvider):
 
         # Try CRAN via crandb (JSON API)
         try:
-            resp = requests.get(
+            resp = http_get(
                 f'https://crandb.r-pkg.org/{package_name}', timeout=10, headers=headers,
             )
             if resp.status_code == 200:
@@ -75,7 +75,7 @@ class CRANProvider(RegistryProvider):
 
         # Fallback: try Bioconductor
         try:
-            resp = requests.get(
+            resp = http_get(
                 f'https://bioconductor.org/packages/json/3.20/bioc/{package_name}',
                 timeout=10, headers=headers,
             )
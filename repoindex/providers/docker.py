@@ -9,8 +9,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,7 @@ class DockerProvider(RegistryProvider):
     registry = "docker"
     name = "Docker Hub"
     batch = False
+    # No detect_files: the image name also depends on the repo's owner
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect Docker image from Dockerfile presence."""
@@ -48,7 +48,7 @@ class DockerProvider(RegistryProvider):
             else:
                 url = f"https://hub.docker.com/v2/repositories/library/{package_name}/"
 
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
 
             if resp.status_code == 200:
                 data = resp.json()
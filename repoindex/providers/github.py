@@ -4,16 +4,20 @@ GitHub platform provider for repoindex.
 Wraps the existing GitHubClient infrastructure to provide
 repo-level metadata enrichment (stars, forks, topics, etc.)
 via the PlatformProvider ABC.
+
+During refresh, prefetch_repos() fetches every GitHub-hosted repo in
+GraphQL batches of ~100, so enrich() is a dictionary lookup; repos the
+batch could not answer fall back to one REST call each.
 """
 
 import json
 import logging
-import os
 import re
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from . import PlatformProvider
-from ..infra.github_client import GitHubClient
+from ..infra.github_client import GitHubClient, GitHubRepo, resolve_token
+from ..infra.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +50,22 @@ class GitHubPlatformProvider(PlatformProvider):
     prefix = "github"
 
     def __init__(self):
-        # Cache clients by token to avoid per-call 'gh auth status' subprocess cost
+        # One client (and connection pool) per token
         self._client_cache: dict = {}
+        # (owner, name), lowercased -> repo from the last prefetch_repos();
+        # None means GitHub reported it as not found
+        self._prefetched: Dict[Tuple[str, str], Optional[GitHubRepo]] = {}
+
+    def _get_client(self, token: Optional[str], config: Optional[dict] = None) -> GitHubClient:
+        """Return a cached GitHubClient for the given token.
 
-    def _get_client(self, token: Optional[str]) -> GitHubClient:
-        """Return a cached GitHubClient for the given token."""
+        Clients share the persistent response cache, so repos that have
+        not changed since the last refresh cost a 304 each, not quota.
+        """
         if token not in self._client_cache:
-            self._client_cache[token] = GitHubClient(token=token)
+            self._client_cache[token] = GitHubClient(
+                token=token, response_cache=get_response_cache(config),
+            )
         return self._client_cache[token]
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> bool:
@@ -61,6 +74,24 @@ class GitHubPlatformProvider(PlatformProvider):
         owner, name = _parse_github_remote(url)
         return owner is not None
 
+    def prefetch_repos(self, repo_records: List[dict], config: dict) -> None:
+        """Fetch all GitHub-hosted repos in GraphQL batches for enrich()."""
+        pairs = []
+        for record in repo_records:
+            owner, name = _parse_github_remote((record or {}).get('remote_url'))
+            if owner and name:
+                pairs.append((owner, name))
+        self._prefetched = {}
+        if not pairs:
+            return
+
+        client = self._get_client(resolve_token(config), config)
+        found = client.get_repos(pairs)
+        self._prefetched = {
+            (owner.lower(), name.lower()): repo for (owner, name), repo in found.items()
+        }
+        logger.info(f"GitHub: prefetched {len(found)} of {len(pairs)} repos via GraphQL")
+
     def enrich(self, repo_path: str, repo_record: Optional[dict] = None,
                config: Optional[dict] = None) -> Optional[dict]:
         """Fetch GitHub metadata and return prefixed fields."""
@@ -69,13 +100,12 @@ class GitHubPlatformProvider(PlatformProvider):
         if not owner or not name:
             return None
 
-        config = config or {}
-        token = config.get('github', {}).get('token')
-        if not token:
-            token = os.environ.get('GITHUB_TOKEN') or os.environ.get('REPOINDEX_GITHUB_TOKEN')
-
-        client = self._get_client(token)
-        repo = client.get_repo(owner, name)
+        key = (owner.lower(), name.lower())
+        if key in self._prefetched:
+            repo = self._prefetched[key]
+        else:
+            client = self._get_client(resolve_token(config), config or {})
+            repo = client.get_repo(owner, name)
         if not repo:
             return None
 
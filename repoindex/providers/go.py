@@ -10,8 +10,7 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -39,6 +38,7 @@ class GoProvider(RegistryProvider):
     registry = "go"
     name = "Go Module Proxy"
     batch = False
+    detect_files = ('go.mod',)
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect Go module path from go.mod."""
@@ -61,7 +61,7 @@ class GoProvider(RegistryProvider):
         try:
             encoded = _encode_module_path(package_name)
             url = f"https://proxy.golang.org/{encoded}/@latest"
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
 
             if resp.status_code == 200:
                 data = resp.json()
@@ -10,8 +10,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -22,6 +21,7 @@ class NpmProvider(RegistryProvider):
     registry = "npm"
     name = "npm Registry"
     batch = False
+    detect_files = ('package.json',)
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect npm package from package.json."""
@@ -48,7 +48,7 @@ class NpmProvider(RegistryProvider):
         """Check npm registry for package."""
         try:
             url = f"https://registry.npmjs.org/{package_name}"
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
 
             if resp.status_code == 200:
                 data = resp.json()
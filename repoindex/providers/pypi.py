@@ -8,8 +8,7 @@ API checks to the existing module.
 import logging
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -22,7 +21,7 @@ def _fetch_downloads(package_name: str) -> Optional[int]:
     PyPI does not expose lifetime totals — pypistats only has recent windows.
     """
     try:
-        resp = requests.get(
+        resp = http_get(
             f'https://pypistats.org/api/packages/{package_name}/recent',
             timeout=10,
             headers={'User-Agent': 'repoindex (+https://github.com/queelius/repoindex)'},
@@ -40,6 +39,7 @@ class PyPIProvider(RegistryProvider):
     registry = "pypi"
     name = "Python Package Index"
     batch = False
+    detect_files = ('pyproject.toml', 'setup.py', 'setup.cfg')
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect Python package name from packaging files."""
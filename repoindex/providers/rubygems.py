@@ -9,8 +9,7 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import requests
-
+from ..infra.http import http_get
 from . import RegistryProvider, PackageMetadata
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,7 @@ class RubyGemsProvider(RegistryProvider):
     registry = "rubygems"
     name = "RubyGems"
     batch = False
+    detect_files = ('.',)  # globs *.gemspec in the repo root
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Optional[str]:
         """Detect gem name from .gemspec file."""
@@ -48,7 +48,7 @@ class RubyGemsProvider(RegistryProvider):
         """Check RubyGems.org for gem."""
         try:
             url = f"https://rubygems.org/api/v1/gems/{package_name}.json"
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
 
             if resp.status_code == 200:
                 data = resp.json()
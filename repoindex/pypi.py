@@ -9,6 +9,7 @@ import toml
 
 from .compat import tomllib
 from .config import logger
+from .infra.http import http_get
 
 
 def find_packaging_files(repo_path: str) -> List[str]:
@@ -199,7 +200,7 @@ def check_pypi_package(package_name: str, timeout: int = 10) -> Optional[Dict]:
         
         # Check main PyPI
         url = f"https://pypi.org/pypi/{package_name}/json"
-        response = requests.get(url, timeout=timeout)
+        response = http_get(url, timeout=timeout)
         
         if response.status_code == 200:
             data = response.json()
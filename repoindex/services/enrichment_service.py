@@ -0,0 +1,270 @@
+"""
+Source enrichment stage for refresh.
+
+Runs every active MetadataSource for every repo being refreshed as one
+stage, instead of a fresh thread pool per repo that at most overlaps
+one repo's sources. All (repo, source) fetches are scheduled up front as
+coroutines on an asyncio event loop in a background thread:
+
+- at most `concurrency` fetches run at a time, and at most `per_source`
+  for any one source (one source talks to one registry host)
+- request pacing and quotas are enforced below this, by the per-host
+  budgets in ``infra.rate_limit``
+- each repo's results are published as soon as its last source finishes,
+  so the DB writer picks them up while later repos are still fetching
+
+Sources keep their synchronous fetch() API (user sources and the
+requests-based providers), so each fetch runs on a worker thread via
+run_in_executor; the event loop only does the scheduling. The worker
+pool lives as long as the service (one refresh) and also serves repos
+fetched outside the stage (run()), so no thread is created per repo.
+
+Every fetch() is timed into SourceTimings, which shows which source is
+the long pole of a refresh.
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..sources.detection import DetectionCache
+
+logger = logging.getLogger(__name__)
+
+# Fetches in flight across all sources
+DEFAULT_CONCURRENCY = 32
+# Fetches in flight per source (matches http.MAX_CONNECTIONS_PER_HOST)
+PER_SOURCE_CONCURRENCY = 8
+# Upper bounds (seconds) of the latency histogram buckets; the last is open
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class SourceTimings:
+    """Thread-safe fetch() latencies per source."""
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, source_id: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(source_id, []).append(seconds)
+
+    def histogram(self, source_id: str) -> List[int]:
+        """Fetch counts per LATENCY_BUCKETS bucket, plus one for slower."""
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        with self._lock:
+            for seconds in self._samples.get(source_id, ()):
+                counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        return counts
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Per-source latency stats, slowest total first.
+
+        Returns:
+            {source_id: {'count', 'total', 'p50', 'p95', 'max', 'histogram'}}
+        """
+        with self._lock:
+            samples = {k: sorted(v) for k, v in self._samples.items() if v}
+        ranked = sorted(samples.items(), key=lambda kv: -sum(kv[1]))
+        return {
+            source_id: {
+                'count': len(values),
+                'total': sum(values),
+                'p50': _percentile(values, 0.5),
+                'p95': _percentile(values, 0.95),
+                'max': values[-1],
+                'histogram': self.histogram(source_id),
+            }
+            for source_id, values in ranked
+        }
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_source(
+    source,
+    repo_path: str,
+    repo_record: dict,
+    config: dict,
+    timings: Optional[SourceTimings] = None,
+    detections: Optional[DetectionCache] = None,
+) -> Optional[Tuple[Any, dict]]:
+    """
+    detect() then fetch() one source; (source, data) if it returned data.
+
+    A source whose (possibly cached) detect() named what it found gets
+    the name back through fetch_detected().
+    """
+    if detections is not None:
+        detected = detections.detect(source, repo_path, repo_record)
+    else:
+        detected = source.detect(repo_path, repo_record)
+    if detected:
+        start = time.perf_counter()
+        try:
+            if isinstance(detected, str):
+                data = source.fetch_detected(detected, repo_path, repo_record, config)
+            else:
+                data = source.fetch(repo_path, repo_record, config)
+        finally:
+            if timings is not None:
+                timings.record(source.source_id, time.perf_counter() - start)
+        if data:
+            return source, data
+    return None
+
+
+class EnrichmentService:
+    """
+    Fetches all sources for a set of repos concurrently.
+
+    Example:
+        enrichment = EnrichmentService(sources, config)
+        enrichment.start([(repo.path, record) for repo, record in todo])
+        try:
+            for repo, _ in todo:
+                write(repo, enrichment.results(repo.path))
+        finally:
+            enrichment.close()
+        print(enrichment.timings.summary())
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Any],
+        config: dict,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_source: int = PER_SOURCE_CONCURRENCY,
+        on_error: Optional[Callable[[Any, Exception], None]] = None,
+        detections: Optional[DetectionCache] = None,
+    ):
+        """
+        Args:
+            sources: Active MetadataSource instances
+            config: Configuration passed to every fetch()
+            concurrency: Fetches in flight across all sources
+            per_source: Fetches in flight for any one source
+            on_error: Called (from a worker thread) with the source and
+                exception when a detect()/fetch() raises; failures are
+                always logged
+            detections: Cache consulted instead of calling detect() on
+                sources that declare their input files
+        """
+        self.sources = list(sources)
+        self.config = config
+        self.concurrency = max(1, concurrency)
+        self.per_source = max(1, per_source)
+        self.on_error = on_error
+        self.timings = SourceTimings()
+        self.detections = detections
+        self._results: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix='repoindex-enrich',
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = False
+
+    def start(self, records: List[Tuple[str, dict]]) -> None:
+        """
+        Begin fetching in the background.
+
+        Args:
+            records: (repo_path, repo_record) for every repo to enrich,
+                in the order results will be consumed
+        """
+        self._results = {path: Future() for path, _ in records}
+        self._thread = threading.Thread(
+            target=asyncio.run, args=(self._run(records),),
+            name='repoindex-enrichment', daemon=True,
+        )
+        self._thread.start()
+
+    async def _run(self, records: List[Tuple[str, dict]]) -> None:
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.concurrency)
+        source_slots = {id(s): asyncio.Semaphore(self.per_source) for s in self.sources}
+
+        async def fetch(source, path: str, record: dict):
+            async with source_slots[id(source)], slots:
+                if self._cancelled:
+                    return None
+                return await loop.run_in_executor(
+                    self._executor, run_source, source, path, record, self.config,
+                    self.timings, self.detections,
+                )
+
+        async def enrich(path: str, record: dict) -> None:
+            outcomes = await asyncio.gather(
+                *(fetch(s, path, record) for s in self.sources), return_exceptions=True,
+            )
+            results = []
+            for source, outcome in zip(self.sources, outcomes):
+                if isinstance(outcome, Exception):
+                    self._report(source, outcome)
+                elif outcome:
+                    results.append(outcome)
+            self._results[path].set_result(results)
+
+        await asyncio.gather(*(enrich(path, record) for path, record in records))
+
+    def _report(self, source, error: Exception) -> None:
+        logger.warning(f"Source {source.source_id} failed: {error}")
+        if self.on_error is not None:
+            try:
+                self.on_error(source, error)
+            except Exception:
+                pass
+
+    def results(self, repo_path: str, timeout: Optional[float] = None) -> Optional[List[Tuple[Any, dict]]]:
+        """
+        Wait for one repo's (source, data) results.
+
+        Returns:
+            The results, or None if the repo was not part of this stage
+        """
+        future = self._results.get(repo_path)
+        if future is None:
+            return None
+        return future.result(timeout)
+
+    def run(self, repo_path: str, repo_record: dict) -> List[Tuple[Any, dict]]:
+        """
+        Fetch all sources for a repo outside the stage, on the shared pool.
+
+        Blocks until every source has finished; failures are reported
+        like the stage's and left out of the results.
+        """
+        futures = {
+            self._executor.submit(
+                run_source, s, repo_path, repo_record, self.config, self.timings, self.detections,
+            ): s
+            for s in self.sources
+        }
+        results = []
+        for future in as_completed(futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                self._report(futures[future], e)
+                continue
+            if outcome:
+                results.append(outcome)
+        return results
+
+    def close(self) -> None:
+        """Stop scheduling new fetches and wait for the running ones."""
+        self._cancelled = True
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -4,15 +4,19 @@ GitHub write operations service for repoindex.
 Provides operations that modify GitHub repository settings:
 - Set topics (from CLI args or pyproject.toml keywords)
 - Set description (from CLI arg or pyproject.toml)
-Uses the `gh` CLI tool for authenticated GitHub API access.
+Calls the GitHub REST API in-process with one client for the whole run;
+the token comes from config, the environment, or the `gh` CLI login.
 """
 
+import json
 import logging
-import subprocess
 from dataclasses import dataclass
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+import requests
 
 from ..config import load_config
+from ..infra.github_client import ApiResponse, GitHubClient, resolve_token
 from ..domain.operation import (
     OperationDetail,
     OperationStatus,
@@ -33,16 +37,19 @@ class GitHubOpsService:
     """
     Service for GitHub write operations.
 
-    Uses the `gh` CLI to set topics, descriptions, and other
-    repository settings on GitHub.
+    Sets topics, descriptions, and other repository settings on GitHub
+    through the REST API.
     """
 
+    NO_TOKEN = "No GitHub token: run 'gh auth login' or set GITHUB_TOKEN"
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or load_config()
         self.last_result: Optional[OperationSummary] = None
+        self._client: Optional[GitHubClient] = None
 
     def _get_repo_nwo(self, repo: Dict[str, Any]) -> Optional[str]:
-        """Get owner/name from remote URL for gh CLI."""
+        """Get owner/name from remote URL."""
         remote_url = repo.get('remote_url', '')
         if not remote_url:
             return None
@@ -59,16 +66,28 @@ class GitHubOpsService:
             nwo = nwo[:-4]
         return nwo.strip('/')
 
-    def _run_gh(self, args: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess:
-        """Run a gh CLI command."""
-        cmd = ['gh'] + args
-        return subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=cwd,
-        )
+    def _get_client(self) -> Optional[GitHubClient]:
+        """The client for this service, or None when no token is available."""
+        if self._client is None:
+            token = resolve_token(self.config)
+            if not token:
+                return None
+            self._client = GitHubClient(token=token)
+        return self._client
+
+    @staticmethod
+    def _split_nwo(nwo: str) -> Tuple[str, str]:
+        owner, _, name = nwo.partition('/')
+        return owner, name
+
+    @staticmethod
+    def _error_message(response: ApiResponse) -> str:
+        """GitHub's error message for a failed write, or the status code."""
+        try:
+            message = json.loads(response.body).get('message')
+        except (ValueError, AttributeError):
+            message = None
+        return message or f"GitHub API returned {response.status}"
 
     def set_topics(
         self,
@@ -145,14 +164,21 @@ class GitHubOpsService:
                 ))
                 continue
 
-            try:
-                # Build gh command: gh repo edit owner/repo --add-topic t1 --add-topic t2
-                args = ['repo', 'edit', nwo]
-                for t in repo_topics:
-                    args.extend(['--add-topic', t])
+            client = self._get_client()
+            if client is None:
+                yield f"Error: {self.NO_TOKEN}"
+                result.add_detail(OperationDetail(
+                    repo_path=path, repo_name=name,
+                    status=OperationStatus.FAILED,
+                    action="set_topics_failed",
+                    error="No GitHub token",
+                ))
+                return result  # No point continuing without credentials
 
-                proc = self._run_gh(args, cwd=path)
-                if proc.returncode == 0:
+            try:
+                # Adds to the repo's existing topics, like `gh repo edit --add-topic`
+                response = client.add_topics(*self._split_nwo(nwo), repo_topics)
+                if response.status == 200:
                     yield f"Set topics for {name}: {', '.join(repo_topics)}"
                     result.add_detail(OperationDetail(
                         repo_path=path, repo_name=name,
@@ -161,7 +187,7 @@ class GitHubOpsService:
                         metadata={'topics': repo_topics},
                     ))
                 else:
-                    error_msg = proc.stderr.strip() or f"gh exited with {proc.returncode}"
+                    error_msg = self._error_message(response)
                     yield f"Failed to set topics for {name}: {error_msg}"
                     result.add_detail(OperationDetail(
                         repo_path=path, repo_name=name,
@@ -170,7 +196,7 @@ class GitHubOpsService:
                         error=error_msg,
                     ))
 
-            except subprocess.TimeoutExpired:
+            except requests.Timeout:
                 yield f"Timeout setting topics for {name}"
                 result.add_detail(OperationDetail(
                     repo_path=path, repo_name=name,
@@ -178,15 +204,14 @@ class GitHubOpsService:
                     action="set_topics_failed",
                     error="Timeout",
                 ))
-            except FileNotFoundError:
-                yield "Error: gh CLI not found. Install from https://cli.github.com/"
+            except (LookupError, requests.RequestException) as e:
+                yield f"Failed to set topics for {name}: {e}"
                 result.add_detail(OperationDetail(
                     repo_path=path, repo_name=name,
                     status=OperationStatus.FAILED,
                     action="set_topics_failed",
-                    error="gh CLI not installed",
+                    error=str(e),
                 ))
-                return result  # No point continuing without gh
 
         return result
 
@@ -264,9 +289,20 @@ class GitHubOpsService:
                 ))
                 continue
 
+            client = self._get_client()
+            if client is None:
+                yield f"Error: {self.NO_TOKEN}"
+                result.add_detail(OperationDetail(
+                    repo_path=path, repo_name=name,
+                    status=OperationStatus.FAILED,
+                    action="set_description_failed",
+                    error="No GitHub token",
+                ))
+                return result
+
             try:
-                proc = self._run_gh(['repo', 'edit', nwo, '--description', desc], cwd=path)
-                if proc.returncode == 0:
+                response = client.update_repo(*self._split_nwo(nwo), description=desc)
+                if response.status == 200:
                     yield f"Set description for {name}"
                     result.add_detail(OperationDetail(
                         repo_path=path, repo_name=name,
@@ -275,7 +311,7 @@ class GitHubOpsService:
                         metadata={'description': desc},
                     ))
                 else:
-                    error_msg = proc.stderr.strip() or f"gh exited with {proc.returncode}"
+                    error_msg = self._error_message(response)
                     yield f"Failed to set description for {name}: {error_msg}"
                     result.add_detail(OperationDetail(
                         repo_path=path, repo_name=name,
@@ -284,7 +320,7 @@ class GitHubOpsService:
                         error=error_msg,
                     ))
 
-            except subprocess.TimeoutExpired:
+            except requests.Timeout:
                 yield f"Timeout setting description for {name}"
                 result.add_detail(OperationDetail(
                     repo_path=path, repo_name=name,
@@ -292,14 +328,13 @@ class GitHubOpsService:
                     action="set_description_failed",
                     error="Timeout",
                 ))
-            except FileNotFoundError:
-                yield "Error: gh CLI not found. Install from https://cli.github.com/"
+            except requests.RequestException as e:
+                yield f"Failed to set description for {name}: {e}"
                 result.add_detail(OperationDetail(
                     repo_path=path, repo_name=name,
                     status=OperationStatus.FAILED,
                     action="set_description_failed",
-                    error="gh CLI not installed",
+                    error=str(e),
                 ))
-                return result
 
         return result
@@ -15,6 +15,7 @@ from ..domain import Repository, GitStatus, GitHubMetadata, PackageMetadata
 from ..domain.repository import LicenseInfo
 from ..infra import GitClient, GitHubClient
 from ..infra.zenodo_client import ZenodoRecord, _normalize_github_url
+from ..languages import PRIMARY_LANGUAGES, LanguageCache, language_stats, rank_languages
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +129,8 @@ class RepositoryService:
         self.git = git_client or GitClient()
         self.github = github_client or GitHubClient()
         self.config = config or {}
+        # Tree-keyed language stats; refresh swaps in one loaded from the DB
+        self.language_cache = LanguageCache()
 
     def discover(
         self,
@@ -359,53 +362,12 @@ class RepositoryService:
         return 'other'
 
     def _detect_languages(self, path: str) -> tuple:
-        """Detect primary language and all languages."""
-        extensions = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.java': 'Java',
-            '.c': 'C',
-            '.cpp': 'C++',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            '.r': 'R',
-            '.R': 'R',
-            '.jl': 'Julia',
-            '.sh': 'Shell',
-            '.lua': 'Lua',
-            '.pl': 'Perl',
-        }
-
-        counts = {}
-
-        try:
-            for ext, lang in extensions.items():
-                pattern = f"**/*{ext}"
-                matches = list(Path(path).glob(pattern))
-                # Exclude common non-source directories
-                matches = [
-                    m for m in matches
-                    if not any(excl in str(m) for excl in EXCLUDE_DIRS)
-                ]
-                if matches:
-                    counts[lang] = len(matches)
-        except Exception:
-            pass
-
-        if not counts:
-            return None, []
-
-        # Primary language is the one with most files
-        primary = max(counts, key=counts.get)
-        all_langs = sorted(counts.keys(), key=lambda x: counts[x], reverse=True)
-
-        return primary, all_langs
+        """
+        Detect primary language (most tracked files among
+        PRIMARY_LANGUAGES) and all languages.
+        """
+        stats = language_stats(path, self.config, self.language_cache)
+        return rank_languages(stats, by='files', primary_from=PRIMARY_LANGUAGES)
 
     def _fetch_github_metadata(self, owner: str, name: str) -> Optional[GitHubMetadata]:
         """Fetch GitHub metadata for repository."""
@@ -44,6 +44,16 @@ _HAS_FLAGS: Tuple[str, ...] = (
     'has_changelog',
 )
 
+# repos-table columns that derive_persistable_tags reads. Callers that
+# load a row only to derive tags select just these, not the whole row
+# (which includes readme_content).
+PERSISTABLE_TAG_COLUMNS: Tuple[str, ...] = (
+    'github_topics',
+    'gitea_topics',
+    'keywords',
+    'language',
+) + _HAS_FLAGS
+
 
 def _load_json_list(raw: Any) -> Optional[list]:
     """Decode a JSON array stored as a TEXT column, or pass through a list.
@@ -92,7 +102,8 @@ def derive_persistable_tags(
     repos table directly).
 
     Args:
-        repo_row: A dict-like row from the repos table.
+        repo_row: A dict-like row from the repos table; only the
+            PERSISTABLE_TAG_COLUMNS are read.
         published_registries: Iterable of registry names where the repo
             has published=1 rows in the publications table. The caller
             runs the SQL; this function just maps to tag strings.
@@ -225,6 +236,7 @@ def derive_implicit_tags(repo_row: Mapping[str, Any]) -> List[str]:
 
 __all__ = [
     'DerivedTag',
+    'PERSISTABLE_TAG_COLUMNS',
     'derive_persistable_tags',
     'derive_implicit_tags',
 ]
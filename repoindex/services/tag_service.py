@@ -68,7 +68,7 @@ class TagService:
             config_store: FileStore for tag persistence
             config_path: Path to config file (creates store if config_store is None)
         """
-        if config_store:
+        if config_store is not None:
             self.store = config_store
         else:
             path = config_path or Path("~/.repoindex/config.json")
@@ -12,6 +12,7 @@ from pathlib import Path
 import logging
 import os
 import fnmatch
+import sqlite3
 import yaml
 import json
 
@@ -24,6 +25,25 @@ from ..query import Query
 
 logger = logging.getLogger(__name__)
 
+# (field, operator) pairs whose compiled SQL matches at least every repo
+# Query would match: the fuzzy operators, which compile to a LIKE or exact
+# test OR'd with the same rapidfuzz scores Query uses, on fields the index
+# stores as discovery reports them.  Equality (case-insensitive in Query,
+# not in SQL), negation and live status such as is_clean are left out.
+_INDEX_PREFILTER = frozenset({
+    ('name', '~='), ('name', 'contains'),
+    ('language', '~='), ('language', 'contains'),
+    ('tags', 'contains'), ('tags', 'matches'),
+})
+
+
+def _index_can_prefilter(node) -> bool:
+    """Whether every condition of a parsed Query is in _INDEX_PREFILTER."""
+    if node[0] in ('and', 'or'):
+        return all(_index_can_prefilter(part) for part in node[1])
+    return len(node) == 3 and (node[0], node[1]) in _INDEX_PREFILTER
+
+
 
 class ViewService:
     """
@@ -46,7 +66,8 @@ class ViewService:
     def __init__(
         self,
         views_path: Optional[str] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        use_index: bool = False,
     ):
         """
         Initialize ViewService.
@@ -54,9 +75,12 @@ class ViewService:
         Args:
             views_path: Path to views.yaml (uses default if None)
             config: Configuration dict
+            use_index: Narrow fuzzy view queries with the index database
+                (when it exists) before evaluating them per repo in Python
         """
         self.views_path = views_path or self._default_views_path()
         self.config = config or {}
+        self.use_index = use_index
 
         # Storage for loaded specs and templates
         self._specs: Dict[str, ViewSpec] = {}
@@ -362,11 +386,39 @@ class ViewService:
         """Evaluate a query against all repositories."""
         try:
             query = Query(query_str)
+            if self.use_index:
+                all_repos = self._prefilter_by_index(query, all_repos)
             return [repo for repo in all_repos if query.evaluate(repo.to_dict())]
         except Exception as e:
             logger.error(f"Query evaluation failed: {e}")
             return []
 
+    def _prefilter_by_index(
+        self,
+        query: Query,
+        all_repos: List[Repository]
+    ) -> List[Repository]:
+        """
+        Drop indexed repos the compiled query rules out.
+
+        Only queries the index can answer without changing their meaning
+        are compiled (see _INDEX_PREFILTER); the rest, and repos not in
+        the index yet, are left for Query to evaluate.
+        """
+        from ..database import Database, QueryCompileError, compile_query, get_db_path
+
+        if not _index_can_prefilter(query.parts) or not get_db_path(self.config).exists():
+            return all_repos
+        try:
+            compiled = compile_query(query.query_str, columns=['path'])
+            with Database(config=self.config, read_only=True) as db:
+                matched = {row['path'] for row in db.execute(compiled.sql, tuple(compiled.params))}
+                indexed = {row['path'] for row in db.execute("SELECT path FROM repos")}
+        except (QueryCompileError, sqlite3.Error) as e:
+            logger.debug(f"Query not run on the index ({e}); evaluating in Python")
+            return all_repos
+        return [repo for repo in all_repos if repo.path in matched or repo.path not in indexed]
+
     def _evaluate_tags(
         self,
         patterns: tuple,
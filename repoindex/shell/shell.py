@@ -489,19 +489,18 @@ class RepoIndexShell(cmd.Cmd):
             print("Usage: query <expression>")
             return
 
-        # Import query engine
-        from ..query import query_repositories
+        from ..database import Database, compile_query
 
-        # Execute query
+        # Execute query on the index (fuzzy operators run inside SQLite)
         try:
-            results = query_repositories(arg, self.metadata_store, self.config)
-
-            # Output as JSONL
-            for result in results:
-                print(json.dumps({
-                    "name": Path(result).name,
-                    "path": result
-                }))
+            compiled = compile_query(arg, columns=['name', 'path'])
+            with Database(config=self.config, read_only=True) as db:
+                # Output as JSONL
+                for row in db.execute(compiled.sql, tuple(compiled.params)):
+                    print(json.dumps({
+                        "name": row['name'],
+                        "path": row['path']
+                    }))
         except Exception as e:
             print(f"query error: {e}", file=sys.stderr)
 
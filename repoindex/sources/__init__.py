@@ -18,7 +18,7 @@ import logging
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -51,14 +51,21 @@ class MetadataSource(ABC):
             Literal so IDEs and type checkers catch typos; runtime
             validation in discover_sources() enforces the same contract.
         batch: True if this source uses batch pre-fetch (e.g., Zenodo ORCID lookup)
+        detect_files: Paths (relative to the repo root) that detect()
+            reads, and nothing else. Declaring them lets refresh cache
+            detect() per repo until one of them changes (see
+            repoindex.sources.detection). None (the default) means
+            detect() also depends on something else, e.g. repo_record,
+            and runs every time.
     """
     source_id: str = ""
     name: str = ""
     target: Literal["repos", "publications"] = "repos"
     batch: bool = False
+    detect_files: Optional[Tuple[str, ...]] = None
 
     @abstractmethod
-    def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> bool:
+    def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> Union[bool, str]:
         """
         Detect whether this source applies to this repo.
 
@@ -67,7 +74,10 @@ class MetadataSource(ABC):
             repo_record: Optional dict of repo metadata from database
 
         Returns:
-            True if this source can provide metadata for this repo
+            True if this source can provide metadata for this repo. A
+            source may instead return what it detected (e.g. a package
+            name) as a non-empty string; it is cached with the answer
+            and passed to fetch_detected()
         """
 
     @abstractmethod
@@ -87,9 +97,29 @@ class MetadataSource(ABC):
             For target="publications": keys are registry, name, version, published, url, etc.
         """
 
+    def fetch_detected(self, detected: Union[bool, str], repo_path: str,
+                       repo_record: Optional[dict] = None,
+                       config: Optional[dict] = None) -> Optional[dict]:
+        """
+        fetch(), given detect()'s (possibly cached) answer.
+
+        Sources whose detect() returns what fetch() needs override this
+        to use it instead of working it out again.
+        """
+        return self.fetch(repo_path, repo_record, config)
+
     def prefetch(self, config: dict) -> None:
         """Optional batch pre-fetch hook, called once per refresh."""
 
+    def prefetch_repos(self, repo_records: List[dict], config: dict) -> None:
+        """
+        Optional batch hook, called once per refresh after discovery.
+
+        Receives the records (remote_url, name, owner) of every repo the
+        refresh will run fetch() on, so remote sources can fetch them in
+        bulk (e.g. GitHub GraphQL) and serve fetch() from memory.
+        """
+
 
 class _RegistryProviderAdapter(MetadataSource):
     """Adapts an old-style RegistryProvider to the MetadataSource interface."""
@@ -101,21 +131,54 @@ class _RegistryProviderAdapter(MetadataSource):
         self.source_id = provider.registry
         self.name = provider.name
         self.batch = getattr(provider, 'batch', False)
+        # Batch providers detect everything; there is nothing to cache
+        self.detect_files = None if self.batch else getattr(provider, 'detect_files', None)
 
     def detect(self, repo_path, repo_record=None):
         # Batch providers (Zenodo) don't use detect() — their matching logic
         # is inside match(), which we call via fetch(). Always return True so
         # _run_sources_parallel gives them a chance to match.
+        # Otherwise the answer is the package name, so fetch_detected()
+        # needn't parse the manifest again.
         if self.batch:
             return True
-        result = self._provider.detect(repo_path, repo_record)
-        return result is not None
+        return self._provider.detect(repo_path, repo_record) or False
 
     def fetch(self, repo_path, repo_record=None, config=None):
-        result = self._provider.match(repo_path, repo_record, config)
-        if result is None:
+        if self._custom_match():
+            # Custom matching logic: nothing to key a cache entry on
+            result = self._provider.match(repo_path, repo_record, config)
+            if result is None:
+                return None
+            return result.to_dict()
+
+        name = self._provider.detect(repo_path, repo_record)
+        if not name:
             return None
-        return result.to_dict()
+        return self._cached_check(name, config)
+
+    def fetch_detected(self, detected, repo_path, repo_record=None, config=None):
+        if isinstance(detected, str) and not self._custom_match():
+            return self._cached_check(detected, config)
+        return self.fetch(repo_path, repo_record, config)
+
+    def _custom_match(self):
+        from ..providers import RegistryProvider
+        return self.batch or type(self._provider).match is not RegistryProvider.match
+
+    def _cached_check(self, package_name, config):
+        """check() through the registry TTL cache; failed lookups are not stored."""
+        from ..infra import registry_cache
+        cache = registry_cache.get_registry_cache(config)
+        ttl, negative_ttl = registry_cache.registry_ttls(self.source_id, config)
+        data = cache.get(self.source_id, package_name, ttl, negative_ttl)
+        if data is None:
+            result = self._provider.check(package_name, config)
+            if result is None:
+                return None
+            data = result.to_dict()
+            cache.put(self.source_id, package_name, data)
+        return data
 
     def prefetch(self, config):
         self._provider.prefetch(config)
@@ -137,6 +200,9 @@ class _PlatformProviderAdapter(MetadataSource):
     def fetch(self, repo_path, repo_record=None, config=None):
         return self._platform.enrich(repo_path, repo_record, config)
 
+    def prefetch_repos(self, repo_records, config):
+        self._platform.prefetch_repos(repo_records, config)
+
 
 def _build_builtin_sources() -> List[MetadataSource]:
     """Build the list of built-in sources by wrapping existing providers."""
@@ -15,6 +15,7 @@ class CitationCffSource(MetadataSource):
     source_id = "citation_cff"
     name = "CITATION.cff"
     target = "repos"
+    detect_files = ('CITATION.cff',)
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> bool:
         return (Path(repo_path) / 'CITATION.cff').exists()
@@ -0,0 +1,92 @@
+"""
+Detection cache for metadata sources.
+
+Most repos are not npm, cargo, conda or CRAN packages, yet every refresh
+asks every active source's detect() about every repo, and several of
+them parse a manifest to answer. A source that declares the files its
+detect() reads (``MetadataSource.detect_files``) has its answer cached
+per repo, keyed by the stat signatures of those files: while none of
+them is created, deleted or modified, detect() is a dictionary lookup.
+A source whose detect() names what it found (a registry source returns
+the package name) has the name cached too, for fetch_detected().
+
+Refresh seeds the cache from the source_detections table and writes back
+the entries resolved during the run (see repoindex.database.detections).
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from ..infra.fingerprint import stat_signature
+
+# detect()'s answer: a bool, or the non-empty string naming what it detected
+Detection = Union[bool, str]
+
+# (repo_path, source_id) -> (input key, detection)
+DetectionEntries = Dict[Tuple[str, str], Tuple[str, Detection]]
+
+
+def _answer(result) -> Detection:
+    """A detect() result as a Detection (a name is kept, anything else is a bool)."""
+    return result if isinstance(result, str) and result else bool(result)
+
+
+def detect_key(repo_path: str, files: Sequence[str]) -> str:
+    """
+    Digest of the stat signatures of a source's declared input files.
+
+    Missing files are part of the key, so creating one changes it. A
+    directory (e.g. ``.`` for a source that globs the repo root) changes
+    signature when entries are added to or removed from it.
+    """
+    digest = hashlib.sha1()
+    for name in files:
+        digest.update(f"{name}={stat_signature(os.path.join(repo_path, name))}\n".encode())
+    return digest.hexdigest()
+
+
+class DetectionCache:
+    """
+    Input-keyed detect() results, safe to share between worker threads.
+
+    Remembers which entries were resolved afresh in this process, so the
+    caller that persists the cache writes only what changed.
+    """
+
+    def __init__(self, entries: Optional[DetectionEntries] = None):
+        self._entries: DetectionEntries = dict(entries or {})
+        self._resolved: Dict[str, Dict[str, Tuple[str, Detection]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def detect(self, source, repo_path: str, repo_record: Optional[dict] = None) -> Detection:
+        """source.detect(), answered from the cache when its inputs are unchanged."""
+        files = getattr(source, 'detect_files', None)
+        if files is None:
+            return _answer(source.detect(repo_path, repo_record))
+
+        key = detect_key(repo_path, files)
+        with self._lock:
+            cached = self._entries.get((repo_path, source.source_id))
+            if cached is not None and cached[0] == key:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        detected = _answer(source.detect(repo_path, repo_record))
+        with self._lock:
+            self._entries[(repo_path, source.source_id)] = (key, detected)
+            self._resolved.setdefault(repo_path, {})[source.source_id] = (key, detected)
+        return detected
+
+    def resolved(self, repo_path: str) -> List[Tuple[str, str, Detection]]:
+        """(source_id, key, detected) entries this repo resolved afresh."""
+        with self._lock:
+            return [(source_id, key, detected)
+                    for source_id, (key, detected) in self._resolved.get(repo_path, {}).items()]
@@ -16,6 +16,7 @@ class KeywordsSource(MetadataSource):
     source_id = "keywords"
     name = "Project Keywords"
     target = "repos"
+    detect_files = _KEYWORD_FILES
 
     def detect(self, repo_path: str, repo_record: Optional[dict] = None) -> bool:
         p = Path(repo_path)
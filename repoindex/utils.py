@@ -21,6 +21,13 @@ def get_git_remote_url(repo_path, remote_name="origin"):
     Returns:
         str: The URL of the remote, or None if not found.
     """
+    from .infra.git_dir import UnsupportedGitLayout, read_remote_url
+
+    try:
+        return read_remote_url(repo_path, remote_name)
+    except UnsupportedGitLayout:
+        pass  # Let git itself resolve exotic layouts
+
     try:
         result, _ = run_command(
             f"git config --get remote.{remote_name}.url",
@@ -272,33 +279,40 @@ def get_git_status(repo_path):
     """
     Get the git status of a repository.
 
+    Runs a single `git status --porcelain=v2 --branch` (no shell) and
+    parses it with the same engine as GitClient.status.
+
     Args:
         repo_path (str): Path to the Git repository.
 
     Returns:
         dict: A dictionary containing 'status' and 'branch' information, or None if an error occurs.
     """
-    try:
-        # Get current branch
-        branch_output, _ = run_command("git rev-parse --abbrev-ref HEAD", cwd=repo_path, capture_output=True, check=False)
-        branch = branch_output.strip() if branch_output else "unknown"
+    from .infra.git_client import STATUS_COMMAND, parse_porcelain_v2
 
-        # Get status (porcelain format for clean parsing)
-        status_output, _ = run_command("git status --porcelain", cwd=repo_path, capture_output=True, check=False)
+    try:
+        status_output, returncode = run_command(
+            STATUS_COMMAND, cwd=repo_path, capture_output=True, check=False
+        )
 
         if status_output is None:
             return None
+        if returncode != 0:
+            raise RuntimeError(f"git status exited with {returncode}")
+
+        parsed = parse_porcelain_v2(status_output)
+        branch = parsed.branch or "unknown"
 
         # Parse status
-        if not status_output.strip():
+        if parsed.clean:
             status = "clean"
         else:
-            # Count different types of changes
-            lines = status_output.strip().split('\n')
-            modified = sum(1 for line in lines if line.startswith(' M') or line.startswith('M'))
-            added = sum(1 for line in lines if line.startswith('A'))
-            deleted = sum(1 for line in lines if line.startswith(' D') or line.startswith('D'))
-            untracked = sum(1 for line in lines if line.startswith('??'))
+            # Count different types of changes (porcelain v1 XY codes)
+            codes = parsed.changes
+            modified = sum(1 for xy in codes if xy.startswith(' M') or xy.startswith('M'))
+            added = sum(1 for xy in codes if xy.startswith('A'))
+            deleted = sum(1 for xy in codes if xy.startswith(' D') or xy.startswith('D'))
+            untracked = sum(1 for xy in codes if xy.startswith('??'))
 
             status_parts = []
             if modified > 0:
@@ -312,42 +326,14 @@ def get_git_status(repo_path):
 
             status = ", ".join(status_parts) if status_parts else "changes"
 
-        # Get ahead/behind counts
-        ahead = 0
-        behind = 0
-
-        # Check if we have an upstream branch
-        upstream_check, _ = run_command(
-            "git rev-parse --abbrev-ref @{u}",
-            cwd=repo_path,
-            capture_output=True,
-            check=False,
-            log_stderr=False
-        )
-
-        if upstream_check and not upstream_check.startswith("fatal:"):
-            # Get ahead/behind counts
-            rev_list_output, _ = run_command(
-                "git rev-list --left-right --count HEAD...@{u}",
-                cwd=repo_path,
-                capture_output=True,
-                check=False,
-                log_stderr=False
-            )
-            if rev_list_output:
-                parts = rev_list_output.strip().split()
-                if len(parts) == 2:
-                    ahead = int(parts[0])
-                    behind = int(parts[1])
-        
         return {
             'status': status,
             'branch': branch,
             'current_branch': branch,  # For backward compatibility
-            'ahead': ahead,
-            'behind': behind
+            'ahead': parsed.ahead,
+            'behind': parsed.behind
         }
-        
+
     except Exception as e:
         # Return a safe default if there's any error
         logger.debug(f"Failed to get git status for {repo_path}: {e}")
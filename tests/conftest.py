@@ -1,7 +1,19 @@
 import pytest
 from pyfakefs.fake_filesystem_unittest import Patcher
 
+from repoindex.infra import registry_cache
+
+
 @pytest.fixture
 def fs():
     with Patcher() as patcher:
         yield patcher.fs
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry_cache(monkeypatch):
+    """Registry lookups cached in memory per test, never in ~/.repoindex."""
+    cache = registry_cache.RegistryCache()
+    monkeypatch.setattr(registry_cache, 'get_registry_cache', lambda config=None: cache)
+    yield cache
+    cache.close()
@@ -0,0 +1,93 @@
+"""Tests for the RepoIndex API reading from the index database."""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from repoindex.api import RepoIndex
+from repoindex.database import Database, upsert_repo
+from repoindex.domain.repository import Repository
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = {'database': {'path': str(tmp_path / 'index.db')}}
+    with Database(config=config) as db:
+        for name, language, owner in (
+            ('alpha', 'Python', 'me'), ('beta', 'Python', None), ('gamma', 'Rust', 'me'),
+        ):
+            upsert_repo(db, Repository(
+                path=f'/repos/{name}', name=name, language=language, owner=owner,
+                tags=frozenset([f'work/{name}']),
+            ))
+    return config
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    # Keep the tag store out of the real ~/.repoindex
+    return str(tmp_path / 'config.json')
+
+
+@pytest.fixture
+def ri(config, config_path):
+    ri = RepoIndex(config=config, config_path=config_path)
+    # Any filesystem walk is a failure in index mode
+    with patch.object(ri.repository_service, 'discover', side_effect=AssertionError('discovered')):
+        yield ri
+
+
+class TestIndexedRepos:
+    def test_query_tags_and_limit(self, ri):
+        assert [r.name for r in ri.repos(query="language == 'Python' order by name")] == ['alpha', 'beta']
+        assert [r.name for r in ri.repos(tags=['work/g*'])] == ['gamma']
+        assert len(list(ri.repos(limit=2))) == 2
+
+    def test_text_compares_case_insensitively(self, ri):
+        assert [r.name for r in ri.repos(query="language == 'python' order by name")] == ['alpha', 'beta']
+        assert [r.name for r in ri.repos(query="language != 'PYTHON'")] == ['gamma']
+
+    def test_hydrates_domain_objects(self, ri):
+        [repo] = ri.repos(query="name == 'alpha'")
+        assert isinstance(repo, Repository)
+        assert repo.path == '/repos/alpha'
+        assert 'work/alpha' in repo.tags
+
+    def test_get_repo_by_name(self, ri):
+        assert ri.get_repo('gamma').language == 'Rust'
+        assert ri.get_repo('missing') is None
+
+    def test_count(self, ri):
+        assert ri.count() == 3
+        assert ri.count(query="language == 'Python'") == 2
+        assert ri.count(query="language == 'python'") == 2
+        assert ri.count(query="language == 'python'") == len(list(ri.repos(query="language == 'python'")))
+        assert ri.count(tags=['work/a*', 'work/gamma']) == 2
+        assert ri.count(query="language == 'Rust'", tags=['work/*']) == 1
+
+    def test_tags_stored_at_config_path(self, ri, config_path):
+        assert str(ri.tag_service.store.path) == str(Path(config_path).resolve())
+
+    def test_stats(self, ri):
+        assert ri.stats('language') == {'Python': 2, 'Rust': 1}
+        assert ri.stats('owner') == {'me': 2, 'Local': 1}
+
+
+class TestDiscoveryFallback:
+    def test_explicit_discover(self, config, config_path):
+        ri = RepoIndex(config=config, config_path=config_path)
+        with patch.object(ri.repository_service, 'discover', return_value=iter([])) as discover:
+            assert list(ri.repos(discover=True)) == []
+        discover.assert_called_once()
+
+    def test_index_disabled(self, config, config_path):
+        ri = RepoIndex(config=config, use_index=False, config_path=config_path)
+        with patch.object(ri.repository_service, 'discover', return_value=iter([])) as discover:
+            assert ri.count() == 0
+        discover.assert_called_once()
+
+    def test_uncompilable_query_is_filtered_in_python(self, config, config_path):
+        ri = RepoIndex(config=config, config_path=config_path)
+        repo = Repository(path='/repos/x', name='x', language='Python')
+        with patch.object(ri.repository_service, 'discover', return_value=iter([repo])):
+            assert [r.name for r in ri.repos(query='lang:python')] == ['x']
@@ -222,7 +222,7 @@ Suggests: testthat, knitr
 class TestCheckCranPackage(unittest.TestCase):
     """Test CRAN API interaction via crandb JSON API."""
 
-    @patch('repoindex.cran.requests.get')
+    @patch('repoindex.cran.http_get')
     def test_package_exists(self, mock_get):
         """Check existing CRAN package via crandb JSON."""
         mock_response = MagicMock()
@@ -243,7 +243,7 @@ class TestCheckCranPackage(unittest.TestCase):
         mock_get.assert_called_once()
         self.assertIn('crandb.r-pkg.org/dplyr', mock_get.call_args[0][0])
 
-    @patch('repoindex.cran.requests.get')
+    @patch('repoindex.cran.http_get')
     def test_package_not_found(self, mock_get):
         """Check non-existent CRAN package."""
         mock_response = MagicMock()
@@ -255,7 +255,7 @@ class TestCheckCranPackage(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertFalse(result['exists'])
 
-    @patch('repoindex.cran.requests.get')
+    @patch('repoindex.cran.http_get')
     def test_network_error(self, mock_get):
         """Handle network error gracefully."""
         mock_get.side_effect = Exception("Network error")
@@ -268,7 +268,7 @@ class TestCheckCranPackage(unittest.TestCase):
 class TestCheckBioconductorPackage(unittest.TestCase):
     """Test Bioconductor JSON API interaction."""
 
-    @patch('repoindex.cran.requests.get')
+    @patch('repoindex.cran.http_get')
     def test_package_exists(self, mock_get):
         """Check existing Bioconductor package via JSON API."""
         mock_response = MagicMock()
@@ -282,7 +282,7 @@ class TestCheckBioconductorPackage(unittest.TestCase):
         self.assertEqual(result['registry'], 'bioconductor')
         self.assertIn('bioconductor.org/packages/json', mock_get.call_args[0][0])
 
-    @patch('repoindex.cran.requests.get')
+    @patch('repoindex.cran.http_get')
     def test_package_not_found(self, mock_get):
         """Check non-existent Bioconductor package."""
         mock_response = MagicMock()
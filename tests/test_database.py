@@ -38,8 +38,12 @@ from repoindex.database.repository import (
     get_all_repos,
     delete_repo,
     needs_refresh,
+    refresh_reasons,
+    find_stale_repos,
+    get_stale_repos,
     get_repo_count,
     record_to_domain,
+    upsert_publications,
 )
 from repoindex.database.events import (
     insert_event,
@@ -48,6 +52,9 @@ from repoindex.database.events import (
     count_events,
     has_event,
     event_count,
+    delete_events_for_repo,
+    get_event_cursors,
+    save_event_cursor,
 )
 from repoindex.database.query_compiler import (
     compile_query,
@@ -58,7 +65,7 @@ from repoindex.database.query_compiler import (
 
 # Domain objects
 from repoindex.domain.repository import Repository, GitStatus, LicenseInfo, PackageMetadata
-from repoindex.domain.event import Event
+from repoindex.domain.event import Event, EventCursor
 
 
 class TestDatabaseConnection(unittest.TestCase):
@@ -411,6 +418,112 @@ class TestRepositoryOperations(unittest.TestCase):
             count = db.fetchone()[0]
             self.assertEqual(count, 1)
 
+    def test_upsert_publications_batch(self):
+        """Test that several registries are upserted in one call."""
+        repo = Repository(path=str(self.repo_path), name='test-repo')
+
+        with Database(db_path=self.db_path) as db:
+            repo_id = upsert_repo(db, repo)
+            upsert_publications(db, repo_id, [
+                PackageMetadata(registry='pypi', name='pkg', version='1.0', published=True),
+                PackageMetadata(registry='conda', name='pkg', version='1.0', published=False),
+            ])
+            upsert_publications(db, repo_id, [
+                PackageMetadata(registry='pypi', name='pkg', version='1.1', published=True),
+            ])
+
+            db.execute(
+                "SELECT registry, current_version, published FROM publications "
+                "WHERE repo_id = ? ORDER BY registry", (repo_id,)
+            )
+            rows = [tuple(row) for row in db.fetchall()]
+            self.assertEqual(rows, [('conda', '1.0', 0), ('pypi', '1.1', 1)])
+
+
+class TestRefreshReasons(unittest.TestCase):
+    """Stat-fingerprint smart refresh against a real git repository."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / 'test.db'
+        self.repo_path = Path(self.temp_dir) / 'repo'
+        self.repo_path.mkdir()
+        self._git('init')
+        self._git('config', 'user.email', 'test@test.com')
+        self._git('config', 'user.name', 'Test')
+        (self.repo_path / 'a.txt').write_text('a')
+        self._git('add', '.')
+        self._git('commit', '-m', 'init')
+        self.repo = Repository(path=str(self.repo_path), name='repo')
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _git(self, *args):
+        import subprocess
+        subprocess.run(['git', *args], cwd=str(self.repo_path), capture_output=True)
+
+    def test_new_then_clean(self):
+        with Database(db_path=self.db_path) as db:
+            self.assertEqual(refresh_reasons(db, str(self.repo_path)), ['new'])
+            upsert_repo(db, self.repo)
+            self.assertEqual(refresh_reasons(db, str(self.repo_path)), [])
+
+    def test_commit_without_index_change(self):
+        """An empty commit moves the branch ref but leaves .git/index alone."""
+        with Database(db_path=self.db_path) as db:
+            upsert_repo(db, self.repo)
+            self._git('commit', '--allow-empty', '-m', 'empty')
+            self.assertIn('refs', refresh_reasons(db, str(self.repo_path)))
+
+    def test_metadata_file_added(self):
+        with Database(db_path=self.db_path) as db:
+            upsert_repo(db, self.repo)
+            (self.repo_path / 'CITATION.cff').write_text('cff-version: 1.2.0\n')
+            self.assertEqual(refresh_reasons(db, str(self.repo_path)), ['CITATION.cff'])
+
+    def test_remote_change_and_gemspec(self):
+        """Remotes live in .git/config; rubygems globs *.gemspec."""
+        with Database(db_path=self.db_path) as db:
+            upsert_repo(db, self.repo)
+            self._git('remote', 'add', 'origin', 'https://github.com/alice/repo.git')
+            self.assertEqual(refresh_reasons(db, str(self.repo_path)), ['config'])
+
+            upsert_repo(db, self.repo)
+            (self.repo_path / 'repo.gemspec').write_text('Gem::Specification.new\n')
+            self.assertEqual(refresh_reasons(db, str(self.repo_path)), ['repo.gemspec'])
+
+    def test_branch_switch_and_fetch_head(self):
+        with Database(db_path=self.db_path) as db:
+            upsert_repo(db, self.repo)
+            self._git('checkout', '--detach')
+            (self.repo_path / '.git' / 'FETCH_HEAD').write_text('')
+            reasons = refresh_reasons(db, str(self.repo_path))
+            self.assertIn('HEAD', reasons)
+            self.assertIn('FETCH_HEAD', reasons)
+
+    def test_find_stale_repos_bulk(self):
+        with Database(db_path=self.db_path) as db:
+            upsert_repo(db, self.repo)
+            other = str(Path(self.temp_dir) / 'not-indexed')
+            self.assertEqual(find_stale_repos(db, [str(self.repo_path), other]), {other: ['new']})
+
+            (self.repo_path / 'LICENSE').write_text('MIT')
+            expected = {str(self.repo_path): ['LICENSE']}
+            self.assertEqual(find_stale_repos(db), expected)
+            self.assertEqual(find_stale_repos(db, workers=1), expected)
+            self.assertEqual(list(get_stale_repos(db)), [str(self.repo_path)])
+
+    def test_fingerprint_given_to_upsert_wins(self):
+        """A fingerprint captured before a mid-scan edit keeps the repo dirty."""
+        from repoindex.infra.fingerprint import repo_fingerprint
+        with Database(db_path=self.db_path) as db:
+            before = repo_fingerprint(str(self.repo_path))
+            (self.repo_path / 'pyproject.toml').write_text('[project]\n')
+            upsert_repo(db, self.repo, fingerprint=before)
+            self.assertEqual(refresh_reasons(db, str(self.repo_path)), ['pyproject.toml'])
+
 
 class TestEventOperations(unittest.TestCase):
     """Tests for event CRUD operations."""
@@ -423,6 +536,38 @@ class TestEventOperations(unittest.TestCase):
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+    def test_event_cursor_roundtrip(self):
+        """Cursors are keyed by repo path and removed with the repo."""
+        with Database(db_path=self.db_path) as db:
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)", ('r', '/test/r'))
+            repo_id = db.lastrowid
+            cursor = EventCursor(head='a' * 40, tags='t', reflog='1:2', since='2026-01-01T00:00:00')
+
+            save_event_cursor(db, repo_id, cursor)
+            self.assertEqual(get_event_cursors(db), {'/test/r': cursor})
+
+            save_event_cursor(db, repo_id, None)
+            self.assertEqual(get_event_cursors(db), {})
+
+            save_event_cursor(db, repo_id, cursor)
+            db.execute("DELETE FROM repos WHERE id = ?", (repo_id,))
+            self.assertEqual(get_event_cursors(db), {})
+
+    def test_delete_events_for_repo_by_type(self):
+        with Database(db_path=self.db_path) as db:
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)", ('r', '/test/r'))
+            repo_id = db.lastrowid
+            insert_events(db, [
+                Event(type='commit', timestamp=datetime.now(), repo_name='r',
+                      repo_path='/test/r', data={'hash': 'abc12345'}),
+                Event(type='git_tag', timestamp=datetime.now(), repo_name='r',
+                      repo_path='/test/r', data={'tag': 'v1'}),
+            ], repo_id)
+
+            self.assertEqual(delete_events_for_repo(db, repo_id, types=['commit', 'merge']), 1)
+            db.execute("SELECT type FROM events WHERE repo_id = ?", (repo_id,))
+            self.assertEqual([row['type'] for row in db.fetchall()], ['git_tag'])
+
     def test_insert_event(self):
         """Test inserting an event."""
         event = Event(
@@ -537,6 +682,66 @@ class TestEventOperations(unittest.TestCase):
             count = event_count(db, repo_id, 'commit')
             self.assertEqual(count, 5)
 
+    def _commits(self, n, start=0):
+        return [
+            Event(
+                type='commit',
+                timestamp=datetime.now(),
+                repo_name='test-repo',
+                repo_path='/test/path',
+                data={'hash': f'{i:08x}', 'message': f'commit {i}'},
+            )
+            for i in range(start, start + n)
+        ]
+
+    def test_insert_events_counts_only_new_rows(self):
+        """Batched insert reports inserted rows, not attempted rows."""
+        with Database(db_path=self.db_path) as db:
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)",
+                      ('test-repo', '/test/path'))
+            repo_id = db.lastrowid
+
+            self.assertEqual(insert_events(db, self._commits(25), repo_id, batch_size=7), 25)
+            # 10 duplicates + 10 new, spread across batch boundaries
+            self.assertEqual(insert_events(db, self._commits(20, start=15), repo_id, batch_size=7), 10)
+            self.assertEqual(count_events(db, repo_id=repo_id), 35)
+
+    def test_insert_events_accepts_generator_and_commits(self):
+        """commit_every commits in chunks so rows survive a rollback."""
+        with Database(db_path=self.db_path) as db:
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)",
+                      ('test-repo', '/test/path'))
+            repo_id = db.lastrowid
+            db.commit()
+
+            events = (e for e in self._commits(30))
+            inserted = insert_events(db, events, repo_id, batch_size=10, commit_every=10)
+            self.assertEqual(inserted, 30)
+            db.rollback()
+            self.assertEqual(count_events(db, repo_id=repo_id), 30)
+
+    def test_insert_events_matches_insert_event_columns(self):
+        """Bulk and single-row paths store identical rows."""
+        event = Event(
+            type='git_tag',
+            timestamp=datetime(2024, 1, 2, 3, 4, 5),
+            repo_name='test-repo',
+            repo_path='/test/path',
+            data={'tag': 'v1.0', 'message': 'release'},
+        )
+        with Database(db_path=self.db_path) as db:
+            db.execute("INSERT INTO repos (name, path) VALUES (?, ?)",
+                      ('test-repo', '/test/path'))
+            repo_id = db.lastrowid
+            self.assertEqual(insert_events(db, [event], repo_id), 1)
+            db.execute("SELECT event_id, type, timestamp, ref, message, metadata FROM events")
+            row = dict(db.fetchone())
+        self.assertEqual(row['event_id'], event.id)
+        self.assertEqual(row['ref'], 'v1.0')
+        self.assertEqual(row['message'], 'release')
+        self.assertEqual(row['timestamp'], '2024-01-02T03:04:05')
+        self.assertEqual(json.loads(row['metadata']), event.data)
+
 
 class TestQueryCompiler(unittest.TestCase):
     """Tests for query compiler."""
@@ -547,6 +752,25 @@ class TestQueryCompiler(unittest.TestCase):
         self.assertIn("language = ?", result.sql)
         self.assertEqual(result.params, ['Python'])
 
+    def test_nocase_equality(self):
+        """Test nocase compares text case-insensitively, but not numbers."""
+        result = compile_query("language == 'python' and stars > 10", nocase=True)
+        self.assertIn("language = ? COLLATE NOCASE", result.sql)
+        self.assertIn("stars > ?", result.sql)
+        self.assertNotIn("COLLATE", compile_query("language == 'python'").sql)
+
+    def test_count_mode(self):
+        """Test that count=True compiles to COUNT(*), keeping LIMIT."""
+        result = compile_query("language == 'Python' order by stars desc", count=True)
+        self.assertEqual(result.sql, "SELECT COUNT(*) AS count FROM repos WHERE language = ?")
+        self.assertEqual(result.params, ['Python'])
+
+        limited = compile_query("language == 'Python' limit 5", count=True)
+        self.assertEqual(
+            limited.sql,
+            "SELECT COUNT(*) AS count FROM (SELECT 1 FROM repos WHERE language = ? LIMIT 5)",
+        )
+
     def test_numeric_comparison(self):
         """Test numeric comparison."""
         result = compile_query("stars > 100")
@@ -646,6 +870,25 @@ class TestQueryCompiler(unittest.TestCase):
         self.assertIn("LIKE", result.sql)
         self.assertIn("%test%", result.params)
 
+    def test_fuzzy_match_scores_after_like(self):
+        """Test ~= only calls fuzzy_ratio for values that miss the LIKE."""
+        result = compile_query("name ~= 'pyton'")
+        self.assertIn(
+            "(name LIKE ? OR (length(name) BETWEEN ? AND ? AND fuzzy_ratio(name, ?) >= ?))",
+            result.sql,
+        )
+        self.assertEqual(result.params, ['%pyton%', 4, 7, 'pyton', 80])
+
+    def test_contains_on_tags(self):
+        """Test tags comparisons go through the tags table."""
+        result = compile_query("'ml' in tags")
+        self.assertIn("FROM tags t", result.sql)
+        self.assertIn("fuzzy_partial_ratio(t.tag, ?)", result.sql)
+
+        result = compile_query("tags contains 'topic:ml/*'")
+        self.assertIn("t.tag GLOB ?", result.sql)
+        self.assertEqual(result.params, ['topic:ml', 'topic:ml/*'])
+
     def test_empty_query(self):
         """Test empty query returns all repos."""
         result = compile_query("")
@@ -739,6 +982,83 @@ class TestIntegration(unittest.TestCase):
             self.assertEqual(len(active_repos), 1)
             self.assertEqual(active_repos[0]['name'], 'active')
 
+    def test_repo_count_with_query(self):
+        """Test get_repo_count with and without a query."""
+        from repoindex.database import get_repo_count
+
+        with Database(db_path=self.db_path) as db:
+            for i, lang in enumerate(['Python', 'Python', 'Rust']):
+                upsert_repo(db, Repository(path=f'/test/repo-{i}', name=f'repo-{i}', language=lang))
+
+            self.assertEqual(get_repo_count(db), 3)
+            self.assertEqual(get_repo_count(db, "language == 'Python'"), 2)
+            self.assertEqual(get_repo_count(db, "language == 'Python' limit 1"), 1)
+            self.assertEqual(get_repo_count(db, "language == 'Go'"), 0)
+
+    def test_query_with_tags(self):
+        """Test that with_tags selects each repo's tags in the same statement."""
+        with Database(db_path=self.db_path) as db:
+            tagged = upsert_repo(db, Repository(
+                path='/test/tagged', name='tagged', language='Python',
+                tags=frozenset(['work', 'topic:a,b']),
+            ))
+            upsert_repo(db, Repository(path='/test/bare', name='bare', language='Python'))
+
+            query = compile_query("language == 'Python' order by name", with_tags=True)
+            db.execute(query.sql, tuple(query.params))
+            records = [query.to_record(row) for row in db.fetchall()]
+
+            self.assertEqual([r['name'] for r in records], ['bare', 'tagged'])
+            self.assertEqual(records[0]['tags'], [])
+            self.assertEqual(sorted(records[1]['tags']), ['topic:a,b', 'work'])
+            self.assertEqual(records[1]['id'], tagged)
+            self.assertNotIn('tags_joined', records[1])
+
+            # The default form is unchanged
+            plain = compile_query("language == 'Python'")
+            db.execute(plain.sql, tuple(plain.params))
+            self.assertNotIn('tags', plain.to_record(db.fetchone()))
+
+    def test_fuzzy_query_matches_python_engine(self):
+        """Test fuzzy operators select the same repos in SQLite as query.Query."""
+        from repoindex.query import Query
+
+        repos = [
+            ('repoindex', 'Python', ['topic:ml/nlp', 'work']),
+            ('ctk', 'Rust', ['topic:ml']),
+            ('other', 'Go', ['topic:web/api', 'misc']),
+        ]
+        with Database(db_path=self.db_path) as db:
+            for name, lang, tags in repos:
+                db.execute(
+                    "INSERT INTO repos (name, path, language) VALUES (?, ?, ?)",
+                    (name, f'/test/{name}', lang),
+                )
+                repo_id = db.lastrowid
+                db.executemany(
+                    "INSERT INTO tags (repo_id, tag, source) VALUES (?, ?, 'user')",
+                    [(repo_id, tag) for tag in tags],
+                )
+
+            for dsl in (
+                "name ~= 'repoindx'",
+                "language ~= 'pyton' or language ~= 'rsut'",
+                "name contains 'index'",
+                "tags contains 'topic:ml/*'",
+                "tags contains 'topic:web/api'",
+                "'misc' in tags",
+                "tags contains 'wrk'",
+            ):
+                query = compile_query(dsl, columns=['name'])
+                db.execute(query.sql, tuple(query.params))
+                in_sql = sorted(row['name'] for row in db.fetchall())
+                in_python = sorted(
+                    name for name, lang, tags in repos
+                    if Query(dsl).evaluate({'name': name, 'language': lang, 'tags': tags})
+                )
+                self.assertEqual(in_sql, in_python, dsl)
+                self.assertTrue(in_sql, dsl)
+
 
 class TestCitationDetection(unittest.TestCase):
     """Tests for citation file detection in repositories."""
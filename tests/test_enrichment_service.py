@@ -0,0 +1,196 @@
+"""Tests for the concurrent source enrichment stage."""
+import threading
+import time
+
+import pytest
+
+from repoindex.services.enrichment_service import (
+    LATENCY_BUCKETS,
+    EnrichmentService,
+    SourceTimings,
+    run_source,
+)
+
+
+class FakeSource:
+    def __init__(self, source_id, delay=0.0, detects=True, fail=False):
+        self.source_id = source_id
+        self.delay = delay
+        self.detects = detects
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def detect(self, repo_path, repo_record=None):
+        return self.detects
+
+    def fetch(self, repo_path, repo_record=None, config=None):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError('registry down')
+            return {f'{self.source_id}_path': repo_path}
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def _records(n):
+    return [(f'/repos/r{i}', {'name': f'r{i}'}) for i in range(n)]
+
+
+class TestRunSource:
+    def test_returns_data(self):
+        source = FakeSource('a')
+        assert run_source(source, '/r', {}, {}) == (source, {'a_path': '/r'})
+
+    def test_undetected_source_is_skipped(self):
+        assert run_source(FakeSource('a', detects=False), '/r', {}, {}) is None
+
+
+class TestEnrichmentService:
+    def test_results_per_repo(self):
+        a, b = FakeSource('a'), FakeSource('b', detects=False)
+        enrichment = EnrichmentService([a, b], {})
+        enrichment.start(_records(3))
+        try:
+            assert enrichment.results('/repos/r1', timeout=5) == [(a, {'a_path': '/repos/r1'})]
+            assert enrichment.results('/repos/unknown') is None
+        finally:
+            enrichment.close()
+
+    def test_fetches_overlap_across_repos(self):
+        source = FakeSource('slow', delay=0.05)
+        enrichment = EnrichmentService([source], {}, concurrency=16, per_source=16)
+        start = time.monotonic()
+        enrichment.start(_records(16))
+        try:
+            for path, _ in _records(16):
+                enrichment.results(path, timeout=5)
+        finally:
+            enrichment.close()
+        # One repo at a time would take 16 * 0.05s
+        assert time.monotonic() - start < 0.5
+        assert source.peak > 1
+
+    def test_per_source_limit(self):
+        slow, other = FakeSource('slow', delay=0.02), FakeSource('other', delay=0.02)
+        enrichment = EnrichmentService([slow, other], {}, concurrency=8, per_source=2)
+        enrichment.start(_records(10))
+        for path, _ in _records(10):
+            enrichment.results(path, timeout=5)
+        enrichment.close()
+        assert slow.peak == 2
+        assert other.peak <= 2
+
+    def test_failing_source_is_isolated(self):
+        good, bad = FakeSource('good'), FakeSource('bad', fail=True)
+        errors = []
+        enrichment = EnrichmentService([good, bad], {}, on_error=lambda s, e: errors.append((s, e)))
+        enrichment.start(_records(2))
+        try:
+            assert enrichment.results('/repos/r0', timeout=5) == [(good, {'good_path': '/repos/r0'})]
+            enrichment.results('/repos/r1', timeout=5)
+        finally:
+            enrichment.close()
+        assert len(errors) == 2
+        assert all(s is bad and isinstance(e, RuntimeError) for s, e in errors)
+
+    def test_close_without_start(self):
+        EnrichmentService([FakeSource('a')], {}).close()
+
+    def test_run_outside_stage_reuses_pool(self):
+        source = FakeSource('a')
+        enrichment = EnrichmentService([source, FakeSource('bad', fail=True)], {}, concurrency=4)
+        try:
+            before = threading.active_count()
+            for path, record in _records(20):
+                assert enrichment.run(path, record) == [(source, {'a_path': path})]
+            # Workers are created on demand, at most `concurrency` of them
+            assert threading.active_count() - before <= 4
+        finally:
+            enrichment.close()
+        assert enrichment.timings.summary()['a']['count'] == 20
+
+
+class TestSourceTimings:
+    def test_histogram_and_summary(self):
+        timings = SourceTimings()
+        for seconds in (0.005, 0.02, 0.02, 0.3, 20.0):
+            timings.record('slow', seconds)
+        timings.record('fast', 0.001)
+
+        histogram = timings.histogram('slow')
+        assert len(histogram) == len(LATENCY_BUCKETS) + 1
+        assert histogram[0] == 1 and histogram[1] == 2 and histogram[-1] == 1
+        summary = timings.summary()
+        assert list(summary) == ['slow', 'fast']  # long pole first
+        assert summary['slow']['count'] == 5
+        assert summary['slow']['p50'] == 0.02
+        assert summary['slow']['max'] == 20.0
+
+    def test_failed_fetches_are_timed(self):
+        timings = SourceTimings()
+        with pytest.raises(RuntimeError):
+            run_source(FakeSource('bad', fail=True), '/r', {}, {}, timings)
+        run_source(FakeSource('skip', detects=False), '/r', {}, {}, timings)
+        assert list(timings.summary()) == ['bad']
+
+    def test_stage_records_timings(self):
+        enrichment = EnrichmentService([FakeSource('a', delay=0.01)], {})
+        enrichment.start(_records(3))
+        for path, _ in _records(3):
+            enrichment.results(path, timeout=5)
+        enrichment.close()
+        assert enrichment.timings.summary()['a']['count'] == 3
+
+
+class TestRefreshUsesStage:
+    def test_collect_repo_prefers_stage_results(self):
+        from unittest.mock import MagicMock, patch
+
+        from repoindex.commands.refresh import _collect_repo
+
+        source = FakeSource('a')
+        enrichment = MagicMock()
+        enrichment.results.return_value = [(source, {'x': 1})]
+        repo = MagicMock(path='/repos/r0')
+        service = MagicMock()
+        service.get_status.return_value = repo
+        with patch('repoindex.commands.refresh._run_sources_parallel') as per_repo:
+            work = _collect_repo(service, repo, None, [source], {}, True, None, enrichment)
+        per_repo.assert_not_called()
+        assert work.source_results == [(source, {'x': 1})]
+
+    def test_repo_outside_stage_uses_shared_pool(self):
+        from unittest.mock import MagicMock, patch
+
+        from repoindex.commands.refresh import _collect_repo
+
+        enrichment = MagicMock()
+        enrichment.results.return_value = None
+        enrichment.run.return_value = []
+        repo = MagicMock(path='/repos/late')
+        service = MagicMock()
+        service.get_status.return_value = repo
+        with patch('repoindex.commands.refresh._run_sources_parallel') as per_repo:
+            _collect_repo(service, repo, None, [FakeSource('a')], {}, True, None, enrichment)
+        per_repo.assert_not_called()
+        assert enrichment.run.call_args.args[0] == '/repos/late'
+
+    def test_latency_table(self):
+        from rich.console import Console
+
+        from repoindex.commands.refresh import _source_latency_table
+
+        timings = SourceTimings()
+        timings.record('pypi', 0.08)
+        timings.record('pypi', 1.5)
+        console = Console(width=120, record=True)
+        console.print(_source_latency_table(timings.summary()))
+        text = console.export_text()
+        assert 'pypi' in text and '1.6s' in text and '█' in text
@@ -18,6 +18,7 @@ from repoindex.events import (
     scan_git_tags,
     scan_commits,
     scan_events,
+    scan_events_incremental,
     get_recent_events,
     events_to_jsonl
 )
@@ -341,6 +342,137 @@ class TestScanEvents:
         assert len(events) == 2
 
 
+class TestScanEventsIncremental:
+    """Incremental local scanning from a stored cursor (real git repo)."""
+
+    @staticmethod
+    def _git(path, *args):
+        import subprocess
+        return subprocess.run(['git', *args], cwd=str(path), capture_output=True, text=True)
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        path = tmp_path / 'repo'
+        path.mkdir()
+        self._git(path, 'init')
+        self._git(path, 'config', 'user.email', 'test@test.com')
+        self._git(path, 'config', 'user.name', 'Test')
+        for i in range(3):
+            self._git(path, 'commit', '--allow-empty', '-m', f'c{i}')
+        return path
+
+    def _commits(self, events):
+        return [e.data['message'] for e in events if e.type == 'commit']
+
+    def test_first_scan_is_full(self, repo):
+        result = scan_events_incremental(str(repo))
+        assert self._commits(result.events) == ['c2', 'c1', 'c0']
+        assert result.cursor.head == self._git(repo, 'rev-parse', 'HEAD').stdout.strip()
+        assert result.rewritten is False
+
+    def test_unchanged_repo_scans_nothing(self, repo):
+        cursor = scan_events_incremental(str(repo)).cursor
+        with patch('repoindex.events.run_command') as run:
+            result = scan_events_incremental(str(repo), cursor=cursor)
+        run.assert_not_called()
+        assert result.events == []
+        assert result.cursor == cursor
+
+    def test_only_new_commits_and_tags(self, repo):
+        cursor = scan_events_incremental(str(repo)).cursor
+        self._git(repo, 'commit', '--allow-empty', '-m', 'c3')
+        self._git(repo, 'tag', 'v1.0')
+
+        result = scan_events_incremental(str(repo), cursor=cursor)
+        assert self._commits(result.events) == ['c3']
+        assert [e.data['tag'] for e in result.events if e.type == 'git_tag'] == ['v1.0']
+        assert result.rewritten is False
+
+    def test_history_rewrite_rescans(self, repo):
+        cursor = scan_events_incremental(str(repo)).cursor
+        self._git(repo, 'reset', '--hard', 'HEAD~1')
+        self._git(repo, 'commit', '--allow-empty', '-m', 'c2-rewritten')
+
+        old_head = cursor.head
+        result = scan_events_incremental(str(repo), cursor=cursor)
+        assert result.rewritten is True
+        assert self._commits(result.events) == ['c2-rewritten', 'c1', 'c0']
+        assert old_head not in result.reachable
+        assert self._git(repo, 'rev-parse', 'HEAD~1').stdout.strip() in result.reachable
+
+    def test_branch_switch_is_not_a_rewrite(self, repo):
+        self._git(repo, 'checkout', '-q', '-b', 'other', 'HEAD~1')
+        self._git(repo, 'commit', '--allow-empty', '-m', 'o1')
+        self._git(repo, 'checkout', '-q', '-')
+        cursor = scan_events_incremental(str(repo)).cursor
+
+        self._git(repo, 'checkout', '-q', 'other')
+        result = scan_events_incremental(str(repo), cursor=cursor)
+        assert result.rewritten is False
+        assert self._commits(result.events) == ['o1']
+
+    def test_wider_window_is_full(self, repo):
+        recent = datetime.now() - timedelta(days=1)
+        cursor = scan_events_incremental(str(repo), since=recent).cursor
+        result = scan_events_incremental(
+            str(repo), since=recent - timedelta(days=30), cursor=cursor,
+        )
+        assert self._commits(result.events) == ['c2', 'c1', 'c0']
+        assert result.cursor.since < cursor.since
+
+
+class TestRefreshKeepsHistory:
+    """Stored commit events across branch switches and rewrites (real git repo)."""
+
+    _git = staticmethod(TestScanEventsIncremental._git)
+
+    def _refresh(self, repo, db_path):
+        from repoindex.commands.refresh import _collect_repo, _write_repo
+        from repoindex.database import Database, get_event_cursors
+        from repoindex.services.repository_service import RepositoryService
+
+        service = RepositoryService(github_client=MagicMock())
+        repo_obj = next(iter(service.discover([str(repo)])))
+        stats = {'updated': 0, 'errors': 0, 'events_added': 0}
+        with Database(db_path=db_path) as db:
+            cursor = get_event_cursors(db).get(repo_obj.path)
+            work = _collect_repo(service, repo_obj, None, [], {}, True, cursor)
+            _write_repo(db, work, stats, True)
+            db.execute("SELECT message FROM events WHERE type = 'commit' ORDER BY message")
+            return [r['message'] for r in db.fetchall()], stats
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        path = tmp_path / 'repo'
+        path.mkdir()
+        self._git(path, 'init', '-q', '-b', 'main')
+        self._git(path, 'config', 'user.email', 'test@test.com')
+        self._git(path, 'config', 'user.name', 'Test')
+        for i in range(3):
+            self._git(path, 'commit', '--allow-empty', '-m', f'c{i}')
+        return path
+
+    def test_branch_switch_keeps_events(self, repo, tmp_path):
+        db_path = tmp_path / 'index.db'
+        assert self._refresh(repo, db_path)[0] == ['c0', 'c1', 'c2']
+
+        self._git(repo, 'checkout', '-q', '-b', 'other', 'HEAD~2')
+        self._git(repo, 'commit', '--allow-empty', '-m', 'o1')
+        messages, stats = self._refresh(repo, db_path)
+        assert messages == ['c0', 'c1', 'c2', 'o1']
+        assert 'history_rewrites' not in stats
+
+    def test_rewrite_drops_only_unreachable(self, repo, tmp_path):
+        db_path = tmp_path / 'index.db'
+        self._refresh(repo, db_path)
+
+        self._git(repo, 'reset', '-q', '--hard', 'HEAD~1')
+        self._git(repo, 'commit', '--allow-empty', '-m', 'c2-rewritten')
+        messages, stats = self._refresh(repo, db_path)
+        assert messages == ['c0', 'c1', 'c2-rewritten']
+        assert stats['history_rewrites'] == 1
+
+
 class TestGetRecentEvents:
     """Test convenience function for getting recent events."""
 
@@ -0,0 +1,133 @@
+"""Tests for the GitClient status engine (porcelain v2)."""
+import subprocess
+
+from repoindex.infra.git_client import GitClient, parse_porcelain_v2
+
+
+def _git(path, *args):
+    return subprocess.run(
+        ['git', *args], cwd=str(path), capture_output=True, text=True,
+    )
+
+
+def _init_repo(path):
+    """Create a repo with one commit, pushed to a bare remote with upstream set."""
+    path.mkdir()
+    _git(path, 'init')
+    _git(path, 'config', 'user.email', 'test@test.com')
+    _git(path, 'config', 'user.name', 'Test')
+    (path / 'tracked.txt').write_text('initial')
+    _git(path, 'add', '.')
+    _git(path, 'commit', '-m', 'init')
+    remote = path.parent / f'{path.name}-remote.git'
+    subprocess.run(['git', 'init', '--bare', str(remote)], capture_output=True)
+    _git(path, 'remote', 'add', 'origin', str(remote))
+    branch = _git(path, 'symbolic-ref', '--short', 'HEAD').stdout.strip()
+    _git(path, 'push', '-u', 'origin', branch)
+    return path, branch
+
+
+class TestParsePorcelainV2:
+    def test_headers(self):
+        status = parse_porcelain_v2(
+            "# branch.oid 1234\n"
+            "# branch.head feature\n"
+            "# branch.upstream origin/feature\n"
+            "# branch.ab +4 -1\n"
+        )
+        assert status.branch == 'feature'
+        assert status.upstream == 'origin/feature'
+        assert status.has_upstream is True
+        assert (status.ahead, status.behind) == (4, 1)
+        assert status.clean is True
+        assert status.uncommitted_changes is False
+
+    def test_upstream_without_ab_is_gone(self):
+        """A configured upstream whose ref no longer exists has no ab line."""
+        status = parse_porcelain_v2(
+            "# branch.oid 1234\n# branch.head main\n# branch.upstream origin/gone\n"
+        )
+        assert status.has_upstream is False
+        assert status.upstream is None
+
+    def test_detached_head(self):
+        status = parse_porcelain_v2("# branch.oid 1234\n# branch.head (detached)\n")
+        assert status.branch == 'HEAD'
+
+    def test_entry_counts(self):
+        status = parse_porcelain_v2(
+            "# branch.oid 1234\n# branch.head main\n"
+            "1 M. N... 100644 100644 100644 a b staged.py\n"
+            "1 .M N... 100644 100644 100644 a b modified.py\n"
+            "1 MM N... 100644 100644 100644 a b both.py\n"
+            "2 R. N... 100644 100644 100644 a b R100 new.py\told.py\n"
+            "u UU N... 100644 100644 100644 100644 a b c conflict.py\n"
+            "? untracked.py\n"
+            "? other/\n"
+        )
+        assert status.clean is False
+        assert status.uncommitted_changes is True
+        assert status.untracked_files == 2
+        assert status.staged_files == 4
+        assert status.modified_files == 3
+        assert status.changes[:2] == ('M ', ' M')
+        assert status.changes.count('??') == 2
+
+    def test_untracked_only_is_not_clean(self):
+        status = parse_porcelain_v2("# branch.head main\n? new.txt\n")
+        assert status.clean is False
+        assert status.untracked_files == 1
+        assert status.staged_files == 0
+
+
+class TestGitClientStatus:
+    def test_single_subprocess_without_shell(self, monkeypatch, tmp_path):
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append((cmd, kwargs))
+            return subprocess.CompletedProcess(cmd, 0, stdout="# branch.head dev\n", stderr="")
+
+        monkeypatch.setattr('repoindex.infra.git_client.subprocess.run', fake_run)
+        status = GitClient().status(str(tmp_path))
+
+        assert len(calls) == 1
+        cmd, kwargs = calls[0]
+        assert isinstance(cmd, list)
+        assert kwargs['shell'] is False
+        assert status.branch == 'dev'
+
+    def test_failure_returns_default(self, tmp_path):
+        status = GitClient().status(str(tmp_path))  # not a repo
+        assert status.branch == 'main'
+        assert status.clean is True
+
+    def test_real_repo(self, tmp_path):
+        repo, branch = _init_repo(tmp_path / 'repo')
+        client = GitClient()
+
+        status = client.status(str(repo))
+        assert status.branch == branch
+        assert status.clean is True
+        assert status.has_upstream is True
+        assert (status.ahead, status.behind) == (0, 0)
+
+        (repo / 'tracked.txt').write_text('changed')
+        (repo / 'new.txt').write_text('new')
+        _git(repo, 'commit', '-am', 'second')
+        (repo / 'tracked.txt').write_text('changed again')
+
+        status = client.status(str(repo))
+        assert status.ahead == 1
+        assert status.behind == 0
+        assert status.modified_files == 1
+        assert status.untracked_files == 1
+        assert status.clean is False
+
+    def test_status_does_not_touch_index(self, tmp_path):
+        repo, _ = _init_repo(tmp_path / 'repo')
+        index = repo / '.git' / 'index'
+        before = index.stat().st_mtime_ns
+        (repo / 'tracked.txt').touch()
+        GitClient().status(str(repo))
+        assert index.stat().st_mtime_ns == before
@@ -0,0 +1,137 @@
+"""Tests for the pure-Python .git reader."""
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from repoindex.infra.git_client import GitClient
+from repoindex.infra.git_dir import (
+    GitDir,
+    UnsupportedGitLayout,
+    find_git_dir,
+    parse_git_config,
+)
+from repoindex.services.repository_service import RepositoryService
+
+
+def _git(path, *args):
+    return subprocess.run(
+        ['git', *args], cwd=str(path), capture_output=True, text=True,
+    )
+
+
+def _cli(path, *args):
+    return _git(path, *args).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / 'repo'
+    path.mkdir()
+    _git(path, 'init')
+    _git(path, 'config', 'user.email', 'test@test.com')
+    _git(path, 'config', 'user.name', 'Test')
+    (path / 'f.txt').write_text('x')
+    _git(path, 'add', '.')
+    _git(path, 'commit', '-m', 'init')
+    _git(path, 'remote', 'add', 'origin', 'git@github.com:owner/repo.git')
+    return path
+
+
+class TestParseGitConfig:
+    def test_sections_and_case(self):
+        config = parse_git_config(
+            '[core]\n'
+            '\tBare = false\n'
+            '[remote "Origin"]\n'
+            '\turl = https://example.com/a.git\n'
+            '[Branch "main"] remote = origin\n'
+        )
+        assert config['core.bare'] == ['false']
+        assert config['remote.Origin.url'] == ['https://example.com/a.git']
+        assert config['branch.main.remote'] == ['origin']
+
+    def test_values(self):
+        config = parse_git_config(
+            '[x]\n'
+            '  flag\n'
+            '  quoted = "a ; b" # comment\n'
+            '  escaped = tab\\there\n'
+            '  spaced =   one  two   \n'
+            '  long = first \\\n'
+            'second\n'
+            '  multi = 1\n'
+            '  multi = 2\n'
+        )
+        assert config['x.flag'] == ['true']
+        assert config['x.quoted'] == ['a ; b']
+        assert config['x.escaped'] == ['tab\there']
+        assert config['x.spaced'] == ['one  two']
+        assert config['x.long'] == ['first second']
+        assert config['x.multi'] == ['1', '2']
+
+    def test_include_is_unsupported(self):
+        with pytest.raises(UnsupportedGitLayout):
+            parse_git_config('[include]\n\tpath = other.config\n')
+
+
+class TestGitDir:
+    def test_matches_cli(self, repo):
+        git_dir = GitDir.open(str(repo))
+        assert git_dir.remote_url() == _cli(repo, 'config', '--get', 'remote.origin.url')
+        assert git_dir.current_branch() == _cli(repo, 'rev-parse', '--abbrev-ref', 'HEAD')
+        ref, oid = git_dir.head()
+        assert oid == _cli(repo, 'rev-parse', 'HEAD')
+        assert git_dir.remote_url('upstream') is None
+
+    def test_packed_refs(self, repo):
+        _git(repo, 'pack-refs', '--all')
+        branch = _cli(repo, 'rev-parse', '--abbrev-ref', 'HEAD')
+        assert not (repo / '.git' / 'refs' / 'heads' / branch).exists()
+        git_dir = GitDir.open(str(repo))
+        assert git_dir.current_branch() == branch
+        assert git_dir.resolve_ref(f'refs/heads/{branch}') == _cli(repo, 'rev-parse', 'HEAD')
+
+    def test_detached_and_unborn(self, repo, tmp_path):
+        _git(repo, 'checkout', '--detach')
+        assert GitDir.open(str(repo)).current_branch() == 'HEAD'
+
+        empty = tmp_path / 'empty'
+        empty.mkdir()
+        _git(empty, 'init')
+        assert GitDir.open(str(empty)).current_branch() is None
+
+    def test_linked_worktree(self, repo, tmp_path):
+        worktree = tmp_path / 'wt'
+        _git(repo, 'worktree', 'add', '-b', 'feature', str(worktree))
+        assert (worktree / '.git').is_file()
+
+        git_dir = GitDir.open(str(worktree))
+        assert git_dir.common_dir.resolve() == (repo / '.git').resolve()
+        assert git_dir.current_branch() == 'feature'
+        assert git_dir.remote_url() == 'git@github.com:owner/repo.git'
+
+    def test_missing_git_dir(self, tmp_path):
+        with pytest.raises(UnsupportedGitLayout):
+            find_git_dir(str(tmp_path))
+
+
+class TestGitClientUsesReader:
+    def test_no_subprocess(self, repo, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError('git was forked')
+
+        monkeypatch.setattr('repoindex.infra.git_client.subprocess.run', fail)
+        client = GitClient()
+        assert client.remote_url(str(repo)) == 'git@github.com:owner/repo.git'
+        assert client.current_branch(str(repo))
+
+        repos = list(RepositoryService(git_client=client, github_client=MagicMock()).discover([str(repo.parent)]))
+        assert [r.owner for r in repos] == ['owner']
+
+    def test_falls_back_for_includes(self, repo):
+        extra = repo / 'extra.config'
+        extra.write_text('[remote "mirror"]\n\turl = https://mirror.example/repo.git\n')
+        _git(repo, 'config', 'include.path', str(extra))
+
+        assert GitClient().remote_url(str(repo), 'mirror') == 'https://mirror.example/repo.git'
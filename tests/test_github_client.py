@@ -0,0 +1,104 @@
+"""Tests for GitHubClient token discovery and in-process requests."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from repoindex.infra import github_client
+from repoindex.infra.github_client import GitHubClient, gh_auth_token, resolve_token
+
+
+@pytest.fixture(autouse=True)
+def fresh_gh_token(monkeypatch):
+    """Forget any `gh auth token` answer from earlier tests."""
+    monkeypatch.setattr(github_client, '_gh_token', None)
+    monkeypatch.setattr(github_client, '_gh_token_checked', False)
+    monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+    monkeypatch.delenv('REPOINDEX_GITHUB_TOKEN', raising=False)
+
+
+class TestTokenDiscovery:
+    def test_gh_auth_token_runs_once(self):
+        proc = MagicMock(returncode=0, stdout='gho_abc\n')
+        with patch('repoindex.infra.github_client.subprocess.run', return_value=proc) as run:
+            assert gh_auth_token() == 'gho_abc'
+            assert gh_auth_token() == 'gho_abc'
+        run.assert_called_once()
+        assert run.call_args.args[0] == ['gh', 'auth', 'token']
+
+    def test_missing_gh_is_remembered(self):
+        with patch('repoindex.infra.github_client.subprocess.run', side_effect=FileNotFoundError) as run:
+            assert gh_auth_token() is None
+            assert gh_auth_token() is None
+        run.assert_called_once()
+
+    def test_logged_out_gh(self):
+        proc = MagicMock(returncode=1, stdout='')
+        with patch('repoindex.infra.github_client.subprocess.run', return_value=proc):
+            assert gh_auth_token() is None
+
+    def test_precedence(self, monkeypatch):
+        with patch('repoindex.infra.github_client.gh_auth_token', return_value='from-gh'):
+            assert resolve_token() == 'from-gh'
+            monkeypatch.setenv('GITHUB_TOKEN', 'from-env')
+            assert resolve_token() == 'from-env'
+            monkeypatch.setenv('REPOINDEX_GITHUB_TOKEN', 'from-repoindex-env')
+            assert resolve_token() == 'from-repoindex-env'
+            assert resolve_token({'github': {'token': 'from-config'}}) == 'from-config'
+
+    def test_config_token_skips_gh(self):
+        with patch('repoindex.infra.github_client.subprocess.run') as run:
+            assert resolve_token({'github': {'token': 'x'}}) == 'x'
+        run.assert_not_called()
+
+
+class TestInProcessRequests:
+    def test_requests_do_not_fork(self):
+        proc = MagicMock(returncode=0, stdout='gho_abc\n')
+        ok = MagicMock(status_code=200, headers={}, text=json.dumps({'name': 'r'}))
+        with patch('repoindex.infra.github_client.subprocess.run', return_value=proc) as run, \
+                patch('repoindex.infra.http.http_get', return_value=ok) as get:
+            client = GitHubClient()
+            for _ in range(3):
+                assert client.api('repos/o/r') == {'name': 'r'}
+        run.assert_called_once()  # token discovery only
+        assert get.call_count == 3
+        assert get.call_args.kwargs['headers']['Authorization'] == 'token gho_abc'
+
+    def test_anonymous_without_token(self):
+        ok = MagicMock(status_code=200, headers={}, text='{}')
+        with patch('repoindex.infra.github_client.gh_auth_token', return_value=None), \
+                patch('repoindex.infra.http.http_get', return_value=ok) as get:
+            GitHubClient().api('repos/o/r')
+        assert 'Authorization' not in get.call_args.kwargs['headers']
+
+
+class TestWrites:
+    def test_add_topics_merges_existing(self):
+        client = GitHubClient(token='t')
+        current = MagicMock(status_code=200, headers={}, text='{"names": ["a", "b"]}')
+        written = MagicMock(status_code=200, headers={}, text='{"names": ["a", "b", "c"]}')
+        with patch('repoindex.infra.http.http_get', return_value=current), \
+                patch('repoindex.infra.http.http_request', return_value=written) as request:
+            response = client.add_topics('o', 'r', ['b', 'c'])
+        assert response.status == 200
+        assert request.call_args.args == ('PUT', 'https://api.github.com/repos/o/r/topics')
+        assert request.call_args.kwargs['json'] == {'names': ['a', 'b', 'c']}
+
+    def test_add_topics_refuses_blind_overwrite(self):
+        client = GitHubClient(token='t')
+        failed = MagicMock(status_code=500, headers={}, text='')
+        with patch('repoindex.infra.http.http_get', return_value=failed), \
+                patch('repoindex.infra.http.http_request') as request:
+            with pytest.raises(LookupError):
+                client.add_topics('o', 'r', ['c'])
+        request.assert_not_called()
+
+    def test_update_repo(self):
+        client = GitHubClient(token='t')
+        written = MagicMock(status_code=422, headers={}, text='{"message": "Validation Failed"}')
+        with patch('repoindex.infra.http.http_request', return_value=written) as request:
+            response = client.update_repo('o', 'r', description='d')
+        assert response.status == 422
+        assert request.call_args.args[0] == 'PATCH'
+        assert request.call_args.kwargs['json'] == {'description': 'd'}
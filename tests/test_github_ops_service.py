@@ -5,14 +5,17 @@ Tests cover:
 - NWO (name-with-owner) parsing from remote URLs
 - set_topics: dry-run, success, failure, no remote, no topics, from_pyproject, sanitization
 - set_description: dry-run, success, failure, no remote, no description, from_pyproject, truncation
-- gh CLI not found handling
+- Missing token handling
 - Timeout handling
 """
 
-import subprocess
+import json
+
 import pytest
+import requests
 from unittest.mock import MagicMock, patch, PropertyMock
 
+from repoindex.infra.github_client import ApiResponse
 from repoindex.services.github_ops_service import (
     GitHubOpsService,
     GitHubOpsOptions,
@@ -20,6 +23,11 @@ from repoindex.services.github_ops_service import (
 from repoindex.domain.operation import OperationStatus
 
 
+def _response(status=200, message=None):
+    body = json.dumps({'message': message}) if message else '{}'
+    return ApiResponse(status, {}, body)
+
+
 # ============================================================================
 # NWO Parsing Tests
 # ============================================================================
@@ -87,17 +95,12 @@ class TestSetTopics:
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
+        client = MagicMock()
+        client.add_topics.return_value = _response(200)
 
-        with patch.object(self.service, '_run_gh', return_value=mock_proc) as mock_gh:
+        with patch.object(self.service, '_get_client', return_value=client):
             messages = list(self.service.set_topics([repo], options, topics=['python']))
-            mock_gh.assert_called_once()
-            args = mock_gh.call_args[0][0]
-            assert 'repo' in args
-            assert 'edit' in args
-            assert '--add-topic' in args
-            assert 'python' in args
+        client.add_topics.assert_called_once_with('user', 'myrepo', ['python'])
 
         result = self.service.last_result
         assert result.successful == 1
@@ -107,11 +110,10 @@ class TestSetTopics:
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1
-        mock_proc.stderr = 'permission denied'
+        client = MagicMock()
+        client.add_topics.return_value = _response(403, 'permission denied')
 
-        with patch.object(self.service, '_run_gh', return_value=mock_proc):
+        with patch.object(self.service, '_get_client', return_value=client):
             messages = list(self.service.set_topics([repo], options, topics=['python']))
 
         result = self.service.last_result
@@ -180,26 +182,42 @@ class TestSetTopics:
         assert 'cli' in topics
         assert 'tools' in topics
 
-    def test_gh_not_found(self):
+    def test_no_token(self):
+        repos = [self._make_repo(), self._make_repo(name='other')]
+        options = GitHubOpsOptions(dry_run=False)
+
+        with patch('repoindex.services.github_ops_service.resolve_token', return_value=None):
+            messages = list(self.service.set_topics(repos, options, topics=['python']))
+
+        result = self.service.last_result
+        assert result.failed == 1  # stops at the first repo
+        assert 'No GitHub token' in result.errors[0]
+
+    def test_timeout(self):
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        with patch.object(self.service, '_run_gh', side_effect=FileNotFoundError):
+        client = MagicMock()
+        client.add_topics.side_effect = requests.Timeout()
+        with patch.object(self.service, '_get_client', return_value=client):
             messages = list(self.service.set_topics([repo], options, topics=['python']))
 
         result = self.service.last_result
         assert result.failed == 1
-        assert 'gh CLI not installed' in result.errors[0]
+        assert 'Timeout' in result.errors[0]
 
-    def test_timeout(self):
+    def test_unreadable_topics_not_overwritten(self):
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        with patch.object(self.service, '_run_gh', side_effect=subprocess.TimeoutExpired(cmd='gh', timeout=30)):
+        client = MagicMock()
+        client.add_topics.side_effect = LookupError('could not read current topics of user/myrepo')
+        with patch.object(self.service, '_get_client', return_value=client):
             messages = list(self.service.set_topics([repo], options, topics=['python']))
 
         result = self.service.last_result
         assert result.failed == 1
+        assert 'could not read' in result.errors[0]
 
     def test_empty_repos(self):
         options = GitHubOpsOptions(dry_run=False)
@@ -239,14 +257,12 @@ class TestSetDescription:
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 0
+        client = MagicMock()
+        client.update_repo.return_value = _response(200)
 
-        with patch.object(self.service, '_run_gh', return_value=mock_proc) as mock_gh:
+        with patch.object(self.service, '_get_client', return_value=client):
             messages = list(self.service.set_description([repo], options, text='A cool project'))
-            args = mock_gh.call_args[0][0]
-            assert '--description' in args
-            assert 'A cool project' in args
+        client.update_repo.assert_called_once_with('user', 'myrepo', description='A cool project')
 
         result = self.service.last_result
         assert result.successful == 1
@@ -305,11 +321,11 @@ class TestSetDescription:
         result = self.service.last_result
         assert result.details[0].metadata['description'] == 'From CLI'
 
-    def test_gh_not_found(self):
+    def test_no_token(self):
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        with patch.object(self.service, '_run_gh', side_effect=FileNotFoundError):
+        with patch('repoindex.services.github_ops_service.resolve_token', return_value=None):
             messages = list(self.service.set_description([repo], options, text='desc'))
 
         result = self.service.last_result
@@ -319,11 +335,10 @@ class TestSetDescription:
         repo = self._make_repo()
         options = GitHubOpsOptions(dry_run=False)
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1
-        mock_proc.stderr = 'not authorized'
+        client = MagicMock()
+        client.update_repo.return_value = _response(401, 'not authorized')
 
-        with patch.object(self.service, '_run_gh', return_value=mock_proc):
+        with patch.object(self.service, '_get_client', return_value=client):
             messages = list(self.service.set_description([repo], options, text='desc'))
 
         result = self.service.last_result
@@ -0,0 +1,102 @@
+"""Tests for the shared HTTP layer (keep-alive pools, retry, Retry-After)."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from repoindex.infra import http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address[1]))
+        status, headers = server.script.pop(0) if server.script else (200, {})
+        body = b'{"ok": true}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    srv.requests = []
+    srv.script = []
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools(monkeypatch):
+    """No backoff sleeps, and pools built from the patched settings."""
+    monkeypatch.setattr(http, 'RETRY_BACKOFF', 0)
+    monkeypatch.setattr(http, '_adapter', None)
+    monkeypatch.setattr(http, '_local', threading.local())
+
+
+def _url(srv, path='/'):
+    return f"http://127.0.0.1:{srv.server_address[1]}{path}"
+
+
+class TestHttpGet:
+    def test_connections_are_reused(self, server):
+        for i in range(3):
+            assert http.http_get(_url(server, f'/{i}'), timeout=5).status_code == 200
+        ports = {port for _, port in server.requests}
+        assert len(server.requests) == 3
+        assert len(ports) == 1
+
+    def test_retries_429_honoring_retry_after(self, server):
+        server.script = [(429, {'Retry-After': '1'}), (503, {})]
+        start = time.monotonic()
+        resp = http.http_get(_url(server), timeout=5)
+        assert resp.status_code == 200
+        assert len(server.requests) == 3
+        assert time.monotonic() - start >= 0.9
+
+    def test_returns_last_response_when_retries_run_out(self, server):
+        server.script = [(429, {})] * (http.RETRY_TOTAL + 1)
+        resp = http.http_get(_url(server), timeout=5)
+        assert resp.status_code == 429
+        assert len(server.requests) == http.RETRY_TOTAL + 1
+
+    def test_not_found_is_not_retried(self, server):
+        server.script = [(404, {})]
+        assert http.http_get(_url(server), timeout=5).status_code == 404
+        assert len(server.requests) == 1
+
+    def test_user_agent(self):
+        assert http.get_session().headers['User-Agent'] == http.USER_AGENT
+
+
+class TestRetryAfterCap:
+    def test_long_retry_after_is_capped(self):
+        response = MagicMock()
+        response.headers = {'Retry-After': '3600'}
+        response.status = 429
+        assert http._CappedRetry(total=1).get_retry_after(response) == http.MAX_RETRY_AFTER
+
+
+class TestSessions:
+    def test_per_thread_sessions_share_pools(self):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(http.get_session()))
+        thread.start()
+        thread.join()
+        mine = http.get_session()
+        assert sessions[0] is not mine
+        assert sessions[0].get_adapter('https://x') is mine.get_adapter('https://y')
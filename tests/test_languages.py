@@ -0,0 +1,197 @@
+"""Tests for the tracked-file language engine and the git index reader."""
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from repoindex.infra.git_dir import UnsupportedGitLayout
+from repoindex.infra.git_index import parse_git_index, read_git_index
+from repoindex.languages import LanguageCache, language_stats, rank_languages
+
+
+def _git(path, *args):
+    return subprocess.run(['git', *args], cwd=str(path), capture_output=True, text=True)
+
+
+def _commit(path, message='c'):
+    _git(path, 'add', '-A')
+    _git(path, '-c', 'user.email=t@t', '-c', 'user.name=T', 'commit', '-q', '-m', message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / 'repo'
+    (path / 'src' / 'pkg').mkdir(parents=True)
+    _git(path, 'init', '-q')
+    (path / 'src' / 'pkg' / 'a.py').write_text('print(1)\n')
+    (path / 'src' / 'b.py').write_text('x = 2\n')
+    (path / 'run.sh').write_text('echo hi\n')
+    (path / 'tool').write_text('#!/usr/bin/env python\n')
+    (path / 'README.md').write_text('# Repo\n')
+    (path / 'logo.png').write_bytes(b'\x89PNG')
+    _commit(path)
+    return path
+
+
+class TestGitIndex:
+    def test_matches_ls_files(self, repo):
+        index = read_git_index(str(repo))
+        assert [e.path for e in index.entries] == _git(repo, 'ls-files').stdout.split()
+        sizes = {e.path: e.size for e in index.entries}
+        assert sizes['src/pkg/a.py'] == len('print(1)\n')
+        assert index.tree == _git(repo, 'rev-parse', 'HEAD^{tree}').stdout.strip()
+        assert index.key == index.tree
+
+    def test_version_4(self, repo):
+        _git(repo, 'update-index', '--index-version', '4')
+        index = read_git_index(str(repo))
+        assert [e.path for e in index.entries] == _git(repo, 'ls-files').stdout.split()
+
+    def test_staged_change_invalidates_tree(self, repo):
+        (repo / 'src' / 'b.py').write_text('x = 3\n')
+        _git(repo, 'add', 'src/b.py')
+        index = read_git_index(str(repo))
+        assert index.tree is None
+        assert index.key.startswith('index:')
+
+    def test_unborn_repo_has_no_entries(self, tmp_path):
+        _git(tmp_path, 'init', '-q')
+        assert read_git_index(str(tmp_path)).entries == []
+
+    def test_not_a_repo(self, tmp_path):
+        (tmp_path / '.git').mkdir()
+        with pytest.raises(UnsupportedGitLayout):
+            read_git_index(str(tmp_path))
+
+    def test_malformed(self):
+        with pytest.raises(UnsupportedGitLayout):
+            parse_git_index(b'DIRC\x00\x00\x00\x02\x00\x00\x00\x05')
+
+
+class TestLanguageStats:
+    def test_counts_tracked_files_only(self, repo):
+        (repo / 'node_modules').mkdir()
+        (repo / 'scratch.js').write_text('untracked')
+        stats = language_stats(str(repo))
+        assert stats['Python'] == {'files': 3, 'bytes': 9 + 6 + 22}
+        assert stats['Shell'] == {'files': 1, 'bytes': 8}
+        assert stats['Markdown']['files'] == 1
+        assert 'JavaScript' not in stats
+
+    def test_skips_tracked_vendor_dirs(self, repo):
+        for rel in ('vendor/lib/x.js', 'docs/_build/y.js', '.hidden/z.js'):
+            (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            (repo / rel).write_text('1')
+        _commit(repo)
+        assert 'JavaScript' not in language_stats(str(repo))
+
+    def test_config_settings(self, repo):
+        config = {'language_detection': {
+            'skip_directories': ['src'],
+            'skip_file_extensions': ['.sh'],
+        }}
+        stats = language_stats(str(repo), config)
+        assert stats['Python']['files'] == 1  # the shebang script
+        assert 'Shell' not in stats
+
+    def test_cache_keyed_by_tree(self, repo):
+        cache = LanguageCache()
+        first = language_stats(str(repo), cache=cache)
+        with patch('repoindex.languages._tally') as tally:
+            assert language_stats(str(repo), cache=cache) == first
+            tally.assert_not_called()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        key, stored = cache.resolved(str(repo))
+        assert key.startswith(_git(repo, 'rev-parse', 'HEAD^{tree}').stdout.strip())
+        assert stored == first
+
+        (repo / 'src' / 'c.go').write_text('package c\n')
+        _commit(repo)
+        assert language_stats(str(repo), cache=cache)['Go']['files'] == 1
+        assert cache.misses == 2
+
+    def test_callers_get_copies(self, repo):
+        cache = LanguageCache()
+        language_stats(str(repo), cache=cache)['Python']['files'] = 99
+        assert language_stats(str(repo), cache=cache)['Python']['files'] == 3
+
+    def test_walk_fallback_budget(self, tmp_path):
+        for i in range(10):
+            (tmp_path / f"f{i}.py").write_text("")
+        assert language_stats(str(tmp_path), budget=4) == {'Python': {'files': 4, 'bytes': 0}}
+
+    def test_rank_languages(self):
+        stats = {
+            'Markdown': {'files': 9, 'bytes': 1},
+            'Python': {'files': 2, 'bytes': 10},
+            'Go': {'files': 2, 'bytes': 50},
+            'Shell': {'files': 1, 'bytes': 500},
+        }
+        assert rank_languages(stats) == ('Go', ['Go', 'Python', 'Shell'])
+        assert rank_languages(stats, by='bytes')[0] == 'Shell'
+        assert rank_languages(stats, code_only=False)[0] == 'Markdown'
+        assert rank_languages({}) == (None, [])
+
+    def test_primary_language_is_code(self, tmp_path):
+        """Markup, styles, TeX and build files never become the repo language."""
+        from repoindex.services.repository_service import RepositoryService
+
+        for i in range(5):
+            (tmp_path / f'page{i}.html').write_text('<p></p>')
+            (tmp_path / f'style{i}.css').write_text('p {}')
+            (tmp_path / f'paper{i}.tex').write_text('x')
+        (tmp_path / 'Makefile').write_text('all:\n')
+        (tmp_path / 'app.py').write_text('print(1)\n')
+
+        service = RepositoryService(github_client=MagicMock())
+        primary, ranked = service._detect_languages(str(tmp_path))
+        assert primary == 'Python'
+        assert ranked[0] in ('HTML', 'CSS', 'TeX')
+        assert rank_languages({'HTML': {'files': 3, 'bytes': 1}}, primary_from=frozenset({'Python'})) == (None, ['HTML'])
+
+    def test_headers_follow_cpp_sources(self, tmp_path):
+        """`.h` headers count as C++ in a C++ repo, and as C otherwise."""
+        from repoindex.services.repository_service import RepositoryService
+
+        cpp, c = tmp_path / 'cpp', tmp_path / 'c'
+        for path, source in ((cpp, 'cpp'), (c, 'c')):
+            (path / 'src').mkdir(parents=True)
+            (path / 'include').mkdir()
+            _git(path, 'init', '-q')
+            for i in range(4):
+                (path / 'src' / f'm{i}.{source}').write_text('int x;\n')
+            for i in range(5):
+                (path / 'include' / f'm{i}.h').write_text('int x;\n')
+            _commit(path)
+
+        service = RepositoryService(github_client=MagicMock())
+        assert service._detect_languages(str(cpp)) == ('C++', ['C++'])
+        assert service._detect_languages(str(c)) == ('C', ['C'])
+        assert language_stats(str(cpp))['C++']['files'] == 9
+
+
+class TestRefreshPersistsLanguageStats:
+    def test_second_refresh_reuses_stored_stats(self, repo, tmp_path):
+        from repoindex.commands.refresh import _collect_repo, _write_repo
+        from repoindex.database import Database, get_language_stats
+        from repoindex.services.repository_service import RepositoryService
+
+        db_path = tmp_path / 'index.db'
+        service = RepositoryService(github_client=MagicMock())
+        repo_obj = next(iter(service.discover([str(repo)])))
+
+        def refresh():
+            with Database(db_path=db_path) as db:
+                service.language_cache = LanguageCache(get_language_stats(db))
+                work = _collect_repo(service, repo_obj, None, [], {}, True)
+                _write_repo(db, work, {'updated': 0, 'errors': 0, 'events_added': 0}, True)
+            return work
+
+        work = refresh()
+        assert work.enriched.language == 'Python'
+        assert service.language_cache.misses == 1
+
+        work = refresh()
+        assert work.enriched.language == 'Python'
+        assert (service.language_cache.hits, service.language_cache.misses) == (1, 0)
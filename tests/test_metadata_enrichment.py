@@ -212,3 +212,34 @@ class TestLocalAssetDetection:
         from repoindex.services.repository_service import _detect_local_assets
         assets = _detect_local_assets(tmp_path)
         assert set(assets.keys()) == {'has_codemeta', 'has_funding', 'has_contributors', 'has_changelog'}
+
+
+class TestLanguageDetection:
+    def _detect(self, path):
+        from unittest.mock import MagicMock
+        from repoindex.services.repository_service import RepositoryService
+        service = RepositoryService(git_client=MagicMock(), github_client=MagicMock())
+        return service._detect_languages(str(path))
+
+    def test_counts_by_extension(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        for name in ("a.py", "b.py", "pkg/c.py", "run.sh", "model.R", "util.r"):
+            (tmp_path / name).write_text("")
+        primary, langs = self._detect(tmp_path)
+        assert primary == 'Python'
+        assert langs == ['Python', 'R', 'Shell']
+
+    def test_excluded_dirs_pruned_by_name(self, tmp_path):
+        (tmp_path / "main.go").write_text("")
+        for excluded in ("node_modules", "venv", ".git"):
+            (tmp_path / excluded / "deep").mkdir(parents=True)
+            for i in range(5):
+                (tmp_path / excluded / "deep" / f"m{i}.js").write_text("")
+        # Substring matches are not exclusions (e.g. "environment", "rebuild")
+        (tmp_path / "environment").mkdir()
+        (tmp_path / "environment" / "rebuild.go").write_text("")
+        assert self._detect(tmp_path) == ('Go', ['Go'])
+
+    def test_no_source_files(self, tmp_path):
+        (tmp_path / "README").write_text("")
+        assert self._detect(tmp_path) == (None, [])
@@ -1746,26 +1746,29 @@ keywords = ["python", "tool"]
 
         assert result.skipped == 1
 
-    @patch('repoindex.services.github_ops_service.subprocess.run')
-    def test_set_topics_actual_call(self, mock_run, sample_repos):
-        """Test that actual gh CLI call is made correctly."""
+    def test_set_topics_actual_call(self, sample_repos):
+        """Test that topics are merged into the repo's existing ones over the REST API."""
         from repoindex.services.github_ops_service import GitHubOpsService, GitHubOpsOptions
-        mock_run.return_value = MagicMock(returncode=0, stderr='')
+        current = MagicMock(status_code=200, headers={}, text='{"names": ["existing"]}')
+        written = MagicMock(status_code=200, headers={}, text='{}')
 
-        service = GitHubOpsService(config={})
+        service = GitHubOpsService(config={'github': {'token': 't'}})
         options = GitHubOpsOptions(dry_run=False)
 
-        messages = list(service.set_topics(
-            sample_repos[:1], options, topics=['python', 'cli'],
-        ))
+        with patch('repoindex.infra.http.http_get', return_value=current), \
+                patch('repoindex.infra.http.http_request', return_value=written) as mock_request:
+            messages = list(service.set_topics(
+                sample_repos[:1], options, topics=['python', 'cli'],
+            ))
         result = service.last_result
 
         assert result.successful == 1
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
-        assert 'gh' in call_args
-        assert '--add-topic' in call_args
-        assert 'python' in call_args
+        mock_request.assert_called_once()
+        method, url = mock_request.call_args.args
+        assert method == 'PUT'
+        assert url.endswith('/topics')
+        assert mock_request.call_args.kwargs['json'] == {'names': ['existing', 'python', 'cli']}
+        assert mock_request.call_args.kwargs['headers']['Authorization'] == 'token t'
 
     def test_set_description_dry_run(self, sample_repos):
         """Test set_description in dry run mode."""
@@ -52,7 +52,7 @@ class TestCRANDetect:
 # ---------------------------------------------------------------------------
 
 class TestCRANCheck:
-    @patch('repoindex.providers.cran.requests.get')
+    @patch('repoindex.providers.cran.http_get')
     def test_check_published_on_cran(self, mock_get):
         """crandb returns 200 with JSON -> CRAN metadata."""
         mock_resp = MagicMock()
@@ -77,7 +77,7 @@ class TestCRANCheck:
         assert mock_get.call_count == 1
         assert 'crandb.r-pkg.org/myRpkg' in mock_get.call_args[0][0]
 
-    @patch('repoindex.providers.cran.requests.get')
+    @patch('repoindex.providers.cran.http_get')
     def test_check_published_on_bioconductor(self, mock_get):
         """crandb 404, Bioconductor 200 -> Bioconductor metadata."""
         cran_resp = MagicMock()
@@ -98,7 +98,7 @@ class TestCRANCheck:
         assert "bioconductor.org" in result.url
         assert mock_get.call_count == 2
 
-    @patch('repoindex.providers.cran.requests.get')
+    @patch('repoindex.providers.cran.http_get')
     def test_check_not_published(self, mock_get):
         """Both APIs return 404 -> PackageMetadata(published=False).
 
@@ -118,7 +118,7 @@ class TestCRANCheck:
         assert result.registry == 'cran'
         assert result.name == 'unpublished-pkg'
 
-    @patch('repoindex.providers.cran.requests.get')
+    @patch('repoindex.providers.cran.http_get')
     def test_check_cran_exception_falls_through_to_bioc(self, mock_get):
         """Network error on crandb -> still tries Bioconductor."""
         bioc_resp = MagicMock()
@@ -132,7 +132,7 @@ class TestCRANCheck:
         assert result is not None
         assert result.registry == "bioconductor"
 
-    @patch('repoindex.providers.cran.requests.get')
+    @patch('repoindex.providers.cran.http_get')
     def test_check_both_exception(self, mock_get):
         """Both APIs raise -> still returns unpublished record (not None)."""
         mock_get.side_effect = Exception("fail")
@@ -143,7 +143,7 @@ class TestCRANCheck:
         assert result is not None
         assert result.published is False
 
-    @patch('repoindex.providers.cran.requests.get')
+    @patch('repoindex.providers.cran.http_get')
     def test_check_version_none_when_missing(self, mock_get):
         """crandb JSON missing Version key -> version=None."""
         mock_resp = MagicMock()
@@ -51,7 +51,7 @@ class TestNpmDetect:
 
 
 class TestNpmCheck:
-    @patch('repoindex.providers.npm.requests.get')
+    @patch('repoindex.providers.npm.http_get')
     def test_check_published(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -63,14 +63,14 @@ class TestNpmCheck:
         assert result.version == "2.0.0"
         assert result.registry == "npm"
 
-    @patch('repoindex.providers.npm.requests.get')
+    @patch('repoindex.providers.npm.http_get')
     def test_check_not_found(self, mock_get):
         mock_get.return_value = MagicMock(status_code=404)
         p = NpmProvider()
         result = p.check("nonexistent")
         assert result.published is False
 
-    @patch('repoindex.providers.npm.requests.get')
+    @patch('repoindex.providers.npm.http_get')
     def test_check_network_error(self, mock_get):
         mock_get.side_effect = Exception("timeout")
         p = NpmProvider()
@@ -106,7 +106,7 @@ members = ["crate-a", "crate-b"]
 
 
 class TestCargoCheck:
-    @patch('repoindex.providers.cargo.requests.get')
+    @patch('repoindex.providers.cargo.http_get')
     def test_check_published(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -118,7 +118,7 @@ class TestCargoCheck:
         assert result.version == "0.5.0"
         assert result.downloads == 1000
 
-    @patch('repoindex.providers.cargo.requests.get')
+    @patch('repoindex.providers.cargo.http_get')
     def test_check_with_user_agent(self, mock_get):
         mock_get.return_value = MagicMock(status_code=404)
         p = CargoProvider()
@@ -162,7 +162,7 @@ package:
 
 
 class TestCondaCheck:
-    @patch('repoindex.providers.conda.requests.get')
+    @patch('repoindex.providers.conda.http_get')
     def test_check_published(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -198,7 +198,7 @@ class TestDockerDetect:
 
 
 class TestDockerCheck:
-    @patch('repoindex.providers.docker.requests.get')
+    @patch('repoindex.providers.docker.http_get')
     def test_check_published(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -209,7 +209,7 @@ class TestDockerCheck:
         assert result.published is True
         assert result.downloads == 5000
 
-    @patch('repoindex.providers.docker.requests.get')
+    @patch('repoindex.providers.docker.http_get')
     def test_check_library_image(self, mock_get):
         mock_get.return_value = MagicMock(status_code=404)
         p = DockerProvider()
@@ -248,7 +248,7 @@ end
 
 
 class TestRubyGemsCheck:
-    @patch('repoindex.providers.rubygems.requests.get')
+    @patch('repoindex.providers.rubygems.http_get')
     def test_check_published(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -288,7 +288,7 @@ class TestGoDetect:
 
 
 class TestGoCheck:
-    @patch('repoindex.providers.go.requests.get')
+    @patch('repoindex.providers.go.http_get')
     def test_check_published(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -303,14 +303,14 @@ class TestGoCheck:
         called_url = mock_get.call_args[0][0]
         assert "proxy.golang.org" in called_url
 
-    @patch('repoindex.providers.go.requests.get')
+    @patch('repoindex.providers.go.http_get')
     def test_check_not_found(self, mock_get):
         mock_get.return_value = MagicMock(status_code=404)
         p = GoProvider()
         result = p.check("github.com/user/nonexistent")
         assert result.published is False
 
-    @patch('repoindex.providers.go.requests.get')
+    @patch('repoindex.providers.go.http_get')
     def test_check_gone(self, mock_get):
         """410 Gone is also a valid "not published" response."""
         mock_get.return_value = MagicMock(status_code=410)
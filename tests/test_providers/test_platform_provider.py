@@ -1,6 +1,6 @@
 """Tests for PlatformProvider ABC and discovery."""
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 
 class TestPlatformProviderABC:
@@ -381,8 +381,10 @@ class TestGitHubPlatformProvider:
         """Clear the cached GitHubClient between tests (singleton pattern)."""
         from repoindex.providers.github import platform
         platform._client_cache.clear()
+        platform._prefetched = {}
         yield
         platform._client_cache.clear()
+        platform._prefetched = {}
 
     def test_platform_attributes(self):
         from repoindex.providers.github import platform
@@ -508,7 +510,7 @@ class TestGitHubPlatformProvider:
                 repo_record={'remote_url': 'https://github.com/user/repo.git'},
                 config={'github': {'token': 'my-token'}},
             )
-            MockClient.assert_called_once_with(token='my-token')
+            MockClient.assert_called_once_with(token='my-token', response_cache=ANY)
 
     def test_enrich_token_from_env(self):
         from repoindex.providers.github import platform
@@ -533,7 +535,7 @@ class TestGitHubPlatformProvider:
                     repo_record={'remote_url': 'https://github.com/user/repo.git'},
                     config={},
                 )
-            MockClient.assert_called_once_with(token='env-token')
+            MockClient.assert_called_once_with(token='env-token', response_cache=ANY)
 
     def test_enrich_returns_none_for_no_record(self):
         from repoindex.providers.github import platform
@@ -642,3 +644,177 @@ class TestGitHubPlatformProvider:
         from repoindex.providers.github import platform
         from repoindex.providers import PlatformProvider
         assert isinstance(platform, PlatformProvider)
+
+
+def _graphql_node(owner, name, **overrides):
+    node = {
+        'name': name,
+        'nameWithOwner': f'{owner}/{name}',
+        'owner': {'login': owner},
+        'description': 'desc',
+        'homepageUrl': None,
+        'primaryLanguage': {'name': 'Python'},
+        'stargazerCount': 7,
+        'forkCount': 2,
+        'issues': {'totalCount': 3},
+        'pullRequests': {'totalCount': 1},
+        'isFork': False,
+        'isPrivate': False,
+        'isArchived': True,
+        'defaultBranchRef': {'name': 'master'},
+        'repositoryTopics': {'nodes': [{'topic': {'name': 'cli'}}]},
+        'licenseInfo': {'key': 'mit'},
+        'hasIssuesEnabled': True,
+        'hasWikiEnabled': False,
+        'deployments': {'totalCount': 1},
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2026-01-01T00:00:00Z',
+        'pushedAt': '2026-01-02T00:00:00Z',
+    }
+    node.update(overrides)
+    return node
+
+
+class TestGitHubBatchPrefetch:
+    """GraphQL batch prefetch and dictionary-lookup enrich."""
+
+    @pytest.fixture
+    def client(self):
+        from repoindex.infra.github_client import GitHubClient
+        return GitHubClient(token='t')
+
+    def test_from_graphql_matches_rest_semantics(self):
+        from repoindex.infra.github_client import GitHubRepo
+        repo = GitHubRepo.from_graphql(_graphql_node('me', 'tool'))
+        assert repo.full_name == 'me/tool'
+        assert repo.stars == repo.watchers == 7
+        assert repo.open_issues == 4  # REST counts open PRs as issues
+        assert repo.topics == ['cli']
+        assert repo.default_branch == 'master'
+        assert repo.has_pages and repo.is_archived and not repo.has_wiki
+
+    def test_get_repos_batches_with_aliases(self, client):
+        from unittest.mock import patch
+        pairs = [('me', f'r{i}') for i in range(5)]
+
+        def answer(query, variables):
+            return {'data': {
+                f'r{i}': _graphql_node(variables[f'o{i}'], variables[f'n{i}'])
+                for i in range(len(variables) // 2)
+            }}
+
+        with patch.object(client, 'graphql', side_effect=answer) as gql:
+            repos = client.get_repos(pairs, batch_size=2)
+
+        assert gql.call_count == 3
+        assert 'r1: repository(owner: $o1, name: $n1)' in gql.call_args_list[0].args[0]
+        assert set(repos) == set(pairs)
+        assert repos[('me', 'r4')].name == 'r4'
+
+    def test_get_repos_asks_rest_for_undeployed_pages(self, client):
+        from unittest.mock import MagicMock, patch
+        response = {'data': {
+            'r0': _graphql_node('me', 'site', deployments={'totalCount': 0}, pagesBranch={'name': 'gh-pages'}),
+            'r1': _graphql_node('me', 'docs', deployments={'totalCount': 0}, docsTree={'__typename': 'Tree'}),
+            'r2': _graphql_node('me', 'plain', deployments={'totalCount': 0}),
+        }}
+        rest = {'site': MagicMock(has_pages=True), 'docs': MagicMock(has_pages=False)}
+        with patch.object(client, 'graphql', return_value=response), \
+             patch.object(client, 'get_repo', side_effect=lambda owner, name: rest[name]) as get_repo:
+            repos = client.get_repos([('me', 'site'), ('me', 'docs'), ('me', 'plain')])
+
+        assert repos[('me', 'site')].has_pages is True
+        assert repos[('me', 'docs')].has_pages is False
+        assert repos[('me', 'plain')].has_pages is False
+        assert get_repo.call_count == 2
+
+    def test_get_repos_not_found_vs_failed(self, client):
+        from unittest.mock import patch
+        response = {
+            'data': {'r0': _graphql_node('me', 'a'), 'r1': None, 'r2': None},
+            'errors': [
+                {'type': 'NOT_FOUND', 'path': ['r1']},
+                {'type': 'FORBIDDEN', 'path': ['r2']},
+            ],
+        }
+        with patch.object(client, 'graphql', return_value=response):
+            repos = client.get_repos([('me', 'a'), ('me', 'gone'), ('me', 'secret')])
+        assert repos[('me', 'gone')] is None
+        assert ('me', 'secret') not in repos
+
+        with patch.object(client, 'graphql', return_value=None):
+            assert client.get_repos([('me', 'a')]) == {}
+
+    def test_graphql_requires_credentials(self):
+        from unittest.mock import patch
+        from repoindex.infra.github_client import GitHubClient
+        with patch('repoindex.infra.github_client.resolve_token', return_value=None):
+            client = GitHubClient()
+        with patch('repoindex.infra.http.http_post') as post:
+            assert client.graphql('query { viewer { login } }') is None
+        post.assert_not_called()
+
+    def test_graphql_posts_with_token(self, client):
+        from unittest.mock import patch
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = {'data': {'viewer': {'login': 'me'}}}
+        with patch('repoindex.infra.http.http_post', return_value=response) as post:
+            assert client.graphql('query { viewer { login } }')['data']['viewer']['login'] == 'me'
+        assert post.call_args.kwargs['headers']['Authorization'] == 'bearer t'
+
+    def test_enrich_served_from_prefetch(self):
+        from unittest.mock import patch
+        from repoindex.infra.github_client import GitHubRepo
+        from repoindex.providers.github import GitHubPlatformProvider
+
+        provider = GitHubPlatformProvider()
+        records = [
+            {'remote_url': 'https://github.com/Me/Tool.git'},
+            {'remote_url': 'git@github.com:me/gone.git'},
+            {'remote_url': 'https://gitlab.com/me/other'},
+        ]
+        with patch('repoindex.providers.github.GitHubClient') as MockClient:
+            client = MockClient.return_value
+            client.get_repos.return_value = {
+                ('Me', 'Tool'): GitHubRepo.from_graphql(_graphql_node('Me', 'Tool')),
+                ('me', 'gone'): None,
+            }
+            provider.prefetch_repos(records, {'github': {'token': 't'}})
+            client.get_repos.assert_called_once_with([('Me', 'Tool'), ('me', 'gone')])
+
+            result = provider.enrich('/t', {'remote_url': 'https://github.com/me/tool'})
+            assert result['github_stars'] == 7
+            assert provider.enrich('/g', {'remote_url': 'https://github.com/me/gone'}) is None
+            client.get_repo.assert_not_called()
+
+            # Not in the batch: one REST call
+            client.get_repo.return_value = None
+            provider.enrich('/n', {'remote_url': 'https://github.com/me/new'})
+            client.get_repo.assert_called_once_with('me', 'new')
+
+    def test_refresh_prefetches_only_repos_to_process(self, tmp_path):
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from click.testing import CliRunner
+        from repoindex.commands.refresh import refresh_handler
+
+        repos = [
+            SimpleNamespace(path=str(tmp_path / n), name=n, owner='me',
+                            remote_url=f'https://github.com/me/{n}')
+            for n in ('fresh', 'changed')
+        ]
+        source = MagicMock(batch=False)
+        source.name = 'GitHub'
+        config = {'repository_directories': [str(tmp_path)], 'database': {'path': str(tmp_path / 'i.db')}}
+        with patch('repoindex.commands.refresh.load_config', return_value=config), \
+                patch('repoindex.commands.refresh._resolve_active_sources', return_value=[source]), \
+                patch('repoindex.commands.refresh.RepositoryService') as Service, \
+                patch('repoindex.commands.refresh.find_stale_repos',
+                      return_value={repos[1].path: ['new']}), \
+                patch('repoindex.commands.refresh._process_repo'):
+            Service.return_value.discover.return_value = repos
+            result = CliRunner().invoke(refresh_handler, ['--quiet'])
+
+        assert result.exit_code == 0, result.output
+        records, _ = source.prefetch_repos.call_args.args
+        assert records == [{'remote_url': 'https://github.com/me/changed', 'name': 'changed', 'owner': 'me'}]
@@ -54,19 +54,19 @@ class TestFetchDownloads:
         mock_resp.json.return_value = {
             'data': {'last_day': 100, 'last_week': 700, 'last_month': 3000}
         }
-        with patch('repoindex.providers.pypi.requests.get', return_value=mock_resp):
+        with patch('repoindex.providers.pypi.http_get', return_value=mock_resp):
             result = _fetch_downloads('repoindex')
         assert result == 3000
 
     def test_returns_none_on_404(self):
         mock_resp = MagicMock()
         mock_resp.status_code = 404
-        with patch('repoindex.providers.pypi.requests.get', return_value=mock_resp):
+        with patch('repoindex.providers.pypi.http_get', return_value=mock_resp):
             result = _fetch_downloads('nonexistent')
         assert result is None
 
     def test_returns_none_on_error(self):
-        with patch('repoindex.providers.pypi.requests.get', side_effect=Exception("timeout")):
+        with patch('repoindex.providers.pypi.http_get', side_effect=Exception("timeout")):
             result = _fetch_downloads('anything')
         assert result is None
 
@@ -74,7 +74,7 @@ class TestFetchDownloads:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {}
-        with patch('repoindex.providers.pypi.requests.get', return_value=mock_resp):
+        with patch('repoindex.providers.pypi.http_get', return_value=mock_resp):
             result = _fetch_downloads('some-pkg')
         assert result is None
 
@@ -82,7 +82,7 @@ class TestFetchDownloads:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {'data': {'last_day': 100}}
-        with patch('repoindex.providers.pypi.requests.get', return_value=mock_resp):
+        with patch('repoindex.providers.pypi.http_get', return_value=mock_resp):
             result = _fetch_downloads('some-pkg')
         assert result is None
 
@@ -90,7 +90,7 @@ class TestFetchDownloads:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.json.return_value = {'data': {'last_month': 500}}
-        with patch('repoindex.providers.pypi.requests.get', return_value=mock_resp) as mock_get:
+        with patch('repoindex.providers.pypi.http_get', return_value=mock_resp) as mock_get:
             _fetch_downloads('my-package')
         call_args = mock_get.call_args
         assert call_args[0][0] == 'https://pypistats.org/api/packages/my-package/recent'
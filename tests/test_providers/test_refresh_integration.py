@@ -9,6 +9,7 @@ from repoindex.commands.refresh import (
     _update_repo_platform_fields,
     _LOCAL_SOURCE_IDS,
 )
+from repoindex.events import IncrementalScan
 from repoindex.sources import MetadataSource
 
 
@@ -413,10 +414,10 @@ class TestProcessRepoWithSources:
         mock_source.detect.return_value = True
         mock_source.fetch.return_value = {'github_stars': 42}
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]), \
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()), \
              patch('repoindex.commands.refresh._update_repo_platform_fields') as mock_update:
             _process_repo(
                 mock_db, mock_service, mock_repo, stats,
@@ -453,11 +454,11 @@ class TestProcessRepoWithSources:
             'version': '1.0.0', 'published': True,
         }
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]), \
-             patch('repoindex.database.repository._upsert_publication') as mock_upsert:
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()), \
+             patch('repoindex.commands.refresh.upsert_publications') as mock_upsert:
             _process_repo(
                 mock_db, mock_service, mock_repo, stats,
                 full=True, since=MagicMock(),
@@ -466,7 +467,7 @@ class TestProcessRepoWithSources:
             )
 
         mock_upsert.assert_called_once()
-        pkg = mock_upsert.call_args[0][2]
+        [pkg] = mock_upsert.call_args[0][2]
         assert pkg.registry == 'pypi'
         assert pkg.name == 'test-pkg'
         assert pkg.version == '1.0.0'
@@ -493,10 +494,10 @@ class TestProcessRepoWithSources:
 
         mock_source = _make_source('github', detect_val=False)
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]):
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()):
             _process_repo(
                 mock_db, mock_service, mock_repo, stats,
                 full=True, since=MagicMock(),
@@ -528,10 +529,10 @@ class TestProcessRepoWithSources:
         mock_source = _make_source('github')
         mock_source.detect.side_effect = RuntimeError("API timeout")
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]):
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()):
             _process_repo(
                 mock_db, mock_service, mock_repo, stats,
                 full=True, since=MagicMock(),
@@ -561,10 +562,10 @@ class TestProcessRepoWithSources:
 
         stats = {'scanned': 0, 'updated': 0, 'skipped': 0, 'events_added': 0, 'errors': 0}
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]):
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()):
             _process_repo(
                 mock_db, mock_service, mock_repo, stats,
                 full=True, since=MagicMock(),
@@ -597,10 +598,10 @@ class TestProcessRepoWithSources:
         mock_source = _make_source('github', detect_val=True)
         mock_source.fetch.return_value = None
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]), \
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()), \
              patch('repoindex.commands.refresh._update_repo_platform_fields') as mock_update:
             _process_repo(
                 mock_db, mock_service, mock_repo, stats,
@@ -643,12 +644,12 @@ class TestProcessRepoWithSources:
         mock_source.detect.return_value = True
         mock_source.fetch.return_value = {'arbitrary': 'data'}
 
-        with patch('repoindex.commands.refresh.needs_refresh', return_value=True), \
+        with patch('repoindex.commands.refresh.refresh_reasons', return_value=['new']), \
              patch('repoindex.commands.refresh.upsert_repo', return_value=1), \
              patch('repoindex.commands.refresh.clear_scan_error_for_path'), \
-             patch('repoindex.commands.refresh.scan_events', return_value=[]), \
+             patch('repoindex.commands.refresh.scan_events_incremental', return_value=IncrementalScan()), \
              patch('repoindex.commands.refresh._update_repo_platform_fields') as mock_update, \
-             patch('repoindex.database.repository._upsert_publication') as mock_upsert:
+             patch('repoindex.commands.refresh.upsert_publications') as mock_upsert:
             with caplog.at_level(logging.WARNING, logger='repoindex.commands.refresh'):
                 _process_repo(
                     mock_db, mock_service, mock_repo, stats,
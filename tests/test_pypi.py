@@ -219,7 +219,7 @@ name = invalid-cfg-package
 class TestCheckPypiPackage(unittest.TestCase):
     """Test PyPI API interaction"""
     
-    @patch('repoindex.pypi.requests.get')
+    @patch('repoindex.pypi.http_get')
     def test_check_package_success(self, mock_get):
         """Test successful PyPI API call"""
         mock_response = MagicMock()
@@ -243,7 +243,7 @@ class TestCheckPypiPackage(unittest.TestCase):
         self.assertEqual(result['version'], '2.1.0')
         self.assertIn('url', result)
     
-    @patch('repoindex.pypi.requests.get')
+    @patch('repoindex.pypi.http_get')
     def test_check_package_not_found(self, mock_get):
         """Test PyPI API call for non-existent package"""
         mock_response = MagicMock()
@@ -255,7 +255,7 @@ class TestCheckPypiPackage(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertFalse(result['exists'])
     
-    @patch('repoindex.pypi.requests.get')
+    @patch('repoindex.pypi.http_get')
     def test_check_package_network_error(self, mock_get):
         """Test PyPI API call with network error"""
         mock_get.side_effect = Exception("Network error")
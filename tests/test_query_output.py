@@ -0,0 +1,91 @@
+"""Tests for column-projected, streamed query output."""
+import json
+
+import pytest
+
+from repoindex.commands.query import (
+    _emit_results,
+    _execute_fts_count,
+    _execute_fts_query,
+    _execute_sql_count,
+    _execute_sql_query,
+)
+from repoindex.database import Database, compile_query, upsert_repo
+from repoindex.domain.repository import Repository
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = {'database': {'path': str(tmp_path / 'index.db')}}
+    with Database(config=config) as db:
+        for name, language in (('alpha', 'Python'), ('beta', 'Python'), ('gamma', 'Rust')):
+            repo_id = upsert_repo(db, Repository(
+                path=f'/repos/{name}', name=name, language=language,
+                tags=frozenset([f'work/{name}']),
+            ))
+            db.execute(
+                "UPDATE repos SET description = ?, readme_content = ? WHERE id = ?",
+                (f'{name} bayes tools', 'x' * 1000, repo_id),
+            )
+    return config
+
+
+def _lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+class TestProjection:
+    def test_project_selects_columns(self):
+        compiled = compile_query("language == 'Python' order by stars desc limit 5")
+        projected = compiled.project(['path', 'name'], with_tags=True)
+        assert projected.sql.startswith("SELECT repos.path, repos.name, (SELECT GROUP_CONCAT")
+        assert projected.sql.endswith("WHERE language = ? ORDER BY github_stars DESC LIMIT 5")
+        assert projected.params == compiled.params
+        assert compiled.project(None).sql == compiled.sql
+
+    def test_project_rejects_non_identifiers(self):
+        from repoindex.database import QueryCompileError
+        with pytest.raises(QueryCompileError):
+            compile_query('').project(['name; DROP TABLE repos'])
+
+
+class TestQueryOutput:
+    def test_fields_select_only_requested_columns(self, config, capsys):
+        with Database(config=config, read_only=True) as db:
+            compiled = compile_query("language == 'Python' order by name")
+            with_sql = []
+            db.conn.set_trace_callback(with_sql.append)
+            _emit_results(db, compiled, False, False, 'language,tags,no_such_field', False)
+
+        query_sql = [sql for sql in with_sql if 'FROM repos' in sql]
+        assert query_sql and all('readme_content' not in sql and '*' not in sql for sql in query_sql)
+        assert _lines(capsys) == [
+            {'path': '/repos/alpha', 'name': 'alpha', 'language': 'Python', 'tags': ['work/alpha']},
+            {'path': '/repos/beta', 'name': 'beta', 'language': 'Python', 'tags': ['work/beta']},
+        ]
+
+    def test_default_jsonl_and_brief(self, config, capsys):
+        _execute_sql_query(config, compile_query("name == 'gamma'"), False, False, None, False)
+        assert _lines(capsys) == [
+            {'path': '/repos/gamma', 'name': 'gamma', 'tags': ['work/gamma'], 'language': 'Rust', 'branch': 'main'},
+        ]
+        _execute_sql_query(config, compile_query("language == 'Python' order by name"), False, True, None, False)
+        assert capsys.readouterr().out.split() == ['alpha', 'beta']
+
+    def test_fts_uses_same_projection(self, config, capsys):
+        _execute_fts_query(config, 'bayes', False, False, 'description', 2, False)
+        lines = _lines(capsys)
+        assert len(lines) == 2
+        assert all(set(line) == {'path', 'name', 'description'} for line in lines)
+
+
+class TestCount:
+    def test_sql_count(self, config, capsys):
+        _execute_sql_count(config, compile_query("language == 'Python'", count=True), False)
+        _execute_sql_count(config, compile_query("1 == 1 limit 2", count=True), False)
+        assert capsys.readouterr().out.split() == ['2', '2']
+
+    def test_fts_count(self, config, capsys):
+        _execute_fts_count(config, 'bayes', None, False)
+        _execute_fts_count(config, 'bayes', 1, False)
+        assert capsys.readouterr().out.split() == ['3', '1']
@@ -0,0 +1,196 @@
+"""Tests for the process-wide per-host request budgets."""
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from repoindex.infra import http, rate_limit
+from repoindex.infra.rate_limit import (
+    HostBudget,
+    RateLimitExhausted,
+    budget_key,
+    get_budget,
+    quota_wait,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_budgets():
+    rate_limit.reset_budgets()
+    yield
+    rate_limit.reset_budgets()
+
+
+def _quota(remaining, limit=5000, reset_in=3600):
+    return {
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Reset': str(int(time.time() + reset_in)),
+    }
+
+
+class TestBudgetKeys:
+    def test_hosts_and_github_resources(self):
+        assert budget_key('https://pypi.org/pypi/x/json') == 'pypi.org'
+        assert budget_key('https://api.github.com/repos/o/r') == 'api.github.com'
+        assert budget_key('https://api.github.com/search/repositories?q=x') == 'api.github.com/search'
+        assert budget_key('https://api.github.com/graphql') == 'api.github.com/graphql'
+
+    def test_one_budget_per_key_with_defaults(self):
+        assert get_budget('https://crates.io/api/v1/crates/a') is get_budget('https://crates.io/x')
+        assert get_budget('https://crates.io/x').rate == 1.0
+        assert get_budget('https://api.github.com/graphql').rate == rate_limit.DEFAULT_LIMITS['api.github.com'][0]
+        assert get_budget('https://example.org/').rate is None
+
+
+class TestTokenBucket:
+    def test_paces_after_burst(self):
+        budget = HostBudget('x', rate=20.0, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            budget.acquire()
+            budget.release()
+        assert time.monotonic() - start >= 0.18
+        assert budget.requests == 5
+
+    def test_threads_share_one_pace(self):
+        budget = HostBudget('x', rate=50.0, burst=1)
+
+        def worker():
+            for _ in range(5):
+                budget.acquire()
+                budget.release()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 20 requests, one free: at least 19/50 s no matter how many threads
+        assert time.monotonic() - start >= 0.36
+        assert budget.requests == 20
+
+    def test_unlimited_host_does_not_wait(self):
+        budget = HostBudget('x')
+        start = time.monotonic()
+        for _ in range(100):
+            budget.acquire()
+            budget.release()
+        assert time.monotonic() - start < 0.1
+
+
+class TestQuotaHeaders:
+    def test_exhausted_quota_waits_for_reset(self):
+        budget = HostBudget('x')
+        budget.acquire()
+        budget.release({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 2)})
+        start = time.monotonic()
+        budget.acquire()
+        assert time.monotonic() - start >= 0.9
+        assert budget.waited > 0
+
+    def test_distant_reset_raises(self):
+        budget = HostBudget('x')
+        budget.acquire()
+        budget.release(_quota(0, reset_in=600))
+        with pytest.raises(RateLimitExhausted):
+            budget.acquire()
+        assert isinstance(RateLimitExhausted('x'), requests.RequestException)
+
+    def test_in_flight_requests_count_against_quota(self):
+        budget = HostBudget('x')
+        budget.acquire()
+        reset = str(int(time.time()) + 600)
+        budget.release({'X-RateLimit-Remaining': '2', 'X-RateLimit-Reset': reset})
+        budget.acquire()
+        budget.acquire()
+        with pytest.raises(RateLimitExhausted):
+            budget.acquire()
+        budget.release({'X-RateLimit-Remaining': '1', 'X-RateLimit-Reset': reset})
+        assert budget.status()['remaining'] == 0
+
+    def test_out_of_order_responses_keep_lowest(self):
+        budget = HostBudget('x')
+        reset = str(int(time.time()) + 600)
+        for remaining in ('10', '12'):
+            budget.acquire()
+            budget.release({'X-RateLimit-Remaining': remaining, 'X-RateLimit-Reset': reset})
+        assert budget.status()['remaining'] == 10
+
+        # A new window is authoritative
+        budget.acquire()
+        budget.release({'X-RateLimit-Remaining': '4999', 'X-RateLimit-Reset': str(int(reset) + 3600)})
+        assert budget.status()['remaining'] == 4999
+
+    def test_paces_when_quota_runs_low(self):
+        budget = HostBudget('x', rate=10.0, burst=10)
+        budget.acquire()
+        budget.release(_quota(4000, reset_in=3600))
+        assert not budget.status()['paced']
+        budget.acquire()
+        budget.release(_quota(100, reset_in=100))
+        status = budget.status()
+        assert status['paced']
+        assert status['rate'] == pytest.approx(1.0, rel=0.05)
+
+    def test_ietf_headers(self):
+        budget = HostBudget('x')
+        budget.acquire()
+        budget.release({'RateLimit-Remaining': '0', 'RateLimit-Limit': '100', 'RateLimit-Reset': '600'})
+        with pytest.raises(RateLimitExhausted):
+            budget.acquire()
+
+    def test_quota_wait_reports_longest(self):
+        get_budget('https://api.github.com/x').acquire()
+        get_budget('https://api.github.com/x').release(_quota(0, reset_in=30))
+        wait, name = quota_wait()
+        assert name == 'api.github.com'
+        assert 25 < wait <= 30
+
+
+class TestHttpIntegration:
+    def test_release_on_transport_error(self):
+        session = MagicMock()
+        session.request.side_effect = requests.ConnectionError('boom')
+        with patch.object(http, 'get_session', return_value=session):
+            with pytest.raises(requests.ConnectionError):
+                http.http_get('https://pypi.org/pypi/x/json')
+        assert get_budget('https://pypi.org/').status()['requests'] == 1
+        assert get_budget('https://pypi.org/')._in_flight == 0
+
+    def test_response_headers_reach_budget(self):
+        response = MagicMock(headers=_quota(0, reset_in=600))
+        session = MagicMock()
+        session.request.return_value = response
+        with patch.object(http, 'get_session', return_value=session):
+            assert http.http_get('https://api.github.com/repos/o/r') is response
+            with pytest.raises(RateLimitExhausted):
+                http.http_get('https://api.github.com/repos/o/r')
+        assert session.request.call_count == 1
+
+    def test_github_client_gives_up_on_exhausted_quota(self):
+        from repoindex.infra.github_client import GitHubClient
+        budget = get_budget('https://api.github.com/repos/o/r')
+        budget.acquire()
+        budget.release(_quota(0, reset_in=600))
+        session = MagicMock()
+        with patch.object(http, 'get_session', return_value=session):
+            assert GitHubClient(token='t').api('repos/o/r') is None
+        session.request.assert_not_called()
+
+
+class TestProjectedFinish:
+    def test_quota_reset_pushes_finish_back(self):
+        from repoindex.commands.refresh import _ProjectedFinishColumn
+        task = MagicMock(time_remaining=10)
+        column = _ProjectedFinishColumn()
+        with patch('repoindex.commands.refresh.quota_wait', return_value=(0.0, None)):
+            assert column.render(task).plain.startswith('done ~')
+        with patch('repoindex.commands.refresh.quota_wait', return_value=(900.0, 'api.github.com')):
+            assert 'api.github.com quota reset' in column.render(task).plain
+        task.time_remaining = None
+        with patch('repoindex.commands.refresh.quota_wait', return_value=(0.0, None)):
+            assert column.render(task).plain == ''
@@ -157,3 +157,49 @@ class TestRefreshHandlerExternalFlags:
         # (it may appear in the description text, but not in the Options listing)
         options_section = result.output.split('Options:')[1] if 'Options:' in result.output else ''
         assert '-p, --provider' not in options_section
+
+
+class TestRefreshCheck:
+    """refresh --check: bulk staleness report, no writes."""
+
+    def _repo(self, root, name):
+        import subprocess
+        path = root / name
+        path.mkdir()
+        subprocess.run(['git', 'init', '-q'], cwd=str(path), capture_output=True)
+        return path
+
+    def test_check_lists_stale_and_exits(self, tmp_path, monkeypatch):
+        from click.testing import CliRunner
+        from repoindex.commands.refresh import refresh_handler
+        from repoindex.database import Database, upsert_repo
+        from repoindex.domain import Repository
+
+        root = tmp_path / 'repos'
+        root.mkdir()
+        clean = self._repo(root, 'clean')
+        dirty = self._repo(root, 'dirty')
+        db_path = tmp_path / 'index.db'
+        monkeypatch.setenv('REPOINDEX_DB', str(db_path))
+        with Database(db_path=db_path) as db:
+            upsert_repo(db, Repository(path=str(clean.resolve()), name='clean'))
+
+        config = {'refresh': {'external_sources': {}, 'providers': {}}}
+        with patch('repoindex.commands.refresh.load_config', return_value=config), \
+             patch('repoindex.commands.refresh._process_repo') as mock_process:
+            result = CliRunner().invoke(refresh_handler, ['--check', '-d', str(root)])
+
+        assert result.exit_code == 1
+        assert f"dirty ({dirty.resolve()}) [new]" in result.output
+        assert 'clean (' not in result.output
+        mock_process.assert_not_called()
+        with Database(db_path=db_path) as db:
+            db.execute("SELECT COUNT(*) FROM repos")
+            assert db.fetchone()[0] == 1
+
+        with Database(db_path=db_path) as db:
+            upsert_repo(db, Repository(path=str(dirty.resolve()), name='dirty'))
+        with patch('repoindex.commands.refresh.load_config', return_value=config):
+            result = CliRunner().invoke(refresh_handler, ['--check', '-q', '-d', str(root)])
+        assert result.exit_code == 0
+        assert result.output == ''
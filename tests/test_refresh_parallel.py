@@ -3,6 +3,7 @@ import time
 from unittest.mock import MagicMock
 import pytest
 
+from repoindex.events import IncrementalScan
 from repoindex.sources import MetadataSource
 
 
@@ -104,3 +105,124 @@ class TestRunSourcesParallel:
         assert len(results) == 2
         targets = {r[0].target for r in results}
         assert targets == {'repos', 'publications'}
+
+
+class TestProcessReposParallel:
+    """--jobs mode: worker pool for collection, single writer for the DB."""
+
+    def _repos(self, n):
+        repos = []
+        for i in range(n):
+            repo = MagicMock()
+            repo.path = f'/repos/r{i}'
+            repo.name = f'r{i}'
+            repos.append(repo)
+        return repos
+
+    def _service(self, fail_paths=()):
+        service = MagicMock()
+        service.config = {}
+
+        def get_status(repo):
+            if repo.path in fail_paths:
+                raise RuntimeError("fatal: not a git repository")
+            enriched = MagicMock()
+            enriched.remote_url = ''
+            enriched.name = repo.name
+            enriched.owner = None
+            return enriched
+
+        service.get_status.side_effect = get_status
+        return service
+
+    def _run(self, jobs, repos, service, stale):
+        from unittest.mock import patch
+        from repoindex.commands import refresh as refresh_mod
+
+        stats = {'scanned': 0, 'updated': 0, 'skipped': 0, 'events_added': 0, 'errors': 0}
+        event = MagicMock()
+        errors = []
+        with patch.object(refresh_mod, 'refresh_reasons', side_effect=lambda db, p: ['HEAD'] if p in stale else []), \
+             patch.object(refresh_mod, 'upsert_repo', return_value=1), \
+             patch.object(refresh_mod, 'clear_scan_error_for_path'), \
+             patch.object(refresh_mod, 'record_scan_error',
+                          side_effect=lambda db, path, kind, msg: errors.append((path, kind))), \
+             patch.object(refresh_mod, 'scan_events_incremental', return_value=IncrementalScan(events=[event, event])), \
+             patch.object(refresh_mod, 'insert_events', return_value=2):
+            db = MagicMock()
+            if jobs > 1:
+                refresh_mod._process_repos_parallel(
+                    db, service, repos, stats, full=False, since=None,
+                    sources=[], config={}, dry_run=False, quiet=True, jobs=jobs,
+                )
+            else:
+                for repo in repos:
+                    refresh_mod._process_repo(
+                        db, service, repo, stats, full=False, since=None,
+                        sources=[], config={}, dry_run=False, quiet=True,
+                    )
+        return stats, sorted(errors)
+
+    def test_stats_match_sequential(self):
+        repos = self._repos(12)
+        stale = {r.path for r in repos[:9]}
+        fail = {'/repos/r3', '/repos/r7'}
+
+        seq = self._run(1, repos, self._service(fail), stale)
+        par = self._run(4, repos, self._service(fail), stale)
+
+        assert par == seq
+        stats, errors = par
+        assert stats['scanned'] == 12
+        assert stats['skipped'] == 3
+        assert stats['updated'] == 7
+        assert stats['errors'] == 2
+        assert stats['events_added'] == 14
+        assert errors == [('/repos/r3', 'not_git'), ('/repos/r7', 'not_git')]
+
+    def test_writes_stay_on_calling_thread(self):
+        import threading
+        from unittest.mock import patch
+        from repoindex.commands import refresh as refresh_mod
+
+        writer_threads = set()
+
+        def upsert(db, repo, **kwargs):
+            writer_threads.add(threading.get_ident())
+            return 1
+
+        stats = {'scanned': 0, 'updated': 0, 'skipped': 0, 'events_added': 0, 'errors': 0}
+        with patch.object(refresh_mod, 'refresh_reasons', return_value=['new']), \
+             patch.object(refresh_mod, 'upsert_repo', side_effect=upsert), \
+             patch.object(refresh_mod, 'clear_scan_error_for_path'), \
+             patch.object(refresh_mod, 'scan_events_incremental', return_value=IncrementalScan()):
+            refresh_mod._process_repos_parallel(
+                MagicMock(), self._service(), self._repos(8), stats,
+                full=True, since=None, sources=[], config={},
+                dry_run=False, quiet=True, jobs=4,
+            )
+
+        assert writer_threads == {threading.get_ident()}
+        assert stats['updated'] == 8
+
+    def test_dry_run_collects_nothing(self):
+        from unittest.mock import patch
+        from repoindex.commands import refresh as refresh_mod
+
+        service = self._service()
+        stats = {'scanned': 0, 'updated': 0, 'skipped': 0, 'events_added': 0, 'errors': 0}
+        with patch.object(refresh_mod, 'refresh_reasons', return_value=['new']):
+            refresh_mod._process_repos_parallel(
+                MagicMock(), service, self._repos(3), stats,
+                full=True, since=None, sources=[], config={},
+                dry_run=True, quiet=True, jobs=4,
+            )
+        service.get_status.assert_not_called()
+        assert stats['scanned'] == 3
+        assert stats['updated'] == 0
+
+    def test_jobs_option_in_help(self):
+        from click.testing import CliRunner
+        from repoindex.commands.refresh import refresh_handler
+        result = CliRunner().invoke(refresh_handler, ['--help'])
+        assert '--jobs' in result.output
@@ -0,0 +1,143 @@
+"""Tests for the registry lookup TTL cache."""
+import time
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+
+from repoindex.domain.repository import PackageMetadata
+from repoindex.infra.registry_cache import (
+    DEFAULT_NEGATIVE_TTL,
+    DEFAULT_TTL,
+    RegistryCache,
+    parse_duration,
+    registry_ttls,
+)
+from repoindex.providers import RegistryProvider
+from repoindex.sources import _RegistryProviderAdapter
+
+
+class FakeRegistry(RegistryProvider):
+    registry = 'fake'
+    name = 'Fake Registry'
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.checks = 0
+
+    def detect(self, repo_path, repo_record=None):
+        return 'pkg'
+
+    def check(self, package_name, config=None):
+        self.checks += 1
+        return self.answer
+
+
+class TestDurations:
+    @pytest.mark.parametrize('value,seconds', [
+        (0, 0), ('3600', 3600), ('30m', 1800), ('12h', 43200), ('7d', 604800), ('1w', 604800),
+    ])
+    def test_parse(self, value, seconds):
+        assert parse_duration(value) == seconds
+
+    @pytest.mark.parametrize('value', ['soon', '-1', '5y', ''])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_duration(value)
+
+    def test_ttls_from_config(self):
+        assert registry_ttls('pypi', {}) == (DEFAULT_TTL, DEFAULT_NEGATIVE_TTL)
+        assert registry_ttls('pypi', {'refresh': {'providers': {'pypi': True}}}) == (DEFAULT_TTL, DEFAULT_NEGATIVE_TTL)
+        config = {'refresh': {'providers': {'cran': {'enabled': True, 'ttl': '7d', 'negative_ttl': '1h'}}}}
+        assert registry_ttls('cran', config) == (604800, 3600)
+        # A short TTL also caps the negative TTL
+        assert registry_ttls('npm', {'refresh': {'providers': {'npm': {'ttl': 60}}}}) == (60, 60)
+
+    def test_max_age_overrides(self):
+        config = {'refresh': {'max_age': 0, 'providers': {'cran': {'ttl': '7d'}}}}
+        assert registry_ttls('cran', config) == (0, 0)
+
+
+class TestRegistryCache:
+    def test_fresh_and_expired(self, tmp_path):
+        cache = RegistryCache(tmp_path / 'registry_cache.db')
+        cache.put('pypi', 'requests', {'name': 'requests', 'published': True})
+        assert cache.get('pypi', 'requests', max_age=60) == {'name': 'requests', 'published': True}
+        assert cache.get('pypi', 'requests', max_age=0) is None
+        assert cache.get('npm', 'requests', max_age=60) is None
+        assert cache.stats() == {'hits': 1, 'negative_hits': 0, 'misses': 2}
+
+        cache.close()
+        assert RegistryCache(tmp_path / 'registry_cache.db').get('pypi', 'requests', 60) is not None
+
+    def test_negative_entries_use_negative_ttl(self):
+        cache = RegistryCache()
+        cache.put('pypi', 'nope', {'name': 'nope', 'published': False})
+        assert cache.get('pypi', 'nope', max_age=3600, negative_max_age=60)['published'] is False
+        with patch('repoindex.infra.registry_cache.time.time', return_value=time.time() + 120):
+            assert cache.get('pypi', 'nope', max_age=3600, negative_max_age=60) is None
+        assert cache.stats()['negative_hits'] == 1
+
+
+class TestAdapterCaching:
+    def test_second_lookup_served_from_cache(self):
+        provider = FakeRegistry(PackageMetadata(registry='fake', name='pkg', version='1.0', published=True))
+        adapter = _RegistryProviderAdapter(provider)
+        first = adapter.fetch('/repo', {}, {})
+        assert adapter.fetch('/other-checkout', {}, {}) == first
+        assert first['version'] == '1.0'
+        assert provider.checks == 1
+
+    def test_not_found_is_cached(self):
+        provider = FakeRegistry(PackageMetadata(registry='fake', name='pkg', published=False))
+        adapter = _RegistryProviderAdapter(provider)
+        assert adapter.fetch('/repo', {}, {})['published'] is False
+        assert adapter.fetch('/repo', {}, {})['published'] is False
+        assert provider.checks == 1
+
+    def test_failed_lookup_is_not_cached(self):
+        provider = FakeRegistry(None)
+        adapter = _RegistryProviderAdapter(provider)
+        assert adapter.fetch('/repo', {}, {}) is None
+        assert adapter.fetch('/repo', {}, {}) is None
+        assert provider.checks == 2
+
+    def test_max_age_zero_requeries(self):
+        provider = FakeRegistry(PackageMetadata(registry='fake', name='pkg', published=True))
+        adapter = _RegistryProviderAdapter(provider)
+        adapter.fetch('/repo', {}, {})
+        adapter.fetch('/repo', {}, {'refresh': {'max_age': 0}})
+        assert provider.checks == 2
+
+    def test_custom_match_bypasses_cache(self):
+        provider = MagicMock()
+        provider.registry = 'zenodo'
+        provider.name = 'Zenodo'
+        provider.batch = True
+        provider.match.return_value = None
+        adapter = _RegistryProviderAdapter(provider)
+        adapter.fetch('/repo', {}, {})
+        adapter.fetch('/repo', {}, {})
+        assert provider.match.call_count == 2
+
+
+class TestRefreshOptions:
+    def test_max_age_validation(self):
+        from repoindex.commands.refresh import _validate_max_age
+        assert _validate_max_age(None, None, '12h') == 43200
+        assert _validate_max_age(None, None, None) is None
+        with pytest.raises(click.BadParameter):
+            _validate_max_age(None, None, 'later')
+
+    def test_provider_ttl_entry_enables_only_when_asked(self):
+        from repoindex.commands.refresh import _resolve_active_sources
+        config = {'refresh': {'external_sources': {}, 'providers': {
+            'cran': {'enabled': True, 'ttl': '7d'},
+            'npm': {'ttl': '1d'},
+        }}}
+        with patch('repoindex.commands.refresh.discover_sources') as discover:
+            discover.return_value = []
+            _resolve_active_sources((), (), None, False, config)
+        only = discover.call_args.kwargs['only']
+        assert 'cran' in only
+        assert 'npm' not in only
@@ -0,0 +1,107 @@
+"""Tests for conditional GitHub requests backed by the response cache."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from repoindex.infra.github_client import GitHubClient
+from repoindex.infra.response_cache import ResponseCache
+
+
+def _response(status, body=None, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = json.dumps(body) if body is not None else ''
+    resp.headers = headers or {}
+    return resp
+
+
+@pytest.fixture
+def client():
+    return GitHubClient(token='t', response_cache=ResponseCache())
+
+
+class TestResponseCache:
+    def test_round_trip_and_counters(self, tmp_path):
+        cache = ResponseCache(tmp_path / 'http_cache.db')
+        assert cache.get('k') is None
+        cache.put('k', '"abc"', None, '{"a": 1}')
+        entry = cache.get('k')
+        assert entry.body == '{"a": 1}'
+        assert entry.conditional_headers() == {'If-None-Match': '"abc"'}
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'not_modified': 0}
+
+        cache.close()
+        assert ResponseCache(tmp_path / 'http_cache.db').get('k').etag == '"abc"'
+
+    def test_responses_without_validators_are_not_stored(self):
+        cache = ResponseCache()
+        cache.put('k', None, None, '{}')
+        assert cache.get('k') is None
+
+    def test_not_opened_until_used(self, tmp_path):
+        ResponseCache(tmp_path / 'sub' / 'http_cache.db')
+        assert not (tmp_path / 'sub').exists()
+
+
+class TestConditionalRequests:
+    def test_304_served_from_cache(self, client):
+        first = _response(200, {'stargazers_count': 5}, {'ETag': 'W/"v1"'})
+        second = _response(304)
+        with patch('repoindex.infra.http.http_get', side_effect=[first, second]) as get:
+            assert client.api('repos/o/r') == {'stargazers_count': 5}
+            assert client.api('repos/o/r') == {'stargazers_count': 5}
+
+        assert 'If-None-Match' not in get.call_args_list[0].kwargs['headers']
+        assert get.call_args_list[1].kwargs['headers']['If-None-Match'] == 'W/"v1"'
+        assert client.response_cache.stats() == {'hits': 1, 'misses': 1, 'not_modified': 1}
+
+    def test_changed_resource_replaces_entry(self, client):
+        responses = [
+            _response(200, {'v': 1}, {'ETag': '"1"'}),
+            _response(200, {'v': 2}, {'ETag': '"2"'}),
+            _response(304),
+        ]
+        with patch('repoindex.infra.http.http_get', side_effect=responses):
+            assert client.api('repos/o/r') == {'v': 1}
+            assert client.api('repos/o/r') == {'v': 2}
+            assert client.api('repos/o/r') == {'v': 2}
+
+    def test_cache_is_per_token(self, client):
+        with patch('repoindex.infra.http.http_get',
+                   return_value=_response(200, {'v': 1}, {'ETag': '"1"'})):
+            client.api('repos/o/r')
+        other = GitHubClient(token='other', response_cache=client.response_cache)
+        assert other._cache_key('repos/o/r', 'x') != client._cache_key('repos/o/r', 'x')
+
+    def test_pagination_follows_link(self, client):
+        link = '<https://api.github.com/repositories/1/releases?page=2>; rel="next"'
+        responses = [_response(200, [1, 2], {'Link': link}), _response(200, [3])]
+        with patch('repoindex.infra.http.http_get', side_effect=responses) as get:
+            assert client.api('repos/o/r/releases', paginate=True) == [1, 2, 3]
+        assert get.call_args_list[1].args[0] == 'https://api.github.com/repositories/1/releases?page=2'
+
+    def test_pagination_from_cached_pages(self, client):
+        link = '<https://api.github.com/repositories/1/releases?page=2>; rel="next"'
+        responses = [
+            _response(200, [1, 2], {'Link': link, 'ETag': '"p1"'}),
+            _response(200, [3], {'ETag': '"p2"'}),
+            _response(304),
+            _response(304),
+        ]
+        with patch('repoindex.infra.http.http_get', side_effect=responses) as get:
+            assert client.api('repos/o/r/releases', paginate=True) == [1, 2, 3]
+            assert client.api('repos/o/r/releases', paginate=True) == [1, 2, 3]
+        assert get.call_args_list[3].kwargs['headers']['If-None-Match'] == '"p2"'
+
+    def test_not_found(self, client):
+        with patch('repoindex.infra.http.http_get', return_value=_response(404, {'message': 'Not Found'})):
+            assert client.get_repo('o', 'missing') is None
+
+    def test_without_cache(self):
+        plain = GitHubClient(token='t')
+        with patch('repoindex.infra.http.http_get',
+                   return_value=_response(200, {'v': 1}, {'ETag': '"1"'})) as get:
+            assert plain.api('repos/o/r') == {'v': 1}
+        assert 'If-None-Match' not in get.call_args.kwargs['headers']
+
@@ -1107,6 +1107,20 @@ class TestShellEdgeCases:
         captured = capsys.readouterr()
         assert 'Usage:' in captured.out
 
+    def test_query_reads_index(self, shell_instance, tmp_path, capsys):
+        """Test query compiles the expression and runs it on the index."""
+        from repoindex.database import Database, upsert_repo
+        from repoindex.domain import Repository
+
+        shell_instance.config = {'database': {'path': str(tmp_path / 'index.db')}}
+        with Database(config=shell_instance.config) as db:
+            upsert_repo(db, Repository(path='/r/repoindex', name='repoindex', language='Python'))
+            upsert_repo(db, Repository(path='/r/ctk', name='ctk', language='Rust'))
+
+        shell_instance.do_query("language ~= 'pyton'")
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [{'name': 'repoindex', 'path': '/r/repoindex'}]
+
 
 class TestShellIntegration:
     """Integration tests for shell commands."""
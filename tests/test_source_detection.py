@@ -0,0 +1,175 @@
+"""Tests for the input-keyed MetadataSource detection cache."""
+import os
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from repoindex.providers.cargo import CargoProvider
+from repoindex.providers.docker import DockerProvider
+from repoindex.providers.zenodo import ZenodoProvider
+from repoindex.sources import MetadataSource, _RegistryProviderAdapter
+from repoindex.sources.detection import DetectionCache, detect_key
+
+
+class CountingSource(MetadataSource):
+    source_id = 'counting'
+    name = 'Counting'
+    detect_files = ('package.json',)
+
+    def __init__(self):
+        self.calls = 0
+
+    def detect(self, repo_path, repo_record=None):
+        self.calls += 1
+        return os.path.exists(os.path.join(repo_path, 'package.json'))
+
+    def fetch(self, repo_path, repo_record=None, config=None):
+        return None
+
+
+def _touch(path, text):
+    path.write_text(text)
+    # Some filesystems have coarse mtimes; make the change visible
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestDetectKey:
+    def test_changes_when_inputs_change(self, tmp_path):
+        before = detect_key(str(tmp_path), ('package.json',))
+        assert detect_key(str(tmp_path), ('package.json',)) == before
+        _touch(tmp_path / 'package.json', '{}')
+        created = detect_key(str(tmp_path), ('package.json',))
+        assert created != before
+        _touch(tmp_path / 'package.json', '{"name": "x"}')
+        assert detect_key(str(tmp_path), ('package.json',)) != created
+
+    def test_unrelated_files_do_not_matter(self, tmp_path):
+        before = detect_key(str(tmp_path), ('package.json',))
+        (tmp_path / 'README.md').write_text('hi')
+        assert detect_key(str(tmp_path), ('package.json',)) == before
+
+
+class TestDetectionCache:
+    def test_negative_answer_reused_until_input_appears(self, tmp_path):
+        source, cache = CountingSource(), DetectionCache()
+        assert cache.detect(source, str(tmp_path)) is False
+        assert cache.detect(source, str(tmp_path)) is False
+        assert source.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        _touch(tmp_path / 'package.json', '{}')
+        assert cache.detect(source, str(tmp_path)) is True
+        assert source.calls == 2
+
+    def test_undeclared_sources_always_detect(self, tmp_path):
+        source = CountingSource()
+        source.detect_files = None
+        cache = DetectionCache()
+        cache.detect(source, str(tmp_path))
+        cache.detect(source, str(tmp_path))
+        assert source.calls == 2
+        assert cache.resolved(str(tmp_path)) == []
+
+    def test_resolved_reports_fresh_entries_only(self, tmp_path):
+        source = CountingSource()
+        key = detect_key(str(tmp_path), source.detect_files)
+        cache = DetectionCache({(str(tmp_path), 'counting'): (key, False)})
+        cache.detect(source, str(tmp_path))
+        assert cache.resolved(str(tmp_path)) == []
+        assert source.calls == 0
+
+        other = tmp_path / 'other'
+        other.mkdir()
+        cache.detect(source, str(other))
+        assert cache.resolved(str(other)) == [('counting', detect_key(str(other), ('package.json',)), False)]
+
+    def test_registry_adapters_declare_inputs(self):
+        assert _RegistryProviderAdapter(CargoProvider()).detect_files == ('Cargo.toml',)
+        assert _RegistryProviderAdapter(ZenodoProvider()).detect_files is None
+
+    def test_docker_name_follows_owner(self, tmp_path):
+        repo = tmp_path / 'dk'
+        repo.mkdir()
+        (repo / 'Dockerfile').write_text('FROM scratch\n')
+        adapter, cache = _RegistryProviderAdapter(DockerProvider()), DetectionCache()
+        assert cache.detect(adapter, str(repo), {}) == 'dk'
+        assert cache.detect(adapter, str(repo), {'owner': 'alice'}) == 'alice/dk'
+
+
+class TestRefreshPersistsDetections:
+    @pytest.fixture
+    def repo(self, tmp_path):
+        path = tmp_path / 'repo'
+        path.mkdir()
+        subprocess.run(['git', 'init', '-q'], cwd=path, check=True)
+        return path
+
+    def test_second_refresh_skips_detect(self, repo, tmp_path):
+        from repoindex.commands.refresh import _collect_repo, _write_repo
+        from repoindex.database import Database, get_source_detections
+        from repoindex.services.enrichment_service import EnrichmentService
+        from repoindex.services.repository_service import RepositoryService
+
+        source = CountingSource()
+        db_path = tmp_path / 'index.db'
+        service = RepositoryService(github_client=MagicMock())
+        repo_obj = next(iter(service.discover([str(repo)])))
+
+        def refresh():
+            with Database(db_path=db_path) as db:
+                enrichment = EnrichmentService(
+                    [source], {}, detections=DetectionCache(get_source_detections(db)),
+                )
+                try:
+                    work = _collect_repo(service, repo_obj, None, [source], {}, True, None, enrichment)
+                    _write_repo(db, work, {'updated': 0, 'errors': 0, 'events_added': 0}, True)
+                finally:
+                    enrichment.close()
+            return enrichment.detections
+
+        assert refresh().misses == 1
+        detections = refresh()
+        assert (detections.hits, detections.misses) == (1, 0)
+        assert source.calls == 1
+
+
+class NamingRegistry(CargoProvider):
+    registry = 'naming'
+
+    def __init__(self):
+        self.detects = 0
+        self.checked = []
+
+    def detect(self, repo_path, repo_record=None):
+        self.detects += 1
+        return 'pkg'
+
+    def check(self, package_name, config=None):
+        self.checked.append(package_name)
+        return None
+
+
+class TestDetectedPackageName:
+    def test_fetch_reuses_cached_name(self, tmp_path):
+        from repoindex.services.enrichment_service import run_source
+
+        provider = NamingRegistry()
+        adapter, cache = _RegistryProviderAdapter(provider), DetectionCache()
+        run_source(adapter, str(tmp_path), {}, {}, detections=cache)
+        run_source(adapter, str(tmp_path), {}, {}, detections=cache)
+        assert provider.detects == 1
+        assert provider.checked == ['pkg', 'pkg']
+        assert cache.resolved(str(tmp_path))[0][2] == 'pkg'
+
+    def test_name_round_trips_through_database(self, tmp_path):
+        from repoindex.database import Database, get_source_detections, save_source_detections
+
+        with Database(db_path=tmp_path / 'index.db') as db:
+            db.execute("INSERT INTO repos (name, path) VALUES ('r', '/r')")
+            repo_id = db.lastrowid
+            save_source_detections(db, repo_id, [('naming', 'k1', 'pkg'), ('counting', 'k2', False)])
+            assert get_source_detections(db) == {
+                ('/r', 'naming'): ('k1', 'pkg'), ('/r', 'counting'): ('k2', False),
+            }
@@ -584,7 +584,7 @@ class TestRegistryProviderAdapter:
         mock_provider.detect.return_value = "pkg-name"  # non-None = detected
 
         adapter = _RegistryProviderAdapter(mock_provider)
-        assert adapter.detect("/repo", {}) is True
+        assert adapter.detect("/repo", {}) == "pkg-name"
 
     def test_detect_none_means_false(self):
         from repoindex.sources import _RegistryProviderAdapter
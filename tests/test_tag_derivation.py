@@ -24,6 +24,10 @@ class _DbWrapper:
         self._cursor = self.conn.execute(sql, params)
         return self._cursor
 
+    def executemany(self, sql, params_seq):
+        self._cursor = self.conn.executemany(sql, params_seq)
+        return self._cursor
+
     def fetchall(self):
         if self._cursor is None:
             return []
@@ -103,6 +107,27 @@ def _get_record(db, repo_id):
 class TestDeriveTags:
     """Tests for _derive_tags function."""
 
+    def test_reads_record_when_not_given(self, tmp_path):
+        db = _create_db(tmp_path)
+        db.conn.execute(
+            "INSERT INTO repos (id, name, language, github_topics, has_readme) "
+            "VALUES (1, 'test', 'Rust', ?, 1)",
+            (json.dumps(['cli']),)
+        )
+        db.conn.commit()
+
+        _derive_tags(db, 1)
+        db.conn.commit()
+
+        assert _get_tags(db, 1) == {
+            'topic:cli': 'github', 'lang:rust': 'implicit', 'has:readme': 'implicit',
+        }
+
+    def test_missing_repo_is_noop(self, tmp_path):
+        db = _create_db(tmp_path)
+        _derive_tags(db, 99)
+        assert _get_tags(db, 99) == {}
+
     def test_github_topics(self, tmp_path):
         db = _create_db(tmp_path)
         db.conn.execute(
@@ -535,6 +560,39 @@ class TestSyncDerivedTags:
         assert len(tags) == 0
 
 
+class TestSyncDerivedTagsBatch:
+    """Tests for reconciling several repos' derived tags at once."""
+
+    def test_batch_reconciles_each_repo(self, tmp_path):
+        from repoindex.database import sync_derived_tags
+
+        db = _create_db(tmp_path)
+        for repo_id in (1, 2, 3):
+            db.conn.execute("INSERT INTO repos (id, name) VALUES (?, ?)", (repo_id, f'r{repo_id}'))
+        db.conn.execute("INSERT INTO tags (repo_id, tag, source) VALUES (1, 'topic:old', 'github')")
+        db.conn.execute("INSERT INTO tags (repo_id, tag, source) VALUES (2, 'lang:go', 'implicit')")
+        db.conn.execute("INSERT INTO tags (repo_id, tag, source) VALUES (2, 'favorite', 'user')")
+        db.conn.execute("INSERT INTO tags (repo_id, tag, source) VALUES (3, 'topic:keep', 'github')")
+        db.conn.commit()
+
+        sync_derived_tags(db, {
+            1: [('topic:new', 'github')],
+            2: [],
+            3: [('topic:keep', 'github')],
+        })
+        db.conn.commit()
+
+        assert _get_tags(db, 1) == {'topic:new': 'github'}
+        assert _get_tags(db, 2) == {'favorite': 'user'}
+        assert _get_tags(db, 3) == {'topic:keep': 'github'}
+
+    def test_empty_batch_is_noop(self, tmp_path):
+        from repoindex.database import sync_derived_tags
+
+        db = _create_db(tmp_path)
+        sync_derived_tags(db, {})
+
+
 class TestUpsertRepoEmptyTags:
     """Regression: upsert_repo must reconcile tags even when repo.tags is empty.
 
@@ -12,6 +12,7 @@ import json
 import pytest
 
 from repoindex.services.tag_derivation import (
+    PERSISTABLE_TAG_COLUMNS,
     derive_implicit_tags,
     derive_persistable_tags,
 )
@@ -129,6 +130,18 @@ class TestDerivePersistableTags:
         second = derive_persistable_tags(row, ['pypi'])
         assert first == second
 
+    def test_reads_only_declared_columns(self):
+        """Callers select PERSISTABLE_TAG_COLUMNS; nothing else may be read."""
+        class _Row(dict):
+            read = set()
+
+            def get(self, key, default=None):
+                self.read.add(key)
+                return super().get(key, default)
+
+        derive_persistable_tags(_Row(language='Go', has_readme=1), ['pypi'])
+        assert _Row.read == set(PERSISTABLE_TAG_COLUMNS)
+
 
 class TestDeriveImplicitTags:
     """Tests for the read-view (richer) implicit-tag derivation.
@@ -426,6 +439,9 @@ class TestBackwardCompatibility:
             def execute(self, sql, params=()):
                 self._cursor = self.conn.execute(sql, params)
                 return self._cursor
+            def executemany(self, sql, params_seq):
+                self._cursor = self.conn.executemany(sql, params_seq)
+                return self._cursor
             def fetchall(self):
                 return self._cursor.fetchall() if self._cursor else []
             def fetchone(self):
@@ -121,9 +121,7 @@ class TestGetGitStatus(unittest.TestCase):
     def test_get_git_status_clean_repo(self, mock_run_command):
         """Test get_git_status with clean repository"""
         mock_run_command.side_effect = [
-            ("main", 0),              # git rev-parse --abbrev-ref HEAD
-            ("", 0),                  # git status --porcelain
-            ("fatal: no upstream", 1) # git rev-parse --abbrev-ref @{u}
+            ("# branch.oid abc123\n# branch.head main", 0),  # git status --porcelain=v2 --branch
         ]
 
         result = get_git_status(self.temp_dir)
@@ -135,9 +133,10 @@ class TestGetGitStatus(unittest.TestCase):
     def test_get_git_status_modified_files(self, mock_run_command):
         """Test get_git_status with modified files"""
         mock_run_command.side_effect = [
-            ("main", 0),                                      # git rev-parse --abbrev-ref HEAD
-            (" M file1.py\nM  file2.py\n?? new_file.py", 0), # git status --porcelain
-            ("fatal: no upstream", 1)                         # git rev-parse --abbrev-ref @{u}
+            ("# branch.oid abc123\n# branch.head main\n"
+             "1 .M N... 100644 100644 100644 aaa bbb file1.py\n"
+             "1 M. N... 100644 100644 100644 aaa bbb file2.py\n"
+             "? new_file.py", 0),                             # git status --porcelain=v2 --branch
         ]
 
         result = get_git_status(self.temp_dir)
@@ -160,9 +159,11 @@ class TestGetGitStatus(unittest.TestCase):
     def test_get_git_status_various_changes(self, mock_run_command):
         """Test get_git_status with various types of changes"""
         mock_run_command.side_effect = [
-            ("feature-branch", 0),                                               # git rev-parse --abbrev-ref HEAD
-            ("A  added.py\n D deleted.py\nM  modified.py\n?? untracked.py", 0), # git status --porcelain
-            ("fatal: no upstream", 1)                                            # git rev-parse --abbrev-ref @{u}
+            ("# branch.oid abc123\n# branch.head feature-branch\n"
+             "1 A. N... 000000 100644 100644 000 bbb added.py\n"
+             "1 .D N... 100644 100644 000000 aaa aaa deleted.py\n"
+             "1 M. N... 100644 100644 100644 aaa bbb modified.py\n"
+             "? untracked.py", 0),                            # git status --porcelain=v2 --branch
         ]
 
         result = get_git_status(self.temp_dir)
@@ -174,6 +175,24 @@ class TestGetGitStatus(unittest.TestCase):
         self.assertIn('1 modified', status)
         self.assertIn('1 untracked', status)
 
+    @patch('repoindex.utils.run_command')
+    def test_get_git_status_single_invocation_with_upstream(self, mock_run_command):
+        """Branch, ahead/behind and changes come from one porcelain v2 call."""
+        mock_run_command.return_value = (
+            "# branch.oid abc123\n# branch.head main\n"
+            "# branch.upstream origin/main\n# branch.ab +2 -3", 0
+        )
+
+        result = get_git_status(self.temp_dir)
+
+        mock_run_command.assert_called_once()
+        cmd = mock_run_command.call_args[0][0]
+        self.assertIsInstance(cmd, list)  # no shell
+        self.assertIn('--porcelain=v2', cmd)
+        self.assertEqual(result['status'], 'clean')
+        self.assertEqual(result['ahead'], 2)
+        self.assertEqual(result['behind'], 3)
+
 
 if __name__ == '__main__':
     unittest.main()
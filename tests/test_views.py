@@ -631,6 +631,43 @@ templates:
         # Should contain rust-tool (our mock Rust repo)
         assert "rust-tool" in view.repo_names
 
+    @pytest.fixture
+    def indexed_service(self, tmp_path, mock_repos):
+        """Service with use_index over an index of all but test-wip."""
+        from repoindex.database import Database, upsert_repo
+
+        config = {'database': {'path': str(tmp_path / 'index.db')}}
+        with Database(config=config) as db:
+            for repo in mock_repos[:-1]:
+                upsert_repo(db, repo)
+        return ViewService(views_path=str(tmp_path / 'views.yaml'), config=config, use_index=True)
+
+    def test_query_prefiltered_by_index(self, indexed_service, mock_repos):
+        """Test fuzzy view queries only evaluate index candidates in Python."""
+        from unittest.mock import patch
+        from repoindex.query import Query
+
+        with patch.object(Query, 'evaluate', autospec=True, side_effect=Query.evaluate) as evaluate:
+            found = indexed_service._evaluate_query("name ~= 'repoindx' or language ~= 'rust'", mock_repos)
+        assert [r.name for r in found] == ['repoindex', 'rust-tool']
+        # ctk and btk are ruled out by the index; test-wip is not indexed
+        evaluated = [call.args[1]['name'] for call in evaluate.call_args_list]
+        assert evaluated == ['repoindex', 'rust-tool', 'test-wip']
+
+    @pytest.mark.parametrize('query', [
+        "language == 'python'",
+        "language ~= 'pyton'",
+        "name contains 'tk' and not language == 'rust'",
+        "name ~= 'test-wipp'",
+        "'tool'",
+    ])
+    def test_index_matches_python(self, indexed_service, mock_repos, query):
+        """Test use_index returns what Query does, unindexed repos included."""
+        python = ViewService(views_path=indexed_service.views_path)
+        expected = [r.name for r in python._evaluate_query(query, mock_repos)]
+        assert expected
+        assert [r.name for r in indexed_service._evaluate_query(query, mock_repos)] == expected
+
 
 class TestViewServiceExtends:
     """Tests for view inheritance via extends."""